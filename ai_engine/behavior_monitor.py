@@ -1,41 +1,82 @@
 import time
-from typing import Dict, Any
+from array import array
+from bisect import bisect_right
+from typing import Callable, Dict, Any, List, Optional
+
+from ai_engine.vision import FaceDetector, apply_face_count, downscale_frame
 
 class BehaviorMonitor:
     """
     A service class configured to track user behavior during an assessment.
     Monitors face presence, absence duration, and multiple faces detections.
-    
-    Note: OpenCV integration logic is currently acting as a placeholder 
-          to be implemented by actual computer vision modules parsing feeds.
+
+    Every absence is kept as a (start, end) pair in array-backed interval logs on a
+    monotonic clock, so sub-second absences add up exactly and the monitor can
+    answer "how long was the face absent in the last N seconds" and produce an
+    absence timeline for the explanation and report.
+
+    Frames are analyzed by process_vision_frame(), or, for live streams, by a shared
+    VisionFrameProcessor (ai_engine/vision.py) that samples, downscales and runs
+    face detection on a thread pool before feeding the results back here.
     """
 
-    def __init__(self):
+    # One monitor exists per live attempt: no per-instance __dict__
+    __slots__ = (
+        "_clock",
+        "_started_at",
+        "face_detected",
+        "multiple_faces_detected",
+        "face_absent_duration",
+        "_last_absence_start_time",
+        "_absence_starts",
+        "_absence_ends",
+    )
+
+    # Shared OpenCV detector, created on first use by process_vision_frame()
+    _default_detector: Optional[FaceDetector] = None
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            clock: Source of timestamps in seconds. Must be monotonic; injectable for
+                tests and for replaying recorded streams.
+        """
+        self._clock = clock
+        self._started_at: float = clock()
+
         # Current status flags
         self.face_detected: bool = True
         self.multiple_faces_detected: bool = False
-        
+
         # Accumulators and Trackers
-        self.face_absent_duration: int = 0
+        self.face_absent_duration: float = 0.0  # Seconds, closed absences only
         self._last_absence_start_time: float = 0.0
+        # Closed absence intervals, in chronological order (allocated on the first absence)
+        self._absence_starts: Optional[array] = None
+        self._absence_ends: Optional[array] = None
 
-    def update_face_status(self, face_present: bool) -> None:
+    def update_face_status(self, face_present: bool, timestamp: Optional[float] = None) -> None:
         """
         Update the current face detection status and calculate absence duration.
-        
+        The clock is only read when the status actually changes.
+
         Args:
             face_present (bool): True if a face is currently detected in the frame.
+            timestamp (float, optional): When the frame was captured, on the monitor's clock.
         """
+        if face_present == self.face_detected:
+            return
+
+        now = self._clock() if timestamp is None else timestamp
         # If the state changed from present -> absent
-        if not face_present and self.face_detected:
-            self._last_absence_start_time = time.time()
-            
+        if not face_present:
+            self._last_absence_start_time = now
+
         # If the state changed from absent -> present
-        elif face_present and not self.face_detected:
+        else:
             # Add the duration of the recent absence block to the total accumulator
-            absence_block = time.time() - self._last_absence_start_time
-            self.face_absent_duration += int(absence_block)
-            
+            self._close_absence(now)
+
         self.face_detected = face_present
 
     def update_multiple_faces(self, status: bool) -> None:
@@ -48,33 +89,132 @@ class BehaviorMonitor:
         if status:
             self.multiple_faces_detected = True
 
+    def get_total_absent_seconds(self, now: Optional[float] = None) -> float:
+        """Return the total absence so far, including an absence still in progress."""
+        if self.face_detected:
+            return self.face_absent_duration
+        now = self._clock() if now is None else now
+        return self.face_absent_duration + max(0.0, now - self._last_absence_start_time)
+
+    def absence_in_last(self, seconds: float, now: Optional[float] = None) -> float:
+        """
+        Return how many of the last `seconds` seconds the face was absent.
+        Binary search skips every absence that ended before the window.
+
+        Args:
+            seconds: Length of the look-back window.
+            now: End of the window (defaults to the clock's current time).
+        """
+        now = self._clock() if now is None else now
+        absent = absence_overlap(self._absence_starts, self._absence_ends, now - seconds, now)
+        if not self.face_detected and self._last_absence_start_time < now:
+            absent += max(0.0, now - max(self._last_absence_start_time, now - seconds))
+        return absent
+
+    def get_absence_timeline(self, now: Optional[float] = None) -> List[Dict[str, float]]:
+        """
+        Return every absence interval as seconds since the monitor started,
+        including an absence still in progress.
+
+        Returns:
+            List of {"start", "end", "seconds"} dicts in chronological order.
+        """
+        open_since = None
+        if not self.face_detected:
+            open_since = self._last_absence_start_time
+            now = self._clock() if now is None else now
+        return absence_timeline(self._absence_starts, self._absence_ends, self._started_at, open_since, now)
+
     def get_behavior_summary(self) -> Dict[str, Any]:
         """
         Return the final accumulated metrics.
-        This closes out any ongoing absence duration before returning the totals.
+        An ongoing absence is included up to now without closing it.
         
         Returns:
             Dict containing face present flag, total absent seconds, and multiple faces flag.
         """
-        # If they are currently still absent when the summary is pulled, calculate the final gap
-        if not self.face_detected:
-            absence_block = time.time() - self._last_absence_start_time
-            self.face_absent_duration += int(absence_block)
-            self._last_absence_start_time = time.time() # Reset clock so it isn't double-counted
-
         return {
             "is_currently_detected": self.face_detected,
-            "total_absent_seconds": self.face_absent_duration,
+            "total_absent_seconds": round(self.get_total_absent_seconds(), 3),
+            "absence_count": (len(self._absence_ends) if self._absence_ends is not None else 0) + (0 if self.face_detected else 1),
             "multiple_faces_detected": self.multiple_faces_detected
         }
 
+    def _close_absence(self, now: float) -> None:
+        start = self._last_absence_start_time
+        now = max(now, start)
+        if self._absence_starts is None:
+            self._absence_starts, self._absence_ends = array("d"), array("d")
+        self._absence_starts.append(start)
+        self._absence_ends.append(now)
+        self.face_absent_duration += now - start
+
     # ==========================================
-    # Placeholder for OpenCV / Real Vision logic
+    # Vision
     # ==========================================
-    def process_vision_frame(self, frame) -> None:
+    def process_vision_frame(
+        self,
+        frame,
+        detector: Optional[FaceDetector] = None,
+        max_width: int = 160,
+        timestamp: Optional[float] = None
+    ) -> int:
         """
-        [MOCK] Process a video frame from OpenCV or a webcam stream.
-        This would be responsible for calling self.update_face_status()
-        and self.update_multiple_faces() under the hood.
+        Synchronously analyze one video frame and update the face status flags.
+        Live streams should go through a VisionFrameProcessor instead, which samples
+        frames adaptively and runs detection off the calling thread.
+
+        Args:
+            frame: An HxW or HxWxC (BGR) uint8 frame from OpenCV or a webcam stream.
+            detector: Face detector to use; a HaarFaceDetector (needs OpenCV) when omitted.
+            max_width: The frame is downscaled to at most this width before detection.
+            timestamp: When the frame was captured, on the monitor's clock (defaults to now).
+
+        Returns:
+            int: The number of faces detected.
         """
-        pass
+        if detector is None:
+            if BehaviorMonitor._default_detector is None:
+                from ai_engine.vision import HaarFaceDetector
+                BehaviorMonitor._default_detector = HaarFaceDetector()
+            detector = BehaviorMonitor._default_detector
+
+        face_count = int(detector(downscale_frame(frame, max_width)))
+        apply_face_count(self, face_count, timestamp)
+        return face_count
+
+
+def absence_overlap(starts: Optional[array], ends: Optional[array], window_start: float, window_end: float) -> float:
+    """
+    Seconds of the closed intervals (starts[i], ends[i]) that fall inside
+    [window_start, window_end]. Intervals must be chronological; binary search
+    skips every interval that ended before the window.
+    """
+    if not ends:
+        return 0.0
+    overlap = 0.0
+    for index in range(bisect_right(ends, window_start), len(ends)):
+        if starts[index] >= window_end:
+            break
+        overlap += min(ends[index], window_end) - max(starts[index], window_start)
+    return overlap
+
+
+def absence_timeline(
+    starts: Optional[array],
+    ends: Optional[array],
+    origin: float,
+    open_since: Optional[float] = None,
+    now: Optional[float] = None
+) -> List[Dict[str, float]]:
+    """
+    Convert interval logs to {"start", "end", "seconds"} dicts relative to `origin`,
+    appending the absence still open since `open_since` (up to `now`) if any.
+    """
+    timeline = [
+        {"start": round(start - origin, 3), "end": round(end - origin, 3), "seconds": round(end - start, 3)}
+        for start, end in zip(starts or (), ends or ())
+    ]
+    if open_since is not None:
+        timeline.append({"start": round(open_since - origin, 3), "end": round(now - origin, 3), "seconds": round(now - open_since, 3)})
+    return timeline
@@ -1,12 +1,27 @@
 import difflib
+import heapq
+import json
+import os
+import zlib
+from collections import Counter, deque
+from typing import Dict, FrozenSet, Hashable, List, Optional, Sequence, Set, Tuple
+
+
+def _ratio_percent(matches: int, total_length: int) -> float:
+    # Same arithmetic as SequenceMatcher.ratio() followed by the percentage rounding,
+    # so a bound computed from an upper bound on `matches` is itself a valid upper bound
+    return round(2.0 * matches / total_length * 100.0, 2)
 
 class CodeSimilarityAnalyzer:
     """
     A service class configured to analyze the similarity between two distinct pieces of code.
-    Currently uses string-based similarity, but is designed to be easily swappable
-    with an AST-based analyzer for deeper logical comparison in the future.
+    Uses string-based similarity. TokenSimilarityAnalyzer (ai_engine/token_similarity.py)
+    exposes the same interface over normalized token streams for deeper logical comparison.
     """
 
+    # Name stored with a persisted FingerprintIndex
+    name = "character"
+
     @staticmethod
     def calculate_similarity(code1: str, code2: str) -> float:
         """
@@ -36,3 +51,374 @@ class CodeSimilarityAnalyzer:
         similarity_percentage = round(ratio * 100.0, 2)
         
         return similarity_percentage
+
+    @staticmethod
+    def length_upper_bound(seq1: Sequence, seq2: Sequence) -> float:
+        """
+        Upper bound of the similarity percentage from the lengths alone
+        (SequenceMatcher.real_quick_ratio): at most min(len) items can match.
+        """
+        total = len(seq1) + len(seq2)
+        return _ratio_percent(min(len(seq1), len(seq2)), total) if total else 100.0
+
+    @staticmethod
+    def multiset_upper_bound(counts1: Counter, counts2: Counter, total_length: int) -> float:
+        """
+        Upper bound of the similarity percentage from item counts
+        (SequenceMatcher.quick_ratio): every match pairs equal items, so at most the
+        size of the multiset intersection can match, whatever the order.
+        """
+        if not total_length:
+            return 100.0
+        return _ratio_percent(sum((counts1 & counts2).values()), total_length)
+
+    @staticmethod
+    def score_above(code1: str, code2: str, threshold: float, counts1: Optional[Counter] = None) -> Optional[float]:
+        """
+        Return the exact calculate_similarity() score if it is >= threshold, else None.
+
+        Pairs are rejected by progressively tighter upper bounds (length, then
+        character counts) before paying for the full SequenceMatcher alignment. The
+        bounds use the same rounding as the exact score, so no pair that would
+        reach the threshold is ever rejected.
+
+        Args:
+            code1: The first code snippet.
+            code2: The second code snippet.
+            threshold: The similarity percentage to reach.
+            counts1: Optional precomputed Counter(code1), when comparing one snippet against many.
+        """
+        if code1 and code2:
+            if CodeSimilarityAnalyzer.length_upper_bound(code1, code2) < threshold:
+                return None
+            if counts1 is None:
+                counts1 = Counter(code1)
+            if CodeSimilarityAnalyzer.multiset_upper_bound(counts1, Counter(code2), len(code1) + len(code2)) < threshold:
+                return None
+
+        score = CodeSimilarityAnalyzer.calculate_similarity(code1, code2)
+        return score if score >= threshold else None
+
+    @staticmethod
+    def similar_above(code1: str, code2: str, threshold: float) -> bool:
+        """
+        Check whether two code snippets are at least `threshold` percent similar.
+        Equivalent to calculate_similarity(code1, code2) >= threshold, but most
+        dissimilar pairs are rejected without running the alignment.
+
+        Args:
+            code1 (str): The first code snippet.
+            code2 (str): The second code snippet.
+            threshold (float): The flag threshold, as a percentage.
+
+        Returns:
+            bool: True if the similarity percentage is >= threshold.
+        """
+        return CodeSimilarityAnalyzer.score_above(code1, code2, threshold) is not None
+
+    @staticmethod
+    def score_candidates(
+        code: str,
+        candidates: List[Tuple[Hashable, str]],
+        min_similarity: Optional[float] = None
+    ) -> List[Tuple[Hashable, float]]:
+        """
+        Score one submission against several candidates.
+        Picklable by reference, so it can be submitted to a process pool.
+
+        Args:
+            code: The submission to check.
+            candidates: (candidate_id, candidate_code) pairs.
+            min_similarity: If given, only candidates at least this similar are
+                returned, and the others are pruned early via score_above().
+
+        Returns:
+            A list of (candidate_id, similarity_percentage) tuples, in input order.
+        """
+        if min_similarity is None:
+            return [
+                (candidate_id, CodeSimilarityAnalyzer.calculate_similarity(code, candidate_code))
+                for candidate_id, candidate_code in candidates
+            ]
+
+        counts = Counter(code)
+        scored = []
+        for candidate_id, candidate_code in candidates:
+            score = CodeSimilarityAnalyzer.score_above(code, candidate_code, min_similarity, counts)
+            if score is not None:
+                scored.append((candidate_id, score))
+        return scored
+
+
+class FingerprintIndex:
+    """
+    A persistent, per-assessment plagiarism index built on winnowed k-gram
+    fingerprints (the MOSS "winnowing" scheme).
+
+    Every stored submission is reduced once to a small set of fingerprint hashes
+    and registered in an inverted index (fingerprint -> submissions). A query only
+    visits the postings of its own fingerprints to shortlist candidates, and the
+    exact (quadratic) SequenceMatcher score is computed for that shortlist alone,
+    instead of against every past submission of the assessment.
+
+    The analyzer scores the shortlist. An analyzer with its own fingerprint()
+    (TokenSimilarityAnalyzer: token k-gram hashes) also replaces the character
+    winnowing, so candidates are shortlisted on the same representation they
+    are scored on.
+    """
+
+    def __init__(
+        self,
+        k: int = 5,
+        window: int = 4,
+        shortlist_factor: int = 4,
+        common_fraction: float = 0.5,
+        common_min_submissions: int = 20,
+        analyzer=CodeSimilarityAnalyzer
+    ):
+        """
+        Args:
+            k: Length of the character k-grams that get hashed.
+            window: Winnowing window size (in k-grams). Any shared substring of
+                length >= window + k - 1 is guaranteed to share a fingerprint.
+            shortlist_factor: How many candidates per requested result get exact scoring.
+            common_fraction: Fingerprints present in more than this fraction of an
+                assessment's submissions (boilerplate such as a shared function
+                signature) are ignored when shortlisting.
+            common_min_submissions: The boilerplate cut-off is only applied once an
+                assessment holds at least this many submissions.
+            analyzer: The scorer of shortlisted candidates (CodeSimilarityAnalyzer
+                or TokenSimilarityAnalyzer).
+        """
+        self.k = k
+        self.window = window
+        self.shortlist_factor = shortlist_factor
+        self.common_fraction = common_fraction
+        self.common_min_submissions = common_min_submissions
+        self.analyzer = analyzer
+
+        # assessment_id -> submission_id -> source code
+        self._submissions: Dict[Hashable, Dict[Hashable, str]] = {}
+        # assessment_id -> submission_id -> fingerprint hashes
+        self._fingerprints: Dict[Hashable, Dict[Hashable, FrozenSet[int]]] = {}
+        # assessment_id -> fingerprint hash -> submission ids containing it
+        self._postings: Dict[Hashable, Dict[int, Set[Hashable]]] = {}
+
+    def fingerprint(self, code: str) -> FrozenSet[int]:
+        """
+        Compute the winnowed fingerprint set of a code snippet.
+        Whitespace is stripped first so re-indented or re-wrapped copies still match.
+
+        Args:
+            code: The source code to fingerprint.
+
+        Returns:
+            A frozenset of 32-bit k-gram hashes selected by winnowing.
+        """
+        analyzer_fingerprint = getattr(self.analyzer, "fingerprint", None)
+        if analyzer_fingerprint is not None:
+            return analyzer_fingerprint(code)
+
+        normalized = "".join(code.split())
+        if not normalized:
+            return frozenset()
+
+        data = normalized.encode("utf-8")
+        if len(data) <= self.k:
+            return frozenset((zlib.crc32(data),))
+
+        hashes = [zlib.crc32(data[i:i + self.k]) for i in range(len(data) - self.k + 1)]
+        if len(hashes) <= self.window:
+            return frozenset((min(hashes),))
+
+        # Sliding-window minimum with a monotonic deque: O(n) over the k-grams.
+        # Ties keep the rightmost position, as in the original winnowing paper.
+        selected: Set[int] = set()
+        candidates: deque = deque()
+        for i, value in enumerate(hashes):
+            while candidates and hashes[candidates[-1]] >= value:
+                candidates.pop()
+            candidates.append(i)
+            if candidates[0] <= i - self.window:
+                candidates.popleft()
+            if i >= self.window - 1:
+                selected.add(hashes[candidates[0]])
+
+        return frozenset(selected)
+
+    def add_submission(self, assessment_id: Hashable, submission_id: Hashable, code: str) -> None:
+        """
+        Fingerprint a submission and register it under its assessment.
+        Re-adding an existing submission id replaces the previous version.
+
+        Args:
+            assessment_id: The assessment the submission belongs to.
+            submission_id: A unique identifier for the submission (e.g. the attempt id).
+            code: The submitted source code.
+        """
+        self._store(assessment_id, submission_id, code, self.fingerprint(code))
+
+    def remove_submission(self, assessment_id: Hashable, submission_id: Hashable) -> None:
+        """
+        Drop a submission from the index. Unknown ids are ignored.
+        """
+        fingerprints = self._fingerprints.get(assessment_id, {}).pop(submission_id, None)
+        if fingerprints is None:
+            return
+
+        del self._submissions[assessment_id][submission_id]
+        postings = self._postings[assessment_id]
+        for value in fingerprints:
+            holders = postings.get(value)
+            if holders is not None:
+                holders.discard(submission_id)
+                if not holders:
+                    del postings[value]
+
+    def submission_count(self, assessment_id: Hashable) -> int:
+        """Return how many submissions are indexed for an assessment."""
+        return len(self._submissions.get(assessment_id, {}))
+
+    def find_similar(
+        self,
+        code: str,
+        assessment_id: Hashable,
+        top_k: int = 5,
+        exclude: Optional[Hashable] = None,
+        min_similarity: Optional[float] = None
+    ) -> List[Tuple[Hashable, float]]:
+        """
+        Find the past submissions of an assessment that are most similar to `code`.
+
+        Candidates are shortlisted by the number of shared fingerprints and then
+        scored exactly by the index's analyzer.
+
+        Args:
+            code: The submission to check.
+            assessment_id: The assessment whose submissions are searched.
+            top_k: Maximum number of results to return.
+            exclude: Optional submission id to skip (e.g. the submission itself).
+            min_similarity: Optional flag threshold; less similar submissions are
+                pruned early and left out of the results.
+
+        Returns:
+            A list of (submission_id, similarity_percentage) tuples, most similar first.
+        """
+        candidates = self.shortlist(code, assessment_id, top_k, exclude)
+        scored = self.analyzer.score_candidates(code, candidates, min_similarity)
+        return heapq.nlargest(top_k, scored, key=lambda item: item[1])
+
+    def shortlist(
+        self,
+        code: str,
+        assessment_id: Hashable,
+        top_k: Optional[int] = 5,
+        exclude: Optional[Hashable] = None
+    ) -> List[Tuple[Hashable, str]]:
+        """
+        Return the candidates find_similar() would score exactly, without scoring them.
+        Lets callers run the expensive scoring elsewhere (e.g. on a process pool).
+        With top_k=None every submission sharing at least one fingerprint is returned.
+
+        Returns:
+            A list of (submission_id, code) tuples, most shared fingerprints first.
+        """
+        submissions = self._submissions.get(assessment_id)
+        if not submissions or (top_k is not None and top_k <= 0):
+            return []
+
+        postings = self._postings[assessment_id]
+        common_cutoff = len(submissions) + 1
+        if len(submissions) >= self.common_min_submissions:
+            common_cutoff = max(2, int(len(submissions) * self.common_fraction))
+
+        shared_counts: Counter = Counter()
+        for value in self.fingerprint(code):
+            holders = postings.get(value)
+            if holders and len(holders) < common_cutoff:
+                shared_counts.update(holders)
+
+        if exclude is not None:
+            shared_counts.pop(exclude, None)
+
+        return [
+            (submission_id, submissions[submission_id])
+            for submission_id, _ in shared_counts.most_common(None if top_k is None else top_k * self.shortlist_factor)
+        ]
+
+    def save(self, path: str) -> None:
+        """
+        Persist the index (code and fingerprints) to a JSON file.
+        The file is written to a temporary path first and atomically moved into place.
+        """
+        payload = {
+            "k": self.k,
+            "window": self.window,
+            "analyzer": self.analyzer.name,
+            "assessments": [
+                {
+                    "assessment_id": assessment_id,
+                    "submissions": [
+                        {
+                            "submission_id": submission_id,
+                            "code": code,
+                            "fingerprints": sorted(self._fingerprints[assessment_id][submission_id])
+                        }
+                        for submission_id, code in submissions.items()
+                    ]
+                }
+                for assessment_id, submissions in self._submissions.items()
+            ]
+        }
+
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str, **kwargs) -> "FingerprintIndex":
+        """
+        Load an index previously written by save(). Stored fingerprints are reused,
+        so no submission is re-hashed, unless they were computed by another analyzer.
+
+        Args:
+            path: The JSON file to read.
+            **kwargs: Extra constructor options (shortlist_factor, common_fraction, analyzer, ...).
+
+        Returns:
+            The restored FingerprintIndex.
+        """
+        with open(path, "r", encoding="utf-8") as handle:
+            payload = json.load(handle)
+
+        index = cls(k=payload["k"], window=payload["window"], **kwargs)
+        # Files written before analyzers were selectable hold character fingerprints
+        same_analyzer = payload.get("analyzer", CodeSimilarityAnalyzer.name) == index.analyzer.name
+        for assessment in payload["assessments"]:
+            for submission in assessment["submissions"]:
+                if not same_analyzer:
+                    index.add_submission(assessment["assessment_id"], submission["submission_id"], submission["code"])
+                    continue
+                index._store(
+                    assessment["assessment_id"],
+                    submission["submission_id"],
+                    submission["code"],
+                    frozenset(submission["fingerprints"])
+                )
+        return index
+
+    def _store(
+        self,
+        assessment_id: Hashable,
+        submission_id: Hashable,
+        code: str,
+        fingerprints: FrozenSet[int]
+    ) -> None:
+        self.remove_submission(assessment_id, submission_id)
+
+        self._submissions.setdefault(assessment_id, {})[submission_id] = code
+        self._fingerprints.setdefault(assessment_id, {})[submission_id] = fingerprints
+        postings = self._postings.setdefault(assessment_id, {})
+        for value in fingerprints:
+            postings.setdefault(value, set()).add(submission_id)
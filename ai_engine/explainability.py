@@ -1,4 +1,6 @@
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
+
+from ai_engine.risk_weights import RiskContributions, refresh_risk_weights
 
 class ExplainabilityEngine:
     """
@@ -13,7 +15,9 @@ class ExplainabilityEngine:
         code_similarity: float,
         copy_paste_count: int,
         multiple_faces_detected: bool,
-        risk_score: float
+        risk_score: float,
+        contributions: Optional[RiskContributions] = None,
+        absence_timeline: Optional[List[Dict[str, float]]] = None
     ) -> Dict[str, Any]:
         """
         Generate a structured dictionary explaining the contributing factors
@@ -26,17 +30,27 @@ class ExplainabilityEngine:
             copy_paste_count: Number of copy-paste actions.
             multiple_faces_detected: Whether multiple faces were observed.
             risk_score: The final computed risk score.
+            contributions: The per-factor terms from RiskCalculator.calculate_risk_breakdown.
+                Computed from the active risk weights when omitted.
+            absence_timeline: Optional face-absence intervals (BehaviorMonitor.get_absence_timeline),
+                summarized in the face absence factor.
             
         Returns:
             Dict containing total score, contributing factors Breakdown, and a human-readable summary.
         """
-        # Define the individual contributions based on the established formula weights
-        # (This matches the weighting from RiskCalculator)
-        tab_switch_contribution = tab_switch_count * 10
-        face_absent_contribution = face_absent_seconds * 2
-        code_similarity_contribution = round(code_similarity * 0.5, 2)
-        copy_paste_contribution = copy_paste_count * 5
-        multiple_faces_contribution = 25 if multiple_faces_detected else 0
+        # Reuse the contributions the score was computed from, so the explanation
+        # always matches the weighting used by RiskCalculator / RiskService
+        if contributions is None:
+            contributions = refresh_risk_weights().contributions(
+                tab_switch_count, face_absent_seconds, code_similarity, copy_paste_count, multiple_faces_detected
+            )
+
+        # Fractional seconds and weights would otherwise show float artifacts (e.g. 6.6000000000000005)
+        tab_switch_contribution = round(contributions.tab_switches, 2)
+        face_absent_contribution = round(contributions.face_absence, 2)
+        code_similarity_contribution = round(contributions.code_similarity, 2)
+        copy_paste_contribution = round(contributions.copy_paste, 2)
+        multiple_faces_contribution = round(contributions.multiple_faces, 2)
 
         contributing_factors = {}
         explanations = []
@@ -53,7 +67,16 @@ class ExplainabilityEngine:
                 "seconds": face_absent_seconds,
                 "risk_contribution": face_absent_contribution
             }
-            explanations.append(f"Face absent for {face_absent_seconds} seconds (+{face_absent_contribution} risk).")
+            if absence_timeline:
+                longest = max(interval["seconds"] for interval in absence_timeline)
+                contributing_factors["face_absence"]["intervals"] = len(absence_timeline)
+                contributing_factors["face_absence"]["longest_seconds"] = longest
+                explanations.append(
+                    f"Face absent for {face_absent_seconds} seconds across {len(absence_timeline)} intervals, "
+                    f"longest {longest} seconds (+{face_absent_contribution} risk)."
+                )
+            else:
+                explanations.append(f"Face absent for {face_absent_seconds} seconds (+{face_absent_contribution} risk).")
 
         if code_similarity > 0.0:
             contributing_factors["code_similarity"] = {
@@ -0,0 +1,237 @@
+import threading
+import time
+from array import array
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+import numpy as np
+
+from ai_engine.behavior_monitor import absence_timeline
+
+
+def _recent_overlap(log: Optional[array], window_start: float, window_end: float) -> float:
+    # Walk a flat [start, end, ...] log backwards: "last N seconds" windows only touch the newest intervals
+    overlap = 0.0
+    if log:
+        for index in range(len(log) - 2, -1, -2):
+            start, end = log[index], log[index + 1]
+            if end <= window_start:
+                break
+            if start < window_end:
+                overlap += min(end, window_end) - max(start, window_start)
+    return overlap
+
+
+class MonitoredAttempt:
+    """
+    A BehaviorMonitor-compatible handle on one attempt of a MonitorRegistry,
+    so a registry-backed attempt can be fed by a VisionFrameProcessor.
+    """
+
+    __slots__ = ("registry", "attempt_id")
+
+    def __init__(self, registry: "MonitorRegistry", attempt_id: Hashable):
+        self.registry = registry
+        self.attempt_id = attempt_id
+
+    def update_face_status(self, face_present: bool, timestamp: Optional[float] = None) -> None:
+        self.registry.update_face_status(self.attempt_id, face_present, timestamp)
+
+    def update_multiple_faces(self, status: bool) -> None:
+        self.registry.update_multiple_faces(self.attempt_id, status)
+
+    def get_behavior_summary(self) -> Dict[str, Any]:
+        return self.registry.get_behavior_summary(self.attempt_id)
+
+
+class MonitorRegistry:
+    """
+    Behavior monitoring state for every live attempt, stored as a struct of arrays.
+
+    Each attempt owns one slot (row) of a set of numpy columns (face flags,
+    absence totals, start of the current absence, ...), found in O(1) through an
+    attempt id -> slot dict. A live attempt therefore costs a few dozen bytes of
+    column storage instead of a Python object per monitor, dashboards read whole
+    columns at once, and evicted slots are recycled through a free list. Interval
+    logs are only allocated for attempts that were actually absent.
+
+    Semantics match BehaviorMonitor (monotonic clock, fractional seconds).
+    """
+
+    def __init__(self, capacity: int = 1024, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            capacity: Initial number of slots; the columns double when full.
+            clock: Source of timestamps in seconds. Must be monotonic.
+        """
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._slots: Dict[Hashable, int] = {}
+        self._slot_ids: List[Optional[Hashable]] = []
+        # Slots below the high-water mark that were freed by evict()
+        self._free: List[int] = []
+        self._high_water = 0
+        # Closed absences of attempts that had at least one, as one flat
+        # [start0, end0, start1, end1, ...] array per slot
+        self._intervals: Dict[int, array] = {}
+        self._allocate(max(1, capacity))
+
+    def _allocate(self, capacity: int) -> None:
+        old_capacity = len(self._slot_ids)
+        columns = {
+            "live": np.bool_,
+            "face_detected": np.bool_,
+            "multiple_faces": np.bool_,
+            "started_at": np.float64,
+            "absent_seconds": np.float64,
+            "absence_started_at": np.float64,
+            "absence_count": np.int32,
+        }
+        for name, dtype in columns.items():
+            grown = np.zeros(capacity, dtype=dtype)
+            if old_capacity:
+                grown[:old_capacity] = getattr(self, f"_{name}")
+            setattr(self, f"_{name}", grown)
+        self._slot_ids.extend([None] * (capacity - old_capacity))
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, attempt_id: Hashable) -> bool:
+        return attempt_id in self._slots
+
+    def add(self, attempt_id: Hashable, started_at: Optional[float] = None) -> MonitoredAttempt:
+        """Start monitoring an attempt (no-op if it is already tracked) and return its handle."""
+        with self._lock:
+            if attempt_id not in self._slots:
+                if self._free:
+                    slot = self._free.pop()
+                else:
+                    if self._high_water == len(self._slot_ids):
+                        self._allocate(len(self._slot_ids) * 2)
+                    slot = self._high_water
+                    self._high_water += 1
+                self._slots[attempt_id] = slot
+                self._slot_ids[slot] = attempt_id
+                self._live[slot] = True
+                self._face_detected[slot] = True
+                self._multiple_faces[slot] = False
+                self._started_at[slot] = self._clock() if started_at is None else started_at
+                self._absent_seconds[slot] = 0.0
+                self._absence_started_at[slot] = 0.0
+                self._absence_count[slot] = 0
+        return MonitoredAttempt(self, attempt_id)
+
+    def update_face_status(self, attempt_id: Hashable, face_present: bool, timestamp: Optional[float] = None) -> None:
+        """Same as BehaviorMonitor.update_face_status, for one tracked attempt."""
+        with self._lock:
+            slot = self._slots[attempt_id]
+            if bool(self._face_detected[slot]) == face_present:
+                return
+            now = self._clock() if timestamp is None else timestamp
+            if not face_present:
+                self._absence_started_at[slot] = now
+            else:
+                start = float(self._absence_started_at[slot])
+                now = max(now, start)
+                log = self._intervals.get(slot)
+                if log is None:
+                    log = self._intervals[slot] = array("d")
+                log.append(start)
+                log.append(now)
+                self._absent_seconds[slot] += now - start
+                self._absence_count[slot] += 1
+            self._face_detected[slot] = face_present
+
+    def update_multiple_faces(self, attempt_id: Hashable, status: bool) -> None:
+        if status:
+            with self._lock:
+                self._multiple_faces[self._slots[attempt_id]] = True
+
+    def get_behavior_summary(self, attempt_id: Hashable, now: Optional[float] = None) -> Dict[str, Any]:
+        """Same as BehaviorMonitor.get_behavior_summary, for one tracked attempt."""
+        with self._lock:
+            return self._summary(self._slots[attempt_id], self._clock() if now is None else now)
+
+    def absence_in_last(self, attempt_id: Hashable, seconds: float, now: Optional[float] = None) -> float:
+        """Same as BehaviorMonitor.absence_in_last, for one tracked attempt."""
+        now = self._clock() if now is None else now
+        with self._lock:
+            slot = self._slots[attempt_id]
+            absent = _recent_overlap(self._intervals.get(slot), now - seconds, now)
+            open_since = float(self._absence_started_at[slot])
+            if not self._face_detected[slot] and open_since < now:
+                absent += max(0.0, now - max(open_since, now - seconds))
+            return absent
+
+    def get_absence_timeline(self, attempt_id: Hashable, now: Optional[float] = None) -> List[Dict[str, float]]:
+        """Same as BehaviorMonitor.get_absence_timeline, for one tracked attempt."""
+        now = self._clock() if now is None else now
+        with self._lock:
+            slot = self._slots[attempt_id]
+            log = self._intervals.get(slot)
+            open_since = None if self._face_detected[slot] else float(self._absence_started_at[slot])
+            starts, ends = (log[0::2], log[1::2]) if log else (None, None)
+            return absence_timeline(starts, ends, float(self._started_at[slot]), open_since, now)
+
+    def snapshot(self, now: Optional[float] = None) -> Dict[str, np.ndarray]:
+        """
+        Return the current state of every live attempt as aligned column arrays
+        (copies), with ongoing absences counted up to `now`.
+        """
+        now = self._clock() if now is None else now
+        with self._lock:
+            slots = np.flatnonzero(self._live)
+            face_detected = self._face_detected[slots]
+            absent = self._absent_seconds[slots] + np.where(
+                face_detected, 0.0, np.maximum(now - self._absence_started_at[slots], 0.0)
+            )
+            return {
+                "attempt_ids": np.array([self._slot_ids[slot] for slot in slots], dtype=object),
+                "face_detected": face_detected,
+                "multiple_faces_detected": self._multiple_faces[slots],
+                "total_absent_seconds": absent,
+                "absence_count": self._absence_count[slots] + ~face_detected,
+            }
+
+    def summary(self, now: Optional[float] = None) -> Dict[str, Any]:
+        """Aggregate figures over all live attempts, for proctoring dashboards."""
+        columns = self.snapshot(now)
+        live = len(columns["attempt_ids"])
+        absent = columns["total_absent_seconds"]
+        return {
+            "live_attempts": live,
+            "currently_absent": int(live - columns["face_detected"].sum()),
+            "multiple_faces_detected": int(columns["multiple_faces_detected"].sum()),
+            "mean_absent_seconds": round(float(absent.mean()), 3) if live else 0.0,
+            "max_absent_seconds": round(float(absent.max()), 3) if live else 0.0
+        }
+
+    def evict(self, attempt_id: Hashable, now: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Stop tracking a finished attempt and free its slot.
+
+        Returns:
+            Its final behavior summary, or None if it was not tracked.
+        """
+        with self._lock:
+            slot = self._slots.pop(attempt_id, None)
+            if slot is None:
+                return None
+            final = self._summary(slot, self._clock() if now is None else now)
+            self._live[slot] = False
+            self._slot_ids[slot] = None
+            self._intervals.pop(slot, None)
+            self._free.append(slot)
+            return final
+
+    def _summary(self, slot: int, now: float) -> Dict[str, Any]:
+        face_detected = bool(self._face_detected[slot])
+        absent = float(self._absent_seconds[slot])
+        if not face_detected:
+            absent += max(0.0, now - float(self._absence_started_at[slot]))
+        return {
+            "is_currently_detected": face_detected,
+            "total_absent_seconds": round(absent, 3),
+            "absence_count": int(self._absence_count[slot]) + (0 if face_detected else 1),
+            "multiple_faces_detected": bool(self._multiple_faces[slot])
+        }
@@ -0,0 +1,280 @@
+import heapq
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ai_engine.code_similarity import FingerprintIndex
+from ai_engine.explainability import ExplainabilityEngine
+from ai_engine.report_generator import ReportGenerator
+from ai_engine.risk_calculator import RiskCalculator
+from ai_engine.skill_analyzer import SkillAnalyzer
+from ai_engine.trust_score_updater import TrustUpdater
+
+STAGES = ("skills", "similarity", "risk", "trust", "explanation", "report")
+
+
+class FinishedAttempt:
+    """The inputs needed to finalize one attempt."""
+
+    __slots__ = (
+        "attempt_id",
+        "user_id",
+        "assessment_id",
+        "code",
+        "time_taken",
+        "test_cases_passed",
+        "total_test_cases",
+        "final_score",
+        "old_trust_score",
+        "tab_switch_count",
+        "face_absent_seconds",
+        "copy_paste_count",
+        "multiple_faces_detected",
+        "code_similarity",
+        "similar_submission_id",
+        "absence_timeline",
+        "finished_at",
+    )
+
+    def __init__(
+        self,
+        attempt_id: Any,
+        user_id: Any,
+        assessment_id: Any,
+        code: str,
+        time_taken: int,
+        test_cases_passed: int,
+        total_test_cases: int,
+        final_score: float,
+        old_trust_score: float,
+        tab_switch_count: int = 0,
+        face_absent_seconds: float = 0,
+        copy_paste_count: int = 0,
+        multiple_faces_detected: bool = False,
+        code_similarity: Optional[float] = None,
+        similar_submission_id: Any = None,
+        absence_timeline: Optional[List[Dict[str, float]]] = None,
+        finished_at: Optional[datetime] = None
+    ):
+        """
+        code_similarity / similar_submission_id may be supplied when similarity was
+        already scored elsewhere (e.g. by a similarity job); the pipeline then only
+        indexes the submission instead of scoring it again. absence_timeline
+        (BehaviorMonitor.get_absence_timeline) is passed on to the explanation and report,
+        and finished_at is stamped on the report so that it is reproducible.
+        """
+        self.attempt_id = attempt_id
+        self.user_id = user_id
+        self.assessment_id = assessment_id
+        self.code = code
+        self.time_taken = time_taken
+        self.test_cases_passed = test_cases_passed
+        self.total_test_cases = total_test_cases
+        self.final_score = final_score
+        self.old_trust_score = old_trust_score
+        self.tab_switch_count = tab_switch_count
+        self.face_absent_seconds = face_absent_seconds
+        self.copy_paste_count = copy_paste_count
+        self.multiple_faces_detected = multiple_faces_detected
+        self.code_similarity = code_similarity
+        self.similar_submission_id = similar_submission_id
+        self.absence_timeline = absence_timeline
+        self.finished_at = finished_at
+
+
+class FinalizedAttempt:
+    """Every intermediate and final output of the pipeline for one attempt."""
+
+    __slots__ = (
+        "attempt",
+        "skill_scores",
+        "code_similarity",
+        "similar_submission_id",
+        "risk_contributions",
+        "risk_score",
+        "new_trust_score",
+        "explanation",
+        "report",
+        "report_json",
+        "report_hash",
+        "stage_seconds",
+    )
+
+    def __init__(self, attempt: FinishedAttempt):
+        self.attempt = attempt
+        self.skill_scores: Dict[str, float] = {}
+        self.code_similarity: float = 0.0
+        self.similar_submission_id: Any = None
+        self.risk_contributions = None
+        self.risk_score: float = 0.0
+        self.new_trust_score: float = attempt.old_trust_score
+        self.explanation: Dict[str, Any] = {}
+        self.report: Dict[str, Any] = {}
+        self.report_json: bytes = b""
+        self.report_hash: str = ""
+        self.stage_seconds: Dict[str, float] = {}
+
+
+class AttemptFinalizationPipeline:
+    """
+    Runs the whole ai_engine chain once per finished attempt:
+    SkillAnalyzer -> code similarity (the index's analyzer) -> RiskCalculator -> TrustUpdater
+    -> ExplainabilityEngine -> ReportGenerator.
+
+    Each stage runs exactly once and hands its output to the later stages
+    (e.g. the risk contributions feed both the score and the explanation).
+    Batches and streams are processed on a worker pool, and the time spent in
+    every stage is accumulated for monitoring.
+    """
+
+    def __init__(
+        self,
+        similarity_index: Optional[FingerprintIndex] = None,
+        max_workers: int = 4,
+        max_in_flight: int = 256
+    ):
+        """
+        Args:
+            similarity_index: Past submissions to check for plagiarism. Each finalized
+                submission is added to it. A private, empty index is used when omitted.
+            max_workers: Size of the worker pool used by run_batch() / stream().
+            max_in_flight: Maximum number of attempts submitted to the pool at once by stream().
+        """
+        self.similarity_index = similarity_index if similarity_index is not None else FingerprintIndex()
+        self.max_workers = max_workers
+        self.max_in_flight = max_in_flight
+
+        self._index_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._stage_totals: Dict[str, float] = {stage: 0.0 for stage in STAGES}
+        self._processed = 0
+
+    def finalize(self, attempt: FinishedAttempt) -> FinalizedAttempt:
+        """Run every stage for a single attempt on the calling thread."""
+        result = FinalizedAttempt(attempt)
+        timings = result.stage_seconds
+
+        started = time.perf_counter()
+        result.skill_scores = SkillAnalyzer.analyze_submission(
+            attempt.time_taken, len(attempt.code), attempt.test_cases_passed, attempt.total_test_cases
+        )
+        timings["skills"] = _lap(started)
+
+        started = time.perf_counter()
+        # Only the index lookup and update hold the lock: exact scoring is the most
+        # CPU-heavy stage and runs on the shortlisted snapshot, concurrently with other workers
+        with self._index_lock:
+            candidates = []
+            if attempt.code_similarity is None:
+                candidates = self.similarity_index.shortlist(
+                    attempt.code, attempt.assessment_id, top_k=1, exclude=attempt.attempt_id
+                )
+            self.similarity_index.add_submission(attempt.assessment_id, attempt.attempt_id, attempt.code)
+        matches = heapq.nlargest(1, self.similarity_index.analyzer.score_candidates(attempt.code, candidates), key=lambda item: item[1])
+        if attempt.code_similarity is not None:
+            result.similar_submission_id, result.code_similarity = attempt.similar_submission_id, attempt.code_similarity
+        elif matches:
+            result.similar_submission_id, result.code_similarity = matches[0]
+        timings["similarity"] = _lap(started)
+
+        started = time.perf_counter()
+        contributions = RiskCalculator.calculate_risk_breakdown(
+            attempt.tab_switch_count,
+            attempt.face_absent_seconds,
+            result.code_similarity,
+            attempt.copy_paste_count,
+            attempt.multiple_faces_detected
+        )
+        result.risk_contributions = contributions
+        result.risk_score = contributions.score
+        timings["risk"] = _lap(started)
+
+        started = time.perf_counter()
+        result.new_trust_score = TrustUpdater.update_trust_score(attempt.old_trust_score, result.risk_score)
+        timings["trust"] = _lap(started)
+
+        started = time.perf_counter()
+        result.explanation = ExplainabilityEngine.generate_risk_explanation(
+            attempt.tab_switch_count,
+            attempt.face_absent_seconds,
+            result.code_similarity,
+            attempt.copy_paste_count,
+            attempt.multiple_faces_detected,
+            result.risk_score,
+            contributions,
+            attempt.absence_timeline
+        )
+        timings["explanation"] = _lap(started)
+
+        started = time.perf_counter()
+        result.report = ReportGenerator.generate_final_report(
+            attempt.user_id,
+            attempt.final_score,
+            result.risk_score,
+            attempt.old_trust_score,
+            result.new_trust_score,
+            result.skill_scores,
+            result.explanation,
+            attempt.absence_timeline,
+            attempt.finished_at
+        )
+        result.report_json, result.report_hash = ReportGenerator.serialize_report(result.report)
+        timings["report"] = _lap(started)
+
+        with self._stats_lock:
+            self._processed += 1
+            for stage, seconds in timings.items():
+                self._stage_totals[stage] += seconds
+
+        return result
+
+    def similarity_candidates(
+        self,
+        code: str,
+        assessment_id: Any,
+        top_k: Optional[int] = 1,
+        exclude: Any = None
+    ) -> List[Tuple[Any, str]]:
+        """Return the (submission_id, code) pairs the similarity stage would score for `code`."""
+        with self._index_lock:
+            return self.similarity_index.shortlist(code, assessment_id, top_k, exclude)
+
+    def run_batch(self, attempts: Iterable[FinishedAttempt]) -> List[FinalizedAttempt]:
+        """Finalize a batch on the worker pool, returning results in input order."""
+        return list(self.stream(attempts))
+
+    def stream(self, attempts: Iterable[FinishedAttempt]) -> Iterator[FinalizedAttempt]:
+        """
+        Finalize a (possibly unbounded) stream of attempts on the worker pool,
+        yielding results in input order with at most `max_in_flight` pending.
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="attempt-finalizer") as pool:
+            pending = []
+            for attempt in attempts:
+                pending.append(pool.submit(self.finalize, attempt))
+                if len(pending) >= self.max_in_flight:
+                    yield pending.pop(0).result()
+            for future in pending:
+                yield future.result()
+
+    def get_stage_timings(self) -> Dict[str, Any]:
+        """Return the number of attempts processed and total / mean milliseconds per stage."""
+        with self._stats_lock:
+            processed = self._processed
+            totals = dict(self._stage_totals)
+        return {
+            "processed": processed,
+            "stages": {
+                stage: {
+                    "total_ms": round(seconds * 1000.0, 3),
+                    "mean_ms": round(seconds * 1000.0 / processed, 3) if processed else 0.0
+                }
+                for stage, seconds in totals.items()
+            }
+        }
+
+
+def _lap(started: float) -> float:
+    return time.perf_counter() - started
@@ -1,6 +1,11 @@
-from typing import Any, Dict
+import hashlib
+import json
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
 
+# Reports at or above this risk score are flagged for mandatory review
+MANDATORY_REVIEW_RISK_THRESHOLD = 50.0
+
 class ReportGenerator:
     """
     A service class configured to generate structured, human-readable 
@@ -16,7 +21,9 @@ class ReportGenerator:
         old_trust_score: float,
         new_trust_score: float,
         skill_scores: Dict[str, float],
-        explanation: Dict[str, Any]
+        explanation: Dict[str, Any],
+        absence_timeline: Optional[List[Dict[str, float]]] = None,
+        generated_at: Optional[datetime] = None
     ) -> Dict[str, Any]:
         """
         Aggregate all metrics from an assessment into a cohesive JSON-style 
@@ -30,6 +37,10 @@ class ReportGenerator:
             new_trust_score: The user's updated trust score.
             skill_scores: The dictionary output of SkillAnalyzer (logic, efficiency, problem solving).
             explanation: The dictionary output of ExplainabilityEngine.
+            absence_timeline: Optional face-absence intervals (BehaviorMonitor.get_absence_timeline),
+                included as the report's behavior timeline.
+            generated_at: Timestamp stamped on the report (defaults to now). Pass the
+                attempt's end time to make the report a pure function of its inputs.
             
         Returns:
             A structured report dictionary.
@@ -40,12 +51,12 @@ class ReportGenerator:
         change_direction = "decreased" if trust_score_change < 0 else "increased" if trust_score_change > 0 else "unchanged"
 
         # Determine overall flag status for admin dashboard
-        needs_review = risk_score >= 50.0  # Threshold can be configured later
+        needs_review = risk_score >= MANDATORY_REVIEW_RISK_THRESHOLD
 
         report = {
             "metadata": {
                 "user_id": user_id,
-                "generated_at": datetime.utcnow().isoformat() + "Z",
+                "generated_at": (generated_at or datetime.utcnow()).isoformat() + "Z",
                 "needs_mandatory_review": needs_review
             },
             "summary": {
@@ -70,5 +81,29 @@ class ReportGenerator:
                 "trend": change_direction
             }
         }
+
+        if absence_timeline is not None:
+            report["behavior_timeline"] = {"face_absence": absence_timeline}
         
         return report
+
+    @staticmethod
+    def serialize_report(report: Dict[str, Any]) -> Tuple[bytes, str]:
+        """
+        Encode a report in canonical JSON (sorted keys, no insignificant whitespace,
+        UTF-8) so equal reports always produce identical bytes, and hash it.
+
+        Always the standard library encoder: faster encoders format some floats
+        differently (1e16 vs 1e+16), and stored hashes / ETags must not depend on
+        which packages are installed.
+
+        Returns:
+            Tuple of the encoded bytes and their SHA-256 hex digest (usable as an ETag).
+
+        Raises:
+            ValueError: If the report holds NaN or infinity (not valid JSON).
+        """
+        payload = json.dumps(
+            report, sort_keys=True, separators=(",", ":"), ensure_ascii=False, allow_nan=False
+        ).encode("utf-8")
+        return payload, hashlib.sha256(payload).hexdigest()
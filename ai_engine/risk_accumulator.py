@@ -0,0 +1,151 @@
+import math
+from typing import Any, Dict, Iterable, Optional
+
+from ai_engine.risk_weights import RiskContributions, RiskWeights, get_risk_weights
+
+# BehaviorLog.event_type values understood by the accumulator
+EVENT_TAB_SWITCH = "tab_switch"
+EVENT_FACE_MISSING = "face_missing"
+EVENT_COPY_PASTE = "copy_paste"
+EVENT_MULTIPLE_FACES = "multiple_faces"
+
+BEHAVIOR_EVENT_TYPES = (EVENT_TAB_SWITCH, EVENT_FACE_MISSING, EVENT_COPY_PASTE, EVENT_MULTIPLE_FACES)
+
+
+class RiskAccumulator:
+    """
+    A running, per-attempt risk tally fed by behavior events as they arrive.
+
+    Each event updates the aggregate counts and the partial (uncapped) risk in O(1),
+    so the live risk score can be read at any moment during the exam and
+    finalizing the attempt never has to rescan its BehaviorLog rows.
+
+    Event semantics follow the BehaviorLog model:
+    - tab_switch / copy_paste: one occurrence per event.
+    - face_missing: severity_score holds the seconds the face was absent.
+    - multiple_faces: sets the (one-off) multiple faces flag.
+    """
+
+    __slots__ = (
+        "attempt_id",
+        "tab_switch_count",
+        "face_absent_seconds",
+        "copy_paste_count",
+        "multiple_faces_detected",
+        "event_count",
+        "_partial_risk",
+        "_weights",
+    )
+
+    def __init__(self, attempt_id: Any = None):
+        self.attempt_id = attempt_id
+        self.tab_switch_count: int = 0
+        self.face_absent_seconds: float = 0.0
+        self.copy_paste_count: int = 0
+        self.multiple_faces_detected: bool = False
+        self.event_count: int = 0
+
+        # Running sum of the weighted terms (excluding code similarity, known only at submission)
+        self._partial_risk: float = 0.0
+        self._weights: RiskWeights = get_risk_weights()
+
+    @classmethod
+    def from_behavior_logs(cls, attempt_id: Any, logs: Iterable[Any]) -> "RiskAccumulator":
+        """
+        Rebuild an accumulator from stored BehaviorLog rows (e.g. after a restart).
+
+        Args:
+            attempt_id: The attempt the logs belong to.
+            logs: Objects exposing `event_type` and `severity_score` attributes.
+        """
+        accumulator = cls(attempt_id)
+        for log in logs:
+            accumulator.apply_event(log.event_type, log.severity_score)
+        return accumulator
+
+    def apply_event(self, event_type: str, severity_score: Optional[float] = None) -> bool:
+        """
+        Fold one behavior event into the running totals.
+
+        Args:
+            event_type: One of tab_switch, face_missing, copy_paste, multiple_faces.
+            severity_score: Seconds of absence for face_missing events; ignored otherwise.
+
+        Returns:
+            bool: True if the event changed the accumulated state, False for unknown event types.
+        """
+        self._sync_weights()
+        weights = self._weights
+
+        if event_type == EVENT_TAB_SWITCH:
+            self.tab_switch_count += 1
+            self._partial_risk += weights.tab_switch_weight
+        elif event_type == EVENT_FACE_MISSING:
+            seconds = float(severity_score or 0.0)
+            # Negative, NaN or infinite durations (e.g. bad rows already stored) count as no absence
+            seconds = seconds if math.isfinite(seconds) and seconds > 0 else 0.0
+            self.face_absent_seconds += seconds
+            self._partial_risk += seconds * weights.face_absent_weight
+        elif event_type == EVENT_COPY_PASTE:
+            self.copy_paste_count += 1
+            self._partial_risk += weights.copy_paste_weight
+        elif event_type == EVENT_MULTIPLE_FACES:
+            if self.multiple_faces_detected:
+                self.event_count += 1
+                return False
+            self.multiple_faces_detected = True
+            self._partial_risk += weights.multiple_faces_penalty
+        else:
+            return False
+
+        self.event_count += 1
+        return True
+
+    @property
+    def live_risk_score(self) -> float:
+        """The capped risk score from the behavior seen so far (code similarity not included)."""
+        self._sync_weights()
+        return float(min(max(self._partial_risk, 0.0), self._weights.max_risk_score))
+
+    def finalize(self, code_similarity: float = 0.0) -> RiskContributions:
+        """
+        Produce the final risk breakdown once the submission's code similarity is known.
+        The result is identical to RiskCalculator.calculate_risk_breakdown on the same totals.
+
+        Args:
+            code_similarity: Percentage of code similarity for the submission (0.0 - 100.0).
+
+        Returns:
+            RiskContributions: The per-factor contributions and the final capped score.
+        """
+        return get_risk_weights().contributions(
+            self.tab_switch_count,
+            self.face_absent_seconds,
+            code_similarity,
+            self.copy_paste_count,
+            self.multiple_faces_detected
+        )
+
+    def get_behavior_summary(self) -> Dict[str, Any]:
+        """Return the aggregate counts in the shape expected by RiskCalculator / ExplainabilityEngine."""
+        return {
+            "tab_switch_count": self.tab_switch_count,
+            "face_absent_seconds": self.face_absent_seconds,
+            "copy_paste_count": self.copy_paste_count,
+            "multiple_faces_detected": self.multiple_faces_detected,
+            "live_risk_score": self.live_risk_score,
+            "event_count": self.event_count
+        }
+
+    def _sync_weights(self) -> None:
+        # Weights were hot-reloaded: re-derive the partial sum from the counts (still O(1))
+        weights = get_risk_weights()
+        if weights is self._weights:
+            return
+        self._weights = weights
+        self._partial_risk = (
+            self.tab_switch_count * weights.tab_switch_weight
+            + self.face_absent_seconds * weights.face_absent_weight
+            + self.copy_paste_count * weights.copy_paste_weight
+            + (weights.multiple_faces_penalty if self.multiple_faces_detected else 0)
+        )
@@ -1,7 +1,18 @@
+from typing import Optional
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from ai_engine.risk_weights import RiskContributions, refresh_risk_weights
+
+
 class RiskCalculator:
     """
     A service class responsible for calculating trust risk scores
     based on various behavioral metrics gathered during an assessment.
+
+    The formula weights come from the shared RiskWeights model
+    (see ai_engine/risk_weights.py).
     """
 
     @staticmethod
@@ -26,24 +37,71 @@ class RiskCalculator:
         Returns:
             float: The calculated risk score, capped between 0 and 100.
         """
-        # Define the weight multipliers for the risk formula
-        TAB_SWITCH_WEIGHT = 10
-        FACE_ABSENT_WEIGHT = 2
-        CODE_SIMILARITY_WEIGHT = 0.5
-        COPY_PASTE_WEIGHT = 5
-        MULTIPLE_FACES_PENALTY = 25
-
-        # Calculate the base score using the given formula
-        base_risk = (tab_switch_count * TAB_SWITCH_WEIGHT) + \
-                    (face_absent_seconds * FACE_ABSENT_WEIGHT) + \
-                    (code_similarity * CODE_SIMILARITY_WEIGHT) + \
-                    (copy_paste_count * COPY_PASTE_WEIGHT)
-
-        # Apply flat penalty if multiple faces are detected
-        if multiple_faces_detected:
-            base_risk += MULTIPLE_FACES_PENALTY
-
-        # Cap the risk score at a maximum of 100.0, and a minimum of 0.0
-        final_risk_score = min(max(base_risk, 0.0), 100.0)
-
-        return float(final_risk_score)
+        return RiskCalculator.calculate_risk_breakdown(
+            tab_switch_count, face_absent_seconds, code_similarity, copy_paste_count, multiple_faces_detected
+        ).score
+
+    @staticmethod
+    def calculate_risk_breakdown(
+        tab_switch_count: int = 0,
+        face_absent_seconds: int = 0,
+        code_similarity: float = 0.0,
+        copy_paste_count: int = 0,
+        multiple_faces_detected: bool = False
+    ) -> RiskContributions:
+        """
+        Calculate the per-factor risk contributions together with the final score.
+        Pass the result to ExplainabilityEngine.generate_risk_explanation so the
+        terms are not computed a second time.
+
+        Returns:
+            RiskContributions: The contribution of each factor and the capped score.
+        """
+        return refresh_risk_weights().contributions(
+            tab_switch_count, face_absent_seconds, code_similarity, copy_paste_count, multiple_faces_detected
+        )
+
+    @staticmethod
+    def calculate_risk_scores_batch(
+        tab_switch_counts: ArrayLike,
+        face_absent_seconds: ArrayLike,
+        code_similarities: ArrayLike,
+        copy_paste_counts: Optional[ArrayLike] = None,
+        multiple_faces_detected: Optional[ArrayLike] = None
+    ) -> np.ndarray:
+        """
+        Vectorized version of calculate_risk_score over column arrays of attempts.
+        Every element gives exactly the same value as the scalar path for the same inputs.
+
+        Args:
+            tab_switch_counts: Tab switch count per attempt.
+            face_absent_seconds: Seconds of face absence per attempt.
+            code_similarities: Code similarity percentage per attempt (0.0 - 100.0).
+            copy_paste_counts: Copy-paste count per attempt. Defaults to all zeros.
+            multiple_faces_detected: Boolean flag per attempt. Defaults to all False.
+
+        Returns:
+            np.ndarray: A float64 array of risk scores, each capped between 0 and 100.
+        """
+        weights = refresh_risk_weights()
+
+        tab_switches = np.asarray(tab_switch_counts, dtype=np.float64)
+        absent = np.asarray(face_absent_seconds, dtype=np.float64)
+        similarity = np.asarray(code_similarities, dtype=np.float64)
+        copy_paste = np.zeros_like(tab_switches) if copy_paste_counts is None \
+            else np.asarray(copy_paste_counts, dtype=np.float64)
+        multiple_faces = np.zeros(tab_switches.shape, dtype=bool) if multiple_faces_detected is None \
+            else np.asarray(multiple_faces_detected, dtype=bool)
+
+        # Same left-to-right order of operations as the scalar formula, so the
+        # float64 rounding matches element for element.
+        base_risk = tab_switches * weights.tab_switch_weight
+        base_risk += absent * weights.face_absent_weight
+        base_risk += similarity * weights.code_similarity_weight
+        base_risk += copy_paste * weights.copy_paste_weight
+
+        # Apply flat penalty where multiple faces were detected
+        base_risk = np.where(multiple_faces, base_risk + weights.multiple_faces_penalty, base_risk)
+
+        # Cap the risk score at the configured maximum, and a minimum of 0.0
+        return np.clip(base_risk, 0.0, weights.max_risk_score)
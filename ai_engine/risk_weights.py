@@ -0,0 +1,208 @@
+import math
+from typing import Any, Callable, Dict, Mapping, Optional
+
+_WEIGHT_FIELDS = (
+    "tab_switch_weight",
+    "face_absent_weight",
+    "code_similarity_weight",
+    "copy_paste_weight",
+    "multiple_faces_penalty",
+    "max_risk_score",
+)
+
+
+def _weight_value(name: str, value: Any):
+    """
+    Coerce a configured weight (a number, or a string from the environment or a
+    file) to a finite number, keeping whole numbers as int (e.g. '+10 risk', not '+10.0 risk').
+
+    Raises:
+        ValueError: If the value is not a finite number.
+    """
+    try:
+        if isinstance(value, bool):
+            raise TypeError(value)
+        parsed = float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Risk weight {name} must be a number, got {value!r}") from None
+    if not math.isfinite(parsed):
+        raise ValueError(f"Risk weight {name} must be finite, got {value!r}")
+    return int(parsed) if parsed.is_integer() else parsed
+
+
+class RiskContributions:
+    """
+    The per-factor contributions of one attempt to its risk score.
+    Computed once by RiskWeights.contributions() and shared by the score
+    (RiskCalculator / RiskService) and the explanation (ExplainabilityEngine).
+    """
+
+    __slots__ = (
+        "tab_switches",
+        "face_absence",
+        "code_similarity",
+        "copy_paste",
+        "multiple_faces",
+        "raw_total",
+        "score",
+    )
+
+    def __init__(
+        self,
+        tab_switches: float,
+        face_absence: float,
+        code_similarity: float,
+        copy_paste: float,
+        multiple_faces: float,
+        raw_total: float,
+        score: float
+    ):
+        for name, value in zip(self.__slots__, (
+            tab_switches, face_absence, code_similarity, copy_paste, multiple_faces, raw_total, score
+        )):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("RiskContributions is immutable")
+
+    def __reduce__(self):
+        return (RiskContributions, tuple(getattr(self, name) for name in self.__slots__))
+
+    def as_dict(self) -> Dict[str, float]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class RiskWeights:
+    """
+    An immutable set of risk formula weights.
+
+    This is the single source of truth for the risk formula: RiskCalculator,
+    the backend RiskService and ExplainabilityEngine all read the active
+    instance through get_risk_weights(). Replacing it with set_risk_weights()
+    is a single reference swap, so new weights take effect without a restart.
+    """
+
+    __slots__ = _WEIGHT_FIELDS
+
+    def __init__(
+        self,
+        tab_switch_weight: float = 10,
+        face_absent_weight: float = 2,
+        code_similarity_weight: float = 0.5,
+        copy_paste_weight: float = 5,
+        multiple_faces_penalty: float = 25,
+        max_risk_score: float = 100.0
+    ):
+        for name, value in zip(_WEIGHT_FIELDS, (
+            tab_switch_weight, face_absent_weight, code_similarity_weight,
+            copy_paste_weight, multiple_faces_penalty, max_risk_score
+        )):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("RiskWeights is immutable; build a new instance and call set_risk_weights()")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RiskWeights):
+            return NotImplemented
+        return self.as_dict() == other.as_dict()
+
+    def __hash__(self) -> int:
+        return hash(tuple(getattr(self, name) for name in _WEIGHT_FIELDS))
+
+    def __reduce__(self):
+        return (RiskWeights, tuple(getattr(self, name) for name in _WEIGHT_FIELDS))
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in _WEIGHT_FIELDS)
+        return f"RiskWeights({fields})"
+
+    @classmethod
+    def from_mapping(cls, values: Mapping[str, Any]) -> "RiskWeights":
+        """
+        Build weights from a mapping (e.g. parsed config), ignoring unknown keys.
+        Missing keys keep their default value; numeric strings are converted.
+
+        Raises:
+            ValueError: If a value is not a finite number, or `values` is not a mapping.
+        """
+        if not isinstance(values, Mapping):
+            raise ValueError(f"Risk weights must be a mapping, got {type(values).__name__}")
+        return cls(**{name: _weight_value(name, values[name]) for name in _WEIGHT_FIELDS if name in values})
+
+    def as_dict(self) -> Dict[str, float]:
+        return {name: getattr(self, name) for name in _WEIGHT_FIELDS}
+
+    def contributions(
+        self,
+        tab_switch_count: float = 0,
+        face_absent_seconds: float = 0,
+        code_similarity: float = 0.0,
+        copy_paste_count: float = 0,
+        multiple_faces_detected: bool = False
+    ) -> RiskContributions:
+        """
+        Compute every factor's contribution and the capped risk score in one pass.
+
+        Args:
+            tab_switch_count: Number of times the user switched away from the assessment tab.
+            face_absent_seconds: Total seconds the user's face was not detected in the camera.
+            code_similarity: Percentage of code similarity matching against references (0.0 - 100.0).
+            copy_paste_count: Number of times copy-paste actions were detected.
+            multiple_faces_detected: True if more than one face was seen during the assessment.
+
+        Returns:
+            RiskContributions: The per-factor terms, the uncapped total and the final score.
+        """
+        tab_switches = tab_switch_count * self.tab_switch_weight
+        face_absence = face_absent_seconds * self.face_absent_weight
+        similarity = code_similarity * self.code_similarity_weight
+        copy_paste = copy_paste_count * self.copy_paste_weight
+        multiple_faces = self.multiple_faces_penalty if multiple_faces_detected else 0
+
+        raw_total = tab_switches + face_absence + similarity + copy_paste
+        if multiple_faces_detected:
+            raw_total += multiple_faces
+
+        # Cap the risk score at the configured maximum, and a minimum of 0.0
+        score = float(min(max(raw_total, 0.0), self.max_risk_score))
+
+        return RiskContributions(tab_switches, face_absence, similarity, copy_paste, multiple_faces, raw_total, score)
+
+
+_active_weights = RiskWeights()
+# Installed by the host application to reload weights whose source changed (see refresh_risk_weights)
+_weights_refresher: Optional[Callable[[], Any]] = None
+
+
+def get_risk_weights() -> RiskWeights:
+    """Return the risk weights currently in effect."""
+    return _active_weights
+
+
+def refresh_risk_weights() -> RiskWeights:
+    """
+    Return the risk weights currently in effect, after letting the installed
+    refresher reload them if their source changed. Scoring entry points call
+    this; the refresher must be cheap when nothing changed.
+    """
+    if _weights_refresher is not None:
+        _weights_refresher()
+    return _active_weights
+
+
+def set_risk_weights_refresher(refresher: Optional[Callable[[], Any]]) -> None:
+    """Install (or remove, with None) the callable refresh_risk_weights() runs first."""
+    global _weights_refresher
+    _weights_refresher = refresher
+
+
+def set_risk_weights(weights: RiskWeights) -> None:
+    """
+    Atomically replace the active risk weights. Scoring calls already in
+    flight keep the instance they started with.
+    """
+    global _active_weights
+    if not isinstance(weights, RiskWeights):
+        raise TypeError("weights must be a RiskWeights instance")
+    _active_weights = weights
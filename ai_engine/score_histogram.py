@@ -0,0 +1,55 @@
+from typing import List, Optional, Sequence
+
+# Risk and trust scores both live on a 0-100 scale
+HISTOGRAM_BUCKETS = 10
+HISTOGRAM_MAX = 100.0
+
+
+def histogram_bucket(value: float, buckets: int = HISTOGRAM_BUCKETS, upper: float = HISTOGRAM_MAX) -> int:
+    """
+    Map a score to its fixed-width bucket: bucket i covers [i * width, (i + 1) * width).
+    Out-of-range values are clamped, so the maximum score falls in the last bucket.
+
+    Args:
+        value: The score to bucket.
+        buckets: Number of buckets covering [0, upper].
+        upper: The top of the score scale.
+
+    Returns:
+        int: The bucket index, between 0 and buckets - 1.
+    """
+    index = int(value * buckets // upper)
+    return min(max(index, 0), buckets - 1)
+
+
+def bucket_edges(buckets: int = HISTOGRAM_BUCKETS, upper: float = HISTOGRAM_MAX) -> List[float]:
+    """Return the buckets + 1 edges of the fixed-width histogram over [0, upper]."""
+    width = upper / buckets
+    return [round(i * width, 6) for i in range(buckets + 1)]
+
+
+def histogram_quantile(counts: Sequence[int], q: float, upper: float = HISTOGRAM_MAX) -> Optional[float]:
+    """
+    Estimate a quantile from bucket counts, interpolating linearly inside the
+    bucket that holds it (values are assumed uniform within a bucket).
+
+    Args:
+        counts: Count per bucket, as produced with histogram_bucket.
+        q: The quantile, between 0.0 and 1.0.
+        upper: The top of the score scale.
+
+    Returns:
+        Optional[float]: The estimate, or None for an empty histogram.
+    """
+    total = sum(counts)
+    if total == 0:
+        return None
+
+    width = upper / len(counts)
+    target = q * total
+    seen = 0
+    for index, count in enumerate(counts):
+        if count and seen + count >= target:
+            return round((index + (target - seen) / count) * width, 2)
+        seen += count
+    return upper
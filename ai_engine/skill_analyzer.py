@@ -68,3 +68,52 @@ class SkillAnalyzer:
             "logic_score": logic_score,
             "efficiency_score": efficiency_score
         }
+
+
+class SkillRollup:
+    """
+    Running per-user aggregate of SkillAnalyzer outputs, updated in O(1) per attempt.
+
+    Means are kept for every score; problem solving additionally tracks its
+    variance with Welford's online algorithm, from which consistency is derived:
+    consistency_score = 100 - population standard deviation (floored at 0).
+    """
+
+    __slots__ = ("attempt_count", "problem_solving_mean", "problem_solving_m2", "logic_mean", "code_quality_mean")
+
+    def __init__(
+        self,
+        attempt_count: int = 0,
+        problem_solving_mean: float = 0.0,
+        problem_solving_m2: float = 0.0,
+        logic_mean: float = 0.0,
+        code_quality_mean: float = 0.0
+    ):
+        self.attempt_count = attempt_count
+        self.problem_solving_mean = problem_solving_mean
+        self.problem_solving_m2 = problem_solving_m2
+        self.logic_mean = logic_mean
+        self.code_quality_mean = code_quality_mean
+
+    def add(self, skill_scores: dict) -> None:
+        """
+        Fold one attempt's SkillAnalyzer.analyze_submission output into the aggregate.
+        The efficiency score feeds the code quality mean.
+        """
+        self.attempt_count += 1
+        n = self.attempt_count
+
+        problem_solving = skill_scores.get("problem_solving_score", 0.0)
+        delta = problem_solving - self.problem_solving_mean
+        self.problem_solving_mean += delta / n
+        self.problem_solving_m2 += delta * (problem_solving - self.problem_solving_mean)
+
+        self.logic_mean += (skill_scores.get("logic_score", 0.0) - self.logic_mean) / n
+        self.code_quality_mean += (skill_scores.get("efficiency_score", 0.0) - self.code_quality_mean) / n
+
+    @property
+    def consistency_score(self) -> float:
+        if self.attempt_count == 0:
+            return 0.0
+        std_dev = (max(self.problem_solving_m2, 0.0) / self.attempt_count) ** 0.5
+        return round(max(100.0 - std_dev, 0.0), 2)
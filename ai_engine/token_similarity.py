@@ -0,0 +1,294 @@
+import builtins
+import difflib
+import hashlib
+import io
+import keyword
+import re
+import threading
+import tokenize
+import zlib
+from collections import Counter, OrderedDict
+from typing import FrozenSet, Hashable, List, Optional, Tuple
+
+from ai_engine.code_similarity import CodeSimilarityAnalyzer
+
+# Tokens that never carry logic and are dropped from the normalized stream
+_IGNORED_TOKEN_TYPES = {
+    tokenize.COMMENT,
+    tokenize.NL,
+    tokenize.ENCODING,
+    tokenize.ENDMARKER,
+}
+
+# f-strings are reported as START / MIDDLE / END pieces on Python 3.12+;
+# the START piece stands for the whole literal and the rest are dropped.
+_STRING_TOKEN_TYPES = {tokenize.STRING} | {
+    getattr(tokenize, name) for name in ("FSTRING_START",) if hasattr(tokenize, name)
+}
+_FSTRING_PART_TOKEN_TYPES = {
+    getattr(tokenize, name) for name in ("FSTRING_MIDDLE", "FSTRING_END") if hasattr(tokenize, name)
+}
+
+_PRESERVED_NAMES = frozenset(keyword.kwlist) | frozenset(getattr(keyword, "softkwlist", [])) | frozenset(dir(builtins))
+
+# Used when the submission is not valid Python (or not Python at all)
+_FALLBACK_TOKEN_RE = re.compile(r"[A-Za-z_]\w*|\d+(?:\.\d+)?|\"(?:\\.|[^\"\\])*\"|'(?:\\.|[^'\\])*'|\S")
+
+
+class NormalizedSubmission:
+    """
+    The canonical token stream of one submission, its token counts (used by the
+    score_above() upper bound) and its token k-gram hashes (used as FingerprintIndex
+    fingerprints). Instances are treated as immutable and computed once per
+    distinct piece of code.
+    """
+
+    __slots__ = ("content_hash", "tokens", "token_counts", "fingerprints")
+
+    def __init__(self, content_hash: str, tokens: Tuple[str, ...], fingerprints: FrozenSet[int]):
+        self.content_hash = content_hash
+        self.tokens = tokens
+        self.token_counts = Counter(tokens)
+        self.fingerprints = fingerprints
+
+
+class TokenSimilarityAnalyzer:
+    """
+    A drop-in replacement for CodeSimilarityAnalyzer that compares normalized
+    token streams instead of raw characters.
+
+    Identifiers are canonicalized to a single placeholder (keywords, builtins and
+    attribute names are kept), literals are collapsed by kind, and comments and
+    blank lines are dropped. Renamed-variable or re-commented copies therefore
+    produce identical streams, and the streams are far shorter than the source.
+
+    Normalized forms are cached by the SHA-256 of the code, so scoring a new
+    submission against past ones never re-tokenizes the past submissions.
+    The cache is shared by every caller and guarded by a lock, so the
+    analyzer can be used from finalization workers and request threads alike.
+
+    Set SIMILARITY_ANALYZER=token to use it for the plagiarism index, the
+    finalization pipeline and similarity jobs: the index then shortlists by
+    shared token k-grams, so renamed copies are found as well as scored.
+    """
+
+    # Name stored with a persisted FingerprintIndex
+    name = "token"
+    # k-gram length (in tokens) for the fingerprint hashes
+    FINGERPRINT_K = 5
+
+    # Maximum number of normalized submissions kept in the LRU cache
+    cache_size = 8192
+    _cache: "OrderedDict[str, NormalizedSubmission]" = OrderedDict()
+    _cache_lock = threading.Lock()
+
+    @classmethod
+    def normalize(cls, code: str) -> NormalizedSubmission:
+        """
+        Return the cached normalized form of a code snippet, computing it on first use.
+
+        Args:
+            code (str): The source code to normalize.
+
+        Returns:
+            NormalizedSubmission: The canonical token stream and its token counts.
+        """
+        content_hash = hashlib.sha256(code.encode("utf-8")).hexdigest()
+        with cls._cache_lock:
+            cached = cls._cache.get(content_hash)
+            if cached is not None:
+                cls._cache.move_to_end(content_hash)
+                return cached
+
+        # Tokenized outside the lock; two threads racing on the same code compute equal results
+        tokens = cls._tokenize(code)
+        normalized = NormalizedSubmission(content_hash, tokens, cls._fingerprint(tokens))
+
+        with cls._cache_lock:
+            cls._cache[content_hash] = normalized
+            cls._cache.move_to_end(content_hash)
+            while len(cls._cache) > cls.cache_size:
+                cls._cache.popitem(last=False)
+        return normalized
+
+    @classmethod
+    def calculate_similarity(cls, code1: str, code2: str) -> float:
+        """
+        Calculate a similarity ratio percentage between two code snippets
+        based on their normalized token streams.
+
+        Args:
+            code1 (str): The first code snippet.
+            code2 (str): The second code snippet (e.g., a reference solution or past submission).
+
+        Returns:
+            float: A percentage representing token similarity, restricted from 0.0 to 100.0.
+        """
+        return cls.compare(cls.normalize(code1), cls.normalize(code2))
+
+    @staticmethod
+    def compare(first: NormalizedSubmission, second: NormalizedSubmission) -> float:
+        """
+        Score two already-normalized submissions.
+
+        Returns:
+            float: A percentage in [0.0, 100.0], rounded to 2 decimal places.
+        """
+        # Edge case: If both are empty, they are perfectly similar
+        if not first.tokens and not second.tokens:
+            return 100.0
+
+        # Edge case: If only one is empty, they are completely different
+        if not first.tokens or not second.tokens:
+            return 0.0
+
+        if first.content_hash == second.content_hash:
+            return 100.0
+
+        # autojunk is disabled: placeholder tokens such as "ID" are expected to be
+        # frequent and must not be discarded as noise.
+        matcher = difflib.SequenceMatcher(None, first.tokens, second.tokens, autojunk=False)
+        return round(matcher.ratio() * 100.0, 2)
+
+    @classmethod
+    def score_above(cls, code1: str, code2: str, threshold: float, counts1: Optional[Counter] = None) -> Optional[float]:
+        """
+        Return the exact calculate_similarity() score if it is >= threshold, else None.
+        Token-length and token-count upper bounds reject most dissimilar pairs before
+        the alignment. `counts1` is accepted for interface parity and ignored: the
+        cached normalized form already holds the token counts.
+        """
+        first, second = cls.normalize(code1), cls.normalize(code2)
+        if first.tokens and second.tokens and first.content_hash != second.content_hash:
+            if CodeSimilarityAnalyzer.length_upper_bound(first.tokens, second.tokens) < threshold:
+                return None
+            total_length = len(first.tokens) + len(second.tokens)
+            bound = CodeSimilarityAnalyzer.multiset_upper_bound(first.token_counts, second.token_counts, total_length)
+            if bound < threshold:
+                return None
+        score = cls.compare(first, second)
+        return score if score >= threshold else None
+
+    @classmethod
+    def similar_above(cls, code1: str, code2: str, threshold: float) -> bool:
+        """
+        Check whether two code snippets are at least `threshold` percent similar.
+        Equivalent to calculate_similarity(code1, code2) >= threshold.
+        """
+        return cls.score_above(code1, code2, threshold) is not None
+
+    @classmethod
+    def score_candidates(
+        cls,
+        code: str,
+        candidates: List[Tuple[Hashable, str]],
+        min_similarity: Optional[float] = None
+    ) -> List[Tuple[Hashable, float]]:
+        """
+        Score one submission against several candidates, like
+        CodeSimilarityAnalyzer.score_candidates. Picklable by reference.
+        """
+        if min_similarity is None:
+            return [(candidate_id, cls.calculate_similarity(code, candidate_code)) for candidate_id, candidate_code in candidates]
+
+        scored = []
+        for candidate_id, candidate_code in candidates:
+            score = cls.score_above(code, candidate_code, min_similarity)
+            if score is not None:
+                scored.append((candidate_id, score))
+        return scored
+
+    @classmethod
+    def fingerprint(cls, code: str) -> FrozenSet[int]:
+        """The cached token k-gram hashes of a code snippet (FingerprintIndex fingerprints)."""
+        return cls.normalize(code).fingerprints
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop every cached normalized submission."""
+        with cls._cache_lock:
+            cls._cache.clear()
+
+    @staticmethod
+    def _tokenize(code: str) -> Tuple[str, ...]:
+        tokens = []
+        previous = ""
+        try:
+            for token in tokenize.generate_tokens(io.StringIO(code).readline):
+                if token.type in _IGNORED_TOKEN_TYPES:
+                    continue
+                canonical = _canonicalize(token.type, token.string, previous)
+                if canonical is not None:
+                    tokens.append(canonical)
+                    previous = token.string
+        except (tokenize.TokenError, IndentationError, SyntaxError):
+            # Not valid Python: fall back to a lexical split with the same canonicalization
+            tokens = []
+            previous = ""
+            for word in _FALLBACK_TOKEN_RE.findall(code):
+                if word[0].isalpha() or word[0] == "_":
+                    token_type = tokenize.NAME
+                elif word[0].isdigit():
+                    token_type = tokenize.NUMBER
+                elif word[0] in "\"'" and len(word) > 1:
+                    token_type = tokenize.STRING
+                else:
+                    token_type = tokenize.OP
+                tokens.append(_canonicalize(token_type, word, previous))
+                previous = word
+
+        return tuple(tokens)
+
+
+    @classmethod
+    def _fingerprint(cls, tokens: Tuple[str, ...]) -> FrozenSet[int]:
+        k = cls.FINGERPRINT_K
+        if not tokens:
+            return frozenset()
+        if len(tokens) <= k:
+            return frozenset((zlib.crc32("\x1f".join(tokens).encode("utf-8")),))
+        return frozenset(
+            zlib.crc32("\x1f".join(tokens[i:i + k]).encode("utf-8"))
+            for i in range(len(tokens) - k + 1)
+        )
+
+
+# Analyzers selectable by name (SIMILARITY_ANALYZER)
+SIMILARITY_ANALYZERS = {
+    CodeSimilarityAnalyzer.name: CodeSimilarityAnalyzer,
+    TokenSimilarityAnalyzer.name: TokenSimilarityAnalyzer,
+}
+
+
+def get_similarity_analyzer(name: str):
+    """
+    Return the analyzer class registered under `name` ("character" or "token").
+
+    Raises:
+        ValueError: If the name is unknown.
+    """
+    try:
+        return SIMILARITY_ANALYZERS[name]
+    except KeyError:
+        raise ValueError(f"Unknown similarity analyzer {name!r}; expected one of {sorted(SIMILARITY_ANALYZERS)}")
+
+
+def _canonicalize(token_type: int, text: str, previous: str):
+    if token_type == tokenize.NAME:
+        # Attribute / method names (after a dot) and language names are kept verbatim
+        if previous == "." or text in _PRESERVED_NAMES:
+            return text
+        return "ID"
+    if token_type == tokenize.NUMBER:
+        return "NUM"
+    if token_type in _STRING_TOKEN_TYPES:
+        return "STR"
+    if token_type in _FSTRING_PART_TOKEN_TYPES:
+        return None
+    if token_type == tokenize.NEWLINE:
+        return "NEWLINE"
+    if token_type == tokenize.INDENT:
+        return "INDENT"
+    if token_type == tokenize.DEDENT:
+        return "DEDENT"
+    return text
@@ -1,3 +1,13 @@
+from typing import Optional, Tuple
+
+import numpy as np
+
+# Trust score of a user with no finished attempts, and its bounds
+INITIAL_TRUST_SCORE = 100.0
+MIN_TRUST_SCORE = 0.0
+MAX_TRUST_SCORE = 100.0
+
+
 class TrustUpdater:
     """
     A service class responsible for safely updating user trust scores
@@ -27,6 +37,57 @@ class TrustUpdater:
         new_score = old_trust_score - deduction
         
         # Ensure the score stays within the valid [0.0, 100.0] range
-        bounded_score = min(max(new_score, 0.0), 100.0)
+        bounded_score = min(max(new_score, MIN_TRUST_SCORE), MAX_TRUST_SCORE)
         
         return float(bounded_score)
+
+    @staticmethod
+    def replay_trust_scores(
+        user_ids: np.ndarray,
+        risk_scores: np.ndarray,
+        start_scores: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Apply update_trust_score over many users' attempt histories at once.
+
+        Rows must be grouped by user (all attempts of a user contiguous) and in
+        chronological order within a user. Step k updates, in one vectorized
+        operation, every user that has at least k + 1 attempts, so the clamping
+        happens after each attempt exactly as in sequential updates and the
+        results are bit-identical to calling update_trust_score in a loop.
+
+        Args:
+            user_ids: The user of each attempt.
+            risk_scores: The risk score of each attempt.
+            start_scores: Trust score of each user (in order of appearance) before its
+                first row here; INITIAL_TRUST_SCORE when omitted.
+
+        Returns:
+            Tuple of the distinct user ids (in order of appearance) and their final trust scores.
+        """
+        user_ids = np.asarray(user_ids)
+        risk_scores = np.asarray(risk_scores, dtype=np.float64)
+        if len(user_ids) == 0:
+            return user_ids[:0], np.empty(0, dtype=np.float64)
+
+        group_starts = np.flatnonzero(np.r_[True, user_ids[1:] != user_ids[:-1]])
+        group_sizes = np.diff(np.r_[group_starts, len(user_ids)])
+        scores = (
+            np.full(len(group_starts), INITIAL_TRUST_SCORE, dtype=np.float64)
+            if start_scores is None else np.array(start_scores, dtype=np.float64)
+        )
+
+        # Rows sorted by their position within the user's history: the rows of step k are contiguous
+        group_of_row = np.repeat(np.arange(len(group_starts)), group_sizes)
+        position = np.arange(len(user_ids)) - group_starts[group_of_row]
+        order = np.argsort(position, kind="stable")
+        step_bounds = np.r_[0, np.cumsum(np.bincount(position))]
+        deductions = risk_scores[order] / 10.0
+        groups = group_of_row[order]
+
+        for step in range(len(step_bounds) - 1):
+            rows = slice(step_bounds[step], step_bounds[step + 1])
+            active = groups[rows]
+            scores[active] = np.minimum(np.maximum(scores[active] - deductions[rows], MIN_TRUST_SCORE), MAX_TRUST_SCORE)
+
+        return user_ids[group_starts], scores
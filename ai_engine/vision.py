@@ -0,0 +1,260 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# A face detector takes a small grayscale uint8 frame and returns the number of faces in it
+FaceDetector = Callable[[np.ndarray], int]
+
+# ITU-R BT.601 luma weights for frames in OpenCV's BGR channel order
+_BGR_LUMA = np.array([0.114, 0.587, 0.299], dtype=np.float32)
+
+
+def downscale_frame(frame: np.ndarray, max_width: int = 160) -> np.ndarray:
+    """
+    Reduce a frame to a small grayscale image before detection.
+
+    Subsampling is done with strided numpy slicing (a view, no copy) by the
+    smallest integer step that brings the width under `max_width`; only the
+    already-small result is converted to grayscale.
+
+    Args:
+        frame: An HxW grayscale or HxWxC (BGR / BGRA) uint8 frame.
+        max_width: Maximum width of the returned frame in pixels.
+
+    Returns:
+        np.ndarray: A 2-D uint8 grayscale frame.
+    """
+    step = max(1, -(-frame.shape[1] // max_width))
+    small = frame[::step, ::step]
+    if small.ndim == 3:
+        small = (small[..., :3] @ _BGR_LUMA).astype(np.uint8)
+    return np.ascontiguousarray(small)
+
+
+class HaarFaceDetector:
+    """
+    OpenCV Haar-cascade face detector. OpenCV is an optional dependency and is
+    only imported when this detector is created. detectMultiScale releases the
+    GIL, so one detector may be shared by every thread of a VisionFrameProcessor.
+    """
+
+    def __init__(self, cascade_path: Optional[str] = None, scale_factor: float = 1.1, min_neighbors: int = 4, min_size: int = 20):
+        try:
+            import cv2
+        except ImportError as exc:
+            raise ImportError("HaarFaceDetector requires OpenCV (pip install opencv-python-headless)") from exc
+
+        self._cv2 = cv2
+        self.cascade_path = cascade_path or cv2.data.haarcascades + "haarcascade_frontalface_default.xml"
+        if cv2.CascadeClassifier(self.cascade_path).empty():
+            raise ValueError(f"Could not load a Haar cascade from {self.cascade_path}")
+        self.scale_factor = scale_factor
+        self.min_neighbors = min_neighbors
+        self.min_size = (min_size, min_size)
+        # A CascadeClassifier must not be used by several threads at once: keep one per thread
+        self._local = threading.local()
+
+    def __call__(self, gray_frame: np.ndarray) -> int:
+        cascade = getattr(self._local, "cascade", None)
+        if cascade is None:
+            cascade = self._local.cascade = self._cv2.CascadeClassifier(self.cascade_path)
+        faces = cascade.detectMultiScale(
+            gray_frame, scaleFactor=self.scale_factor, minNeighbors=self.min_neighbors, minSize=self.min_size
+        )
+        return len(faces)
+
+
+class AdaptiveSampler:
+    """
+    Decides which frames of a stream get analyzed.
+
+    Right after a change in the detected state (and at start-up) frames are
+    analyzed every `burst_interval` seconds. Each analysis that finds the same
+    state as before doubles the interval, up to `stable_interval`.
+    """
+
+    __slots__ = ("burst_interval", "stable_interval", "interval", "next_sample_at", "last_state")
+
+    def __init__(self, burst_interval: float = 0.2, stable_interval: float = 2.0):
+        self.burst_interval = burst_interval
+        self.stable_interval = stable_interval
+        self.interval = burst_interval
+        self.next_sample_at = 0.0
+        self.last_state: Optional[int] = None
+
+    def should_sample(self, timestamp: float) -> bool:
+        return timestamp >= self.next_sample_at
+
+    def record(self, timestamp: float, state: int) -> bool:
+        """
+        Register the state observed on a sampled frame and schedule the next sample.
+
+        Returns:
+            bool: True if the state differs from the previous sample.
+        """
+        changed = state != self.last_state
+        if changed:
+            self.interval = self.burst_interval
+        else:
+            self.interval = min(self.interval * 2.0, self.stable_interval)
+        self.last_state = state
+        self.next_sample_at = timestamp + self.interval
+        return changed
+
+
+def apply_face_count(monitor: Any, face_count: int, timestamp: Optional[float] = None) -> None:
+    """Feed a detection result (for a frame captured at `timestamp`) into a BehaviorMonitor."""
+    monitor.update_face_status(face_count > 0, timestamp)
+    monitor.update_multiple_faces(face_count > 1)
+
+
+class _Stream:
+    __slots__ = ("monitor", "sampler", "busy", "lock")
+
+    def __init__(self, monitor: Any, sampler: AdaptiveSampler):
+        self.monitor = monitor
+        self.sampler = sampler
+        self.busy = False
+        self.lock = threading.Lock()
+
+
+class VisionFrameProcessor:
+    """
+    Frame-processing engine shared by every examinee's video stream.
+
+    Incoming frames are filtered by a per-stream AdaptiveSampler, downscaled, and
+    handed to a thread pool for face detection (OpenCV releases the GIL, so
+    detections of different streams run in parallel). At most one detection per
+    stream is in flight: frames arriving while it runs are dropped, so a slow
+    detector never builds a backlog. Results are applied to the stream's
+    BehaviorMonitor in order.
+    """
+
+    def __init__(
+        self,
+        detector: Optional[FaceDetector] = None,
+        max_workers: int = 4,
+        max_width: int = 160,
+        burst_interval: float = 0.2,
+        stable_interval: float = 2.0
+    ):
+        """
+        Args:
+            detector: Face detector to run; a HaarFaceDetector (needs OpenCV) when omitted.
+            max_workers: Size of the detection thread pool.
+            max_width: Frames are downscaled to at most this width before detection.
+            burst_interval: Seconds between analyzed frames right after a state change.
+            stable_interval: Maximum seconds between analyzed frames while the state is stable.
+        """
+        self.detector = detector if detector is not None else HaarFaceDetector()
+        self.max_width = max_width
+        self.burst_interval = burst_interval
+        self.stable_interval = stable_interval
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="vision")
+        self._streams: Dict[Hashable, _Stream] = {}
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._in_flight = 0
+
+        self.frames_received = 0
+        self.frames_sampled = 0
+        self.frames_dropped_busy = 0
+        self.detection_cpu_seconds = 0.0
+
+    def register(self, stream_id: Hashable, monitor: Any) -> None:
+        """Start routing frames of `stream_id` to a BehaviorMonitor."""
+        with self._lock:
+            self._streams[stream_id] = _Stream(monitor, AdaptiveSampler(self.burst_interval, self.stable_interval))
+
+    def unregister(self, stream_id: Hashable) -> None:
+        with self._lock:
+            self._streams.pop(stream_id, None)
+
+    def submit_frame(self, stream_id: Hashable, frame: np.ndarray, timestamp: Optional[float] = None) -> bool:
+        """
+        Offer one frame of a stream. Cheap for frames that are not sampled.
+
+        Args:
+            stream_id: A registered stream.
+            frame: The raw frame (HxW or HxWxC uint8).
+            timestamp: Capture time in seconds on the monitors' clock (defaults to time.monotonic()).
+
+        Returns:
+            bool: True if the frame was queued for detection.
+        """
+        stream = self._streams.get(stream_id)
+        if stream is None:
+            raise KeyError(f"Unknown vision stream {stream_id!r}")
+        if timestamp is None:
+            timestamp = time.monotonic()
+
+        with stream.lock:
+            due = stream.sampler.should_sample(timestamp)
+            sampled = due and not stream.busy
+            dropped = due and stream.busy
+            if sampled:
+                stream.busy = True
+
+        with self._lock:
+            self.frames_received += 1
+            self.frames_sampled += sampled
+            self.frames_dropped_busy += dropped
+            self._in_flight += sampled
+        if not sampled:
+            return False
+
+        try:
+            self._executor.submit(self._detect, stream, frame, timestamp)
+        except Exception:
+            # e.g. the processor was shut down: undo the claim, or wait_idle() would never return
+            with stream.lock:
+                stream.busy = False
+            with self._idle:
+                self.frames_sampled -= 1
+                self._in_flight -= 1
+                self._idle.notify_all()
+            raise
+        return True
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Block until no detection is queued or running. Returns False on timeout."""
+        with self._idle:
+            return self._idle.wait_for(lambda: self._in_flight == 0, timeout)
+
+    def _detect(self, stream: _Stream, frame: np.ndarray, timestamp: float) -> None:
+        started = time.thread_time()
+        try:
+            face_count = int(self.detector(downscale_frame(frame, self.max_width)))
+            with stream.lock:
+                stream.sampler.record(timestamp, face_count)
+                apply_face_count(stream.monitor, face_count, timestamp)
+        except Exception:
+            logger.exception("Face detection failed")
+        finally:
+            elapsed = time.thread_time() - started
+            with stream.lock:
+                stream.busy = False
+            with self._idle:
+                self._in_flight -= 1
+                self.detection_cpu_seconds += elapsed
+                self._idle.notify_all()
+
+    def get_stats(self) -> Dict[str, Any]:
+        sampled = self.frames_sampled
+        return {
+            "streams": len(self._streams),
+            "frames_received": self.frames_received,
+            "frames_sampled": sampled,
+            "frames_dropped_busy": self.frames_dropped_busy,
+            "detection_cpu_ms": round(self.detection_cpu_seconds * 1000.0, 3),
+            "mean_detection_cpu_ms": round(self.detection_cpu_seconds * 1000.0 / sampled, 3) if sampled else 0.0
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
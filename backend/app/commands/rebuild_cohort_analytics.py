@@ -0,0 +1,23 @@
+"""
+Recompute every assessment's daily cohort counters and score histograms from
+finished attempts, e.g. to backfill them or after changing the bucket layout.
+
+Usage (from backend/): python -m app.commands.rebuild_cohort_analytics
+"""
+import time
+
+import app.core.config  # noqa: F401
+import app.database.base  # noqa: F401
+from app.database.db import SessionLocal
+from app.services.cohort_analytics_service import CohortAnalyticsService
+
+
+def main() -> None:
+    started = time.perf_counter()
+    with SessionLocal() as db:
+        attempts = CohortAnalyticsService.rebuild_all(db)
+    print(f"Rebuilt cohort analytics from {attempts} attempts in {time.perf_counter() - started:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
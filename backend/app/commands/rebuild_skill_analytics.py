@@ -0,0 +1,22 @@
+"""
+Recompute every user's SkillAnalytics rollup from their attempts.
+
+Usage (from backend/): python -m app.commands.rebuild_skill_analytics
+"""
+import time
+
+import app.core.config  # noqa: F401
+import app.database.base  # noqa: F401
+from app.database.db import SessionLocal
+from app.services.skill_rollup_service import SkillRollupService
+
+
+def main() -> None:
+    started = time.perf_counter()
+    with SessionLocal() as db:
+        users = SkillRollupService.rebuild_all(db)
+    print(f"Rebuilt skill analytics for {users} users in {time.perf_counter() - started:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
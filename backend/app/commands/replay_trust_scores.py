@@ -0,0 +1,27 @@
+"""
+Recompute every user's trust score by replaying their attempt history,
+recording each change in the trust ledger. Attempts with stored risk factors
+are re-scored with the current risk weights first.
+
+Usage (from backend/): python -m app.commands.replay_trust_scores
+"""
+import time
+
+import app.core.config  # noqa: F401
+import app.database.base  # noqa: F401
+from app.database.db import SessionLocal
+from app.services.trust_service import TrustService
+
+
+def main() -> None:
+    started = time.perf_counter()
+    with SessionLocal() as db:
+        stats = TrustService.replay_all(db)
+    print(
+        f"Replayed {stats['attempts']} attempts ({stats['rescored']} re-scored) for {stats['users']} users "
+        f"({stats['changed']} changed) in {time.perf_counter() - started:.2f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Set, Tuple
+
+from app.core.config import ACCESS_TOKEN_EXPIRE_MINUTES, AUTH_CACHE_MAX_ENTRIES, AUTH_CACHE_TTL_SECONDS
+
+
+class Principal:
+    """The authenticated identity attached to a request (what routes receive as `current_user`)."""
+
+    __slots__ = ("id", "name", "email", "role")
+
+    def __init__(self, id: int, name: str, email: str, role: str):
+        self.id = id
+        self.name = name
+        self.email = email
+        self.role = role
+
+    def __repr__(self) -> str:
+        return f"Principal(id={self.id!r}, email={self.email!r}, role={self.role!r})"
+
+
+class AuthCache:
+    """
+    A TTL + LRU cache of decoded access tokens, keyed by the raw token.
+
+    invalidate_user() drops every cached principal of a user and marks tokens
+    issued before that moment as stale, so their embedded claims are no longer
+    trusted and the next request re-reads the user from the database. A stale
+    marker is kept for one token lifetime: after that, every token it applies
+    to has expired anyway.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = AUTH_CACHE_TTL_SECONDS,
+        max_entries: int = AUTH_CACHE_MAX_ENTRIES,
+        token_lifetime_seconds: float = ACCESS_TOKEN_EXPIRE_MINUTES * 60
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.token_lifetime_seconds = token_lifetime_seconds
+
+        # token -> (expires_at on the monotonic clock, principal)
+        self._entries: "OrderedDict[str, Tuple[float, Principal]]" = OrderedDict()
+        self._tokens_by_user: Dict[int, Set[str]] = {}
+        # user id -> wall-clock second before which issued tokens must be re-validated
+        # (whole seconds, like the JWT `iat` claim it is compared with), oldest first
+        self._stale_before: "OrderedDict[int, int]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, token: str) -> Optional[Principal]:
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, principal = entry
+            if expires_at <= time.monotonic():
+                self._discard(token, principal.id)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(token)
+            self.hits += 1
+            return principal
+
+    def put(self, token: str, principal: Principal, token_expires_at: Optional[float] = None) -> None:
+        """
+        Cache a principal for a token.
+
+        Args:
+            token: The raw bearer token.
+            principal: The resolved identity.
+            token_expires_at: The token's `exp` claim (epoch seconds), if any.
+        """
+        if self.max_entries <= 0:
+            return
+        ttl = self.ttl_seconds
+        if token_expires_at is not None:
+            ttl = min(ttl, token_expires_at - time.time())
+        if ttl <= 0:
+            return
+
+        with self._lock:
+            self._entries[token] = (time.monotonic() + ttl, principal)
+            self._entries.move_to_end(token)
+            self._tokens_by_user.setdefault(principal.id, set()).add(token)
+            while len(self._entries) > self.max_entries:
+                oldest_token, (_, oldest) = self._entries.popitem(last=False)
+                self._forget_token(oldest_token, oldest.id)
+
+    def invalidate_user(self, user_id: int) -> None:
+        """
+        Call whenever a user's profile, role or credentials change. Commits that
+        update those columns through the ORM call this automatically (see models.user).
+        """
+        with self._lock:
+            for token in self._tokens_by_user.pop(user_id, set()):
+                self._entries.pop(token, None)
+            now = int(time.time())
+            self._stale_before[user_id] = now
+            self._stale_before.move_to_end(user_id)
+            # Markers older than a token lifetime only cover tokens that have expired
+            while self._stale_before and next(iter(self._stale_before.values())) <= now - self.token_lifetime_seconds:
+                self._stale_before.popitem(last=False)
+            self.invalidations += 1
+
+    def claims_are_fresh(self, user_id: int, issued_at: Optional[float]) -> bool:
+        """
+        True if a token's embedded claims may be used without a database lookup.
+
+        `iat` has one-second resolution, so a token issued in the same second as
+        the invalidation counts as fresh: otherwise the token handed out right
+        after a credential change would never skip the database lookup. The cost
+        is that a token issued earlier within that second is trusted too.
+        """
+        stale_before = self._stale_before.get(user_id)
+        if stale_before is None:
+            return True
+        return issued_at is not None and issued_at >= stale_before
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._tokens_by_user.clear()
+            self._stale_before.clear()
+
+    def get_stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "invalidations": self.invalidations
+        }
+
+    def _discard(self, token: str, user_id: int) -> None:
+        self._entries.pop(token, None)
+        self._forget_token(token, user_id)
+
+    def _forget_token(self, token: str, user_id: int) -> None:
+        tokens = self._tokens_by_user.get(user_id)
+        if tokens is not None:
+            tokens.discard(token)
+            if not tokens:
+                del self._tokens_by_user[user_id]
+
+# Export a default instance shared by the routes
+auth_cache = AuthCache()
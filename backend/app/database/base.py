@@ -9,3 +9,6 @@ from app.models.assessment import Assessment
 from app.models.attempt import Attempt
 from app.models.behavior_log import BehaviorLog
 from app.models.skill_analytics import SkillAnalytics
+from app.models.attempt_report import AttemptReport
+from app.models.trust_ledger import TrustLedgerEntry
+from app.models.cohort_stats import AssessmentDailyStats, AssessmentDailyBucket
@@ -1,15 +1,92 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///./trustscore.db"
-
-# connect_args={"check_same_thread": False} is needed only for SQLite
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
+from app.core.config import (
+    ASYNC_DATABASE_URL,
+    DATABASE_URL,
+    DB_MAX_OVERFLOW,
+    DB_POOL_PRE_PING,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+    SQLITE_BUSY_TIMEOUT_MS,
+    SQLITE_JOURNAL_MODE,
+    SQLITE_SYNCHRONOUS,
 )
 
+SQLALCHEMY_DATABASE_URL = DATABASE_URL
+
+# Async drivers used when ASYNC_DATABASE_URL is derived from DATABASE_URL
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+def _is_in_memory(url: URL) -> bool:
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+def _engine_options(url: URL) -> dict:
+    options = {"pool_pre_ping": DB_POOL_PRE_PING}
+    if url.get_backend_name() == "sqlite":
+        # check_same_thread=False is needed only for SQLite
+        options["connect_args"] = {"check_same_thread": False, "timeout": SQLITE_BUSY_TIMEOUT_MS / 1000.0}
+    if not _is_in_memory(url):
+        options.update(
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_timeout=DB_POOL_TIMEOUT,
+            pool_recycle=DB_POOL_RECYCLE,
+        )
+    return options
+
+def _install_sqlite_pragmas(sync_engine, in_memory: bool) -> None:
+    @event.listens_for(sync_engine, "connect")
+    def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        if SQLITE_JOURNAL_MODE and not in_memory:
+            cursor.execute(f"PRAGMA journal_mode={SQLITE_JOURNAL_MODE}")
+        if SQLITE_SYNCHRONOUS:
+            cursor.execute(f"PRAGMA synchronous={SQLITE_SYNCHRONOUS}")
+        cursor.execute(f"PRAGMA busy_timeout={int(SQLITE_BUSY_TIMEOUT_MS)}")
+        cursor.close()
+
+def build_engine(database_url: str = SQLALCHEMY_DATABASE_URL):
+    """
+    Create the SQLAlchemy engine from the configured URL and pool settings.
+    SQLite connections additionally get WAL journaling, synchronous=NORMAL and
+    a busy timeout; any other database (e.g. PostgreSQL) is used as-is.
+    """
+    url = make_url(database_url)
+    new_engine = create_engine(url, **_engine_options(url))
+    if url.get_backend_name() == "sqlite":
+        _install_sqlite_pragmas(new_engine, _is_in_memory(url))
+    return new_engine
+
+def build_async_engine(database_url: str = ""):
+    """
+    Create the AsyncEngine used by the async routes, with the same pool settings
+    and SQLite pragmas as the sync engine.
+    """
+    explicit_url = database_url or ASYNC_DATABASE_URL
+    url = make_url(explicit_url or SQLALCHEMY_DATABASE_URL)
+    if not explicit_url:
+        # Swap the sync driver (pysqlite, psycopg2, ...) for its async counterpart
+        url = url.set(drivername=ASYNC_DRIVERS.get(url.get_backend_name(), url.drivername))
+    new_engine = create_async_engine(url, **_engine_options(url))
+    if url.get_backend_name() == "sqlite":
+        _install_sqlite_pragmas(new_engine.sync_engine, _is_in_memory(url))
+    return new_engine
+
+engine = build_engine()
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+async_engine = build_async_engine()
+
+AsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
 Base = declarative_base()
 
 def get_db():
@@ -19,3 +96,8 @@ def get_db():
         yield db
     finally:
         db.close()
+
+async def get_async_db():
+    """Dependency for getting an async DB session (for `async def` routes)."""
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -1,15 +1,50 @@
-from fastapi import FastAPI
+import math
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+
+# Loads settings (including the risk weights) once at startup
+import app.core.config  # noqa: F401
+# Registers every model so relationships between them resolve
+import app.database.base  # noqa: F401
 
 from app.routes.auth import router as auth_router
 from app.routes.users import router as users_router
 from app.routes.assessments import router as assessments_router
 from app.routes.attempts import router as attempts_router
+from app.routes.similarity import router as similarity_router
+from app.routes.reports import router as reports_router
+from app.routes.analytics import router as analytics_router
+from app.routes.proctoring import router as proctoring_router
+from app.core.security import password_hasher
+from app.database.db import async_engine
+from app.services.event_ingestion import behavior_event_queue
+from app.services.finalization_service import attempt_finalization_service
+from app.services.proctoring_feed import proctoring_feed
+from app.services.similarity_jobs import similarity_job_service
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Drain queued behavior events in the background, and flush the rest on shutdown
+    await behavior_event_queue.start()
+    attempt_finalization_service.start()
+    yield
+    proctoring_feed.close()
+    await behavior_event_queue.stop()
+    attempt_finalization_service.shutdown()
+    similarity_job_service.shutdown()
+    await async_engine.dispose()
+    password_hasher.shutdown()
 
 app = FastAPI(
     title="TrustScoreAI",
     description="AI-based assessment platform API",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # Add CORS middleware (allow all origins for hackathon)
@@ -21,11 +56,33 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+def _json_safe(value):
+    # The request parser accepts NaN / Infinity, but JSON responses may not contain them
+    if isinstance(value, float) and not math.isfinite(value):
+        return str(value)
+    if isinstance(value, list):
+        return [_json_safe(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _json_safe(item) for key, item in value.items()}
+    return value
+
+@app.exception_handler(RequestValidationError)
+async def request_validation_exception_handler(request: Request, exc: RequestValidationError):
+    """The default 422 response, with non-finite inputs echoed back as strings."""
+    return JSONResponse(
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        content={"detail": _json_safe(jsonable_encoder(exc.errors()))}
+    )
+
 # Include routers
 app.include_router(auth_router, prefix="/api/auth", tags=["Auth"])
 app.include_router(users_router, prefix="/api/users", tags=["Users"])
 app.include_router(assessments_router, prefix="/api/assessments", tags=["Assessments"])
 app.include_router(attempts_router, prefix="/api/attempts", tags=["Attempts"])
+app.include_router(similarity_router, prefix="/api/similarity", tags=["Similarity"])
+app.include_router(reports_router, prefix="/api/reports", tags=["Reports"])
+app.include_router(analytics_router, prefix="/api/analytics", tags=["Analytics"])
+app.include_router(proctoring_router, prefix="/api/proctoring", tags=["Proctoring"])
 
 @app.get("/health", tags=["Health"])
 async def health_check():
@@ -1,21 +1,44 @@
-from sqlalchemy import Column, Integer, Float, DateTime, ForeignKey
+from sqlalchemy import Boolean, Column, Integer, Float, DateTime, ForeignKey, Index, String
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
 from app.database.db import Base
 
+# Attempt lifecycle: started -> submitted (claimed by the submit request) -> finalized
+ATTEMPT_IN_PROGRESS = "in_progress"
+ATTEMPT_SUBMITTED = "submitted"
+ATTEMPT_FINALIZED = "finalized"
+
 class Attempt(Base):
     __tablename__ = "attempts"
+    __table_args__ = (
+        # "All attempts for user Y" (in chronological order)
+        Index("ix_attempts_user_id_start_time", "user_id", "start_time"),
+        # "Finished attempts of assessment Z" (by completion time)
+        Index("ix_attempts_assessment_id_end_time", "assessment_id", "end_time"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
     assessment_id = Column(Integer, ForeignKey("assessments.id"))
     start_time = Column(DateTime, default=datetime.utcnow)
     end_time = Column(DateTime, nullable=True)
+    status = Column(String, nullable=False, default=ATTEMPT_IN_PROGRESS, server_default=ATTEMPT_IN_PROGRESS)
     final_score = Column(Float, nullable=True)
     risk_score = Column(Float, nullable=True)
+    # SkillAnalyzer output, kept so skill rollups can be rebuilt from attempts
+    problem_solving_score = Column(Float, nullable=True)
+    logic_score = Column(Float, nullable=True)
+    efficiency_score = Column(Float, nullable=True)
+    # Risk factors at finalization, kept so risk scores can be recomputed when the weights change
+    tab_switch_count = Column(Integer, nullable=True)
+    face_absent_seconds = Column(Float, nullable=True)
+    copy_paste_count = Column(Integer, nullable=True)
+    multiple_faces_detected = Column(Boolean, nullable=True)
+    code_similarity = Column(Float, nullable=True)
 
     # Relationships
     user = relationship("User", back_populates="attempts")
     assessment = relationship("Assessment", back_populates="attempts")
     behavior_logs = relationship("BehaviorLog", back_populates="attempt")
+    report = relationship("AttemptReport", back_populates="attempt", uselist=False)
@@ -0,0 +1,23 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, LargeBinary, Index
+from sqlalchemy.orm import relationship
+from datetime import datetime
+
+from app.database.db import Base
+
+class AttemptReport(Base):
+    """The final report of an attempt, stored once in canonical JSON form."""
+
+    __tablename__ = "attempt_reports"
+    __table_args__ = (
+        # "Reports of user Y" listings, streamed in attempt order
+        Index("ix_attempt_reports_user_id_attempt_id", "user_id", "attempt_id"),
+    )
+
+    attempt_id = Column(Integer, ForeignKey("attempts.id"), primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    content_hash = Column(String(64), nullable=False)  # SHA-256 of payload, served as the ETag
+    payload = Column(LargeBinary, nullable=False)      # ReportGenerator.serialize_report output
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    # Relationships
+    attempt = relationship("Attempt", back_populates="report")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Float, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, Float, String, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -6,6 +6,10 @@ from app.database.db import Base
 
 class BehaviorLog(Base):
     __tablename__ = "behavior_logs"
+    __table_args__ = (
+        # "All events for attempt X in time order"
+        Index("ix_behavior_logs_attempt_id_timestamp", "attempt_id", "timestamp"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     attempt_id = Column(Integer, ForeignKey("attempts.id"))
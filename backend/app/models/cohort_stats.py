@@ -0,0 +1,41 @@
+from sqlalchemy import Column, Integer, Float, String, Date, ForeignKey, Index
+
+from app.database.db import Base
+
+class AssessmentDailyStats(Base):
+    """
+    Counters of the attempts of one assessment finalized on one (UTC) day,
+    maintained incrementally at finalization.
+    """
+
+    __tablename__ = "assessment_daily_stats"
+    __table_args__ = (
+        # Cohort analytics across all assessments, by day
+        Index("ix_assessment_daily_stats_day", "day"),
+    )
+
+    assessment_id = Column(Integer, ForeignKey("assessments.id"), primary_key=True)
+    day = Column(Date, primary_key=True)
+    attempt_count = Column(Integer, default=0, nullable=False)
+    flagged_count = Column(Integer, default=0, nullable=False)  # Reports needing mandatory review
+    risk_score_sum = Column(Float, default=0.0, nullable=False)
+    trust_score_sum = Column(Float, default=0.0, nullable=False)  # Trust scores right after each attempt
+    trust_score_count = Column(Integer, default=0, nullable=False)  # Attempts with a known trust score
+
+
+class AssessmentDailyBucket(Base):
+    """
+    One bucket of a fixed-width score histogram (see ai_engine.score_histogram)
+    of one assessment on one day.
+    """
+
+    __tablename__ = "assessment_daily_buckets"
+    __table_args__ = (
+        Index("ix_assessment_daily_buckets_day", "day"),
+    )
+
+    assessment_id = Column(Integer, ForeignKey("assessments.id"), primary_key=True)
+    day = Column(Date, primary_key=True)
+    metric = Column(String, primary_key=True)  # risk, trust
+    bucket = Column(Integer, primary_key=True)
+    count = Column(Integer, default=0, nullable=False)
@@ -12,6 +12,9 @@ class SkillAnalytics(Base):
     logic_score = Column(Float, default=0.0)
     code_quality_score = Column(Float, default=0.0)
     consistency_score = Column(Float, default=0.0)
+    # Running-aggregate state (see ai_engine SkillRollup)
+    attempt_count = Column(Integer, default=0, nullable=False)
+    problem_solving_m2 = Column(Float, default=0.0, nullable=False)  # Welford sum of squared deviations
     last_updated = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
@@ -0,0 +1,29 @@
+from sqlalchemy import Column, Integer, Float, String, DateTime, ForeignKey, Index
+from sqlalchemy.orm import relationship
+from datetime import datetime
+
+from app.database.db import Base
+
+class TrustLedgerEntry(Base):
+    """
+    Append-only record of every change to a user's trust score: one entry per
+    finalized attempt, plus one adjustment per user whose score a replay changed.
+    """
+
+    __tablename__ = "trust_ledger"
+    __table_args__ = (
+        # "Trust history of user Y", in order
+        Index("ix_trust_ledger_user_id_id", "user_id", "id"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    attempt_id = Column(Integer, ForeignKey("attempts.id"), nullable=True)  # Null for replay adjustments
+    reason = Column(String, nullable=False)  # attempt, replay
+    risk_score = Column(Float, nullable=True)
+    delta = Column(Float, nullable=False)
+    trust_score = Column(Float, nullable=False)  # Trust score after this entry
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    # Relationships
+    user = relationship("User", back_populates="trust_ledger")
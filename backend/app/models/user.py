@@ -1,19 +1,46 @@
-from sqlalchemy import Column, Integer, String, DateTime
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, Float, String, DateTime, Index, event, inspect
+from sqlalchemy.orm import Session, relationship
 from datetime import datetime
 
+from app.core.auth_cache import auth_cache
 from app.database.db import Base
 
+# Columns embedded in access tokens / cached principals, plus the password hash
+IDENTITY_COLUMNS = ("name", "email", "hashed_password", "role")
+
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        # Keyset pagination of users filtered / ordered by trust score
+        Index("ix_users_trust_score_id", "trust_score", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, index=True)
     email = Column(String, unique=True, index=True)
     hashed_password = Column(String)
-    trust_score = Column(Integer, default=100)
+    trust_score = Column(Float, default=100.0)
+    role = Column(String, default="student")  # student, proctor, admin
     created_at = Column(DateTime, default=datetime.utcnow)
 
     # Relationships
     attempts = relationship("Attempt", back_populates="user")
     skill_analytics = relationship("SkillAnalytics", back_populates="user", uselist=False)
+    trust_ledger = relationship("TrustLedgerEntry", back_populates="user")
+
+
+@event.listens_for(User, "after_update")
+def _record_identity_change(mapper, connection, target):
+    state = inspect(target)
+    if any(state.attrs[column].history.has_changes() for column in IDENTITY_COLUMNS):
+        state.session.info.setdefault("changed_identities", set()).add(target.id)
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_changed_identities(session):
+    # Only after the commit: a request re-reading the user earlier would cache the old row again
+    for user_id in session.info.pop("changed_identities", ()):
+        auth_cache.invalidate_user(user_id)
+
+@event.listens_for(Session, "after_rollback")
+def _forget_identity_changes(session):
+    session.info.pop("changed_identities", None)
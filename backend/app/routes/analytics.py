@@ -0,0 +1,35 @@
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+
+from app.core.auth_cache import Principal
+from app.database.db import get_db
+from app.routes.reports import REVIEWER_ROLES
+from app.routes.users import get_current_user
+from app.schemas.analytics_schema import CohortAnalyticsResponse
+from app.services.cohort_analytics_service import CohortAnalyticsService
+
+router = APIRouter()
+
+@router.get("/cohort", response_model=CohortAnalyticsResponse)
+def get_cohort_analytics(
+    assessment_id: Optional[int] = None,
+    days: int = Query(30, ge=1, le=366),
+    end_day: Optional[date] = None,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user)
+):
+    """
+    Return risk / trust histograms, flagged-attempt counts and the daily trend
+    of one assessment (or all of them) over the `days` days ending at `end_day`
+    (default: today, UTC). Reads only the pre-aggregated daily tables.
+    Proctors and admins only.
+    """
+    if current_user.role not in REVIEWER_ROLES:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not allowed to view cohort analytics")
+
+    end_day = end_day or datetime.utcnow().date()
+    start_day = end_day - timedelta(days=days - 1)
+    return CohortAnalyticsService.get_cohort(db, start_day, end_day, assessment_id)
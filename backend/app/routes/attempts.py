@@ -1,3 +1,190 @@
-from fastapi import APIRouter
+from datetime import datetime
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.core.auth_cache import Principal
+from app.core.config import EVENT_MAX_BATCH_SIZE
+from app.database.db import get_db
+from app.routes.reports import REVIEWER_ROLES
+from app.routes.users import get_current_user
+from app.models.attempt import ATTEMPT_IN_PROGRESS, ATTEMPT_SUBMITTED, Attempt
+from app.schemas.attempt_schema import (
+    AttemptCreate,
+    AttemptResponse,
+    AttemptSubmission,
+    AttemptSubmissionResponse,
+    BehaviorEventBatchResponse,
+    BehaviorEventCreate,
+)
+from app.services.event_ingestion import EventQueueFull, behavior_event_queue
+from app.services.finalization_service import attempt_finalization_service
+from app.services.live_risk_service import live_risk_service
+from app.services.proctoring_feed import proctoring_feed
 
 router = APIRouter()
+
+def _get_in_progress_attempt(db: Session, attempt_id: int, current_user: Principal, allow_reviewers: bool = False) -> Attempt:
+    """
+    Load an attempt the current user may act on while it is in progress.
+    Someone else's attempt is reported as not found, like a missing one.
+    """
+    attempt = db.get(Attempt, attempt_id)
+    if attempt is None or (attempt.user_id != current_user.id and not (allow_reviewers and current_user.role in REVIEWER_ROLES)):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Attempt not found")
+    if attempt.status != ATTEMPT_IN_PROGRESS:
+        raise _no_longer_in_progress()
+    return attempt
+
+def _no_longer_in_progress() -> HTTPException:
+    return HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Attempt is no longer in progress")
+
+def _require_reviewer(current_user: Principal) -> None:
+    # Operational counters and timings are not for examinees
+    if current_user.role not in REVIEWER_ROLES:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not allowed to view service statistics")
+
+def _rebuild_live_risk(db: Session, attempt_id: int) -> None:
+    """Rebuild an untracked attempt's accumulator, unless it was submitted in the meantime."""
+    live_risk_service.get_accumulator(attempt_id, db)
+    # A submit landing during the rebuild may already have discarded the accumulator
+    db.expire_all()
+    attempt = db.get(Attempt, attempt_id)
+    if attempt is None or attempt.status != ATTEMPT_IN_PROGRESS:
+        live_risk_service.discard(attempt_id)
+
+@router.post("/", response_model=AttemptResponse, status_code=status.HTTP_201_CREATED)
+def start_attempt(attempt_in: AttemptCreate, db: Session = Depends(get_db), current_user: Principal = Depends(get_current_user)):
+    """Start an attempt of an assessment for the current user."""
+    attempt = Attempt(user_id=current_user.id, assessment_id=attempt_in.assessment_id)
+    db.add(attempt)
+    db.commit()
+    db.refresh(attempt)
+    # Track it from the start, so event batches never need to rebuild it from behavior_logs
+    live_risk_service.get_accumulator(attempt.id)
+    return attempt
+
+@router.post("/{attempt_id}/submit", response_model=AttemptSubmissionResponse, status_code=status.HTTP_202_ACCEPTED)
+def submit_attempt(
+    attempt_id: int,
+    submission: AttemptSubmission,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user)
+):
+    """
+    Submit an attempt's code. Skills, similarity, risk, trust score and the
+    report are computed in the background by the finalization pipeline.
+    """
+    attempt = db.get(Attempt, attempt_id)
+    if attempt is None or attempt.user_id != current_user.id:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Attempt not found")
+    assessment_id = attempt.assessment_id
+
+    # Claim the attempt atomically: of two concurrent submits, only one updates the row
+    claimed = db.execute(
+        update(Attempt)
+        .where(Attempt.id == attempt_id, Attempt.end_time.is_(None), Attempt.status == ATTEMPT_IN_PROGRESS)
+        .values(status=ATTEMPT_SUBMITTED)
+    ).rowcount
+    db.commit()
+    if not claimed:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Attempt already submitted")
+
+    _, similarity_job = attempt_finalization_service.submit(
+        attempt_id,
+        current_user.id,
+        assessment_id,
+        submission.code,
+        submission.test_cases_passed,
+        submission.total_test_cases,
+        submission.final_score
+    )
+    return {
+        "attempt_id": attempt_id,
+        "status": "processing",
+        "similarity_job_id": similarity_job.job_id if similarity_job else None
+    }
+
+@router.get("/finalization/stats")
+def get_finalization_stats(current_user: Principal = Depends(get_current_user)):
+    """Return finalization job counters and per-stage pipeline timings. Proctors and admins only."""
+    _require_reviewer(current_user)
+    return attempt_finalization_service.get_stats()
+
+@router.post("/{attempt_id}/events", response_model=BehaviorEventBatchResponse, status_code=status.HTTP_202_ACCEPTED)
+async def ingest_events(
+    attempt_id: int,
+    events: List[BehaviorEventCreate],
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user)
+):
+    """
+    Accept a batch of behavior events for an attempt. Events are acknowledged
+    immediately and written to behavior_logs in bulk by the write-behind queue.
+    """
+    if len(events) > EVENT_MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {EVENT_MAX_BATCH_SIZE} events per request"
+        )
+
+    # Events for a submitted attempt would re-track it after finalization discarded it
+    await run_in_threadpool(_get_in_progress_attempt, db, attempt_id, current_user)
+
+    received_at = datetime.utcnow()
+    rows = [
+        {
+            "attempt_id": attempt_id,
+            "event_type": event.event_type,
+            "severity_score": event.severity_score,
+            "timestamp": event.timestamp or received_at
+        }
+        for event in events
+    ]
+
+    # An attempt started before a restart is rebuilt from behavior_logs. This must happen
+    # before its rows are queued, or a flush during the rebuild would count them twice.
+    # The rebuild reads the database: keep it off the event loop.
+    if not live_risk_service.is_tracked(attempt_id):
+        await run_in_threadpool(_rebuild_live_risk, db, attempt_id)
+    # Finalization discards the accumulator: from here on, only record into an existing one
+    if not live_risk_service.is_tracked(attempt_id):
+        raise _no_longer_in_progress()
+
+    try:
+        await behavior_event_queue.enqueue(rows)
+    except EventQueueFull:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Event ingestion is saturated, retry shortly",
+            headers={"Retry-After": "1"}
+        )
+
+    live_risk_score = live_risk_service.current_risk_score(attempt_id)
+    for event in events:
+        if live_risk_score is None:
+            break
+        live_risk_score = live_risk_service.record_event(attempt_id, event.event_type, event.severity_score, create=False)
+    if live_risk_score is None:
+        # Finalized while this batch was in flight: never re-track it, nor broadcast
+        # a risk update after its `finalized` event
+        raise _no_longer_in_progress()
+    # One broadcast per batch, and only if the risk or flags changed
+    proctoring_feed.publish_risk(attempt_id)
+
+    return {"attempt_id": attempt_id, "accepted": len(rows), "live_risk_score": live_risk_score}
+
+@router.get("/events/stats")
+async def get_event_queue_stats(current_user: Principal = Depends(get_current_user)):
+    """Return write-behind queue depth and flush latency counters. Proctors and admins only."""
+    _require_reviewer(current_user)
+    return behavior_event_queue.get_stats()
+
+@router.get("/{attempt_id}/risk")
+def get_live_risk(attempt_id: int, db: Session = Depends(get_db), current_user: Principal = Depends(get_current_user)):
+    """Return the running risk score and behavior totals for an in-progress attempt (its owner or a reviewer)."""
+    _get_in_progress_attempt(db, attempt_id, current_user, allow_reviewers=True)
+    return live_risk_service.get_live_risk(attempt_id, db)
@@ -1,25 +1,40 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database.db import get_db
+from app.database.db import get_async_db
 from app.models.user import User
 from app.schemas.user_schema import UserCreate, UserLogin, UserResponse
-from app.core.security import get_password_hash, verify_password, create_access_token
+from app.core.auth_cache import Principal, auth_cache
+from app.core.security import PasswordWorkQueueFull, build_identity_claims, create_access_token, password_hasher
+from app.routes.users import get_current_user
 
 router = APIRouter()
 
+def _password_pool_busy() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Authentication is busy, retry shortly",
+        headers={"Retry-After": "1"}
+    )
+
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-def register(user: UserCreate, db: Session = Depends(get_db)):
+async def register(user: UserCreate, db: AsyncSession = Depends(get_async_db)):
     # Check if user exists
-    db_user = db.query(User).filter(User.email == user.email).first()
-    if db_user:
+    existing = await db.execute(select(User.id).where(User.email == user.email))
+    if existing.first():
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
+    # End the read transaction so no pooled connection is held while bcrypt runs
+    await db.commit()
     
-    # Create new user
-    hashed_pass = get_password_hash(user.password)
+    # Create new user (bcrypt runs on the dedicated password process pool)
+    try:
+        hashed_pass = await password_hasher.hash(user.password)
+    except PasswordWorkQueueFull:
+        raise _password_pool_busy()
     new_user = User(
         name=user.name,
         email=user.email,
@@ -27,23 +42,42 @@ def register(user: UserCreate, db: Session = Depends(get_db)):
     )
     
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    await db.commit()
+    await db.refresh(new_user)
     
     return new_user
 
 @router.post("/login")
-def login(user: UserLogin, db: Session = Depends(get_db)):
+async def login(user: UserLogin, db: AsyncSession = Depends(get_async_db)):
     # Find user
-    db_user = db.query(User).filter(User.email == user.email).first()
-    if not db_user or not verify_password(user.password, db_user.hashed_password):
+    result = await db.execute(select(User).where(User.email == user.email))
+    db_user = result.scalars().first()
+    if not db_user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid credentials"
+        )
+
+    # End the read transaction so no pooled connection is held while bcrypt runs
+    await db.commit()
+
+    try:
+        valid, new_hash = await password_hasher.verify_and_update(user.password, db_user.hashed_password)
+    except PasswordWorkQueueFull:
+        raise _password_pool_busy()
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid credentials"
         )
+
+    # The bcrypt cost changed since this hash was created: store a re-hashed password
+    if new_hash:
+        db_user.hashed_password = new_hash
+        await db.commit()
     
-    # Generate token
-    access_token = create_access_token(data={"sub": str(db_user.id)})
+    # Generate token (identity claims are embedded so requests can skip the user lookup)
+    access_token = create_access_token(data=build_identity_claims(db_user))
     
     return {
         "access_token": access_token,
@@ -52,3 +86,10 @@ def login(user: UserLogin, db: Session = Depends(get_db)):
         "name": db_user.name,
         "trust_score": db_user.trust_score
     }
+
+@router.get("/cache-stats")
+async def get_auth_cache_stats(current_user: Principal = Depends(get_current_user)):
+    """Return hit/miss counters of the authentication cache. Admins only."""
+    if current_user.role != "admin":
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not allowed to view cache statistics")
+    return auth_cache.get_stats()
@@ -0,0 +1,44 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
+
+from app.core.auth_cache import Principal
+from app.routes.reports import REVIEWER_ROLES
+from app.routes.users import get_current_user
+from app.services.proctoring_feed import ProctoringFeedFull, proctoring_feed
+
+router = APIRouter()
+
+def _require_reviewer(current_user: Principal) -> None:
+    if current_user.role not in REVIEWER_ROLES:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not allowed to watch the proctoring feed")
+
+@router.get("/feed")
+async def get_proctoring_feed(current_user: Principal = Depends(get_current_user)):
+    """
+    Server-sent events of live proctoring state. The stream starts with a
+    `snapshot` event (every in-progress attempt), followed by `risk` events when
+    an attempt's live risk, behavior totals or flag change and `finalized`
+    events when it is submitted and scored. Proctors and admins only.
+    """
+    _require_reviewer(current_user)
+    # Subscribe before the response starts: once the 200 is sent, a full feed can no longer be reported
+    try:
+        feed_stream = proctoring_feed.open_stream()
+    except ProctoringFeedFull:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Proctoring feed is at capacity, retry shortly",
+            headers={"Retry-After": "5"}
+        )
+    return StreamingResponse(
+        feed_stream,
+        media_type="text/event-stream",
+        # No caching, and no proxy buffering of the stream
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.get("/stats")
+async def get_proctoring_feed_stats(current_user: Principal = Depends(get_current_user)):
+    """Return subscriber, fan-out and coalescing counters of the proctoring feed."""
+    _require_reviewer(current_user)
+    return proctoring_feed.get_stats()
@@ -0,0 +1,104 @@
+from typing import Iterator, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.auth_cache import Principal
+from app.database.db import SessionLocal, get_db
+from app.models.attempt_report import AttemptReport
+from app.routes.users import get_current_user
+
+router = APIRouter()
+
+# Rows fetched per round trip while streaming a report list
+STREAM_BATCH_SIZE = 500
+# Reports may be cached but must be revalidated with If-None-Match on every use
+REPORT_CACHE_CONTROL = "private, no-cache"
+
+REVIEWER_ROLES = {"proctor", "admin"}
+
+
+def _etag(content_hash: str) -> str:
+    return f'"{content_hash}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = [value.strip() for value in header.split(",")]
+    # Weak comparison (RFC 9110): a W/ prefix does not prevent a match
+    return "*" in candidates or any(value.removeprefix("W/") == etag for value in candidates)
+
+
+@router.get("/{attempt_id}")
+def get_report(
+    attempt_id: int,
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user)
+):
+    """
+    Return the stored final report of an attempt. Answers 304 Not Modified when
+    the client's If-None-Match already holds the report's ETag.
+    """
+    row = db.execute(
+        select(AttemptReport.user_id, AttemptReport.content_hash).where(AttemptReport.attempt_id == attempt_id)
+    ).first()
+    if row is None or (row.user_id != current_user.id and current_user.role not in REVIEWER_ROLES):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Report not found")
+
+    etag = _etag(row.content_hash)
+    headers = {"ETag": etag, "Cache-Control": REPORT_CACHE_CONTROL}
+    if _etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    # Only load the payload once a full response is actually needed
+    payload = db.execute(select(AttemptReport.payload).where(AttemptReport.attempt_id == attempt_id)).scalar_one()
+    return Response(content=payload, media_type="application/json", headers=headers)
+
+
+def _stream_reports(user_id: Optional[int], after_attempt_id: Optional[int], limit: Optional[int]) -> Iterator[bytes]:
+    # Runs after the request's own session is gone: use a dedicated one
+    db = SessionLocal()
+    try:
+        query = select(AttemptReport.payload).order_by(AttemptReport.attempt_id)
+        if user_id is not None:
+            query = query.where(AttemptReport.user_id == user_id)
+        if after_attempt_id is not None:
+            query = query.where(AttemptReport.attempt_id > after_attempt_id)
+        if limit is not None:
+            query = query.limit(limit)
+
+        yield b"["
+        first = True
+        for payload in db.execute(query.execution_options(yield_per=STREAM_BATCH_SIZE)).scalars():
+            if not first:
+                yield b","
+            first = False
+            yield payload
+        yield b"]"
+    finally:
+        db.close()
+
+
+@router.get("/")
+def list_reports(
+    user_id: Optional[int] = None,
+    after_attempt_id: Optional[int] = None,
+    limit: Optional[int] = Query(None, ge=1),
+    current_user: Principal = Depends(get_current_user)
+):
+    """
+    Stream stored reports as a JSON array in attempt order, written straight
+    from the pre-serialized payloads without building the list in memory.
+    Students only see their own reports.
+    """
+    if current_user.role not in REVIEWER_ROLES:
+        if user_id is not None and user_id != current_user.id:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not allowed to list other users' reports")
+        user_id = current_user.id
+
+    return StreamingResponse(_stream_reports(user_id, after_attempt_id, limit), media_type="application/json")
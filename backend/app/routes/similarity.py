@@ -0,0 +1,73 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from app.core.auth_cache import Principal
+from app.routes.reports import REVIEWER_ROLES
+from app.routes.users import get_current_user
+from app.schemas.similarity_schema import SimilarityJobCreate, SimilarityJobResponse
+from app.services.finalization_service import attempt_finalization_service
+from app.services.similarity_jobs import SimilarityPoolUnavailable, SimilarityQueueFull, similarity_job_service
+
+router = APIRouter()
+
+def _require_reviewer(current_user: Principal) -> None:
+    # Scores and matched submissions would let examinees probe the detector
+    if current_user.role not in REVIEWER_ROLES:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not allowed to run similarity checks")
+
+@router.post("/jobs", response_model=SimilarityJobResponse, status_code=status.HTTP_202_ACCEPTED)
+def create_similarity_job(job_in: SimilarityJobCreate, current_user: Principal = Depends(get_current_user)):
+    """
+    Score a piece of code against an assessment's past submissions on the
+    similarity process pool. Returns immediately; poll the job for results.
+    Proctors and admins only.
+    """
+    _require_reviewer(current_user)
+    candidates = attempt_finalization_service.pipeline.similarity_candidates(
+        job_in.code,
+        job_in.assessment_id,
+        top_k=None if job_in.exhaustive else job_in.top_k,
+        exclude=job_in.exclude_attempt_id
+    )
+    try:
+        job = similarity_job_service.submit(
+            job_in.code, candidates, top_k=job_in.top_k, min_similarity=job_in.min_similarity
+        )
+    except SimilarityQueueFull:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Similarity scoring is saturated, retry shortly",
+            headers={"Retry-After": "1"}
+        )
+    except SimilarityPoolUnavailable:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Similarity scoring is restarting, retry shortly",
+            headers={"Retry-After": "1"}
+        )
+    return job.as_dict()
+
+@router.get("/jobs/{job_id}", response_model=SimilarityJobResponse)
+async def get_similarity_job(job_id: str, current_user: Principal = Depends(get_current_user)):
+    """Return the status and (partial) matches of a similarity job. Proctors and admins only."""
+    _require_reviewer(current_user)
+    job = similarity_job_service.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Similarity job not found")
+    return job.as_dict()
+
+@router.delete("/jobs/{job_id}", response_model=SimilarityJobResponse)
+async def cancel_similarity_job(job_id: str, current_user: Principal = Depends(get_current_user)):
+    """Cancel a queued or running similarity job. Proctors and admins only."""
+    _require_reviewer(current_user)
+    if not similarity_job_service.cancel(job_id):
+        job = similarity_job_service.get(job_id)
+        if job is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Similarity job not found")
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=f"Similarity job already {job.status}")
+    return similarity_job_service.get(job_id).as_dict()
+
+@router.get("/stats")
+async def get_similarity_stats(current_user: Principal = Depends(get_current_user)):
+    """Return similarity pool occupancy and job counters. Proctors and admins only."""
+    _require_reviewer(current_user)
+    return similarity_job_service.get_stats()
@@ -1,18 +1,31 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import math
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
+from sqlalchemy import select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
 import jwt
 from jwt.exceptions import PyJWTError
 
-from app.database.db import get_db
+from app.database.db import get_async_db
 from app.models.user import User
 from app.schemas.user_schema import UserResponse
+from app.core.auth_cache import Principal, auth_cache
 from app.core.security import SECRET_KEY, ALGORITHM
 
 router = APIRouter()
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/auth/login")
 
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
+async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_async_db)) -> Principal:
+    """
+    Resolve the bearer token to a Principal. Cached tokens and tokens carrying
+    fresh identity claims are resolved without touching the database.
+    """
+    cached = auth_cache.get(token)
+    if cached is not None:
+        return cached
+
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -23,24 +36,90 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
         user_id: str = payload.get("sub")
         if user_id is None:
             raise credentials_exception
-    except PyJWTError:
-        raise credentials_exception
-    
-    user = db.query(User).filter(User.id == int(user_id)).first()
-    if user is None:
+        user_id = int(user_id)
+    except (PyJWTError, ValueError):
         raise credentials_exception
-    return user
+
+    if "role" in payload and auth_cache.claims_are_fresh(user_id, payload.get("iat")):
+        principal = Principal(user_id, payload.get("name"), payload.get("email"), payload["role"])
+    else:
+        # Tokens without identity claims, or issued before the user last changed
+        user = await db.get(User, user_id)
+        if user is None:
+            raise credentials_exception
+        principal = Principal(user.id, user.name, user.email, user.role or "student")
+
+    auth_cache.put(token, principal, payload.get("exp"))
+    return principal
+
+def _parse_cursor(cursor: str, ordered_by_trust: bool):
+    """Cursors are '<id>' for id order, or '<trust_score>,<id>' for trust-score order."""
+    raw = cursor.split(",")
+    try:
+        if len(raw) != (2 if ordered_by_trust else 1):
+            raise ValueError(cursor)
+        # repr() of a float round-trips exactly, so the seek resumes right after the last row
+        parts = [float(raw[0]), int(raw[1])] if ordered_by_trust else [int(raw[0])]
+        if not math.isfinite(parts[0]):
+            raise ValueError(cursor)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    return parts
 
 @router.get("/", response_model=list[UserResponse])
-def get_users(skip: int = 0, limit: int = 100, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    """Return a list of users. Requires authentication."""
-    users = db.query(User).offset(skip).limit(limit).all()
-    return users
+async def get_users(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    min_trust_score: Optional[float] = None,
+    max_trust_score: Optional[float] = None,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_user)
+):
+    """
+    Return a page of users. Requires authentication.
+
+    Uses keyset pagination: pass the X-Next-Cursor header of the previous page
+    as `cursor`. Without trust-score filters users are ordered by id; with them,
+    by (trust_score, id) so the filter and the page walk both use
+    ix_users_trust_score_id. Every page costs the same, however deep.
+    """
+    ordered_by_trust = min_trust_score is not None or max_trust_score is not None
+
+    # Only the UserResponse columns: no ORM hydration, no password hashes
+    query = select(User.id, User.name, User.email, User.trust_score)
+    if max_trust_score is not None:
+        query = query.where(User.trust_score <= max_trust_score)
+
+    if ordered_by_trust:
+        position = _parse_cursor(cursor, True) if cursor else None
+        if position is not None:
+            # A cursor from these filters never lies below min_trust_score: one that
+            # does belongs to another query, and restarting the walk would repeat rows
+            if min_trust_score is not None and position[0] < min_trust_score:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+            # The cursor already implies the lower bound; seeking from it (rather than
+            # from min_trust_score) keeps deep pages as cheap as the first one
+            query = query.where(tuple_(User.trust_score, User.id) > tuple(position))
+        elif min_trust_score is not None:
+            query = query.where(User.trust_score >= min_trust_score)
+        query = query.order_by(User.trust_score, User.id)
+    else:
+        if cursor:
+            query = query.where(User.id > _parse_cursor(cursor, False)[0])
+        query = query.order_by(User.id)
+
+    rows = (await db.execute(query.limit(limit))).all()
+
+    if len(rows) == limit:
+        last = rows[-1]
+        response.headers["X-Next-Cursor"] = f"{last.trust_score},{last.id}" if ordered_by_trust else str(last.id)
+    return rows
 
 @router.get("/{user_id}", response_model=UserResponse)
-def get_user(user_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+async def get_user(user_id: int, db: AsyncSession = Depends(get_async_db), current_user: Principal = Depends(get_current_user)):
     """Return a specific user by ID. Requires authentication."""
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     if user is None:
         raise HTTPException(status_code=404, detail="User not found")
     return user
@@ -0,0 +1,30 @@
+from datetime import date
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+class ScoreHistogram(BaseModel):
+    edges: List[float]  # len(counts) + 1 bucket edges on the 0-100 scale
+    counts: List[int]
+    p50: Optional[float] = None  # Estimated from the buckets
+    p90: Optional[float] = None
+
+class DailyCohortStats(BaseModel):
+    day: date
+    attempts: int
+    flagged: int
+    mean_risk_score: Optional[float] = None
+    mean_trust_score: Optional[float] = None
+
+class CohortAnalyticsResponse(BaseModel):
+    assessment_id: Optional[int] = None  # None: all assessments
+    start_day: date
+    end_day: date
+    attempts: int
+    flagged: int  # Attempts whose report needs mandatory review
+    flagged_rate: float
+    mean_risk_score: Optional[float] = None
+    mean_trust_score: Optional[float] = None
+    risk_histogram: ScoreHistogram
+    trust_histogram: ScoreHistogram
+    daily: List[DailyCohortStats]
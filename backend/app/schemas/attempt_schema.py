@@ -0,0 +1,45 @@
+from datetime import datetime
+from typing import Literal, Optional
+
+from pydantic import BaseModel, Field
+
+from app.core.config import EVENT_MAX_SEVERITY_SCORE
+
+class BehaviorEventCreate(BaseModel):
+    event_type: Literal["tab_switch", "face_missing", "copy_paste", "multiple_faces"]
+    # Seconds of absence for face_missing events; NaN / infinity would poison the attempt's risk
+    severity_score: float = Field(1.0, ge=0, le=EVENT_MAX_SEVERITY_SCORE, allow_inf_nan=False)
+    timestamp: Optional[datetime] = None  # Client-side time of the event; defaults to receipt time
+
+class BehaviorEventBatchResponse(BaseModel):
+    attempt_id: int
+    accepted: int
+    live_risk_score: float
+
+class AttemptCreate(BaseModel):
+    assessment_id: int
+
+class AttemptResponse(BaseModel):
+    id: int
+    user_id: int
+    assessment_id: int
+    start_time: datetime
+    end_time: Optional[datetime] = None
+    status: str = "in_progress"
+    final_score: Optional[float] = None
+    risk_score: Optional[float] = None
+
+    class Config:
+        from_attributes = True  # Pydantic v2 support
+        orm_mode = True         # Pydantic v1 support
+
+class AttemptSubmission(BaseModel):
+    code: str
+    test_cases_passed: int = 0
+    total_test_cases: int = 0
+    final_score: float = 0.0
+
+class AttemptSubmissionResponse(BaseModel):
+    attempt_id: int
+    status: str
+    similarity_job_id: Optional[str] = None  # Reviewers can poll GET /api/similarity/jobs/{id}
@@ -0,0 +1,26 @@
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+class SimilarityJobCreate(BaseModel):
+    code: str
+    assessment_id: int
+    top_k: int = 5
+    exclude_attempt_id: Optional[int] = None
+    exhaustive: bool = False  # Score every submission sharing a fingerprint, not just the shortlist
+    min_similarity: Optional[float] = None  # Only report (and fully score) matches at least this similar
+
+class SimilarityMatch(BaseModel):
+    submission_id: int
+    similarity: float
+
+class SimilarityJobResponse(BaseModel):
+    job_id: str
+    status: str  # queued, done, failed, cancelled, timed_out
+    total_pairs: int
+    total_chunks: int
+    completed_chunks: int
+    matches: List[SimilarityMatch]
+    max_similarity: float
+    error: Optional[str] = None
+    elapsed_ms: float
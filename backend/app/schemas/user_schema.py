@@ -13,7 +13,7 @@ class UserLogin(BaseModel):
 
 class UserResponse(UserBase):
     id: int
-    trust_score: int
+    trust_score: float
 
     class Config:
         from_attributes = True  # Pydantic v2 support
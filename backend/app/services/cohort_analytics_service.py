@@ -0,0 +1,212 @@
+from collections import defaultdict
+from datetime import date
+from typing import Any, Dict, Optional
+
+from sqlalchemy import and_, delete, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.attempt import Attempt
+from app.models.cohort_stats import AssessmentDailyBucket, AssessmentDailyStats
+from app.models.trust_ledger import TrustLedgerEntry
+from app.services.trust_service import LEDGER_REASON_ATTEMPT
+from ai_engine.report_generator import MANDATORY_REVIEW_RISK_THRESHOLD
+from ai_engine.score_histogram import HISTOGRAM_BUCKETS, bucket_edges, histogram_bucket, histogram_quantile
+
+METRIC_RISK = "risk"
+METRIC_TRUST = "trust"
+
+# Rows per executemany batch when rebuilding
+REBUILD_BATCH_SIZE = 5000
+
+
+def _increment(db: Session, model, key: Dict[str, Any], amounts: Dict[str, Any]) -> None:
+    # UPDATE ... SET column = column + amount keeps concurrent finalizations from
+    # losing counts; the first attempt of a key inserts the row instead
+    table = model.__table__
+    condition = and_(*(table.c[column] == value for column, value in key.items()))
+    increments = {column: table.c[column] + amount for column, amount in amounts.items()}
+    if db.execute(update(table).where(condition).values(increments)).rowcount:
+        return
+    try:
+        with db.begin_nested():
+            db.execute(insert(table).values(**key, **amounts))
+    except IntegrityError:
+        # Another transaction inserted the row first
+        db.execute(update(table).where(condition).values(increments))
+
+
+def _mean(total: Optional[float], count: int) -> Optional[float]:
+    return round(total / count, 2) if count else None
+
+
+def _histogram(counts) -> Dict[str, Any]:
+    return {
+        "edges": bucket_edges(),
+        "counts": counts,
+        "p50": histogram_quantile(counts, 0.5),
+        "p90": histogram_quantile(counts, 0.9)
+    }
+
+
+class CohortAnalyticsService:
+    @staticmethod
+    def record_attempt(db: Session, attempt: Attempt, new_trust_score: float) -> None:
+        """
+        Fold a finalized attempt into its assessment's counters and risk / trust
+        histograms for the day it ended. Does not commit: call it inside the
+        transaction that finalizes the attempt.
+
+        Args:
+            db: The session of the finalizing transaction.
+            attempt: The finished attempt, with end_time and risk_score set.
+            new_trust_score: The user's trust score after the attempt.
+        """
+        if attempt.assessment_id is None or attempt.end_time is None:
+            return
+
+        key = {"assessment_id": attempt.assessment_id, "day": attempt.end_time.date()}
+        risk_score = attempt.risk_score or 0.0
+        _increment(db, AssessmentDailyStats, key, {
+            "attempt_count": 1,
+            "flagged_count": int(risk_score >= MANDATORY_REVIEW_RISK_THRESHOLD),
+            "risk_score_sum": risk_score,
+            "trust_score_sum": new_trust_score,
+            "trust_score_count": 1
+        })
+        for metric, value in ((METRIC_RISK, risk_score), (METRIC_TRUST, new_trust_score)):
+            _increment(db, AssessmentDailyBucket, {**key, "metric": metric, "bucket": histogram_bucket(value)}, {"count": 1})
+
+    @staticmethod
+    def rebuild_all(db: Session) -> int:
+        """
+        Recompute every assessment's daily counters and histograms from finished
+        attempts in one streaming pass, replacing both tables in one transaction.
+        An attempt's trust score is taken from its trust ledger entry; attempts
+        finalized before the ledger existed only count towards the risk figures.
+
+        Returns:
+            int: The number of attempts aggregated.
+        """
+        query = (
+            select(Attempt.assessment_id, Attempt.end_time, Attempt.risk_score, TrustLedgerEntry.trust_score)
+            .outerjoin(TrustLedgerEntry, and_(
+                TrustLedgerEntry.attempt_id == Attempt.id,
+                TrustLedgerEntry.reason == LEDGER_REASON_ATTEMPT
+            ))
+            .where(Attempt.assessment_id.is_not(None), Attempt.end_time.is_not(None), Attempt.risk_score.is_not(None))
+            .execution_options(yield_per=REBUILD_BATCH_SIZE)
+        )
+
+        stats = defaultdict(lambda: [0, 0, 0.0, 0.0, 0])
+        buckets = defaultdict(int)
+        attempts = 0
+        connection = db.connection()
+        for assessment_id, end_time, risk_score, trust_score in connection.execute(query):
+            key = (assessment_id, end_time.date())
+            counters = stats[key]
+            counters[0] += 1
+            counters[1] += risk_score >= MANDATORY_REVIEW_RISK_THRESHOLD
+            counters[2] += risk_score
+            buckets[key + (METRIC_RISK, histogram_bucket(risk_score))] += 1
+            if trust_score is not None:
+                counters[3] += trust_score
+                counters[4] += 1
+                buckets[key + (METRIC_TRUST, histogram_bucket(trust_score))] += 1
+            attempts += 1
+
+        db.execute(delete(AssessmentDailyStats))
+        db.execute(delete(AssessmentDailyBucket))
+        stat_rows = [
+            {"assessment_id": assessment_id, "day": day, "attempt_count": count, "flagged_count": flagged,
+             "risk_score_sum": risk_sum, "trust_score_sum": trust_sum, "trust_score_count": trust_count}
+            for (assessment_id, day), (count, flagged, risk_sum, trust_sum, trust_count) in stats.items()
+        ]
+        bucket_rows = [
+            {"assessment_id": assessment_id, "day": day, "metric": metric, "bucket": bucket, "count": count}
+            for (assessment_id, day, metric, bucket), count in buckets.items()
+        ]
+        for model, rows in ((AssessmentDailyStats, stat_rows), (AssessmentDailyBucket, bucket_rows)):
+            for offset in range(0, len(rows), REBUILD_BATCH_SIZE):
+                db.execute(insert(model), rows[offset:offset + REBUILD_BATCH_SIZE])
+
+        db.commit()
+        return attempts
+
+    @staticmethod
+    def get_cohort(db: Session, start_day: date, end_day: date, assessment_id: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Read cohort analytics for a day range from the pre-aggregated tables, in
+        time proportional to days x buckets rather than to the number of attempts.
+
+        Args:
+            db: The session.
+            start_day: First day included (UTC).
+            end_day: Last day included (UTC).
+            assessment_id: Restrict to one assessment; None covers all of them.
+
+        Returns:
+            Dict with totals, risk and trust histograms and a per-day trend.
+        """
+        stats_filter = [AssessmentDailyStats.day >= start_day, AssessmentDailyStats.day <= end_day]
+        bucket_filter = [AssessmentDailyBucket.day >= start_day, AssessmentDailyBucket.day <= end_day]
+        if assessment_id is not None:
+            stats_filter.append(AssessmentDailyStats.assessment_id == assessment_id)
+            bucket_filter.append(AssessmentDailyBucket.assessment_id == assessment_id)
+
+        daily_rows = db.execute(
+            select(
+                AssessmentDailyStats.day,
+                func.sum(AssessmentDailyStats.attempt_count),
+                func.sum(AssessmentDailyStats.flagged_count),
+                func.sum(AssessmentDailyStats.risk_score_sum),
+                func.sum(AssessmentDailyStats.trust_score_sum),
+                func.sum(AssessmentDailyStats.trust_score_count)
+            )
+            .where(*stats_filter)
+            .group_by(AssessmentDailyStats.day)
+            .order_by(AssessmentDailyStats.day)
+        ).all()
+
+        histograms = {METRIC_RISK: [0] * HISTOGRAM_BUCKETS, METRIC_TRUST: [0] * HISTOGRAM_BUCKETS}
+        for metric, bucket, count in db.execute(
+            select(AssessmentDailyBucket.metric, AssessmentDailyBucket.bucket, func.sum(AssessmentDailyBucket.count))
+            .where(*bucket_filter)
+            .group_by(AssessmentDailyBucket.metric, AssessmentDailyBucket.bucket)
+        ):
+            if metric in histograms and 0 <= bucket < HISTOGRAM_BUCKETS:
+                histograms[metric][bucket] = int(count)
+
+        daily = []
+        totals = [0, 0, 0.0, 0.0, 0]
+        for day, count, flagged, risk_sum, trust_sum, trust_count in daily_rows:
+            totals[0] += count
+            totals[1] += flagged
+            totals[2] += risk_sum
+            totals[3] += trust_sum
+            totals[4] += trust_count
+            daily.append({
+                "day": day,
+                "attempts": count,
+                "flagged": flagged,
+                "mean_risk_score": _mean(risk_sum, count),
+                "mean_trust_score": _mean(trust_sum, trust_count)
+            })
+
+        attempts, flagged, risk_sum, trust_sum, trust_count = totals
+        return {
+            "assessment_id": assessment_id,
+            "start_day": start_day,
+            "end_day": end_day,
+            "attempts": attempts,
+            "flagged": flagged,
+            "flagged_rate": round(flagged / attempts, 4) if attempts else 0.0,
+            "mean_risk_score": _mean(risk_sum, attempts),
+            "mean_trust_score": _mean(trust_sum, trust_count),
+            "risk_histogram": _histogram(histograms[METRIC_RISK]),
+            "trust_histogram": _histogram(histograms[METRIC_TRUST]),
+            "daily": daily
+        }
+
+# Export a default instance if needed
+cohort_analytics_service = CohortAnalyticsService()
@@ -0,0 +1,205 @@
+import asyncio
+import logging
+import time
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.core.config import EVENT_FLUSH_INTERVAL_SECONDS, EVENT_FLUSH_SIZE, EVENT_QUEUE_MAX_SIZE
+from app.database.db import SessionLocal
+from app.models.behavior_log import BehaviorLog
+
+logger = logging.getLogger(__name__)
+
+
+class EventQueueFull(Exception):
+    """Raised when a batch would exceed the write-behind queue's capacity."""
+
+
+class BehaviorEventQueue:
+    """
+    An in-process asyncio write-behind queue for behavior_logs rows.
+
+    Requests enqueue rows and return immediately; a background task drains the
+    queue and writes each batch with one executemany INSERT in a single
+    transaction, off the event loop. Memory is bounded by `max_size` rows:
+    a batch that does not fit is rejected as a whole (EventQueueFull -> 429).
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        flush_size: int = EVENT_FLUSH_SIZE,
+        flush_interval: float = EVENT_FLUSH_INTERVAL_SECONDS,
+        max_size: int = EVENT_QUEUE_MAX_SIZE
+    ):
+        self.session_factory = session_factory
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.max_size = max_size
+
+        # Created in start(), so the queue binds to the serving event loop
+        self._queue: Optional[asyncio.Queue] = None
+        self._drainer: Optional[asyncio.Task] = None
+        self._stopping: Optional[asyncio.Event] = None
+
+        # Counters
+        self.enqueued_events = 0
+        self.rejected_events = 0
+        self.written_events = 0
+        self.failed_events = 0
+        self.flush_count = 0
+        self.total_flush_seconds = 0.0
+        self.last_flush_seconds = 0.0
+        self.max_flush_seconds = 0.0
+
+    @property
+    def depth(self) -> int:
+        """Number of events waiting to be written."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def start(self) -> None:
+        """Create the queue and start the background drain task on the running loop."""
+        if self._drainer is not None and not self._drainer.done():
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_size)
+        self._stopping = asyncio.Event()
+        self._drainer = asyncio.create_task(self._drain(), name="behavior-event-drainer")
+
+    async def stop(self) -> None:
+        """Let the drain task write everything still queued, then stop it."""
+        if self._drainer is None:
+            return
+        self._stopping.set()
+        await self._drainer
+        self._drainer = None
+
+    async def enqueue(self, rows: List[Dict[str, object]]) -> None:
+        """
+        Queue behavior_logs rows for writing, without waiting for the database.
+
+        Raises:
+            EventQueueFull: If the batch does not fit in the remaining capacity.
+        """
+        if self._drainer is None or self._drainer.done():
+            await self.start()
+
+        # No await between the capacity check and the puts, so the batch is all-or-nothing
+        if self._queue.qsize() + len(rows) > self.max_size:
+            self.rejected_events += len(rows)
+            raise EventQueueFull(f"Behavior event queue is full ({self.max_size} events pending)")
+
+        for row in rows:
+            self._queue.put_nowait(row)
+        self.enqueued_events += len(rows)
+
+    def get_stats(self) -> Dict[str, float]:
+        """Return queue depth and flush counters for monitoring."""
+        return {
+            "queue_depth": self.depth,
+            "queue_capacity": self.max_size,
+            "enqueued_events": self.enqueued_events,
+            "rejected_events": self.rejected_events,
+            "written_events": self.written_events,
+            "failed_events": self.failed_events,
+            "flush_count": self.flush_count,
+            "last_flush_ms": round(self.last_flush_seconds * 1000.0, 3),
+            "avg_flush_ms": round(self.total_flush_seconds / self.flush_count * 1000.0, 3) if self.flush_count else 0.0,
+            "max_flush_ms": round(self.max_flush_seconds * 1000.0, 3)
+        }
+
+    async def _drain(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            rows = self._take(1)
+            if not rows:
+                if self._stopping.is_set():
+                    return
+                # Idle: wait for work, waking up periodically to notice a shutdown
+                try:
+                    rows = [await asyncio.wait_for(self._queue.get(), timeout=self.flush_interval)]
+                except asyncio.TimeoutError:
+                    continue
+
+            # Give the batch up to flush_interval to fill (no waiting once shutting down)
+            deadline = loop.time() + self.flush_interval
+            while len(rows) < self.flush_size:
+                rows.extend(self._take(self.flush_size - len(rows)))
+                remaining = deadline - loop.time()
+                if len(rows) >= self.flush_size or remaining <= 0 or self._stopping.is_set():
+                    break
+                try:
+                    rows.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            await self._flush(rows)
+
+    def _take(self, limit: int) -> List[Dict[str, object]]:
+        rows = []
+        while len(rows) < limit and not self._queue.empty():
+            rows.append(self._queue.get_nowait())
+        return rows
+
+    async def _flush(self, rows: List[Dict[str, object]]) -> None:
+        if not rows:
+            return
+        started = time.perf_counter()
+        try:
+            failed = await asyncio.to_thread(write_behavior_logs, self.session_factory, rows)
+            self.written_events += len(rows) - failed
+            self.failed_events += failed
+        except Exception:
+            self.failed_events += len(rows)
+            logger.exception("Failed to write %d behavior events", len(rows))
+        elapsed = time.perf_counter() - started
+
+        self.flush_count += 1
+        self.total_flush_seconds += elapsed
+        self.last_flush_seconds = elapsed
+        self.max_flush_seconds = max(self.max_flush_seconds, elapsed)
+
+
+def _insert_behavior_logs(session_factory: Callable[[], Session], rows: List[Dict[str, object]]) -> None:
+    db = session_factory()
+    try:
+        db.execute(insert(BehaviorLog), rows)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def write_behavior_logs(session_factory: Callable[[], Session], rows: List[Dict[str, object]]) -> int:
+    """
+    Bulk insert behavior_logs rows in a single transaction (executemany).
+    A batch mixes many attempts: if it fails, each attempt's rows are retried
+    in their own transaction, so one bad row only loses its own attempt's events.
+
+    Returns:
+        int: The number of rows that could not be written.
+    """
+    try:
+        _insert_behavior_logs(session_factory, rows)
+        return 0
+    except Exception:
+        logger.warning("Writing %d behavior events failed; retrying per attempt", len(rows), exc_info=True)
+
+    rows_by_attempt: Dict[object, List[Dict[str, object]]] = {}
+    for row in rows:
+        rows_by_attempt.setdefault(row["attempt_id"], []).append(row)
+
+    failed = 0
+    for attempt_id, attempt_rows in rows_by_attempt.items():
+        try:
+            _insert_behavior_logs(session_factory, attempt_rows)
+        except Exception:
+            failed += len(attempt_rows)
+            logger.exception("Dropped %d behavior events of attempt %s", len(attempt_rows), attempt_id)
+    return failed
+
+# Export a default instance shared by the routes
+behavior_event_queue = BehaviorEventQueue()
@@ -0,0 +1,298 @@
+import logging
+import math
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import update
+
+from app.core.config import FINALIZATION_WORKERS, SIMILARITY_ANALYZER, SIMILARITY_INDEX_PATH, refresh_risk_weights
+from app.database.db import SessionLocal
+from app.models.attempt import ATTEMPT_FINALIZED, ATTEMPT_IN_PROGRESS, ATTEMPT_SUBMITTED, Attempt
+from app.models.attempt_report import AttemptReport
+from app.models.behavior_log import BehaviorLog
+from app.models.user import User
+from app.services.cohort_analytics_service import CohortAnalyticsService
+from app.services.live_risk_service import live_risk_service
+from app.services.proctoring_feed import proctoring_feed
+from app.services.similarity_jobs import JOB_DONE, SimilarityJob, SimilarityQueueFull, similarity_job_service
+from app.services.skill_rollup_service import SkillRollupService
+from app.services.trust_service import TrustService
+from ai_engine.code_similarity import FingerprintIndex
+from ai_engine.pipeline import AttemptFinalizationPipeline, FinalizedAttempt, FinishedAttempt
+from ai_engine.risk_accumulator import EVENT_FACE_MISSING
+from ai_engine.token_similarity import get_similarity_analyzer
+from ai_engine.trust_score_updater import INITIAL_TRUST_SCORE
+
+logger = logging.getLogger(__name__)
+
+USER_LOCK_STRIPES = 64
+
+
+def build_absence_timeline(db, attempt: Attempt) -> List[Dict[str, float]]:
+    """
+    Rebuild an attempt's face-absence intervals from its face_missing events, as
+    seconds since the attempt started. Each event is logged when the absence
+    ends, with its duration in seconds as the severity score.
+    """
+    rows = db.query(BehaviorLog.timestamp, BehaviorLog.severity_score) \
+        .filter(BehaviorLog.attempt_id == attempt.id, BehaviorLog.event_type == EVENT_FACE_MISSING) \
+        .order_by(BehaviorLog.timestamp).all()
+
+    timeline = []
+    for timestamp, seconds in rows:
+        seconds = float(seconds or 0.0)
+        if not math.isfinite(seconds) or seconds < 0:
+            # Same rule as RiskAccumulator: an invalid duration counts as no absence
+            seconds = 0.0
+        end = (timestamp - attempt.start_time).total_seconds() if attempt.start_time else 0.0
+        timeline.append({"start": round(max(end - seconds, 0.0), 3), "end": round(end, 3), "seconds": round(seconds, 3)})
+    return timeline
+
+
+class AttemptFinalizationService:
+    """
+    Finalizes submitted attempts on a worker pool. Each job runs the
+    AttemptFinalizationPipeline once and stores its outputs (scores, skill
+    rollup, trust score and ledger entry, cohort aggregates, serialized report)
+    in a single transaction.
+    """
+
+    def __init__(self, max_workers: int = FINALIZATION_WORKERS, session_factory=SessionLocal):
+        self.max_workers = max_workers
+        self.session_factory = session_factory
+        self.analyzer = get_similarity_analyzer(SIMILARITY_ANALYZER)
+        self.pipeline = AttemptFinalizationPipeline(FingerprintIndex(analyzer=self.analyzer), max_workers=max_workers)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        # Serializes finalizations of the same user within this process (SQLite has no row locks)
+        self._user_locks = [threading.Lock() for _ in range(USER_LOCK_STRIPES)]
+        self._pending = 0
+        self._completed = 0
+        self._failed = 0
+        self._skipped = 0
+
+    def start(self) -> None:
+        """Load the persisted similarity index, if one is configured."""
+        if SIMILARITY_INDEX_PATH and os.path.exists(SIMILARITY_INDEX_PATH):
+            self.pipeline.similarity_index = FingerprintIndex.load(SIMILARITY_INDEX_PATH, analyzer=self.analyzer)
+
+    def submit(
+        self,
+        attempt_id: int,
+        user_id: int,
+        assessment_id: int,
+        code: str,
+        test_cases_passed: int,
+        total_test_cases: int,
+        final_score: float
+    ) -> Tuple[Future, Optional[SimilarityJob]]:
+        """
+        Queue a submitted attempt for finalization and return immediately.
+        Similarity scoring is dispatched to the similarity process pool right away.
+        The caller must already have moved the attempt to ATTEMPT_SUBMITTED.
+
+        Returns:
+            Tuple[Future, Optional[SimilarityJob]]: A future resolving to the FinalizedAttempt
+            once it has been stored (None if the attempt was not awaiting finalization),
+            and the similarity job (None if the pool was saturated or unavailable,
+            in which case similarity is scored by the finalization worker itself).
+
+        Raises:
+            Exception: If the attempt could not be queued; the claim is released
+                first, so the examinee can submit again.
+        """
+        try:
+            candidates = self.pipeline.similarity_candidates(code, assessment_id, exclude=attempt_id)
+            try:
+                similarity_job = similarity_job_service.submit(code, candidates, top_k=1)
+            except SimilarityQueueFull:
+                similarity_job = None
+            except Exception:
+                # e.g. a similarity worker died: the finalization worker scores in-process instead
+                logger.exception("Could not start a similarity job for attempt %s; scoring in-process", attempt_id)
+                similarity_job = None
+
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="finalization")
+                executor = self._executor
+                self._pending += 1
+            try:
+                future = executor.submit(
+                    self._finalize, attempt_id, user_id, code, test_cases_passed, total_test_cases, final_score, similarity_job
+                )
+            except Exception:
+                with self._lock:
+                    self._pending -= 1
+                raise
+        except Exception:
+            # Give the attempt back so the examinee can submit it again
+            self._release_claim(attempt_id)
+            raise
+        return future, similarity_job
+
+    def _finalize(
+        self,
+        attempt_id: int,
+        user_id: int,
+        code: str,
+        test_cases_passed: int,
+        total_test_cases: int,
+        final_score: float,
+        similarity_job: Optional[SimilarityJob] = None
+    ) -> Optional[FinalizedAttempt]:
+        refresh_risk_weights()
+        similarity = None
+        if similarity_job is not None:
+            similarity_job_service.wait(similarity_job)
+            if similarity_job.status == JOB_DONE:
+                similarity = similarity_job.best_match or (None, 0.0)
+            else:
+                logger.warning(
+                    "Similarity job %s for attempt %s ended as %s; scoring in-process",
+                    similarity_job.job_id, attempt_id, similarity_job.status
+                )
+
+        db = self.session_factory()
+        try:
+            with self._user_locks[hash(user_id) % USER_LOCK_STRIPES]:
+                result = self.finalize_attempt(
+                    db, attempt_id, code, test_cases_passed, total_test_cases, final_score, similarity
+                )
+                db.commit()
+        except Exception:
+            db.rollback()
+            with self._lock:
+                self._failed += 1
+            logger.exception("Finalizing attempt %s failed", attempt_id)
+            # Give the attempt back so the examinee can submit it again
+            self._release_claim(attempt_id)
+            raise
+        finally:
+            db.close()
+            with self._lock:
+                self._pending -= 1
+
+        if result is None:
+            logger.warning("Attempt %s is not awaiting finalization; skipped", attempt_id)
+            with self._lock:
+                self._skipped += 1
+            return None
+
+        live_risk_service.discard(attempt_id)
+        proctoring_feed.publish_finalized(attempt_id, result.risk_score)
+        with self._lock:
+            self._completed += 1
+        return result
+
+    def finalize_attempt(
+        self,
+        db,
+        attempt_id: int,
+        code: str,
+        test_cases_passed: int,
+        total_test_cases: int,
+        final_score: float,
+        similarity: Optional[Tuple[Any, float]] = None
+    ) -> Optional[FinalizedAttempt]:
+        """
+        Run the pipeline for one attempt and write its results to the session.
+        Does not commit.
+
+        Args:
+            similarity: An already scored (similar_submission_id, code_similarity) pair;
+                scored by the pipeline when omitted.
+
+        Returns:
+            The FinalizedAttempt, or None (and nothing written) if the attempt is
+            not in the ATTEMPT_SUBMITTED state, e.g. it was already finalized.
+        """
+        attempt = db.get(Attempt, attempt_id, with_for_update=True)
+        if attempt is None:
+            raise LookupError(f"Attempt {attempt_id} not found")
+        if attempt.status != ATTEMPT_SUBMITTED or attempt.end_time is not None:
+            return None
+        # Row lock on PostgreSQL so concurrent finalizations of one user don't lose trust updates
+        user = db.get(User, attempt.user_id, with_for_update=True)
+
+        end_time = datetime.utcnow()
+        time_taken = int((end_time - attempt.start_time).total_seconds()) if attempt.start_time else 0
+        behavior = live_risk_service.get_live_risk(attempt_id, db)
+
+        result = self.pipeline.finalize(FinishedAttempt(
+            attempt_id=attempt.id,
+            user_id=attempt.user_id,
+            assessment_id=attempt.assessment_id,
+            code=code,
+            time_taken=time_taken,
+            test_cases_passed=test_cases_passed,
+            total_test_cases=total_test_cases,
+            final_score=final_score,
+            old_trust_score=user.trust_score if user.trust_score is not None else INITIAL_TRUST_SCORE,
+            tab_switch_count=behavior["tab_switch_count"],
+            face_absent_seconds=behavior["face_absent_seconds"],
+            copy_paste_count=behavior["copy_paste_count"],
+            multiple_faces_detected=behavior["multiple_faces_detected"],
+            similar_submission_id=similarity[0] if similarity else None,
+            code_similarity=similarity[1] if similarity else None,
+            absence_timeline=build_absence_timeline(db, attempt) if behavior["face_absent_seconds"] else None,
+            finished_at=end_time
+        ))
+
+        attempt.end_time = end_time
+        attempt.status = ATTEMPT_FINALIZED
+        attempt.final_score = final_score
+        attempt.risk_score = result.risk_score
+        attempt.tab_switch_count = result.attempt.tab_switch_count
+        attempt.face_absent_seconds = result.attempt.face_absent_seconds
+        attempt.copy_paste_count = result.attempt.copy_paste_count
+        attempt.multiple_faces_detected = result.attempt.multiple_faces_detected
+        attempt.code_similarity = result.code_similarity
+        SkillRollupService.record_attempt(db, attempt, result.skill_scores)
+        TrustService.record_attempt(db, attempt, result.attempt.old_trust_score, result.new_trust_score)
+        user.trust_score = result.new_trust_score
+        CohortAnalyticsService.record_attempt(db, attempt, result.new_trust_score)
+        db.merge(AttemptReport(
+            attempt_id=attempt.id,
+            user_id=attempt.user_id,
+            content_hash=result.report_hash,
+            payload=result.report_json
+        ))
+        return result
+
+    def _release_claim(self, attempt_id: int) -> None:
+        db = self.session_factory()
+        try:
+            db.execute(
+                update(Attempt)
+                .where(Attempt.id == attempt_id, Attempt.status == ATTEMPT_SUBMITTED)
+                .values(status=ATTEMPT_IN_PROGRESS)
+            )
+            db.commit()
+        except Exception:
+            db.rollback()
+            logger.exception("Could not reopen attempt %s after a failed finalization", attempt_id)
+        finally:
+            db.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return job counters and the pipeline's per-stage timings."""
+        with self._lock:
+            stats = {"pending": self._pending, "completed": self._completed, "failed": self._failed, "skipped": self._skipped}
+        stats["pipeline"] = self.pipeline.get_stage_timings()
+        return stats
+
+    def shutdown(self) -> None:
+        """Finish queued jobs, then persist the similarity index if configured."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        if SIMILARITY_INDEX_PATH:
+            self.pipeline.similarity_index.save(SIMILARITY_INDEX_PATH)
+
+# Export a default instance shared by the routes
+attempt_finalization_service = AttemptFinalizationService()
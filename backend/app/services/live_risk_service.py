@@ -0,0 +1,122 @@
+import threading
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.config import refresh_risk_weights
+from app.models.behavior_log import BehaviorLog
+from ai_engine.risk_accumulator import RiskAccumulator
+from ai_engine.risk_weights import RiskContributions
+
+
+class LiveRiskService:
+    """
+    Keeps one RiskAccumulator per in-progress attempt so the live risk score is
+    available at any time and finalizing an attempt needs no BehaviorLog scan.
+    """
+
+    def __init__(self):
+        self._accumulators: Dict[int, RiskAccumulator] = {}
+        self._lock = threading.Lock()
+        # Called with the attempt id whenever an attempt stops being tracked
+        self._discard_listeners: List[Callable[[int], None]] = []
+
+    def add_discard_listener(self, listener: Callable[[int], None]) -> None:
+        """Register a callback run (on the calling thread) when an attempt stops being tracked."""
+        self._discard_listeners.append(listener)
+
+    def is_tracked(self, attempt_id: int) -> bool:
+        return attempt_id in self._accumulators
+
+    def get_accumulator(self, attempt_id: int, db: Optional[Session] = None) -> RiskAccumulator:
+        """
+        Return the accumulator for an attempt, creating it on first use.
+        If a DB session is given and the attempt is not tracked yet (e.g. after a
+        restart), the accumulator is rebuilt once from the stored BehaviorLog rows.
+        """
+        accumulator = self._accumulators.get(attempt_id)
+        if accumulator is not None:
+            return accumulator
+
+        if db is not None:
+            logs = db.query(BehaviorLog.event_type, BehaviorLog.severity_score) \
+                .filter(BehaviorLog.attempt_id == attempt_id).all()
+            rebuilt = RiskAccumulator.from_behavior_logs(attempt_id, logs)
+        else:
+            rebuilt = RiskAccumulator(attempt_id)
+
+        with self._lock:
+            return self._accumulators.setdefault(attempt_id, rebuilt)
+
+    def record_event(
+        self,
+        attempt_id: int,
+        event_type: str,
+        severity_score: Optional[float] = None,
+        create: bool = True
+    ) -> Optional[float]:
+        """
+        Fold one behavior event into the attempt's running risk in O(1).
+
+        Args:
+            create: Start tracking the attempt if it is not tracked. With False, an
+                untracked (e.g. just finalized) attempt stays untracked.
+
+        Returns:
+            Optional[float]: The live risk score after the event, or None if the
+            attempt is not tracked and create is False.
+        """
+        refresh_risk_weights()
+        if create:
+            accumulator = self.get_accumulator(attempt_id)
+        else:
+            accumulator = self._accumulators.get(attempt_id)
+            if accumulator is None:
+                return None
+        with self._lock:
+            accumulator.apply_event(event_type, severity_score)
+            return accumulator.live_risk_score
+
+    def current_risk_score(self, attempt_id: int) -> Optional[float]:
+        """Return the live risk score of a tracked attempt, or None if it is not tracked."""
+        refresh_risk_weights()
+        accumulator = self._accumulators.get(attempt_id)
+        return None if accumulator is None else accumulator.live_risk_score
+
+    def get_live_risk(self, attempt_id: int, db: Optional[Session] = None) -> Dict[str, object]:
+        """Return the live behavior totals and risk score for an attempt."""
+        refresh_risk_weights()
+        summary = self.get_accumulator(attempt_id, db).get_behavior_summary()
+        summary["attempt_id"] = attempt_id
+        return summary
+
+    def snapshot(self) -> List[Dict[str, object]]:
+        """Return the live behavior totals and risk score of every tracked attempt."""
+        refresh_risk_weights()
+        with self._lock:
+            accumulators = list(self._accumulators.items())
+        summaries = []
+        for attempt_id, accumulator in accumulators:
+            summary = accumulator.get_behavior_summary()
+            summary["attempt_id"] = attempt_id
+            summaries.append(summary)
+        return summaries
+
+    def finalize(self, attempt_id: int, code_similarity: float = 0.0, db: Optional[Session] = None) -> RiskContributions:
+        """
+        Produce the final risk breakdown for an attempt and stop tracking it.
+        """
+        refresh_risk_weights()
+        contributions = self.get_accumulator(attempt_id, db).finalize(code_similarity)
+        self.discard(attempt_id)
+        return contributions
+
+    def discard(self, attempt_id: int) -> None:
+        """Stop tracking an attempt whose risk was finalized elsewhere."""
+        with self._lock:
+            self._accumulators.pop(attempt_id, None)
+        for listener in self._discard_listeners:
+            listener(attempt_id)
+
+# Export a default instance shared by the routes
+live_risk_service = LiveRiskService()
@@ -0,0 +1,290 @@
+import asyncio
+import json
+from typing import AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from app.core.config import (
+    PROCTORING_FEED_FLUSH_INTERVAL_SECONDS,
+    PROCTORING_FEED_KEEPALIVE_SECONDS,
+    PROCTORING_FEED_MAX_PENDING,
+    PROCTORING_FEED_MAX_SUBSCRIBERS,
+)
+from app.services.live_risk_service import live_risk_service
+from ai_engine.report_generator import MANDATORY_REVIEW_RISK_THRESHOLD
+
+FEED_EVENT_SNAPSHOT = "snapshot"
+FEED_EVENT_RISK = "risk"
+FEED_EVENT_FINALIZED = "finalized"
+
+KEEPALIVE_FRAME = b": keepalive\n\n"
+
+
+class ProctoringFeedFull(Exception):
+    """Raised when the feed already has its maximum number of subscribers."""
+
+
+def _frame(event: str, data: object) -> bytes:
+    return f"event: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n".encode()
+
+
+def _risk_update(summary: Dict[str, object]) -> Dict[str, object]:
+    update = dict(summary)
+    update["flagged"] = update["live_risk_score"] >= MANDATORY_REVIEW_RISK_THRESHOLD
+    return update
+
+
+class _Subscriber:
+    __slots__ = ("pending", "wakeup", "needs_snapshot", "closed", "last_flush", "frames_sent", "resyncs")
+
+    def __init__(self):
+        # attempt_id -> latest frame: a newer update replaces the unsent one in place
+        self.pending: Dict[int, bytes] = {}
+        self.wakeup = asyncio.Event()
+        self.needs_snapshot = True
+        self.closed = False
+        self.last_flush = 0.0
+        self.frames_sent = 0
+        self.resyncs = 0
+
+
+class FeedStream:
+    """
+    The SSE body of one subscriber. Unsubscribes when closed or garbage
+    collected, so a response whose body is never iterated (the client left
+    before it started) does not hold its subscription forever.
+    """
+
+    def __init__(self, feed: "ProctoringFeed", subscriber: _Subscriber):
+        self._feed = feed
+        self._subscriber = subscriber
+        self._chunks = feed.stream(subscriber)
+
+    def __aiter__(self) -> "FeedStream":
+        return self
+
+    async def __anext__(self) -> bytes:
+        return await self._chunks.__anext__()
+
+    async def aclose(self) -> None:
+        await self._chunks.aclose()
+        self._feed.unsubscribe(self._subscriber)
+
+    def __del__(self):
+        self._feed.unsubscribe(self._subscriber)
+
+
+class ProctoringFeed:
+    """
+    Fans live risk changes out to every subscribed proctor as server-sent events.
+
+    Each change is encoded once and handed to every subscriber's buffer, which
+    holds at most one unsent frame per attempt: rapid updates of an attempt
+    coalesce into the latest one, and a subscriber is flushed at most every
+    `flush_interval`. A subscriber falling more than `max_pending` attempts
+    behind drops its buffer and is sent a fresh snapshot instead, so a slow
+    consumer costs bounded memory and never delays the others.
+
+    All state belongs to the event loop; publish_finalized and forget may be
+    called from worker threads.
+    """
+
+    def __init__(
+        self,
+        snapshot_source: Callable[[], List[Dict[str, object]]] = live_risk_service.snapshot,
+        summary_source: Callable[[int], Dict[str, object]] = live_risk_service.get_live_risk,
+        flush_interval: float = PROCTORING_FEED_FLUSH_INTERVAL_SECONDS,
+        max_pending: int = PROCTORING_FEED_MAX_PENDING,
+        max_subscribers: int = PROCTORING_FEED_MAX_SUBSCRIBERS,
+        keepalive_interval: float = PROCTORING_FEED_KEEPALIVE_SECONDS
+    ):
+        self.snapshot_source = snapshot_source
+        self.summary_source = summary_source
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.max_subscribers = max_subscribers
+        self.keepalive_interval = keepalive_interval
+
+        self._subscribers: List[_Subscriber] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Last published state per attempt, to broadcast changes only (kept while subscribed)
+        self._last_state: Dict[int, Tuple] = {}
+
+        # Counters
+        self.published_updates = 0
+        self.unchanged_updates = 0
+        self.coalesced_updates = 0
+        self.resyncs = 0
+        self.frames_sent = 0
+
+    @property
+    def is_full(self) -> bool:
+        return len(self._subscribers) >= self.max_subscribers
+
+    def subscribe(self) -> _Subscriber:
+        """
+        Register a subscriber on the running loop; its first frame is a snapshot.
+
+        Raises:
+            ProctoringFeedFull: If max_subscribers are already connected.
+        """
+        if self.is_full:
+            raise ProctoringFeedFull(f"Proctoring feed is full ({self.max_subscribers} subscribers)")
+        self._loop = asyncio.get_running_loop()
+        subscriber = _Subscriber()
+        self._subscribers.append(subscriber)
+        return subscriber
+
+    def open_stream(self) -> FeedStream:
+        """
+        Subscribe and return the subscriber's stream. Call on the event loop,
+        before the response starts, so a full feed can still be refused.
+
+        Raises:
+            ProctoringFeedFull: If max_subscribers are already connected.
+        """
+        return FeedStream(self, self.subscribe())
+
+    def unsubscribe(self, subscriber: _Subscriber) -> None:
+        if subscriber in self._subscribers:
+            self._subscribers.remove(subscriber)
+            self.frames_sent += subscriber.frames_sent
+        if not self._subscribers:
+            self._last_state.clear()
+
+    def publish_risk(self, attempt_id: int) -> None:
+        """
+        Broadcast an attempt's live risk and flag if they changed since the last
+        broadcast. A no-op without subscribers. Call on the event loop.
+        """
+        if not self._subscribers:
+            return
+        update = _risk_update(self.summary_source(attempt_id))
+        state = tuple(update.values())
+        if self._last_state.get(attempt_id) == state:
+            self.unchanged_updates += 1
+            return
+        self._last_state[attempt_id] = state
+        self._broadcast(attempt_id, _frame(FEED_EVENT_RISK, update))
+
+    def publish_finalized(self, attempt_id: int, risk_score: float) -> None:
+        """Broadcast that an attempt was finalized and left the live set. Thread-safe."""
+        loop = self._loop
+        if loop is None or not self._subscribers:
+            return
+        payload = {
+            "attempt_id": attempt_id,
+            "risk_score": risk_score,
+            "flagged": risk_score >= MANDATORY_REVIEW_RISK_THRESHOLD
+        }
+        try:
+            loop.call_soon_threadsafe(self._finalized, attempt_id, _frame(FEED_EVENT_FINALIZED, payload))
+        except RuntimeError:
+            # The loop was closed (shutdown)
+            pass
+
+    def forget(self, attempt_id: int) -> None:
+        """
+        Drop the last published state of an attempt that is no longer tracked
+        (registered as a live_risk_service discard listener). Thread-safe.
+        """
+        loop = self._loop
+        if loop is None:
+            return
+        try:
+            loop.call_soon_threadsafe(self._last_state.pop, attempt_id, None)
+        except RuntimeError:
+            # The loop was closed (shutdown)
+            pass
+
+    def _finalized(self, attempt_id: int, frame: bytes) -> None:
+        self._last_state.pop(attempt_id, None)
+        if self._subscribers:
+            self._broadcast(attempt_id, frame)
+
+    def _broadcast(self, attempt_id: int, frame: bytes) -> None:
+        self.published_updates += 1
+        for subscriber in self._subscribers:
+            if subscriber.needs_snapshot:
+                # The pending snapshot will carry this state
+                continue
+            pending = subscriber.pending
+            if attempt_id in pending:
+                self.coalesced_updates += 1
+            elif len(pending) >= self.max_pending:
+                pending.clear()
+                subscriber.needs_snapshot = True
+                subscriber.resyncs += 1
+                self.resyncs += 1
+                subscriber.wakeup.set()
+                continue
+            pending[attempt_id] = frame
+            subscriber.wakeup.set()
+
+    async def stream(self, subscriber: Optional[_Subscriber] = None) -> AsyncIterator[bytes]:
+        """
+        Yield a subscriber's SSE chunks: a snapshot, then batches of coalesced
+        updates, with keepalive comments while idle. Routes pass a subscriber
+        from subscribe(), so a full feed is refused before the response starts;
+        without one, it is registered when iteration starts. Unsubscribes when closed.
+
+        Raises:
+            ProctoringFeedFull: If no subscriber was given and the feed is full.
+        """
+        loop = asyncio.get_running_loop()
+        if subscriber is None:
+            subscriber = self.subscribe()
+        try:
+            while not subscriber.closed:
+                if subscriber.needs_snapshot:
+                    subscriber.needs_snapshot = False
+                    subscriber.pending.clear()
+                    snapshot = [_risk_update(summary) for summary in self.snapshot_source()]
+                    subscriber.frames_sent += 1
+                    yield _frame(FEED_EVENT_SNAPSHOT, snapshot)
+                    continue
+
+                if not subscriber.pending:
+                    subscriber.wakeup.clear()
+                    try:
+                        await asyncio.wait_for(subscriber.wakeup.wait(), timeout=self.keepalive_interval)
+                    except asyncio.TimeoutError:
+                        yield KEEPALIVE_FRAME
+                    continue
+
+                # Leave rapid updates time to coalesce before flushing
+                delay = subscriber.last_flush + self.flush_interval - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                    if subscriber.needs_snapshot:
+                        continue
+
+                frames = subscriber.pending
+                subscriber.pending = {}
+                subscriber.last_flush = loop.time()
+                subscriber.frames_sent += len(frames)
+                yield b"".join(frames.values())
+        finally:
+            self.unsubscribe(subscriber)
+
+    def close(self) -> None:
+        """End every open stream (at shutdown). Call on the event loop."""
+        for subscriber in self._subscribers:
+            subscriber.closed = True
+            subscriber.wakeup.set()
+
+    def get_stats(self) -> Dict[str, float]:
+        """Return subscriber, fan-out and coalescing counters for monitoring."""
+        return {
+            "subscribers": len(self._subscribers),
+            "max_subscribers": self.max_subscribers,
+            "tracked_attempts": len(self._last_state),
+            "published_updates": self.published_updates,
+            "unchanged_updates": self.unchanged_updates,
+            "coalesced_updates": self.coalesced_updates,
+            "pending_updates": sum(len(subscriber.pending) for subscriber in self._subscribers),
+            "resyncs": self.resyncs,
+            "frames_sent": self.frames_sent + sum(subscriber.frames_sent for subscriber in self._subscribers)
+        }
+
+# Export a default instance shared by the routes
+proctoring_feed = ProctoringFeed()
+live_risk_service.add_discard_listener(proctoring_feed.forget)
@@ -1,34 +1,49 @@
+from app.core.config import refresh_risk_weights
+from ai_engine.risk_weights import RiskContributions
+
+
 class RiskService:
     @staticmethod
     def calculate_risk_score(
         tab_switch_count: int = 0,
         face_absent_seconds: int = 0,
-        code_similarity: float = 0.0
+        code_similarity: float = 0.0,
+        copy_paste_count: int = 0,
+        multiple_faces_detected: bool = False
     ) -> float:
         """
         Calculate the risk score of an assessment attempt based on behavior metrics.
+        Uses the same weights and cap as ai_engine's RiskCalculator.
         
         Args:
             tab_switch_count: Number of times the user switched away from the assessment tab.
             face_absent_seconds: Total seconds the user's face was not detected.
             code_similarity: Percentage of code similarity to known sources (0.0 to 100.0).
+            copy_paste_count: Number of copy-paste actions detected.
+            multiple_faces_detected: True if more than one face was seen.
             
         Returns:
-            float: The calculated risk score.
+            float: The calculated risk score, capped between 0 and the configured maximum.
         """
-        # Risk formula weights
-        TAB_SWITCH_WEIGHT = 10
-        FACE_ABSENT_WEIGHT = 2
-        CODE_SIMILARITY_WEIGHT = 0.5
-        
-        base_risk = (tab_switch_count * TAB_SWITCH_WEIGHT) + \
-                    (face_absent_seconds * FACE_ABSENT_WEIGHT) + \
-                    (code_similarity * CODE_SIMILARITY_WEIGHT)
-                    
-        # Optional: Normalize or cap the score if needed
-        # risk_score = min(max(base_risk, 0.0), 100.0)
-        
-        return float(base_risk)
+        return RiskService.calculate_risk_breakdown(
+            tab_switch_count, face_absent_seconds, code_similarity, copy_paste_count, multiple_faces_detected
+        ).score
+
+    @staticmethod
+    def calculate_risk_breakdown(
+        tab_switch_count: int = 0,
+        face_absent_seconds: int = 0,
+        code_similarity: float = 0.0,
+        copy_paste_count: int = 0,
+        multiple_faces_detected: bool = False
+    ) -> RiskContributions:
+        """
+        Calculate the per-factor contributions and the score in one pass, picking up
+        any hot-reloaded weights. Hand the result to ExplainabilityEngine as-is.
+        """
+        return refresh_risk_weights().contributions(
+            tab_switch_count, face_absent_seconds, code_similarity, copy_paste_count, multiple_faces_detected
+        )
 
 # Export a default instance if needed, though static methods make it optional
 risk_service = RiskService()
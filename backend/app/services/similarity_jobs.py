@@ -0,0 +1,293 @@
+import heapq
+import multiprocessing
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import CancelledError, Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from app.core.config import (
+    SIMILARITY_ANALYZER,
+    SIMILARITY_CHUNK_SIZE,
+    SIMILARITY_JOB_RETENTION,
+    SIMILARITY_JOB_TIMEOUT_SECONDS,
+    SIMILARITY_MAX_PENDING_CHUNKS,
+    SIMILARITY_WORKERS,
+)
+from ai_engine.token_similarity import get_similarity_analyzer
+
+JOB_QUEUED = "queued"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+JOB_TIMED_OUT = "timed_out"
+
+
+class SimilarityQueueFull(Exception):
+    """Raised when the similarity pool already has its maximum number of chunks pending."""
+
+
+class SimilarityPoolUnavailable(Exception):
+    """Raised when a job could not be handed to the pool (a worker died, or the pool was shut down)."""
+
+
+class SimilarityJob:
+    """One submission scored against a list of candidates, split into chunks."""
+
+    __slots__ = (
+        "job_id",
+        "status",
+        "top_k",
+        "total_pairs",
+        "total_chunks",
+        "completed_chunks",
+        "matches",
+        "error",
+        "created_at",
+        "deadline",
+        "finished_at",
+        "futures",
+        "finished",
+    )
+
+    def __init__(self, top_k: int, total_pairs: int, timeout: float):
+        now = time.monotonic()
+        self.job_id = uuid.uuid4().hex
+        self.status = JOB_QUEUED
+        self.top_k = top_k
+        self.total_pairs = total_pairs
+        self.total_chunks = 0
+        self.completed_chunks = 0
+        self.matches: List[Tuple[Hashable, float]] = []
+        self.error: Optional[str] = None
+        self.created_at = now
+        self.deadline = now + timeout
+        self.finished_at: Optional[float] = None
+        self.futures: List[Future] = []
+        self.finished = threading.Event()
+
+    @property
+    def best_match(self) -> Optional[Tuple[Hashable, float]]:
+        return self.matches[0] if self.matches else None
+
+    def as_dict(self) -> Dict[str, Any]:
+        end = self.finished_at if self.finished_at is not None else time.monotonic()
+        best = self.best_match
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "total_pairs": self.total_pairs,
+            "total_chunks": self.total_chunks,
+            "completed_chunks": self.completed_chunks,
+            "matches": [{"submission_id": submission_id, "similarity": score} for submission_id, score in self.matches],
+            "max_similarity": best[1] if best else 0.0,
+            "error": self.error,
+            "elapsed_ms": round((end - self.created_at) * 1000.0, 3)
+        }
+
+
+class SimilarityJobService:
+    """
+    Scores code similarity on a dedicated, size-limited process pool.
+
+    A job's (submission, candidate) pairs are split into chunks, each chunk is a
+    separate pool task, and the per-chunk results are merged into the job's top-k
+    matches as they complete. Jobs can be polled, waited on, cancelled, and
+    expire after their timeout: queued chunks are cancelled, and chunks already
+    running in a worker finish but their results are discarded. A pool broken by
+    a dead worker is dropped and recreated by the next submit.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = SIMILARITY_WORKERS,
+        chunk_size: int = SIMILARITY_CHUNK_SIZE,
+        max_pending_chunks: int = SIMILARITY_MAX_PENDING_CHUNKS,
+        default_timeout: float = SIMILARITY_JOB_TIMEOUT_SECONDS,
+        retention: int = SIMILARITY_JOB_RETENTION,
+        analyzer_name: str = SIMILARITY_ANALYZER
+    ):
+        self.max_workers = max_workers
+        # The scorer run in the pool (CodeSimilarityAnalyzer or TokenSimilarityAnalyzer)
+        self.analyzer = get_similarity_analyzer(analyzer_name)
+        self.chunk_size = chunk_size
+        self.max_pending_chunks = max_pending_chunks
+        self.default_timeout = default_timeout
+        self.retention = retention
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # Re-entrant: cancelling a future runs its done-callback synchronously, which takes the lock again
+        self._lock = threading.RLock()
+        self._jobs: "OrderedDict[str, SimilarityJob]" = OrderedDict()
+        self._pending_chunks = 0
+        self._rejected = 0
+        self._finished_by_status: Dict[str, int] = {
+            status: 0 for status in (JOB_DONE, JOB_FAILED, JOB_CANCELLED, JOB_TIMED_OUT)
+        }
+
+    def submit(
+        self,
+        code: str,
+        candidates: List[Tuple[Hashable, str]],
+        top_k: int = 5,
+        timeout: Optional[float] = None,
+        min_similarity: Optional[float] = None
+    ) -> SimilarityJob:
+        """
+        Start scoring `code` against every candidate and return immediately.
+
+        Args:
+            code: The submission to check.
+            candidates: (submission_id, code) pairs to compare against.
+            top_k: Number of best matches to keep.
+            timeout: Seconds before the job expires (defaults to SIMILARITY_JOB_TIMEOUT_SECONDS).
+            min_similarity: Optional flag threshold; candidates below it are pruned
+                early and never reported.
+
+        Raises:
+            SimilarityQueueFull: If the pool has no room for the job's chunks.
+            SimilarityPoolUnavailable: If the chunks could not be submitted; the job
+                is finished as failed.
+        """
+        job = SimilarityJob(top_k, len(candidates), self.default_timeout if timeout is None else timeout)
+        chunks = [candidates[i:i + self.chunk_size] for i in range(0, len(candidates), self.chunk_size)]
+
+        with self._lock:
+            if self._pending_chunks + len(chunks) > self.max_pending_chunks:
+                self._rejected += 1
+                raise SimilarityQueueFull(f"{self._pending_chunks} similarity chunks already pending")
+
+            self._remember(job)
+            job.total_chunks = len(chunks)
+            if not chunks:
+                self._finish(job, JOB_DONE)
+                return job
+
+            if self._executor is None:
+                # spawn: never fork a process that is running an event loop and threads
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            self._pending_chunks += len(chunks)
+            executor = self._executor
+
+        submitted = 0
+        try:
+            for chunk in chunks:
+                future = executor.submit(self.analyzer.score_candidates, code, chunk, min_similarity)
+                submitted += 1
+                job.futures.append(future)
+                future.add_done_callback(lambda done, job=job: self._on_chunk_done(job, done, executor))
+        except (BrokenProcessPool, RuntimeError) as exc:
+            # RuntimeError: the pool was shut down. Chunks already submitted release
+            # their count from their done-callback once cancelled
+            with self._lock:
+                self._pending_chunks -= len(chunks) - submitted
+                if isinstance(exc, BrokenProcessPool):
+                    self._drop_executor(executor)
+                if job.status == JOB_QUEUED:
+                    job.error = repr(exc)
+                    self._finish(job, JOB_FAILED)
+            raise SimilarityPoolUnavailable(f"Similarity pool unavailable: {exc!r}") from exc
+        return job
+
+    def get(self, job_id: str) -> Optional[SimilarityJob]:
+        """Return a job by id (expiring it first if its deadline passed), or None if unknown."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                self._expire_if_due(job)
+            return job
+
+    def wait(self, job: SimilarityJob) -> SimilarityJob:
+        """Block until the job finishes or its deadline passes."""
+        job.finished.wait(max(0.0, job.deadline - time.monotonic()))
+        with self._lock:
+            self._expire_if_due(job)
+        return job
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        Cancel a job. Returns False if it is unknown or already finished.
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.status != JOB_QUEUED:
+                return False
+            self._finish(job, JOB_CANCELLED)
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "chunk_size": self.chunk_size,
+                "pending_chunks": self._pending_chunks,
+                "max_pending_chunks": self.max_pending_chunks,
+                "rejected": self._rejected,
+                "finished_jobs": dict(self._finished_by_status),
+                "tracked_jobs": len(self._jobs)
+            }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _on_chunk_done(self, job: SimilarityJob, future: Future, executor: ProcessPoolExecutor) -> None:
+        with self._lock:
+            self._pending_chunks -= 1
+            if not future.cancelled() and isinstance(future.exception(), BrokenProcessPool):
+                self._drop_executor(executor)
+            if job.status != JOB_QUEUED:
+                # Cancelled or expired: late results are dropped
+                return
+            try:
+                scored = future.result()
+            except CancelledError:
+                return
+            except Exception as exc:
+                job.error = repr(exc)
+                self._finish(job, JOB_FAILED)
+                return
+
+            job.matches = heapq.nlargest(job.top_k, job.matches + scored, key=lambda item: item[1])
+            job.completed_chunks += 1
+            if job.completed_chunks == job.total_chunks:
+                self._finish(job, JOB_DONE)
+
+    def _drop_executor(self, executor: ProcessPoolExecutor) -> None:
+        # Called with self._lock held; a broken pool never recovers, the next submit starts a new one
+        if self._executor is executor:
+            self._executor = None
+
+    def _expire_if_due(self, job: SimilarityJob) -> None:
+        if job.status == JOB_QUEUED and time.monotonic() >= job.deadline:
+            self._finish(job, JOB_TIMED_OUT)
+
+    def _finish(self, job: SimilarityJob, status: str) -> None:
+        # Called with self._lock held
+        job.status = status
+        job.finished_at = time.monotonic()
+        self._finished_by_status[status] += 1
+        if status != JOB_DONE:
+            for future in job.futures:
+                future.cancel()
+        job.finished.set()
+
+    def _remember(self, job: SimilarityJob) -> None:
+        # Called with self._lock held; forget the oldest finished jobs beyond the retention limit
+        self._jobs[job.job_id] = job
+        while len(self._jobs) > self.retention:
+            oldest_id, oldest = next(iter(self._jobs.items()))
+            if oldest.status == JOB_QUEUED:
+                self._jobs.move_to_end(oldest_id)
+                break
+            del self._jobs[oldest_id]
+
+# Export a default instance shared by the routes
+similarity_job_service = SimilarityJobService()
@@ -0,0 +1,112 @@
+from datetime import datetime
+from typing import Dict
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session
+
+from app.models.attempt import Attempt
+from app.models.skill_analytics import SkillAnalytics
+from ai_engine.skill_analyzer import SkillRollup
+
+# Rows per executemany batch when rebuilding
+REBUILD_BATCH_SIZE = 5000
+
+
+def _to_rollup(row: SkillAnalytics) -> SkillRollup:
+    return SkillRollup(
+        attempt_count=row.attempt_count or 0,
+        problem_solving_mean=row.problem_solving_score or 0.0,
+        problem_solving_m2=row.problem_solving_m2 or 0.0,
+        logic_mean=row.logic_score or 0.0,
+        code_quality_mean=row.code_quality_score or 0.0
+    )
+
+
+def _row_values(user_id: int, rollup: SkillRollup, now: datetime) -> Dict[str, object]:
+    return {
+        "user_id": user_id,
+        "problem_solving_score": rollup.problem_solving_mean,
+        "logic_score": rollup.logic_mean,
+        "code_quality_score": rollup.code_quality_mean,
+        "consistency_score": rollup.consistency_score,
+        "attempt_count": rollup.attempt_count,
+        "problem_solving_m2": rollup.problem_solving_m2,
+        "last_updated": now
+    }
+
+
+class SkillRollupService:
+    @staticmethod
+    def record_attempt(db: Session, attempt: Attempt, skill_scores: Dict[str, float]) -> SkillAnalytics:
+        """
+        Store an attempt's skill scores and fold them into the user's SkillAnalytics row in O(1).
+        Does not commit: call it inside the transaction that finalizes the attempt.
+
+        Args:
+            db: The session of the finalizing transaction.
+            attempt: The finished attempt.
+            skill_scores: The output of SkillAnalyzer.analyze_submission.
+
+        Returns:
+            SkillAnalytics: The updated rollup row.
+        """
+        attempt.problem_solving_score = skill_scores.get("problem_solving_score", 0.0)
+        attempt.logic_score = skill_scores.get("logic_score", 0.0)
+        attempt.efficiency_score = skill_scores.get("efficiency_score", 0.0)
+
+        # Row lock on PostgreSQL so concurrent finalizations of one user serialize
+        row = db.get(SkillAnalytics, attempt.user_id, with_for_update=True)
+        if row is None:
+            row = SkillAnalytics(user_id=attempt.user_id)
+            db.add(row)
+
+        rollup = _to_rollup(row)
+        rollup.add(skill_scores)
+        for column, value in _row_values(attempt.user_id, rollup, datetime.utcnow()).items():
+            setattr(row, column, value)
+        return row
+
+    @staticmethod
+    def rebuild_all(db: Session) -> int:
+        """
+        Recompute every user's rollup from their attempts in a single streaming pass
+        ordered by (user_id, start_time), replacing skill_analytics in one transaction.
+
+        Returns:
+            int: The number of users rebuilt.
+        """
+        now = datetime.utcnow()
+        query = (
+            select(Attempt.user_id, Attempt.problem_solving_score, Attempt.logic_score, Attempt.efficiency_score)
+            .where(Attempt.problem_solving_score.is_not(None))
+            .order_by(Attempt.user_id, Attempt.start_time)
+            .execution_options(yield_per=REBUILD_BATCH_SIZE)
+        )
+
+        db.execute(delete(SkillAnalytics))
+        batch = []
+        users = 0
+        current_user, rollup = None, None
+        for user_id, problem_solving, logic, efficiency in db.execute(query):
+            if user_id != current_user:
+                if rollup is not None:
+                    batch.append(_row_values(current_user, rollup, now))
+                    users += 1
+                current_user, rollup = user_id, SkillRollup()
+            rollup.add({"problem_solving_score": problem_solving, "logic_score": logic, "efficiency_score": efficiency})
+
+            if len(batch) >= REBUILD_BATCH_SIZE:
+                db.execute(insert(SkillAnalytics), batch)
+                batch = []
+
+        if rollup is not None:
+            batch.append(_row_values(current_user, rollup, now))
+            users += 1
+        if batch:
+            db.execute(insert(SkillAnalytics), batch)
+
+        db.commit()
+        return users
+
+# Export a default instance if needed
+skill_rollup_service = SkillRollupService()
@@ -1,3 +1,23 @@
+from datetime import datetime
+from typing import Dict, Optional
+
+import numpy as np
+from sqlalchemy import bindparam, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.models.attempt import Attempt
+from app.models.trust_ledger import TrustLedgerEntry
+from app.models.user import User
+from ai_engine.risk_calculator import RiskCalculator
+from ai_engine.trust_score_updater import INITIAL_TRUST_SCORE, TrustUpdater
+
+LEDGER_REASON_ATTEMPT = "attempt"
+LEDGER_REASON_REPLAY = "replay"
+
+# Attempts fetched and replayed per batch
+REPLAY_BATCH_SIZE = 100_000
+
+
 class TrustService:
     @staticmethod
     def calculate_new_trust_score(old_trust_score: float, risk_score: float) -> float:
@@ -5,20 +25,168 @@ class TrustService:
         Calculate the updated trust score based on the risk score of an attempt.
         
         Formula: new_trust_score = old_trust_score - (risk_score / 10)
-        Ensures the score never drops below 0.
+        Same rule as TrustUpdater: the result is kept within [0.0, 100.0].
         
         Args:
             old_trust_score: The user's current trust score.
             risk_score: The calculated risk score from their latest attempt.
             
         Returns:
-            float: The updated trust score (minimum 0.0).
+            float: The updated trust score, between 0.0 and 100.0.
         """
-        deduction = risk_score / 10.0
-        new_trust_score = float(old_trust_score) - deduction
-        
-        # Ensure trust score never goes below 0
-        return max(0.0, float(new_trust_score))
+        return TrustUpdater.update_trust_score(float(old_trust_score), risk_score)
+
+    @staticmethod
+    def record_attempt(db: Session, attempt: Attempt, old_trust_score: float, new_trust_score: float) -> TrustLedgerEntry:
+        """
+        Append the trust change caused by a finalized attempt to the ledger.
+        Does not commit: call it inside the transaction that finalizes the attempt.
+        """
+        entry = TrustLedgerEntry(
+            user_id=attempt.user_id,
+            attempt_id=attempt.id,
+            reason=LEDGER_REASON_ATTEMPT,
+            risk_score=attempt.risk_score,
+            delta=new_trust_score - old_trust_score,
+            trust_score=new_trust_score
+        )
+        db.add(entry)
+        return entry
+
+    @staticmethod
+    def replay_all(db: Session, batch_size: int = REPLAY_BATCH_SIZE, rescore_risk: bool = True) -> Dict[str, int]:
+        """
+        Recompute every user's trust score from their finished attempts, e.g. after
+        the risk weights or the trust formula changed.
+
+        With rescore_risk, each attempt's risk score is first recomputed from its
+        stored risk factors (behavior totals and code similarity) with the current
+        weights, and attempts whose score changes are updated. Attempts finalized
+        before the factors were stored keep their stored risk score. Reports and
+        cohort aggregates keep the values from finalization.
+
+        Attempts are streamed once, ordered by (user_id, start_time), in batches that
+        are replayed with TrustUpdater.replay_trust_scores (a user whose history
+        spans two batches carries its score over). Users whose score changes get
+        one bulk UPDATE and one "replay" ledger entry each, in a single transaction.
+
+        Returns:
+            Dict with the number of attempts replayed and re-scored, users and users changed.
+        """
+        query = (
+            select(
+                Attempt.id,
+                Attempt.user_id,
+                Attempt.risk_score,
+                Attempt.tab_switch_count,
+                Attempt.face_absent_seconds,
+                Attempt.code_similarity,
+                Attempt.copy_paste_count,
+                Attempt.multiple_faces_detected
+            )
+            .where(Attempt.risk_score.is_not(None))
+            .order_by(Attempt.user_id, Attempt.start_time, Attempt.id)
+            .execution_options(yield_per=batch_size)
+        )
+
+        replayed_ids, replayed_scores = [], []
+        rescored_ids, rescored_scores = [], []
+        carried_user: Optional[int] = None
+        carried_score = INITIAL_TRUST_SCORE
+        attempts = 0
+        # Core-level rows: the ORM result layer would dominate the replay
+        connection = db.connection()
+        for rows in connection.execute(query).partitions():
+            attempt_column, user_column, risk_column, *factor_columns = zip(*rows)
+            user_ids = np.array(user_column, dtype=np.int64)
+            risk_scores = np.array(risk_column, dtype=np.float64)
+            attempts += len(user_ids)
+
+            if rescore_risk:
+                # NULL factors (attempts finalized before they were stored) become NaN
+                tab_switches, absent, similarity, copy_paste, multiple_faces = (
+                    np.array(column, dtype=np.float64) for column in factor_columns
+                )
+                known = ~(np.isnan(tab_switches) | np.isnan(absent) | np.isnan(copy_paste))
+                rescored = RiskCalculator.calculate_risk_scores_batch(
+                    tab_switches[known],
+                    absent[known],
+                    np.nan_to_num(similarity[known]),
+                    copy_paste[known],
+                    np.nan_to_num(multiple_faces[known]) > 0
+                )
+                moved = rescored != risk_scores[known]
+                if moved.any():
+                    positions = np.flatnonzero(known)[moved]
+                    risk_scores[positions] = rescored[moved]
+                    rescored_ids.append(np.array(attempt_column, dtype=np.int64)[positions])
+                    rescored_scores.append(rescored[moved])
+
+            group_count = 1 + int(np.count_nonzero(user_ids[1:] != user_ids[:-1]))
+            start_scores = np.full(group_count, INITIAL_TRUST_SCORE)
+            if carried_user is not None:
+                if user_ids[0] == carried_user:
+                    start_scores[0] = carried_score
+                else:
+                    replayed_ids.append(np.array([carried_user]))
+                    replayed_scores.append(np.array([carried_score]))
+
+            ids, scores = TrustUpdater.replay_trust_scores(user_ids, risk_scores, start_scores)
+            # The last user may continue in the next batch
+            replayed_ids.append(ids[:-1])
+            replayed_scores.append(scores[:-1])
+            carried_user, carried_score = int(ids[-1]), float(scores[-1])
+
+        if carried_user is not None:
+            replayed_ids.append(np.array([carried_user]))
+            replayed_scores.append(np.array([carried_score]))
+
+        # Written once the stream is exhausted: SQLite cannot update rows under an open cursor
+        rescored_count = 0
+        if rescored_ids:
+            attempts_table = Attempt.__table__
+            statement = update(attempts_table).where(attempts_table.c.id == bindparam("attempt_id")).values(risk_score=bindparam("score"))
+            for ids, scores in zip(rescored_ids, rescored_scores):
+                connection.execute(statement, [
+                    {"attempt_id": int(attempt_id), "score": float(score)} for attempt_id, score in zip(ids, scores)
+                ])
+                rescored_count += len(ids)
+
+        current = connection.execute(select(User.id, User.trust_score).order_by(User.id)).all()
+        if not current:
+            db.commit()
+            return {"attempts": attempts, "rescored": rescored_count, "users": 0, "changed": 0}
+        user_ids = np.array([row[0] for row in current], dtype=np.int64)
+        old_scores = np.array([np.nan if row[1] is None else row[1] for row in current], dtype=np.float64)
+
+        # Users without finished attempts are back at the initial score
+        new_scores = np.full(len(user_ids), INITIAL_TRUST_SCORE)
+        if replayed_ids:
+            ids = np.concatenate(replayed_ids)
+            positions = np.searchsorted(user_ids, ids)
+            known = (positions < len(user_ids)) & (user_ids[np.minimum(positions, len(user_ids) - 1)] == ids)
+            new_scores[positions[known]] = np.concatenate(replayed_scores)[known]
+
+        changed = np.flatnonzero(new_scores != old_scores)
+        if len(changed):
+            now = datetime.utcnow()
+            users = User.__table__
+            connection.execute(
+                update(users).where(users.c.id == bindparam("user_id")).values(trust_score=bindparam("score")),
+                [{"user_id": int(user_ids[i]), "score": float(new_scores[i])} for i in changed]
+            )
+            connection.execute(insert(TrustLedgerEntry.__table__), [
+                {
+                    "user_id": int(user_ids[i]),
+                    "reason": LEDGER_REASON_REPLAY,
+                    "delta": float(new_scores[i] - (INITIAL_TRUST_SCORE if np.isnan(old_scores[i]) else old_scores[i])),
+                    "trust_score": float(new_scores[i]),
+                    "created_at": now
+                }
+                for i in changed
+            ])
+        db.commit()
+        return {"attempts": attempts, "rescored": rescored_count, "users": len(user_ids), "changed": len(changed)}
 
 # Export a default instance if needed
 trust_service = TrustService()
@@ -0,0 +1,133 @@
+"""
+Query benchmark for the attempt / behavior-log access patterns, before and
+after the composite indexes of database/migrations/001_access_pattern_indexes.sql.
+
+Seeds a SQLite database with millions of behavior events, times
+"all events for attempt X in time order", "all attempts for user Y" and
+"finished attempts of assessment Z" without the composite indexes, then
+applies the migration's indexes and times them again.
+
+Usage: python benchmarks/bench_access_indexes.py [num_events]
+"""
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+COMPOSITE_INDEXES = (
+    "ix_attempts_user_id_start_time",
+    "ix_attempts_assessment_id_end_time",
+    "ix_behavior_logs_attempt_id_timestamp",
+)
+QUERIES = {
+    "events of attempt (time order)": (
+        "SELECT event_type, severity_score, timestamp FROM behavior_logs WHERE attempt_id = ? ORDER BY timestamp",
+        "attempt",
+        (),
+    ),
+    "attempts of user (chronological)": (
+        "SELECT id, start_time, risk_score FROM attempts WHERE user_id = ? ORDER BY start_time",
+        "user",
+        (),
+    ),
+    "finished attempts of assessment": (
+        "SELECT id, end_time, risk_score FROM attempts WHERE assessment_id = ? AND end_time >= ? ORDER BY end_time",
+        "assessment",
+        (datetime(2026, 5, 1),),
+    ),
+}
+
+
+def seed(connection: sqlite3.Connection, num_events: int, rng: random.Random) -> dict:
+    num_attempts = max(num_events // 100, 1)
+    num_users = max(num_attempts // 10, 1)
+    num_assessments = 50
+    epoch = datetime(2026, 1, 1)
+
+    connection.executemany(
+        "INSERT INTO users (id, name, email, hashed_password, trust_score) VALUES (?, ?, ?, 'x', 100)",
+        ((i, f"User {i}", f"user{i}@example.com") for i in range(1, num_users + 1)),
+    )
+    connection.executemany(
+        "INSERT INTO assessments (id, title, difficulty) VALUES (?, ?, 'medium')",
+        ((i, f"Assessment {i}") for i in range(1, num_assessments + 1)),
+    )
+    starts = {}
+    rows = []
+    for attempt_id in range(1, num_attempts + 1):
+        start = epoch + timedelta(minutes=rng.randint(0, 60 * 24 * 180))
+        starts[attempt_id] = start
+        rows.append((attempt_id, rng.randint(1, num_users), rng.randint(1, num_assessments),
+                     start, start + timedelta(minutes=45), rng.uniform(0, 100)))
+    connection.executemany(
+        "INSERT INTO attempts (id, user_id, assessment_id, start_time, end_time, risk_score) VALUES (?, ?, ?, ?, ?, ?)",
+        rows,
+    )
+
+    event_types = ("tab_switch", "face_missing", "copy_paste")
+    batch = []
+    for _ in range(num_events):
+        attempt_id = rng.randint(1, num_attempts)
+        batch.append((attempt_id, rng.choice(event_types), 1.0,
+                      starts[attempt_id] + timedelta(seconds=rng.randint(0, 2700))))
+        if len(batch) == 100_000:
+            connection.executemany(
+                "INSERT INTO behavior_logs (attempt_id, event_type, severity_score, timestamp) VALUES (?, ?, ?, ?)", batch)
+            batch.clear()
+    if batch:
+        connection.executemany(
+            "INSERT INTO behavior_logs (attempt_id, event_type, severity_score, timestamp) VALUES (?, ?, ?, ?)", batch)
+    connection.commit()
+    return {"attempt": num_attempts, "user": num_users, "assessment": num_assessments}
+
+
+def time_queries(connection: sqlite3.Connection, sizes: dict, rng: random.Random, repeat: int = 200) -> dict:
+    results = {}
+    for name, (sql, key, extra_params) in QUERIES.items():
+        params = [(rng.randint(1, sizes[key]),) + extra_params for _ in range(repeat)]
+        started = time.perf_counter()
+        for args in params:
+            connection.execute(sql, args).fetchall()
+        results[name] = (time.perf_counter() - started) / repeat * 1000.0
+    return results
+
+
+def main() -> None:
+    num_events = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    rng = random.Random(42)
+    path = os.path.join(tempfile.mkdtemp(prefix="trustscore-bench-"), "bench.db")
+    connection = sqlite3.connect(path, detect_types=sqlite3.PARSE_DECLTYPES)
+
+    with open(os.path.join(ROOT, "database", "schema.sql"), encoding="utf-8") as handle:
+        connection.executescript(handle.read())
+    for index in COMPOSITE_INDEXES:
+        connection.execute(f"DROP INDEX IF EXISTS {index}")
+
+    started = time.perf_counter()
+    sizes = seed(connection, num_events, rng)
+    print(f"seeded {num_events:,} events / {sizes['attempt']:,} attempts in {time.perf_counter() - started:.1f}s")
+
+    connection.execute("ANALYZE")
+    before = time_queries(connection, sizes, rng, repeat=20)
+
+    with open(os.path.join(ROOT, "database", "migrations", "001_access_pattern_indexes.sql"), encoding="utf-8") as handle:
+        migration = handle.read()
+    started = time.perf_counter()
+    for statement in migration.split(";"):
+        if "CREATE INDEX" in statement:
+            connection.execute(statement)
+    connection.execute("ANALYZE")
+    print(f"migration indexes built in {time.perf_counter() - started:.1f}s")
+    after = time_queries(connection, sizes, rng)
+
+    print(f"{'query':<34} {'before ms':>10} {'after ms':>10}")
+    for name in QUERIES:
+        print(f"{name:<34} {before[name]:>10.3f} {after[name]:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
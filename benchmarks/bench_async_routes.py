@@ -0,0 +1,104 @@
+"""
+Side-by-side load test of the async (AsyncSession) user routes against the
+equivalent sync routes (blocking Session on FastAPI's threadpool).
+
+Both variants are mounted on one app and hit with the same concurrent load.
+The sync variant mirrors the previous `def` implementation of the routes.
+
+Usage: python benchmarks/bench_async_routes.py [requests] [concurrency]
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "backend"))
+os.chdir(tempfile.mkdtemp(prefix="trustscore-bench-"))
+# With more in-flight requests than pooled connections, the sync variant can
+# starve: threadpool workers block waiting for connections that are only
+# released by teardowns queued behind them. Fail fast and report it.
+os.environ.setdefault("DB_POOL_TIMEOUT", "5")
+
+import httpx
+import jwt
+from fastapi import Depends, FastAPI, HTTPException
+from sqlalchemy import insert
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.orm import Session
+
+from app.core.security import ALGORITHM, SECRET_KEY, create_access_token
+from app.database.base import Base
+from app.database.db import SessionLocal, engine, get_db
+from app.main import app
+from app.models.user import User
+from app.routes.users import oauth2_scheme
+from app.schemas.user_schema import UserResponse
+
+
+def get_current_user_sync(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
+    user_id = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])["sub"]
+    user = db.query(User).filter(User.id == int(user_id)).first()
+    if user is None:
+        raise HTTPException(status_code=401)
+    return user
+
+
+def build_sync_app() -> FastAPI:
+    sync_app = FastAPI()
+
+    @sync_app.get("/api/users/", response_model=list[UserResponse])
+    def get_users(skip: int = 0, limit: int = 100, db: Session = Depends(get_db), current_user: User = Depends(get_current_user_sync)):
+        return db.query(User).offset(skip).limit(limit).all()
+
+    @sync_app.get("/api/users/{user_id}", response_model=UserResponse)
+    def get_user(user_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user_sync)):
+        return db.query(User).filter(User.id == user_id).first()
+
+    return sync_app
+
+
+async def load(target: FastAPI, path_for, headers: dict, requests: int, concurrency: int) -> str:
+    semaphore = asyncio.Semaphore(concurrency)
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=target), base_url="http://bench") as client:
+        async def one(i):
+            async with semaphore:
+                response = await client.get(path_for(i), headers=headers)
+                assert response.status_code == 200, response.text
+
+        started = time.perf_counter()
+        try:
+            await asyncio.gather(*(one(i) for i in range(requests)))
+        except PoolTimeoutError:
+            return "pool starved"
+        return f"{requests / (time.perf_counter() - started):.1f}"
+
+
+async def main() -> None:
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        db.execute(insert(User), [
+            {"name": f"User {i}", "email": f"user{i}@example.com", "hashed_password": "x", "trust_score": 100}
+            for i in range(1, 1001)
+        ])
+        db.commit()
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': '1'})}"}
+
+    sync_app = build_sync_app()
+    cases = {
+        "GET /api/users/": lambda i: "/api/users/?limit=20",
+        "GET /api/users/{id}": lambda i: f"/api/users/{i % 1000 + 1}",
+    }
+    print(f"{'endpoint':<22} {'sync req/s':>12} {'async req/s':>12}")
+    for name, path_for in cases.items():
+        sync_rate = await load(sync_app, path_for, headers, requests, concurrency)
+        async_rate = await load(app, path_for, headers, requests, concurrency)
+        print(f"{name:<22} {sync_rate:>12} {async_rate:>12}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,76 @@
+"""
+Authenticated requests/sec with and without the auth cache.
+
+Hits an endpoint whose handler does no database work (the live risk of an
+attempt), so the numbers isolate the cost of resolving the bearer token:
+- sub-only token, cache off: decode + user lookup on every request
+- identity-claims token, cache off: decode only
+- cache on: one dict lookup per request
+
+Usage: python benchmarks/bench_auth_cache.py [requests] [concurrency]
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "backend"))
+
+
+async def measure(app, headers: dict, requests: int, concurrency: int) -> float:
+    import httpx
+
+    semaphore = asyncio.Semaphore(concurrency)
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        async def one(i):
+            async with semaphore:
+                response = await client.get(f"/api/attempts/{i % 100 + 1}/risk", headers=headers)
+                assert response.status_code == 200, response.text
+
+        await one(0)  # Warm up
+        started = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(requests)))
+        return requests / (time.perf_counter() - started)
+
+
+async def main() -> None:
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    from sqlalchemy import insert
+
+    from app.core.auth_cache import auth_cache
+    from app.core.security import build_identity_claims, create_access_token
+    from app.database.base import Base
+    from app.database.db import SessionLocal, engine
+    from app.main import app
+    from app.models.user import User
+
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        db.execute(insert(User), [{"id": 1, "name": "Bench", "email": "bench@example.com", "hashed_password": "x", "role": "student"}])
+        db.commit()
+        user = db.get(User, 1)
+        claims_token = create_access_token(build_identity_claims(user))
+    sub_only_token = create_access_token({"sub": "1"})
+
+    cache_size = auth_cache.max_entries
+    auth_cache.max_entries = 0
+    auth_cache.clear()
+    lookup = await measure(app, {"Authorization": f"Bearer {sub_only_token}"}, requests, concurrency)
+    decode = await measure(app, {"Authorization": f"Bearer {claims_token}"}, requests, concurrency)
+
+    auth_cache.max_entries = cache_size
+    cached = await measure(app, {"Authorization": f"Bearer {sub_only_token}"}, requests, concurrency)
+
+    print(f"sub-only token, no cache (DB lookup): {lookup:>8.1f} req/s")
+    print(f"claims token, no cache (decode only): {decode:>8.1f} req/s")
+    print(f"cache enabled:                        {cached:>8.1f} req/s")
+    print(f"cache stats:                          {auth_cache.get_stats()}")
+
+
+if __name__ == "__main__":
+    os.chdir(tempfile.mkdtemp(prefix="trustscore-bench-"))
+    asyncio.run(main())
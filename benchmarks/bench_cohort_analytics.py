@@ -0,0 +1,100 @@
+"""
+Cohort analytics for the admin dashboard: computing the risk histogram, flagged
+count and daily trend from raw attempts on every request versus reading the
+pre-aggregated daily tables (GET /api/analytics/cohort). Also times the
+incremental per-attempt update and checks both reads agree.
+
+Usage: python benchmarks/bench_cohort_analytics.py [num_attempts] [num_assessments]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "backend"))
+
+
+def timed(func, repeat: int = 5) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return (time.perf_counter() - started) / repeat * 1000.0, result
+
+
+def main() -> None:
+    num_attempts = int(sys.argv[1]) if len(sys.argv) > 1 else 300_000
+    num_assessments = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    from sqlalchemy import insert, select
+
+    from app.database.base import Base
+    from app.database.db import SessionLocal, engine
+    from app.models.attempt import Attempt
+    from app.services.cohort_analytics_service import CohortAnalyticsService
+    from ai_engine.report_generator import MANDATORY_REVIEW_RISK_THRESHOLD
+    from ai_engine.score_histogram import histogram_bucket
+
+    Base.metadata.create_all(bind=engine)
+    rng = random.Random(11)
+    end = datetime(2026, 6, 30, 23, 0)
+    with SessionLocal() as db:
+        for offset in range(0, num_attempts, 100_000):
+            rows = []
+            for _ in range(offset, min(offset + 100_000, num_attempts)):
+                finished = end - timedelta(minutes=rng.randint(0, 90 * 24 * 60))
+                rows.append({"user_id": rng.randint(1, 5000), "assessment_id": rng.randint(1, num_assessments),
+                             "start_time": finished - timedelta(minutes=45), "end_time": finished,
+                             "risk_score": min(rng.expovariate(1 / 25.0), 100.0)})
+            db.execute(insert(Attempt), rows)
+        db.commit()
+        started = time.perf_counter()
+        CohortAnalyticsService.rebuild_all(db)
+        rebuild_seconds = time.perf_counter() - started
+
+    start_day, end_day = (end - timedelta(days=29)).date(), end.date()
+    window_start = datetime.combine(start_day, datetime.min.time())
+
+    def from_attempts():
+        with SessionLocal() as db:
+            counts, daily = [0] * 10, defaultdict(int)
+            flagged = 0
+            query = select(Attempt.end_time, Attempt.risk_score).where(
+                Attempt.assessment_id == 1, Attempt.end_time >= window_start, Attempt.risk_score.is_not(None)
+            )
+            for finished, risk_score in db.execute(query):
+                counts[histogram_bucket(risk_score)] += 1
+                flagged += risk_score >= MANDATORY_REVIEW_RISK_THRESHOLD
+                daily[finished.date()] += 1
+            return counts, flagged
+
+    def from_aggregates():
+        with SessionLocal() as db:
+            result = CohortAnalyticsService.get_cohort(db, start_day, end_day, 1)
+            return result["risk_histogram"]["counts"], result["flagged"]
+
+    raw_ms, raw = timed(from_attempts)
+    aggregate_ms, aggregated = timed(from_aggregates, repeat=50)
+    print(f"{num_attempts} attempts, {num_assessments} assessments, 90 days (rebuild {rebuild_seconds:.2f} s)")
+    print(f"30-day cohort of one assessment, from attempts:   {raw_ms:8.2f} ms")
+    print(f"30-day cohort of one assessment, from aggregates: {aggregate_ms:8.2f} ms ({raw_ms / aggregate_ms:.0f}x)")
+    print(f"results agree: {raw == aggregated}")
+
+    with SessionLocal() as db:
+        attempt = Attempt(user_id=1, assessment_id=1, start_time=end, end_time=end, risk_score=42.0)
+        db.add(attempt)
+        db.flush()
+        started = time.perf_counter()
+        for _ in range(200):
+            CohortAnalyticsService.record_attempt(db, attempt, 90.0)
+        print(f"incremental update per finalized attempt:          {(time.perf_counter() - started) / 200 * 1000.0:8.2f} ms")
+        db.rollback()
+
+
+if __name__ == "__main__":
+    os.chdir(tempfile.mkdtemp(prefix="trustscore-bench-"))
+    main()
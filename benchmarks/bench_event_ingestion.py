@@ -0,0 +1,78 @@
+"""
+Load benchmark for POST /api/attempts/{id}/events.
+
+Drives the FastAPI app in-process with a fresh SQLite database and reports
+acknowledged events/sec and end-to-end (persisted) events/sec, for one event
+per request and for batched requests, plus write-behind queue counters.
+
+Usage: python benchmarks/bench_event_ingestion.py [requests] [events_per_request]
+"""
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "backend"))
+
+# Run against a throwaway database in a temporary working directory
+os.chdir(tempfile.mkdtemp(prefix="trustscore-bench-"))
+
+from fastapi.testclient import TestClient
+
+from app.database.base import Base
+from app.database.db import SessionLocal, engine
+from app.main import app
+from app.models.behavior_log import BehaviorLog
+from app.services.event_ingestion import behavior_event_queue
+
+EVENT_TYPES = ["tab_switch", "face_missing", "copy_paste"]
+
+
+def authenticate(client: TestClient) -> dict:
+    credentials = {"name": "Bench", "email": "bench@example.com", "password": "bench-password"}
+    client.post("/api/auth/register", json=credentials)
+    token = client.post("/api/auth/login", json=credentials).json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+def run(client: TestClient, headers: dict, requests: int, batch_size: int) -> tuple:
+    batch = [{"event_type": EVENT_TYPES[i % len(EVENT_TYPES)], "severity_score": 1.0} for i in range(batch_size)]
+    target = behavior_event_queue.written_events + requests * batch_size
+
+    started = time.perf_counter()
+    for request_number in range(requests):
+        response = client.post(f"/api/attempts/{request_number % 50 + 1}/events", json=batch, headers=headers)
+        assert response.status_code == 202, response.text
+    acknowledged = time.perf_counter() - started
+
+    # Wait for the background drainer to persist everything
+    while behavior_event_queue.written_events < target:
+        time.sleep(0.005)
+    persisted = time.perf_counter() - started
+
+    total = requests * batch_size
+    return total / acknowledged, total / persisted
+
+
+def main() -> None:
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    Base.metadata.create_all(bind=engine)
+
+    with TestClient(app) as client:
+        headers = authenticate(client)
+        single = run(client, headers, requests, 1)
+        batched = run(client, headers, requests, batch_size)
+        stats = behavior_event_queue.get_stats()
+
+    with SessionLocal() as db:
+        stored = db.query(BehaviorLog).count()
+
+    print(f"1 event/request:     {single[0]:,.0f} acked events/sec, {single[1]:,.0f} persisted events/sec")
+    print(f"{batch_size} events/request:   {batched[0]:,.0f} acked events/sec, {batched[1]:,.0f} persisted events/sec")
+    print(f"flushes:             {stats['flush_count']} (avg {stats['avg_flush_ms']} ms, max {stats['max_flush_ms']} ms)")
+    print(f"rows stored:         {stored}")
+
+if __name__ == "__main__":
+    main()
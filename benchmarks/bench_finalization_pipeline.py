@@ -0,0 +1,96 @@
+"""
+Finalize a batch of attempts the old way (every ai_engine module called on its
+own, with the risk score recomputed for the explanation and each submission
+compared pairwise against all earlier ones) versus AttemptFinalizationPipeline,
+and print the pipeline's per-stage timings.
+
+Usage: python benchmarks/bench_finalization_pipeline.py [num_attempts] [workers]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from ai_engine.code_similarity import CodeSimilarityAnalyzer
+from ai_engine.explainability import ExplainabilityEngine
+from ai_engine.pipeline import AttemptFinalizationPipeline, FinishedAttempt
+from ai_engine.report_generator import ReportGenerator
+from ai_engine.risk_calculator import RiskCalculator
+from ai_engine.skill_analyzer import SkillAnalyzer
+from ai_engine.trust_score_updater import TrustUpdater
+
+sys.path.insert(0, os.path.dirname(__file__))
+from bench_fingerprint_index import make_submission  # noqa: E402
+
+
+def make_attempts(count: int, rng: random.Random):
+    return [
+        FinishedAttempt(
+            attempt_id=i,
+            user_id=i % 500,
+            assessment_id=i % 4,
+            code=make_submission(rng),
+            time_taken=rng.randint(60, 3600),
+            test_cases_passed=rng.randint(0, 10),
+            total_test_cases=10,
+            final_score=rng.uniform(0, 100),
+            old_trust_score=100.0,
+            tab_switch_count=rng.randint(0, 5),
+            face_absent_seconds=rng.uniform(0, 30),
+            copy_paste_count=rng.randint(0, 3),
+            multiple_faces_detected=rng.random() < 0.05
+        )
+        for i in range(count)
+    ]
+
+
+def finalize_separately(attempts):
+    previous = {}
+    for attempt in attempts:
+        skills = SkillAnalyzer.analyze_submission(
+            attempt.time_taken, len(attempt.code), attempt.test_cases_passed, attempt.total_test_cases
+        )
+        past = previous.setdefault(attempt.assessment_id, [])
+        similarity = max((CodeSimilarityAnalyzer.calculate_similarity(attempt.code, code) for code in past), default=0.0)
+        past.append(attempt.code)
+        risk = RiskCalculator.calculate_risk_score(
+            attempt.tab_switch_count, attempt.face_absent_seconds, similarity,
+            attempt.copy_paste_count, attempt.multiple_faces_detected
+        )
+        trust = TrustUpdater.update_trust_score(attempt.old_trust_score, risk)
+        explanation = ExplainabilityEngine.generate_risk_explanation(
+            attempt.tab_switch_count, attempt.face_absent_seconds, similarity,
+            attempt.copy_paste_count, attempt.multiple_faces_detected, risk
+        )
+        ReportGenerator.generate_final_report(
+            attempt.user_id, attempt.final_score, risk, attempt.old_trust_score, trust, skills, explanation
+        )
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    attempts = make_attempts(count, random.Random(7))
+
+    started = time.perf_counter()
+    finalize_separately(attempts)
+    separate_seconds = time.perf_counter() - started
+
+    pipeline = AttemptFinalizationPipeline(max_workers=workers)
+    started = time.perf_counter()
+    results = pipeline.run_batch(attempts)
+    pipeline_seconds = time.perf_counter() - started
+
+    print(f"attempts:           {count} ({workers} workers)")
+    print(f"separate modules:   {separate_seconds:.2f} s  ({count / separate_seconds:.0f} attempts/s)")
+    print(f"pipeline:           {pipeline_seconds:.2f} s  ({len(results) / pipeline_seconds:.0f} attempts/s)")
+    print(f"speedup:            {separate_seconds / max(pipeline_seconds, 1e-9):.1f}x")
+    print("per-stage mean (ms):")
+    for stage, timing in pipeline.get_stage_timings()["stages"].items():
+        print(f"  {stage:<12} {timing['mean_ms']:.3f}")
+
+
+if __name__ == "__main__":
+    main()
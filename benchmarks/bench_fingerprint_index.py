@@ -0,0 +1,74 @@
+"""
+Compare a brute-force pairwise scan against FingerprintIndex.find_similar
+for one submission checked against an assessment's past submissions.
+
+Usage: python benchmarks/bench_fingerprint_index.py [num_submissions]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from ai_engine.code_similarity import CodeSimilarityAnalyzer, FingerprintIndex
+
+TEMPLATE_LINES = [
+    "def solve(nums):",
+    "    total = 0",
+    "    seen = set()",
+    "    for i, value in enumerate(nums):",
+    "        if value in seen:",
+    "            continue",
+    "        seen.add(value)",
+    "        total += value * i",
+    "    result = sorted(seen)",
+    "    while result and result[-1] > total:",
+    "        result.pop()",
+    "    return total + len(result)",
+]
+
+
+def make_submission(rng: random.Random) -> str:
+    lines = list(TEMPLATE_LINES)
+    rng.shuffle(lines[1:-1])
+    names = ["acc", "tmp", "cnt", "idx", "buf", "val", "res", "key"]
+    extra = [f"    {rng.choice(names)}{rng.randint(0, 999)} = {rng.randint(0, 10**6)}" for _ in range(rng.randint(2, 12))]
+    for line in extra:
+        lines.insert(rng.randint(1, len(lines) - 1), line)
+    return "\n".join(lines)
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    rng = random.Random(42)
+    corpus = {submission_id: make_submission(rng) for submission_id in range(count)}
+    query = corpus[count // 2] + "\n# tweaked copy"
+
+    index = FingerprintIndex()
+    started = time.perf_counter()
+    for submission_id, code in corpus.items():
+        index.add_submission("bench", submission_id, code)
+    build_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    brute = sorted(
+        ((submission_id, CodeSimilarityAnalyzer.calculate_similarity(query, code)) for submission_id, code in corpus.items()),
+        key=lambda item: item[1],
+        reverse=True
+    )[:5]
+    brute_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    indexed = index.find_similar(query, "bench", top_k=5)
+    index_seconds = time.perf_counter() - started
+
+    print(f"submissions:        {count}")
+    print(f"index build:        {build_seconds * 1000:.1f} ms")
+    print(f"brute-force query:  {brute_seconds * 1000:.1f} ms  top={brute[0]}")
+    print(f"indexed query:      {index_seconds * 1000:.1f} ms  top={indexed[0] if indexed else None}")
+    print(f"speedup:            {brute_seconds / max(index_seconds, 1e-9):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Simulate the exam-start login burst: many concurrent logins while a probe
+keeps calling /health. Reports login outcomes (200 vs fast 503 rejections)
+and /health latency during the burst, which must stay low because bcrypt
+work runs on the dedicated password process pool.
+
+Usage: python benchmarks/bench_login_burst.py [logins] [bcrypt_rounds]
+"""
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "backend"))
+
+
+async def burst(logins: int) -> None:
+    import httpx
+
+    from app.core.security import password_hasher
+    from app.database.base import Base
+    from app.database.db import engine
+    from app.main import app
+
+    Base.metadata.create_all(bind=engine)
+    credentials = {"name": "Bench", "email": "bench@example.com", "password": "bench-password"}
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        await client.post("/api/auth/register", json=credentials)
+
+        statuses = []
+        health_latencies = []
+        done = asyncio.Event()
+
+        async def login():
+            response = await client.post("/api/auth/login", json=credentials)
+            statuses.append(response.status_code)
+
+        async def probe():
+            while not done.is_set():
+                started = time.perf_counter()
+                await client.get("/health")
+                health_latencies.append((time.perf_counter() - started) * 1000.0)
+                await asyncio.sleep(0.01)
+
+        probe_task = asyncio.create_task(probe())
+        started = time.perf_counter()
+        await asyncio.gather(*(login() for _ in range(logins)))
+        elapsed = time.perf_counter() - started
+        done.set()
+        await probe_task
+
+    password_hasher.shutdown()
+
+    health_latencies.sort()
+    print(f"logins:               {logins} in {elapsed:.2f}s")
+    print(f"  200 OK:             {statuses.count(200)}")
+    print(f"  503 fast-rejected:  {statuses.count(503)}")
+    print(f"/health during burst: p50 {statistics.median(health_latencies):.2f} ms, "
+          f"p99 {health_latencies[int(len(health_latencies) * 0.99) - 1]:.2f} ms ({len(health_latencies)} probes)")
+
+
+def main() -> None:
+    logins = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    os.environ.setdefault("BCRYPT_ROUNDS", sys.argv[2] if len(sys.argv) > 2 else "10")
+    os.chdir(tempfile.mkdtemp(prefix="trustscore-bench-"))
+    asyncio.run(burst(logins))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Memory per tracked examinee: a BehaviorMonitor with a per-instance __dict__
+(as before), the __slots__ BehaviorMonitor, and the struct-of-arrays
+MonitorRegistry. Measured with tracemalloc for monitors that were never absent
+and for monitors with a few recorded absences.
+
+Usage: python benchmarks/bench_monitor_memory.py [examinees] [absences_per_examinee]
+"""
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from ai_engine.behavior_monitor import BehaviorMonitor
+from ai_engine.monitor_registry import MonitorRegistry
+
+
+class DictBehaviorMonitor(BehaviorMonitor):
+    """A subclass without __slots__ gets a per-instance __dict__ again."""
+
+
+def measure(build) -> int:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return after - before
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    absences = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    clock = time.monotonic
+
+    def monitors(cls, with_absences):
+        def build():
+            tracked = {}
+            for attempt_id in range(count):
+                monitor = cls(clock=clock)
+                for step in range(absences if with_absences else 0):
+                    monitor.update_face_status(False, step * 10.0)
+                    monitor.update_face_status(True, step * 10.0 + 2.5)
+                tracked[attempt_id] = monitor
+            return tracked
+        return build
+
+    def registry(with_absences):
+        def build():
+            tracked = MonitorRegistry(capacity=count, clock=clock)
+            for attempt_id in range(count):
+                tracked.add(attempt_id)
+                for step in range(absences if with_absences else 0):
+                    tracked.update_face_status(attempt_id, False, step * 10.0)
+                    tracked.update_face_status(attempt_id, True, step * 10.0 + 2.5)
+            return tracked
+        return build
+
+    print(f"{count} examinees; bytes per tracked examinee (including the attempt id -> monitor mapping)")
+    print(f"{'':28} {'no absences':>12} {f'{absences} absences':>12}")
+    for label, factory in (
+        ("BehaviorMonitor (__dict__)", lambda flag: monitors(DictBehaviorMonitor, flag)),
+        ("BehaviorMonitor (__slots__)", lambda flag: monitors(BehaviorMonitor, flag)),
+        ("MonitorRegistry", registry),
+    ):
+        idle = measure(factory(False)) / count
+        busy = measure(factory(True)) / count
+        print(f"{label:28} {idle:12.1f} {busy:12.1f}")
+
+    tracked = registry(True)()
+    started = time.perf_counter()
+    summary = tracked.summary()
+    print(f"registry dashboard summary over {summary['live_attempts']} attempts: "
+          f"{(time.perf_counter() - started) * 1000.0:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
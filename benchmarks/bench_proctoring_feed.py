@@ -0,0 +1,126 @@
+"""
+Live proctoring fan-out: every live-risk change pushed to every proctor through
+a plain per-subscriber asyncio.Queue versus ProctoringFeed (encode once,
+per-attempt coalescing, bounded buffers with snapshot resync). A share of the
+subscribers is stalled to model slow consumers. Reports publish cost, frames
+written and the largest backlog held for one subscriber.
+
+Usage: python benchmarks/bench_proctoring_feed.py [num_subscribers] [num_updates] [num_attempts]
+"""
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "backend"))
+
+# Share of subscribers that stop reading during the run
+STALLED_SHARE = 0.1
+
+
+def summary(attempt_id: int, event_count: int) -> dict:
+    return {
+        "tab_switch_count": event_count, "face_absent_seconds": 0.0, "copy_paste_count": 0,
+        "multiple_faces_detected": False, "live_risk_score": min(event_count * 10.0, 100.0),
+        "event_count": event_count, "attempt_id": attempt_id
+    }
+
+
+async def run_queues(num_subscribers: int, updates: list) -> tuple:
+    queues = [asyncio.Queue() for _ in range(num_subscribers)]
+    stalled = int(num_subscribers * STALLED_SHARE)
+    written = 0
+
+    async def consume(queue):
+        nonlocal written
+        while True:
+            await queue.get()
+            written += 1
+
+    consumers = [asyncio.create_task(consume(queue)) for queue in queues[stalled:]]
+    started = time.perf_counter()
+    for index, (attempt_id, event_count) in enumerate(updates):
+        frame = f"event: risk\ndata: {json.dumps(summary(attempt_id, event_count))}\n\n".encode()
+        for queue in queues:
+            queue.put_nowait(frame)
+        if index % 100 == 0:
+            await asyncio.sleep(0)
+    elapsed = time.perf_counter() - started
+    await asyncio.sleep(0.05)
+    backlog = max(queue.qsize() for queue in queues)
+    for consumer in consumers:
+        consumer.cancel()
+    return elapsed, written, backlog
+
+
+async def run_feed(num_subscribers: int, updates: list, num_attempts: int) -> tuple:
+    from app.services.proctoring_feed import ProctoringFeed
+
+    state = {}
+    feed = ProctoringFeed(
+        snapshot_source=lambda: [summary(attempt_id, count) for attempt_id, count in state.items()],
+        summary_source=lambda attempt_id: summary(attempt_id, state[attempt_id]),
+        flush_interval=0.05,
+        max_pending=num_attempts // 2,
+        max_subscribers=num_subscribers
+    )
+    stalled = int(num_subscribers * STALLED_SHARE)
+    subscribers = [feed.subscribe() for _ in range(num_subscribers)]
+    written = 0
+
+    async def consume(subscriber):
+        nonlocal written
+        async for chunk in feed.stream(subscriber):
+            written += chunk.count(b"event: ")
+
+    # Stalled subscribers are never read after connecting
+    consumers = [asyncio.create_task(consume(subscriber)) for subscriber in subscribers[stalled:]]
+    for subscriber in subscribers[:stalled]:
+        subscriber.needs_snapshot = False
+    await asyncio.sleep(0)
+
+    started = time.perf_counter()
+    for index, (attempt_id, event_count) in enumerate(updates):
+        state[attempt_id] = event_count
+        feed.publish_risk(attempt_id)
+        if index % 100 == 0:
+            await asyncio.sleep(0)
+    elapsed = time.perf_counter() - started
+    await asyncio.sleep(0.1)
+    backlog = max(len(subscriber.pending) for subscriber in subscribers)
+    stats = feed.get_stats()
+    feed.close()
+    await asyncio.gather(*consumers)
+    return elapsed, written, backlog, stats
+
+
+def main() -> None:
+    num_subscribers = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    num_updates = int(sys.argv[2]) if len(sys.argv) > 2 else 20000
+    num_attempts = int(sys.argv[3]) if len(sys.argv) > 3 else 2000
+
+    rng = random.Random(5)
+    counts = {}
+    updates = []
+    for _ in range(num_updates):
+        attempt_id = rng.randint(1, num_attempts)
+        counts[attempt_id] = counts.get(attempt_id, 0) + 1
+        updates.append((attempt_id, counts[attempt_id]))
+
+    print(f"{num_updates} updates of {num_attempts} attempts to {num_subscribers} subscribers "
+          f"({int(num_subscribers * STALLED_SHARE)} stalled)")
+    elapsed, written, backlog = asyncio.run(run_queues(num_subscribers, updates))
+    print(f"per-subscriber queues: {elapsed / num_updates * 1e6:8.1f} us/update, "
+          f"{written:9d} frames written, max backlog {backlog} frames")
+    elapsed, written, backlog, stats = asyncio.run(run_feed(num_subscribers, updates, num_attempts))
+    print(f"ProctoringFeed:        {elapsed / num_updates * 1e6:8.1f} us/update, "
+          f"{written:9d} frames written, max backlog {backlog} frames "
+          f"({stats['coalesced_updates']} coalesced, {stats['resyncs']} resyncs)")
+
+
+if __name__ == "__main__":
+    main()
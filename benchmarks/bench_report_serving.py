@@ -0,0 +1,92 @@
+"""
+Serving final reports: rebuilding and serializing a report on every request
+versus returning the stored canonical payload (200) or just its ETag (304), and
+listing reports by materializing every report versus streaming the stored
+payloads (GET /api/reports/). Reports time and peak traced memory.
+
+Usage: python benchmarks/bench_report_serving.py [num_reports]
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "backend"))
+
+
+def timed(func, repeat: int = 2000) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - started) / repeat * 1e6
+
+
+def traced(func):
+    tracemalloc.start()
+    started = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+    from sqlalchemy import insert, select
+
+    from app.database.base import Base
+    from app.database.db import SessionLocal, engine
+    from app.models.attempt_report import AttemptReport
+    from app.routes.reports import _etag, _stream_reports
+    from ai_engine.explainability import ExplainabilityEngine
+    from ai_engine.report_generator import ReportGenerator
+
+    explanation = ExplainabilityEngine.generate_risk_explanation(3, 12.5, 40.0, 1, False, 62.5)
+    skills = {"problem_solving_score": 80.0, "logic_score": 75.0, "efficiency_score": 90.0}
+    timeline = [{"start": float(i * 30), "end": float(i * 30 + 2.5), "seconds": 2.5} for i in range(5)]
+
+    def build(user_id):
+        return ReportGenerator.generate_final_report(user_id, 70.0, 62.5, 100.0, 93.75, skills, explanation, timeline)
+
+    payload, content_hash = ReportGenerator.serialize_report(build(1))
+    etag = _etag(content_hash)
+    print(f"report size: {len(payload)} bytes")
+    print(f"rebuild + json.dumps per request: {timed(lambda: json.dumps(build(1)).encode()):8.1f} us")
+    print(f"stored payload (200):            {timed(lambda: bytes(payload)):8.1f} us")
+    print(f"ETag match (304):                {timed(lambda: _etag(content_hash) == etag):8.1f} us")
+
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        rows = []
+        for attempt_id in range(1, count + 1):
+            body, digest = ReportGenerator.serialize_report(build(attempt_id % 500))
+            rows.append({"attempt_id": attempt_id, "user_id": attempt_id % 500, "content_hash": digest, "payload": body})
+        db.execute(insert(AttemptReport), rows)
+        db.commit()
+        del rows
+
+    def materialized():
+        with SessionLocal() as db:
+            reports = [json.loads(body) for body in db.execute(select(AttemptReport.payload).order_by(AttemptReport.attempt_id)).scalars()]
+        return json.dumps(reports).encode()
+
+    def streamed():
+        size = 0
+        for chunk in _stream_reports(None, None, None):
+            size += len(chunk)
+        return size
+
+    for label, func in (("materialized list", materialized), ("streamed payloads", streamed)):
+        elapsed, peak = traced(func)
+        print(f"{label:18} of {count} reports: {elapsed * 1000.0:8.1f} ms, peak memory {peak / 1e6:7.1f} MB")
+
+
+if __name__ == "__main__":
+    os.chdir(tempfile.mkdtemp(prefix="trustscore-bench-"))
+    main()
@@ -0,0 +1,46 @@
+"""
+Compare per-attempt RiskCalculator.calculate_risk_score calls against
+RiskCalculator.calculate_risk_scores_batch, and check both agree exactly.
+
+Usage: python benchmarks/bench_risk_batch.py [num_attempts]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from ai_engine.risk_calculator import RiskCalculator
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    rng = np.random.default_rng(42)
+    tab_switches = rng.integers(0, 8, count)
+    absent = rng.integers(0, 40, count)
+    similarity = np.round(rng.uniform(0.0, 100.0, count), 2)
+    copy_paste = rng.integers(0, 5, count)
+    multiple_faces = rng.random(count) < 0.05
+
+    columns = (tab_switches.tolist(), absent.tolist(), similarity.tolist(), copy_paste.tolist(), multiple_faces.tolist())
+
+    started = time.perf_counter()
+    scalar = [RiskCalculator.calculate_risk_score(*row) for row in zip(*columns)]
+    scalar_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    batch = RiskCalculator.calculate_risk_scores_batch(tab_switches, absent, similarity, copy_paste, multiple_faces)
+    batch_seconds = time.perf_counter() - started
+
+    mismatches = int(np.count_nonzero(np.asarray(scalar) != batch))
+    print(f"attempts:           {count}")
+    print(f"scalar loop:        {scalar_seconds * 1e9 / count:.1f} ns/attempt")
+    print(f"vectorized batch:   {batch_seconds * 1e9 / count:.1f} ns/attempt")
+    print(f"speedup:            {scalar_seconds / max(batch_seconds, 1e-9):.1f}x")
+    print(f"mismatches:         {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
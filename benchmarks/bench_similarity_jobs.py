@@ -0,0 +1,60 @@
+"""
+Measure similarity-job throughput (pairs scored per second) on the process pool
+for increasing worker counts, against scoring the same pairs inline. Throughput
+should grow close to linearly with workers up to the number of cores.
+
+Usage: python benchmarks/bench_similarity_jobs.py [jobs] [candidates_per_job] [max_workers]
+"""
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "backend"))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from bench_fingerprint_index import make_submission  # noqa: E402
+
+
+def main() -> None:
+    jobs = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    per_job = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    max_workers = int(sys.argv[3]) if len(sys.argv) > 3 else (os.cpu_count() or 2)
+
+    from app.services.similarity_jobs import JOB_DONE, SimilarityJobService
+    from ai_engine.code_similarity import CodeSimilarityAnalyzer
+
+    rng = random.Random(3)
+    corpus = [(i, make_submission(rng)) for i in range(per_job)]
+    queries = [make_submission(rng) for _ in range(jobs)]
+    pairs = jobs * per_job
+
+    started = time.perf_counter()
+    for query in queries:
+        CodeSimilarityAnalyzer.score_candidates(query, corpus)
+    inline_seconds = time.perf_counter() - started
+    print(f"{jobs} jobs x {per_job} candidates ({os.cpu_count()} cores)")
+    print(f"inline:          {pairs / inline_seconds:8.0f} pairs/s")
+
+    workers = 1
+    while workers <= max_workers:
+        service = SimilarityJobService(max_workers=workers, default_timeout=600)
+        # Warm the pool up so process start-up is not measured
+        service.wait(service.submit(queries[0], corpus[:workers * service.chunk_size]))
+
+        started = time.perf_counter()
+        submitted = [service.submit(query, corpus) for query in queries]
+        for job in submitted:
+            service.wait(job)
+        elapsed = time.perf_counter() - started
+        done = sum(job.status == JOB_DONE for job in submitted)
+        service.shutdown()
+
+        print(f"{workers:2d} worker(s):    {pairs / elapsed:8.0f} pairs/s  "
+              f"speedup {inline_seconds / elapsed:.2f}x  ({done}/{jobs} done)")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Pruning rate of CodeSimilarityAnalyzer.similar_above on an all-pairs scan of a
+synthetic submission corpus (several problems, each solved with local
+variations), per flag threshold: how many pairs each bound rejects, the time
+saved against calculate_similarity() >= threshold, and a check that both agree.
+
+Usage: python benchmarks/bench_similarity_threshold.py [submissions] [thresholds...]
+"""
+import os
+import random
+import sys
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from ai_engine.code_similarity import CodeSimilarityAnalyzer
+
+PROBLEMS = [
+    [
+        "def two_sum(nums, target):",
+        "    seen = {}",
+        "    for index, value in enumerate(nums):",
+        "        if target - value in seen:",
+        "            return [seen[target - value], index]",
+        "        seen[value] = index",
+        "    return []",
+    ],
+    [
+        "class Solution:",
+        "    def is_valid(self, s: str) -> bool:",
+        "        pairs = {')': '(', ']': '[', '}': '{'}",
+        "        stack = []",
+        "        for ch in s:",
+        "            if ch in pairs:",
+        "                if not stack or stack.pop() != pairs[ch]:",
+        "                    return False",
+        "            else:",
+        "                stack.append(ch)",
+        "        return not stack",
+    ],
+    [
+        "import heapq",
+        "",
+        "def merge_k_lists(lists):",
+        "    heap = [(lst[0], i, 0) for i, lst in enumerate(lists) if lst]",
+        "    heapq.heapify(heap)",
+        "    merged = []",
+        "    while heap:",
+        "        value, list_index, position = heapq.heappop(heap)",
+        "        merged.append(value)",
+        "        if position + 1 < len(lists[list_index]):",
+        "            heapq.heappush(heap, (lists[list_index][position + 1], list_index, position + 1))",
+        "    return merged",
+    ],
+    [
+        "def longest_common_subsequence(a, b):",
+        "    rows, cols = len(a), len(b)",
+        "    table = [[0] * (cols + 1) for _ in range(rows + 1)]",
+        "    for i in range(1, rows + 1):",
+        "        for j in range(1, cols + 1):",
+        "            if a[i - 1] == b[j - 1]:",
+        "                table[i][j] = table[i - 1][j - 1] + 1",
+        "            else:",
+        "                table[i][j] = max(table[i - 1][j], table[i][j - 1])",
+        "    return table[rows][cols]",
+        "",
+        "",
+        "if __name__ == '__main__':",
+        "    print(longest_common_subsequence(input(), input()))",
+    ],
+]
+
+NAMES = ["acc", "tmp", "cnt", "idx", "buf", "val", "res", "key", "node", "item"]
+
+
+def make_corpus(count: int, rng: random.Random):
+    corpus = []
+    for _ in range(count):
+        lines = list(rng.choice(PROBLEMS))
+        # Students add debugging, comments, docstrings and helper code of very different sizes
+        for _ in range(rng.choice([0, 1, 2, 4, 8, 16, 32])):
+            kind = rng.random()
+            if kind < 0.4:
+                line = f"    # {rng.choice(NAMES)} {rng.choice(['check', 'todo', 'fix', 'edge case'])}"
+            elif kind < 0.7:
+                line = f"    print('{rng.choice(NAMES)}', {rng.choice(NAMES)}{rng.randint(0, 99)})"
+            else:
+                line = f"    {rng.choice(NAMES)}{rng.randint(0, 999)} = {rng.randint(0, 10 ** 6)}"
+            lines.insert(rng.randint(1, len(lines)), line)
+        corpus.append("\n".join(lines))
+    return corpus
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 150
+    thresholds = [float(value) for value in sys.argv[2:]] or [50.0, 70.0, 80.0, 90.0]
+    corpus = make_corpus(count, random.Random(11))
+    pairs = [(i, j) for i in range(count) for j in range(i + 1, count)]
+
+    started = time.perf_counter()
+    exact = [CodeSimilarityAnalyzer.calculate_similarity(corpus[i], corpus[j]) for i, j in pairs]
+    exact_seconds = time.perf_counter() - started
+    counts = [Counter(code) for code in corpus]
+
+    print(f"{count} submissions, {len(pairs)} pairs; full alignment of every pair: {exact_seconds:.2f} s")
+    print(f"{'threshold':>9} {'flagged':>8} {'length':>8} {'counts':>8} {'aligned':>8} {'pruned':>7} {'time':>8} {'speedup':>8} mismatches")
+    for threshold in thresholds:
+        rejected = Counter()
+        for i, j in pairs:
+            a, b = corpus[i], corpus[j]
+            if CodeSimilarityAnalyzer.length_upper_bound(a, b) < threshold:
+                rejected["length"] += 1
+            elif CodeSimilarityAnalyzer.multiset_upper_bound(counts[i], counts[j], len(a) + len(b)) < threshold:
+                rejected["counts"] += 1
+
+        started = time.perf_counter()
+        flagged = [CodeSimilarityAnalyzer.similar_above(corpus[i], corpus[j], threshold) for i, j in pairs]
+        seconds = time.perf_counter() - started
+
+        mismatches = sum(flag != (score >= threshold) for flag, score in zip(flagged, exact))
+        pruned = rejected["length"] + rejected["counts"]
+        print(f"{threshold:>9.1f} {sum(flagged):>8} {rejected['length']:>8} {rejected['counts']:>8} "
+              f"{len(pairs) - pruned:>8} {pruned / len(pairs):>6.1%} {seconds:>7.2f}s "
+              f"{exact_seconds / max(seconds, 1e-9):>7.1f}x {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Recomputing every trust score from attempt history: a per-user Python loop over
+the attempts (one UPDATE per user) versus TrustService.replay_all (streamed,
+vectorized replay with one bulk write-back). Checks both agree exactly.
+
+Usage: python benchmarks/bench_trust_replay.py [num_attempts] [num_users]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "backend"))
+
+
+def main() -> None:
+    num_attempts = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    num_users = int(sys.argv[2]) if len(sys.argv) > 2 else 50_000
+
+    from sqlalchemy import insert, select, update
+
+    from app.database.base import Base
+    from app.database.db import SessionLocal, engine
+    from app.models.attempt import Attempt
+    from app.models.user import User
+    from app.services.trust_service import TrustService
+
+    Base.metadata.create_all(bind=engine)
+    rng = random.Random(7)
+    origin = datetime(2026, 1, 1)
+    with SessionLocal() as db:
+        db.execute(insert(User), [
+            {"id": i, "name": f"user{i}", "email": f"user{i}@example.com",
+             "hashed_password": "x", "trust_score": 100.0}
+            for i in range(1, num_users + 1)
+        ])
+        for offset in range(0, num_attempts, 100_000):
+            db.execute(insert(Attempt), [
+                {"user_id": rng.randint(1, num_users), "assessment_id": 1,
+                 "start_time": origin + timedelta(minutes=i), "risk_score": rng.uniform(0.0, 100.0)}
+                for i in range(offset, min(offset + 100_000, num_attempts))
+            ])
+        db.commit()
+
+    def sequential():
+        scores = {}
+        with SessionLocal() as db:
+            query = select(Attempt.user_id, Attempt.risk_score).where(Attempt.risk_score.is_not(None))
+            for user_id, risk_score in db.execute(query.order_by(Attempt.user_id, Attempt.start_time, Attempt.id)):
+                scores[user_id] = TrustService.calculate_new_trust_score(scores.get(user_id, 100.0), risk_score)
+            for user_id, score in scores.items():
+                db.execute(update(User).where(User.id == user_id).values(trust_score=score))
+            db.commit()
+        return scores
+
+    started = time.perf_counter()
+    expected = sequential()
+    loop_seconds = time.perf_counter() - started
+
+    with SessionLocal() as db:
+        db.execute(update(User).values(trust_score=100.0))
+        db.commit()
+        started = time.perf_counter()
+        stats = TrustService.replay_all(db)
+        replay_seconds = time.perf_counter() - started
+        actual = dict(db.execute(select(User.id, User.trust_score)).all())
+
+    mismatches = sum(1 for user_id, score in expected.items() if actual[user_id] != score)
+    print(f"{num_attempts} attempts, {num_users} users ({stats['changed']} changed)")
+    print(f"per-user loop:   {loop_seconds:7.2f} s")
+    print(f"replay_all:      {replay_seconds:7.2f} s ({loop_seconds / replay_seconds:.1f}x)")
+    print(f"mismatches:      {mismatches}")
+
+
+if __name__ == "__main__":
+    os.chdir(tempfile.mkdtemp(prefix="trustscore-bench-"))
+    main()
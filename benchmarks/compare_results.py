@@ -0,0 +1,130 @@
+"""
+Compare two benchmark result files (see run_suite.py) and fail on regressions.
+
+A benchmark regresses when its value moves in the wrong direction by more than
+its threshold: --threshold for microbenchmarks, --macro-threshold for the
+noisier macrobenchmarks, or a per-benchmark --limit NAME=FRACTION. Exits with
+status 1 if anything regressed, so it can gate CI.
+
+Usage:
+    python benchmarks/compare_results.py baseline.json current.json
+        [--threshold 0.10] [--macro-threshold 0.25] [--limit micro.risk_calculator.score=0.2]
+"""
+import argparse
+import os
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from harness import load_results
+
+DEFAULT_THRESHOLD = 0.10
+DEFAULT_MACRO_THRESHOLD = 0.25
+
+STATUS_OK = "ok"
+STATUS_IMPROVED = "improved"
+STATUS_REGRESSED = "REGRESSED"
+STATUS_MISSING = "missing"
+STATUS_NEW = "new"
+
+
+def relative_change(baseline: float, current: float, better: str) -> float:
+    """
+    Change of `current` against `baseline` as a fraction, signed so that a
+    positive value is always a regression (slower, or lower throughput).
+    """
+    if baseline == 0:
+        return 0.0
+    change = (current - baseline) / abs(baseline)
+    return change if better == "lower" else -change
+
+
+def compare(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+    macro_threshold: float = DEFAULT_MACRO_THRESHOLD,
+    limits: Optional[Dict[str, float]] = None
+) -> List[Tuple[str, str, Optional[float], Optional[float], Optional[float], float]]:
+    """
+    Compare every benchmark of two result files.
+
+    Returns:
+        (name, status, baseline value, current value, regression fraction, threshold)
+        rows, sorted by name.
+    """
+    limits = limits or {}
+    old, new = baseline["results"], current["results"]
+    rows = []
+    for name in sorted(set(old) | set(new)):
+        limit = limits.get(name, macro_threshold if name.startswith("macro.") else threshold)
+        if name not in new:
+            rows.append((name, STATUS_MISSING, old[name]["value"], None, None, limit))
+            continue
+        if name not in old:
+            rows.append((name, STATUS_NEW, None, new[name]["value"], None, limit))
+            continue
+
+        change = relative_change(old[name]["value"], new[name]["value"], new[name].get("better", "lower"))
+        if change > limit:
+            status = STATUS_REGRESSED
+        elif change < -limit:
+            status = STATUS_IMPROVED
+        else:
+            status = STATUS_OK
+        rows.append((name, status, old[name]["value"], new[name]["value"], change, limit))
+    return rows
+
+
+def comparability_warnings(baseline: Dict[str, Any], current: Dict[str, Any]) -> List[str]:
+    """Differences in environment or workload that make the comparison unreliable."""
+    warnings = []
+    old, new = baseline.get("meta", {}), current.get("meta", {})
+    for key in ("python", "implementation", "machine", "cpu_count", "seed", "macro"):
+        if key in old and key in new and old[key] != new[key]:
+            warnings.append(f"{key} differs: {old[key]} vs {new[key]}")
+    return warnings
+
+
+def _format(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value:.3f}"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files.")
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="allowed microbenchmark regression (fraction)")
+    parser.add_argument("--macro-threshold", type=float, default=DEFAULT_MACRO_THRESHOLD, help="allowed macrobenchmark regression (fraction)")
+    parser.add_argument("--limit", action="append", default=[], metavar="NAME=FRACTION", help="per-benchmark threshold")
+    args = parser.parse_args(argv)
+
+    limits = {}
+    for item in args.limit:
+        name, _, fraction = item.partition("=")
+        try:
+            limits[name] = float(fraction)
+        except ValueError:
+            parser.error(f"invalid --limit {item!r}, expected NAME=FRACTION")
+
+    baseline, current = load_results(args.baseline), load_results(args.current)
+    for warning in comparability_warnings(baseline, current):
+        print(f"warning: {warning}")
+
+    rows = compare(baseline, current, args.threshold, args.macro_threshold, limits)
+    print(f"{'benchmark':48} {'baseline':>12} {'current':>12} {'change':>9} {'limit':>7}  status")
+    for name, status, old, new, change, limit in rows:
+        change_text = "-" if change is None else f"{change * 100:+.1f}%"
+        print(f"{name:48} {_format(old):>12} {_format(new):>12} {change_text:>9} {limit * 100:>6.0f}%  {status}")
+
+    regressions = [row[0] for row in rows if row[1] == STATUS_REGRESSED]
+    if regressions:
+        print(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+        return 1
+    print("No regressions.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+"""
+Timing and result helpers shared by the benchmark suite (run_suite.py) and
+compare_results.py.
+
+A result file is JSON: {"meta": {...}, "results": {name: result}} where each
+result holds the compared "value" with its "unit" and which direction is
+"better" ("lower" for times, "higher" for throughputs), plus extra statistics.
+"""
+import gc
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+RESULTS_FORMAT_VERSION = 1
+
+
+def percentile(samples: List[float], q: float) -> float:
+    """Nearest-rank percentile of `samples` (q between 0 and 100)."""
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, math.ceil(q / 100.0 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def measure(func: Callable[[], Any], repeat: int = 7, number: Optional[int] = None, min_time: float = 0.05) -> Dict[str, Any]:
+    """
+    Time `func` like timeit: `repeat` rounds of `number` calls each, reporting
+    per-call statistics in microseconds. The compared value is the median round,
+    which is far less noisy than the mean on a shared machine.
+
+    Args:
+        func: A zero-argument callable.
+        repeat: Number of timed rounds.
+        number: Calls per round; calibrated so a round lasts at least min_time if None.
+        min_time: Target round duration in seconds when calibrating.
+    """
+    func()  # Warm up caches and lazy imports
+    if number is None:
+        number = 1
+        while True:
+            started = time.perf_counter()
+            for _ in range(number):
+                func()
+            if time.perf_counter() - started >= min_time or number >= 1 << 20:
+                break
+            number *= 2
+
+    rounds = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            for _ in range(number):
+                func()
+            rounds.append((time.perf_counter() - started) / number * 1e6)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    return {
+        "value": round(statistics.median(rounds), 4),
+        "unit": "us",
+        "better": "lower",
+        "min": round(min(rounds), 4),
+        "max": round(max(rounds), 4),
+        "stdev": round(statistics.stdev(rounds), 4) if len(rounds) > 1 else 0.0,
+        "rounds": repeat,
+        "calls_per_round": number
+    }
+
+
+def latency_result(samples_seconds: List[float]) -> Dict[str, Any]:
+    """Summarize request latencies (seconds) as a p50-compared result in milliseconds."""
+    samples = [sample * 1000.0 for sample in samples_seconds]
+    return {
+        "value": round(percentile(samples, 50), 4),
+        "unit": "ms",
+        "better": "lower",
+        "p95": round(percentile(samples, 95), 4),
+        "p99": round(percentile(samples, 99), 4),
+        "max": round(max(samples), 4),
+        "count": len(samples)
+    }
+
+
+def rate_result(count: int, seconds: float, unit: str) -> Dict[str, Any]:
+    """A throughput result (higher is better)."""
+    return {
+        "value": round(count / seconds, 3) if seconds > 0 else 0.0,
+        "unit": unit,
+        "better": "higher",
+        "count": count,
+        "seconds": round(seconds, 4)
+    }
+
+
+def environment_info() -> Dict[str, Any]:
+    """Describe where results were produced, to judge whether two runs are comparable."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, timeout=10
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    return {
+        "format_version": RESULTS_FORMAT_VERSION,
+        "created_at": datetime.utcnow().isoformat() + "Z",
+        "git_commit": commit,
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count()
+    }
+
+
+def write_results(path: str, meta: Dict[str, Any], results: Dict[str, Dict[str, Any]]) -> None:
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump({"meta": meta, "results": results}, handle, indent=2, sort_keys=True)
+        handle.write("\n")
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    with open(path, encoding="utf-8") as handle:
+        data = json.load(handle)
+    if "results" not in data:
+        raise ValueError(f"{path} is not a benchmark result file")
+    return data
@@ -0,0 +1,129 @@
+"""
+Macrobenchmark of the assessment workflow: N simulated examinees drive the
+FastAPI app in-process (register -> login -> start attempt -> stream behavior
+events -> submit) on top of a synthetic dataset, then a proctor reads reports,
+cohort analytics and the user list. Reports per-endpoint latency percentiles
+and workflow / finalization throughput.
+
+Must run in a scratch working directory (the app uses ./trustscore.db by
+default) and under `if __name__ == "__main__"` (the app starts process pools).
+
+Run through the suite: python benchmarks/run_suite.py --layer macro --examinees 50 --scale 100
+"""
+import os
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "backend"))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from harness import latency_result, rate_result
+from synthetic_data import SEED_PASSWORD, generate_dataset, load_dataset
+from bench_fingerprint_index import make_submission
+
+EVENT_TYPES = ["tab_switch", "face_missing", "copy_paste"]
+# Seconds to wait for every submitted attempt to be finalized
+FINALIZATION_TIMEOUT = 300.0
+# Repetitions of each proctor read
+READ_REPEAT = 20
+
+
+def _timed(samples: List[float], func, *args, **kwargs):
+    started = time.perf_counter()
+    response = func(*args, **kwargs)
+    samples.append(time.perf_counter() - started)
+    return response
+
+
+def _examinee(client, number: int, rng: random.Random, event_batches: int, events_per_batch: int, samples) -> int:
+    credentials = {"name": f"Examinee {number}", "email": f"examinee{number}@bench.example.com", "password": "bench-pw"}
+    response = _timed(samples["register"], client.post, "/api/auth/register", json=credentials)
+    assert response.status_code in (200, 201), response.text
+    token = _timed(samples["login"], client.post, "/api/auth/login", json=credentials).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    response = _timed(samples["start_attempt"], client.post, "/api/attempts/", json={"assessment_id": rng.randint(1, 5)}, headers=headers)
+    assert response.status_code == 201, response.text
+    attempt_id = response.json()["id"]
+
+    for _ in range(event_batches):
+        batch = [
+            {"event_type": rng.choice(EVENT_TYPES), "severity_score": round(rng.uniform(1.0, 5.0), 1)}
+            for _ in range(events_per_batch)
+        ]
+        response = _timed(samples["events_batch"], client.post, f"/api/attempts/{attempt_id}/events", json=batch, headers=headers)
+        assert response.status_code == 202, response.text
+
+    submission = {"code": make_submission(rng), "test_cases_passed": rng.randint(0, 10), "total_test_cases": 10, "final_score": rng.uniform(0, 100)}
+    response = _timed(samples["submit"], client.post, f"/api/attempts/{attempt_id}/submit", json=submission, headers=headers)
+    assert response.status_code == 202, response.text
+    return attempt_id
+
+
+def run_macro(
+    examinees: int = 20,
+    scale: int = 1,
+    event_batches: int = 5,
+    events_per_batch: int = 10,
+    concurrency: int = 4,
+    seed: int = 42
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Load a synthetic dataset of the given scale, run the examinee workflow and
+    the proctor reads, and return the results keyed by benchmark name.
+    """
+    from fastapi.testclient import TestClient
+
+    from app.database.base import Base
+    from app.database.db import SessionLocal, engine
+    from app.main import app
+    from app.services.cohort_analytics_service import CohortAnalyticsService
+    from app.services.finalization_service import attempt_finalization_service
+
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        load_dataset(connection, generate_dataset(scale, seed))
+    with SessionLocal() as db:
+        CohortAnalyticsService.rebuild_all(db)
+
+    samples = {name: [] for name in ("register", "login", "start_attempt", "events_batch", "submit")}
+    reads = {name: [] for name in ("report", "cohort_analytics", "users_page")}
+    results: Dict[str, Dict[str, Any]] = {}
+
+    with TestClient(app) as client:
+        completed_before = attempt_finalization_service.get_stats()["completed"]
+        rngs = [random.Random(f"{seed}:examinee:{number}") for number in range(examinees)]
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            attempt_ids = list(pool.map(
+                lambda number: _examinee(client, number, rngs[number], event_batches, events_per_batch, samples),
+                range(examinees)
+            ))
+        workflow_seconds = time.perf_counter() - started
+
+        deadline = time.perf_counter() + FINALIZATION_TIMEOUT
+        while attempt_finalization_service.get_stats()["completed"] - completed_before < examinees:
+            if time.perf_counter() > deadline:
+                raise RuntimeError("Timed out waiting for attempts to be finalized")
+            time.sleep(0.01)
+        finalized_seconds = time.perf_counter() - started
+
+        # The dataset's admin reviews the results
+        token = client.post("/api/auth/login", json={"email": "admin1@example.com", "password": SEED_PASSWORD}).json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+        for index in range(READ_REPEAT):
+            response = _timed(reads["report"], client.get, f"/api/reports/{attempt_ids[index % len(attempt_ids)]}", headers=headers)
+            assert response.status_code == 200, response.text
+            _timed(reads["cohort_analytics"], client.get, "/api/analytics/cohort", params={"days": 366}, headers=headers)
+            _timed(reads["users_page"], client.get, "/api/users/", params={"limit": 100}, headers=headers)
+
+    for name, values in {**samples, **reads}.items():
+        results[f"macro.{name}"] = latency_result(values)
+    results["macro.workflow_throughput"] = rate_result(examinees, workflow_seconds, "examinees/s")
+    results["macro.finalization_throughput"] = rate_result(examinees, finalized_seconds, "attempts/s")
+    return results
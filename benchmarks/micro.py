@@ -0,0 +1,115 @@
+"""
+Microbenchmarks of the ai_engine hot paths: code similarity, risk, skills,
+explanations and reports. Every benchmark builds its inputs from a seeded
+random generator, so two runs time exactly the same work.
+
+Run through the suite: python benchmarks/run_suite.py --layer micro
+"""
+import os
+import random
+import sys
+from typing import Any, Callable, Dict
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+
+from ai_engine.code_similarity import CodeSimilarityAnalyzer
+from ai_engine.explainability import ExplainabilityEngine
+from ai_engine.report_generator import ReportGenerator
+from ai_engine.risk_calculator import RiskCalculator
+from ai_engine.skill_analyzer import SkillAnalyzer
+from bench_fingerprint_index import make_submission
+
+# Rows in the vectorized risk benchmark
+RISK_BATCH_SIZE = 10_000
+
+
+def _similarity_pair(rng: random.Random):
+    code = make_submission(rng)
+    # A near copy: the typical pair worth scoring exactly
+    return code, code.replace("total", "acc_total") + "\n# edited"
+
+
+def bench_similarity_pair(rng: random.Random) -> Callable[[], Any]:
+    code1, code2 = _similarity_pair(rng)
+    return lambda: CodeSimilarityAnalyzer.calculate_similarity(code1, code2)
+
+
+def bench_similarity_threshold_reject(rng: random.Random) -> Callable[[], Any]:
+    # Unrelated submissions: the upper bounds should reject without a full match
+    code1 = make_submission(rng)
+    code2 = "\n".join(f"print({i} * {i})" for i in range(40))
+    return lambda: CodeSimilarityAnalyzer.score_above(code1, code2, 80.0)
+
+
+def bench_similarity_candidates(rng: random.Random) -> Callable[[], Any]:
+    code = make_submission(rng)
+    candidates = [(submission_id, make_submission(rng)) for submission_id in range(20)]
+    return lambda: CodeSimilarityAnalyzer.score_candidates(code, candidates)
+
+
+def bench_risk_score(rng: random.Random) -> Callable[[], Any]:
+    args = (rng.randint(0, 5), rng.uniform(0, 30), rng.uniform(0, 100), rng.randint(0, 3), rng.random() < 0.1)
+    return lambda: RiskCalculator.calculate_risk_score(*args)
+
+
+def bench_risk_batch(rng: random.Random) -> Callable[[], Any]:
+    np_rng = np.random.default_rng(rng.randint(0, 2**32 - 1))
+    tab_switches = np_rng.integers(0, 6, RISK_BATCH_SIZE)
+    absences = np_rng.uniform(0, 30, RISK_BATCH_SIZE)
+    similarities = np_rng.uniform(0, 100, RISK_BATCH_SIZE)
+    copy_pastes = np_rng.integers(0, 4, RISK_BATCH_SIZE)
+    multiple_faces = np_rng.random(RISK_BATCH_SIZE) < 0.1
+    return lambda: RiskCalculator.calculate_risk_scores_batch(
+        tab_switches, absences, similarities, copy_pastes, multiple_faces
+    )
+
+
+def bench_skill_analysis(rng: random.Random) -> Callable[[], Any]:
+    args = (rng.randint(60, 3600), rng.randint(200, 4000), rng.randint(0, 10), 10)
+    return lambda: SkillAnalyzer.analyze_submission(*args)
+
+
+def bench_explanation(rng: random.Random) -> Callable[[], Any]:
+    behavior = (rng.randint(1, 5), rng.uniform(1, 30), rng.uniform(0, 100), rng.randint(0, 3), True)
+    contributions = RiskCalculator.calculate_risk_breakdown(*behavior)
+    timeline = [{"start": float(i * 60), "end": float(i * 60 + 4), "seconds": 4.0} for i in range(5)]
+    return lambda: ExplainabilityEngine.generate_risk_explanation(
+        *behavior, contributions.score, contributions=contributions, absence_timeline=timeline
+    )
+
+
+def _report_inputs(rng: random.Random):
+    behavior = (rng.randint(1, 5), rng.uniform(1, 30), rng.uniform(0, 100), rng.randint(0, 3), False)
+    risk_score = RiskCalculator.calculate_risk_score(*behavior)
+    explanation = ExplainabilityEngine.generate_risk_explanation(*behavior, risk_score)
+    skills = SkillAnalyzer.analyze_submission(1200, 1500, 8, 10)
+    return risk_score, explanation, skills
+
+
+def bench_report_generate(rng: random.Random) -> Callable[[], Any]:
+    risk_score, explanation, skills = _report_inputs(rng)
+    return lambda: ReportGenerator.generate_final_report(1, 80.0, risk_score, 100.0, 95.0, skills, explanation)
+
+
+def bench_report_serialize(rng: random.Random) -> Callable[[], Any]:
+    risk_score, explanation, skills = _report_inputs(rng)
+    report = ReportGenerator.generate_final_report(1, 80.0, risk_score, 100.0, 95.0, skills, explanation)
+    return lambda: ReportGenerator.serialize_report(report)
+
+
+# Name -> factory building the timed callable from a seeded generator
+MICROBENCHMARKS: Dict[str, Callable[[random.Random], Callable[[], Any]]] = {
+    "code_similarity.pair": bench_similarity_pair,
+    "code_similarity.threshold_reject": bench_similarity_threshold_reject,
+    "code_similarity.candidates_20": bench_similarity_candidates,
+    "risk_calculator.score": bench_risk_score,
+    "risk_calculator.batch_10k": bench_risk_batch,
+    "skill_analyzer.analyze": bench_skill_analysis,
+    "explainability.explanation": bench_explanation,
+    "report_generator.generate": bench_report_generate,
+    "report_generator.serialize": bench_report_serialize,
+}
@@ -0,0 +1,103 @@
+"""
+Benchmark suite: ai_engine microbenchmarks and the in-process API workflow
+macrobenchmark, written to one JSON result file that compare_results.py can
+check against a baseline.
+
+Usage:
+    python benchmarks/run_suite.py [--layer micro|macro|all] [--output results.json]
+        [--examinees N] [--scale 1|100] [--concurrency N] [--seed N] [--quick]
+
+Typical regression check:
+    python benchmarks/run_suite.py --output baseline.json      # on the base commit
+    python benchmarks/run_suite.py --output current.json       # with the change
+    python benchmarks/compare_results.py baseline.json current.json
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from harness import environment_info, measure, write_results
+
+DEFAULT_OUTPUT = "benchmark-results.json"
+
+
+def run_micro(seed: int, repeat: int, min_time: float, selected: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+    from micro import MICROBENCHMARKS
+
+    results = {}
+    for name, factory in MICROBENCHMARKS.items():
+        if selected and not any(pattern in name for pattern in selected):
+            continue
+        # Seeded per benchmark, so adding one does not change the inputs of the others
+        func = factory(random.Random(f"{seed}:{name}"))
+        results[f"micro.{name}"] = result = measure(func, repeat=repeat, min_time=min_time)
+        print(f"  micro.{name:40} {result['value']:12.3f} {result['unit']}")
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run the TrustScoreAI benchmark suite.")
+    parser.add_argument("--layer", choices=("micro", "macro", "all"), default="all")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="JSON result file (default: %(default)s)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--filter", action="append", help="only microbenchmarks whose name contains this (repeatable)")
+    parser.add_argument("--repeat", type=int, default=7, help="timed rounds per microbenchmark")
+    parser.add_argument("--examinees", type=int, default=20, help="simulated examinees in the macrobenchmark")
+    parser.add_argument("--scale", type=int, default=1, help="synthetic dataset scale (1 = seed_data.sql, 100 = 100x)")
+    parser.add_argument("--concurrency", type=int, default=4, help="examinees in flight at once")
+    parser.add_argument("--event-batches", type=int, default=5)
+    parser.add_argument("--events-per-batch", type=int, default=10)
+    parser.add_argument("--quick", action="store_true", help="fewer rounds and examinees, for a smoke run")
+    args = parser.parse_args(argv)
+    if args.quick:
+        args.repeat = min(args.repeat, 3)
+        args.examinees = min(args.examinees, 5)
+
+    output = os.path.abspath(args.output)
+    meta = environment_info()
+    meta["seed"] = args.seed
+    meta["layers"] = ["micro", "macro"] if args.layer == "all" else [args.layer]
+    results: Dict[str, Dict[str, Any]] = {}
+    started = time.perf_counter()
+
+    if args.layer in ("micro", "all"):
+        print("Microbenchmarks (median per call):")
+        results.update(run_micro(args.seed, args.repeat, 0.02 if args.quick else 0.05, args.filter))
+
+    if args.layer in ("macro", "all"):
+        # The app uses ./trustscore.db by default: run against a throwaway one
+        os.chdir(tempfile.mkdtemp(prefix="trustscore-bench-"))
+        from macro import run_macro
+
+        from app.core.config import BCRYPT_ROUNDS
+
+        meta["macro"] = {
+            "examinees": args.examinees,
+            "scale": args.scale,
+            "concurrency": args.concurrency,
+            "event_batches": args.event_batches,
+            "events_per_batch": args.events_per_batch,
+            "bcrypt_rounds": BCRYPT_ROUNDS
+        }
+        print(f"Macrobenchmark ({args.examinees} examinees, dataset scale {args.scale}):")
+        macro_results = run_macro(
+            args.examinees, args.scale, args.event_batches, args.events_per_batch, args.concurrency, args.seed
+        )
+        for name, result in macro_results.items():
+            print(f"  {name:46} {result['value']:12.3f} {result['unit']}")
+        results.update(macro_results)
+
+    meta["duration_seconds"] = round(time.perf_counter() - started, 2)
+    write_results(output, meta, results)
+    print(f"Wrote {len(results)} results to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,284 @@
+"""
+Seeded synthetic dataset generator: users, assessments, attempts and behavior
+logs that look like real exam traffic, identical for a given (scale, seed).
+
+Scale 1 is the demo dataset shipped as database/seed_data.sql (50 users,
+5 assessments, ~250 attempts); scale 100 is the 100x dataset the benchmark
+suite loads. Finished attempts carry risk and skill scores computed with the
+ai_engine modules, and users' trust scores are the result of their attempt
+history. Derived tables (skill_analytics, trust_ledger, cohort aggregates,
+attempt_reports) are left empty: fill them with the app.commands rebuild
+commands.
+
+Usage:
+    python benchmarks/synthetic_data.py --scale 1 --sql database/seed_data.sql
+    python benchmarks/synthetic_data.py --scale 100 --database sqlite:///./trustscore.db
+"""
+import argparse
+import math
+import os
+import random
+import sys
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+from ai_engine.risk_accumulator import EVENT_COPY_PASTE, EVENT_FACE_MISSING, EVENT_MULTIPLE_FACES, EVENT_TAB_SWITCH
+from ai_engine.risk_calculator import RiskCalculator
+from ai_engine.skill_analyzer import SkillAnalyzer
+from ai_engine.trust_score_updater import INITIAL_TRUST_SCORE, TrustUpdater
+
+DEFAULT_SEED = 42
+
+# Scale 1
+BASE_STUDENTS = 45
+BASE_PROCTORS = 4
+BASE_ADMINS = 1
+BASE_ASSESSMENTS = 5
+ATTEMPTS_PER_STUDENT = 5.5  # Mean; actual counts vary per student
+IN_PROGRESS_SHARE = 0.02
+SUSPICIOUS_SHARE = 0.1
+DATASET_DAYS = 90
+# Fixed so the dataset does not depend on when it is generated
+DATASET_END = datetime(2026, 1, 1)
+
+# Every generated account logs in with this password
+SEED_PASSWORD = "trustscore-demo"
+SEED_PASSWORD_HASH = "$2b$12$Na6ABHjNtcI90S0eTCta2eVODOfAmJjJj5ubUWMMuWArl62o.05K6"
+
+TOPICS = ["Arrays", "Strings", "Graphs", "Dynamic Programming", "Trees", "Sorting", "Hashing", "Recursion"]
+DIFFICULTIES = ["easy", "medium", "hard"]
+
+# Table name -> rows, in insertion (foreign key) order
+TABLE_ORDER = ("users", "assessments", "attempts", "behavior_logs")
+
+
+def generate_dataset(scale: int = 1, seed: int = DEFAULT_SEED) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Generate a dataset of `scale` times the demo size.
+
+    Args:
+        scale: Size multiplier (1 = database/seed_data.sql, 100 = the 100x dataset).
+        seed: Random seed; the same (scale, seed) always gives the same rows.
+
+    Returns:
+        Dict mapping table name to its rows (column -> value dicts).
+    """
+    rng = random.Random(seed)
+    start = DATASET_END - timedelta(days=DATASET_DAYS)
+
+    users = []
+    roles = ["admin"] * (BASE_ADMINS * scale) + ["proctor"] * (BASE_PROCTORS * scale) + ["student"] * (BASE_STUDENTS * scale)
+    for user_id, role in enumerate(roles, start=1):
+        users.append({
+            "id": user_id,
+            "name": f"{role.title()} {user_id}",
+            "email": f"{role}{user_id}@example.com",
+            "hashed_password": SEED_PASSWORD_HASH,
+            "trust_score": INITIAL_TRUST_SCORE,
+            "role": role,
+            "created_at": start - timedelta(days=rng.randint(1, 60))
+        })
+
+    assessments = [
+        {
+            "id": assessment_id,
+            "title": f"{TOPICS[(assessment_id - 1) % len(TOPICS)]} {(assessment_id - 1) // len(TOPICS) + 1}",
+            "difficulty": DIFFICULTIES[(assessment_id - 1) % len(DIFFICULTIES)],
+            "created_at": start - timedelta(days=rng.randint(0, 30))
+        }
+        for assessment_id in range(1, BASE_ASSESSMENTS * scale + 1)
+    ]
+
+    attempts, behavior_logs = [], []
+    students = [user for user in users if user["role"] == "student"]
+    for user in students:
+        suspicious = rng.random() < SUSPICIOUS_SHARE
+        for _ in range(max(1, round(rng.gauss(ATTEMPTS_PER_STUDENT, 2.0)))):
+            attempt_id = len(attempts) + 1
+            started_at = start + timedelta(seconds=rng.randint(0, DATASET_DAYS * 86400))
+            time_taken = rng.randint(300, 5400)
+            attempt = {
+                "id": attempt_id,
+                "user_id": user["id"],
+                "assessment_id": rng.randint(1, len(assessments)),
+                "start_time": started_at,
+                "end_time": None,
+                "status": "in_progress",
+                "final_score": None,
+                "risk_score": None,
+                "problem_solving_score": None,
+                "logic_score": None,
+                "efficiency_score": None,
+                "tab_switch_count": None,
+                "face_absent_seconds": None,
+                "copy_paste_count": None,
+                "multiple_faces_detected": None,
+                "code_similarity": None
+            }
+            attempts.append(attempt)
+
+            events = _generate_events(rng, attempt_id, started_at, time_taken, suspicious)
+            behavior_logs.extend(events)
+            if rng.random() < IN_PROGRESS_SHARE:
+                continue
+
+            total_test_cases = rng.choice([5, 8, 10, 12])
+            test_cases_passed = min(total_test_cases, max(0, round(rng.gauss(0.7, 0.25) * total_test_cases)))
+            skills = SkillAnalyzer.analyze_submission(time_taken, rng.randint(200, 4000), test_cases_passed, total_test_cases)
+            similarity = rng.uniform(70.0, 98.0) if suspicious and rng.random() < 0.3 else rng.uniform(0.0, 20.0)
+            factors = {
+                "tab_switch_count": sum(1 for event in events if event["event_type"] == EVENT_TAB_SWITCH),
+                "face_absent_seconds": sum(event["severity_score"] for event in events if event["event_type"] == EVENT_FACE_MISSING),
+                "copy_paste_count": sum(1 for event in events if event["event_type"] == EVENT_COPY_PASTE),
+                "multiple_faces_detected": any(event["event_type"] == EVENT_MULTIPLE_FACES for event in events),
+                "code_similarity": similarity
+            }
+            attempt.update(factors)
+            attempt.update({
+                "end_time": started_at + timedelta(seconds=time_taken),
+                "status": "finalized",
+                "final_score": round(100.0 * test_cases_passed / total_test_cases, 2),
+                "risk_score": RiskCalculator.calculate_risk_score(**factors),
+                "problem_solving_score": skills["problem_solving_score"],
+                "logic_score": skills["logic_score"],
+                "efficiency_score": skills["efficiency_score"]
+            })
+
+    # Trust scores follow from each user's finished attempts, in order
+    by_user: Dict[int, List[Dict[str, Any]]] = {}
+    for attempt in attempts:
+        if attempt["risk_score"] is not None:
+            by_user.setdefault(attempt["user_id"], []).append(attempt)
+    for user in students:
+        score = INITIAL_TRUST_SCORE
+        for attempt in sorted(by_user.get(user["id"], []), key=lambda row: (row["start_time"], row["id"])):
+            score = TrustUpdater.update_trust_score(score, attempt["risk_score"])
+        user["trust_score"] = score
+
+    return {"users": users, "assessments": assessments, "attempts": attempts, "behavior_logs": behavior_logs}
+
+
+def _generate_events(
+    rng: random.Random, attempt_id: int, started_at: datetime, time_taken: int, suspicious: bool
+) -> List[Dict[str, Any]]:
+    # Mean events per attempt; suspicious examinees are four times as active
+    rates = {EVENT_TAB_SWITCH: 0.5, EVENT_FACE_MISSING: 0.5, EVENT_COPY_PASTE: 0.3, EVENT_MULTIPLE_FACES: 0.01}
+    if suspicious:
+        rates = {event_type: rate * 4 for event_type, rate in rates.items()}
+
+    events = []
+    for event_type, rate in rates.items():
+        count = _poisson(rng, rate)
+        if event_type == EVENT_MULTIPLE_FACES:
+            count = min(count, 1)
+        for _ in range(count):
+            events.append({
+                "attempt_id": attempt_id,
+                "event_type": event_type,
+                # face_missing severity is the seconds the face was absent
+                "severity_score": round(rng.uniform(1.0, 5.0), 1) if event_type == EVENT_FACE_MISSING else 1.0,
+                "timestamp": started_at + timedelta(seconds=rng.randint(0, time_taken))
+            })
+    events.sort(key=lambda event: event["timestamp"])
+    return events
+
+
+def _poisson(rng: random.Random, rate: float) -> int:
+    # Knuth's method; rates here are small
+    threshold, count, product = math.exp(-rate), 0, rng.random()
+    while product > threshold:
+        count += 1
+        product *= rng.random()
+    return count
+
+
+def _sql_literal(value: Any) -> str:
+    if value is None:
+        return "NULL"
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if isinstance(value, datetime):
+        return f"'{value.strftime('%Y-%m-%d %H:%M:%S')}'"
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def iter_sql(dataset: Dict[str, List[Dict[str, Any]]], rows_per_statement: int = 500) -> Iterable[str]:
+    """Yield multi-row INSERT statements for the dataset, tables in foreign key order."""
+    for table in TABLE_ORDER:
+        rows = dataset[table]
+        if not rows:
+            continue
+        columns = list(rows[0])
+        for offset in range(0, len(rows), rows_per_statement):
+            values = ",\n".join(
+                "(" + ", ".join(_sql_literal(row[column]) for column in columns) + ")"
+                for row in rows[offset:offset + rows_per_statement]
+            )
+            yield f"INSERT INTO {table} ({', '.join(columns)}) VALUES\n{values};\n"
+
+
+def write_sql(dataset: Dict[str, List[Dict[str, Any]]], path: str, scale: int, seed: int) -> None:
+    """Write the dataset as a SQL script to load after database/schema.sql."""
+    with open(path, "w", encoding="utf-8") as handle:
+        handle.write(
+            f"-- Synthetic TrustScoreAI data (scale {scale}, seed {seed}), generated by\n"
+            f"-- benchmarks/synthetic_data.py; regenerate rather than editing by hand.\n"
+            f"-- Load after database/schema.sql. Every account's password is '{SEED_PASSWORD}'.\n\n"
+        )
+        for statement in iter_sql(dataset):
+            handle.write(statement)
+
+
+def load_dataset(connection, dataset: Dict[str, List[Dict[str, Any]]], batch_size: int = 5000) -> None:
+    """
+    Bulk insert the dataset through a SQLAlchemy connection (executemany per
+    batch). The caller creates the schema and commits.
+    """
+    backend = os.path.join(ROOT, "backend")
+    if backend not in sys.path:
+        sys.path.insert(0, backend)
+    from sqlalchemy import insert
+
+    from app.database.base import Base
+
+    for table in TABLE_ORDER:
+        rows = dataset[table]
+        for offset in range(0, len(rows), batch_size):
+            connection.execute(insert(Base.metadata.tables[table]), rows[offset:offset + batch_size])
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--scale", type=int, default=1, help="size multiplier (1 = seed_data.sql, 100 = 100x)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--sql", help="write INSERT statements to this file")
+    parser.add_argument("--database", help="load into this database URL (schema is created if missing)")
+    args = parser.parse_args(argv)
+    if not args.sql and not args.database:
+        parser.error("pass --sql and/or --database")
+
+    dataset = generate_dataset(args.scale, args.seed)
+    counts = ", ".join(f"{len(dataset[table])} {table}" for table in TABLE_ORDER)
+    if args.sql:
+        write_sql(dataset, args.sql, args.scale, args.seed)
+        print(f"Wrote {counts} to {args.sql}")
+    if args.database:
+        sys.path.insert(0, os.path.join(ROOT, "backend"))
+        from sqlalchemy import create_engine
+
+        from app.database.base import Base
+
+        engine = create_engine(args.database)
+        Base.metadata.create_all(bind=engine)
+        with engine.begin() as connection:
+            load_dataset(connection, dataset)
+        print(f"Loaded {counts} into {args.database}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,19 @@
+-- 001: indexes for the hot access patterns, plus the users.role column.
+-- Safe to re-run on SQLite and PostgreSQL (except the ALTER TABLE below on
+-- databases that already have users.role; skip it there).
+--
+--   sqlite3 trustscore.db < database/migrations/001_access_pattern_indexes.sql
+--   psql "$DATABASE_URL" -f database/migrations/001_access_pattern_indexes.sql
+
+-- Identity claims embedded in access tokens
+ALTER TABLE users ADD COLUMN role VARCHAR DEFAULT 'student';
+
+-- Keyset pagination of users by trust score
+CREATE INDEX IF NOT EXISTS ix_users_trust_score_id ON users (trust_score, id);
+
+-- "All attempts for user Y" and "finished attempts of assessment Z"
+CREATE INDEX IF NOT EXISTS ix_attempts_user_id_start_time ON attempts (user_id, start_time);
+CREATE INDEX IF NOT EXISTS ix_attempts_assessment_id_end_time ON attempts (assessment_id, end_time);
+
+-- "All events for attempt X in time order"
+CREATE INDEX IF NOT EXISTS ix_behavior_logs_attempt_id_timestamp ON behavior_logs (attempt_id, timestamp);
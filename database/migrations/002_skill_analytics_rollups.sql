@@ -0,0 +1,9 @@
+-- 002: state for incremental SkillAnalytics rollups.
+-- After applying, backfill with: (cd backend && python -m app.commands.rebuild_skill_analytics)
+
+ALTER TABLE attempts ADD COLUMN problem_solving_score FLOAT;
+ALTER TABLE attempts ADD COLUMN logic_score FLOAT;
+ALTER TABLE attempts ADD COLUMN efficiency_score FLOAT;
+
+ALTER TABLE skill_analytics ADD COLUMN attempt_count INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE skill_analytics ADD COLUMN problem_solving_m2 FLOAT NOT NULL DEFAULT 0.0;
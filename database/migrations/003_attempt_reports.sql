@@ -0,0 +1,11 @@
+-- 003: final reports persisted once per finalized attempt, in canonical JSON with a content hash.
+-- On PostgreSQL use BYTEA instead of BLOB.
+
+CREATE TABLE IF NOT EXISTS attempt_reports (
+    attempt_id   INTEGER NOT NULL PRIMARY KEY REFERENCES attempts (id),
+    user_id      INTEGER NOT NULL REFERENCES users (id),
+    content_hash VARCHAR(64) NOT NULL,
+    payload      BLOB NOT NULL,
+    created_at   TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS ix_attempt_reports_user_id_attempt_id ON attempt_reports (user_id, attempt_id);
@@ -0,0 +1,19 @@
+-- 004: fractional trust scores and an append-only ledger of trust changes.
+-- users.trust_score becomes FLOAT. SQLite's INTEGER affinity already stores the
+-- fractional values, so only PostgreSQL needs:
+--   ALTER TABLE users ALTER COLUMN trust_score TYPE DOUBLE PRECISION;
+--   ALTER TABLE users ALTER COLUMN trust_score SET DEFAULT 100.0;
+-- Then rebuild the scores from attempt history:
+--   python -m app.commands.replay_trust_scores
+
+CREATE TABLE IF NOT EXISTS trust_ledger (
+    id          INTEGER PRIMARY KEY,
+    user_id     INTEGER NOT NULL REFERENCES users (id),
+    attempt_id  INTEGER REFERENCES attempts (id),
+    reason      VARCHAR NOT NULL,
+    risk_score  FLOAT,
+    delta       FLOAT NOT NULL,
+    trust_score FLOAT NOT NULL,
+    created_at  TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS ix_trust_ledger_user_id_id ON trust_ledger (user_id, id);
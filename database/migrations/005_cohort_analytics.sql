@@ -0,0 +1,25 @@
+-- 005: per-assessment, per-day cohort counters and score histograms, maintained at
+-- finalization. Backfill them from existing attempts with:
+--   python -m app.commands.rebuild_cohort_analytics
+
+CREATE TABLE IF NOT EXISTS assessment_daily_stats (
+    assessment_id     INTEGER NOT NULL REFERENCES assessments (id),
+    day               DATE NOT NULL,
+    attempt_count     INTEGER NOT NULL DEFAULT 0,
+    flagged_count     INTEGER NOT NULL DEFAULT 0,
+    risk_score_sum    FLOAT NOT NULL DEFAULT 0.0,
+    trust_score_sum   FLOAT NOT NULL DEFAULT 0.0,
+    trust_score_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (assessment_id, day)
+);
+CREATE INDEX IF NOT EXISTS ix_assessment_daily_stats_day ON assessment_daily_stats (day);
+
+CREATE TABLE IF NOT EXISTS assessment_daily_buckets (
+    assessment_id INTEGER NOT NULL REFERENCES assessments (id),
+    day           DATE NOT NULL,
+    metric        VARCHAR NOT NULL,
+    bucket        INTEGER NOT NULL,
+    count         INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (assessment_id, day, metric, bucket)
+);
+CREATE INDEX IF NOT EXISTS ix_assessment_daily_buckets_day ON assessment_daily_buckets (day);
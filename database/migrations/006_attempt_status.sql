@@ -0,0 +1,5 @@
+-- 006: explicit attempt lifecycle, so a submission is claimed exactly once.
+-- Attempts that already have an end_time were finalized.
+
+ALTER TABLE attempts ADD COLUMN status VARCHAR NOT NULL DEFAULT 'in_progress';
+UPDATE attempts SET status = 'finalized' WHERE end_time IS NOT NULL;
@@ -0,0 +1,10 @@
+-- 007: keep the behavior totals and code similarity each risk score was computed
+-- from, so the trust replay can re-score attempts after the risk weights change:
+--   python -m app.commands.replay_trust_scores
+-- Attempts finalized before this migration keep their stored risk score.
+
+ALTER TABLE attempts ADD COLUMN tab_switch_count INTEGER;
+ALTER TABLE attempts ADD COLUMN face_absent_seconds FLOAT;
+ALTER TABLE attempts ADD COLUMN copy_paste_count INTEGER;
+ALTER TABLE attempts ADD COLUMN multiple_faces_detected BOOLEAN;
+ALTER TABLE attempts ADD COLUMN code_similarity FLOAT;
@@ -0,0 +1,127 @@
+-- TrustScoreAI database schema.
+-- Mirrors the SQLAlchemy models in backend/app/models; keep both in sync.
+-- Existing databases are upgraded with the scripts in database/migrations/.
+
+CREATE TABLE IF NOT EXISTS users (
+    id              INTEGER NOT NULL PRIMARY KEY,
+    name            VARCHAR,
+    email           VARCHAR,
+    hashed_password VARCHAR,
+    trust_score     FLOAT DEFAULT 100.0,
+    role            VARCHAR DEFAULT 'student',
+    created_at      TIMESTAMP
+);
+CREATE UNIQUE INDEX IF NOT EXISTS ix_users_email ON users (email);
+CREATE INDEX IF NOT EXISTS ix_users_id ON users (id);
+CREATE INDEX IF NOT EXISTS ix_users_name ON users (name);
+CREATE INDEX IF NOT EXISTS ix_users_trust_score_id ON users (trust_score, id);
+
+CREATE TABLE IF NOT EXISTS assessments (
+    id         INTEGER NOT NULL PRIMARY KEY,
+    title      VARCHAR,
+    difficulty VARCHAR,
+    created_at TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS ix_assessments_id ON assessments (id);
+CREATE INDEX IF NOT EXISTS ix_assessments_title ON assessments (title);
+CREATE INDEX IF NOT EXISTS ix_assessments_difficulty ON assessments (difficulty);
+
+CREATE TABLE IF NOT EXISTS attempts (
+    id            INTEGER NOT NULL PRIMARY KEY,
+    user_id       INTEGER REFERENCES users (id),
+    assessment_id INTEGER REFERENCES assessments (id),
+    start_time    TIMESTAMP,
+    end_time      TIMESTAMP,
+    status        VARCHAR NOT NULL DEFAULT 'in_progress',  -- in_progress, submitted, finalized
+    final_score   FLOAT,
+    risk_score    FLOAT,
+    -- SkillAnalyzer output, kept so skill rollups can be rebuilt
+    problem_solving_score FLOAT,
+    logic_score           FLOAT,
+    efficiency_score      FLOAT,
+    -- Risk factors at finalization, kept so risk scores can be recomputed
+    tab_switch_count        INTEGER,
+    face_absent_seconds     FLOAT,
+    copy_paste_count        INTEGER,
+    multiple_faces_detected BOOLEAN,
+    code_similarity         FLOAT
+);
+CREATE INDEX IF NOT EXISTS ix_attempts_id ON attempts (id);
+CREATE INDEX IF NOT EXISTS ix_attempts_user_id_start_time ON attempts (user_id, start_time);
+CREATE INDEX IF NOT EXISTS ix_attempts_assessment_id_end_time ON attempts (assessment_id, end_time);
+
+CREATE TABLE IF NOT EXISTS behavior_logs (
+    id             INTEGER NOT NULL PRIMARY KEY,
+    attempt_id     INTEGER REFERENCES attempts (id),
+    event_type     VARCHAR,
+    severity_score FLOAT,
+    timestamp      TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS ix_behavior_logs_id ON behavior_logs (id);
+CREATE INDEX IF NOT EXISTS ix_behavior_logs_event_type ON behavior_logs (event_type);
+CREATE INDEX IF NOT EXISTS ix_behavior_logs_attempt_id_timestamp ON behavior_logs (attempt_id, timestamp);
+
+CREATE TABLE IF NOT EXISTS skill_analytics (
+    user_id               INTEGER NOT NULL PRIMARY KEY REFERENCES users (id),
+    problem_solving_score FLOAT DEFAULT 0.0,
+    logic_score           FLOAT DEFAULT 0.0,
+    code_quality_score    FLOAT DEFAULT 0.0,
+    consistency_score     FLOAT DEFAULT 0.0,
+    -- Running-aggregate state: attempts folded in and Welford M2 of problem solving
+    attempt_count         INTEGER NOT NULL DEFAULT 0,
+    problem_solving_m2    FLOAT NOT NULL DEFAULT 0.0,
+    last_updated          TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS attempt_reports (
+    attempt_id   INTEGER NOT NULL PRIMARY KEY REFERENCES attempts (id),
+    user_id      INTEGER NOT NULL REFERENCES users (id),
+    -- SHA-256 of payload, served as the ETag
+    content_hash VARCHAR(64) NOT NULL,
+    -- Canonical JSON (sorted keys, compact, UTF-8)
+    payload      BLOB NOT NULL,
+    created_at   TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS ix_attempt_reports_user_id_attempt_id ON attempt_reports (user_id, attempt_id);
+
+CREATE TABLE IF NOT EXISTS trust_ledger (
+    id          INTEGER PRIMARY KEY,
+    user_id     INTEGER NOT NULL REFERENCES users (id),
+    -- Null for replay adjustments
+    attempt_id  INTEGER REFERENCES attempts (id),
+    -- attempt, replay
+    reason      VARCHAR NOT NULL,
+    risk_score  FLOAT,
+    delta       FLOAT NOT NULL,
+    -- Trust score after this entry
+    trust_score FLOAT NOT NULL,
+    created_at  TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS ix_trust_ledger_user_id_id ON trust_ledger (user_id, id);
+
+CREATE TABLE IF NOT EXISTS assessment_daily_stats (
+    assessment_id     INTEGER NOT NULL REFERENCES assessments (id),
+    -- UTC day the attempts were finalized
+    day               DATE NOT NULL,
+    attempt_count     INTEGER NOT NULL DEFAULT 0,
+    -- Attempts whose report needs mandatory review
+    flagged_count     INTEGER NOT NULL DEFAULT 0,
+    risk_score_sum    FLOAT NOT NULL DEFAULT 0.0,
+    -- Trust scores right after each attempt, and how many were known
+    trust_score_sum   FLOAT NOT NULL DEFAULT 0.0,
+    trust_score_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (assessment_id, day)
+);
+CREATE INDEX IF NOT EXISTS ix_assessment_daily_stats_day ON assessment_daily_stats (day);
+
+CREATE TABLE IF NOT EXISTS assessment_daily_buckets (
+    assessment_id INTEGER NOT NULL REFERENCES assessments (id),
+    day           DATE NOT NULL,
+    -- risk, trust
+    metric        VARCHAR NOT NULL,
+    -- Fixed-width bucket index on the 0-100 scale
+    bucket        INTEGER NOT NULL,
+    count         INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (assessment_id, day, metric, bucket)
+);
+CREATE INDEX IF NOT EXISTS ix_assessment_daily_buckets_day ON assessment_daily_buckets (day);
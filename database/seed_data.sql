@@ -0,0 +1,786 @@
+-- Synthetic TrustScoreAI data (scale 1, seed 42), generated by
+-- benchmarks/synthetic_data.py; regenerate rather than editing by hand.
+-- Load after database/schema.sql. Every account's password is 'trustscore-demo'.
+
+INSERT INTO users (id, name, email, hashed_password, trust_score, role, created_at) VALUES
+(1, 'Admin 1', 'admin1@example.com', '$2b$12$Na6ABHjNtcI90S0eTCta2eVODOfAmJjJj5ubUWMMuWArl62o.05K6', 100.0, 'admin', '2025-08-23 00:00:00'),
+(2, 'Proctor 2', 'proctor2@example.com', '$2b$12$Na6ABHjNtcI90S0eTCta2eVODOfAmJjJj5ubUWMMuWArl62o.05K6', 100.0, 'proctor', '2025-09-25 00:00:00'),
+(3, 'Proctor 3', 'proctor3@example.com', '$2b$12$Na6ABHjNtcI90S0eTCta2eVODOfAmJjJj5ubUWMMuWArl62o.05K6', 100.0, 'proctor', '2025-10-01 00:00:00'),
+(4, 'Proctor 4', 'proctor4@example.com', '$2b$12$Na6ABHjNtcI90S0eTCta2eVODOfAmJjJj5ubUWMMuWArl62o.05K6', 100.0, 'proctor', '2025-08-16 00:00:00'),
+(5, 'Proctor 5', 'proctor5@example.com', '$2b$12$Na6ABHjNtcI90S0eTCta2eVODOfAmJjJj5ubUWMMuWArl62o.05K6', 100.0, 'proctor', '2025-09-15 00:00:00'),
+(6, 'Student 6', 'student6@example.com', '$2b$12$Na6ABHjNtcI90S0eTCta2eVODOfAmJjJj5ubUWMMuWArl62o.05K6', 94.09637152533959, 'student', '2025-09-17 00:00:00'),
+(7, 'Student 7', 'student7@example.com', '$2b$12$Na6ABHjNtcI90S0eTCta2eVODOfAmJjJj5ubUWMMuWArl62o.05K6', 94.11727428260674, 'student', '2025-09-18 00:00:00'),
+(8, 'Student 8', 'student8@example.com', '$2b$12$Na6ABHjNtcI90S0eTCta2eVODOfAmJjJj5ubUWMMuWArl62o.05K6', 88.41169925226897, 'student', '2025-09-24 00:00:00'),
+(9, 'Student 9', 'student9@example.com', '$2b$12$Na6ABHjNtcI90S0eTCta2eVODOfAmJjJj5ubUWMMuWArl62o.05K6', 89.16117524910904, 'student', '2025-08-16 00:00:00'),
+(10, 'Student 10', 'student10@example.com', '$2b$12$Na6ABHjNtcI90S0eTCta2eVODOfAmJjJj5ubUWMMuWArl62o.05K6', 91.89950882415998, 'student', '2025-09-26 00:00:00'),
+(11, 'Student 11', 'student11@example.com', '$2b$12$Na6ABHjNtcI90S0eTCta2eVODOfAmJjJj5ubUWMMuWArl62o.05K6', 91.0509600060724, 'student', '2025-08-20 00:00:00'),
+(12, 'Student 12', 'student12@example.com', '$2b$12$Na6ABHjNtcI90S0eTCta2eVODOfAmJjJj5ubUWMMuWArl62o.05K6', 91.5489048550508, 'student', '2025-08-16 00:00:00'),
+(13, 'Student 13', 'student13@example.com', '$2b$12$Na6ABHjNtcI90S0eTCta2eVODOfAmJjJj5ubUWMMuWArl62o.05K6', 91.49342515957981, 'student', '2025-08-06 00:00:00'),
+(14, 'Student 14', 'student14@example.com', '$2b$12$Na6ABHjNtcI90S0eTCta2eVODOfAmJjJj5ubUWMMuWArl62o.05K6', 66.02054768635298, 'student', '2025-08-29 00:00:00'),
+(15, 'Student 15', 'student15@example.com', '$2b$12$Na6ABHjNtcI90S0eTCta2eVODOfAmJjJj5ubUWMMuWArl62o.05K6', 95.10282392220856, 'student', '2025-09-27 00:00:00'),
+(16, 'Student 16', 'student16@example.com', '$2b$12$Na6ABHjNtcI90S0eTCta2eVODOfAmJjJj5ubUWMMuWArl62o.05K6', 87.62700963872611, 'student', '2025-08-26 00:00:00'),
+(17, 'Student 17', 'student17@example.com', '$2b$12$Na6ABHjNtcI90S0eTCta2eVODOfAmJjJj5ubUWMMuWArl62o.05K6', 95.9028626841332, 'student', '2025-09-05 00:00:00'),
+(18, 'Student 18', 'student18@example.com', '$2b$12$Na6ABHjNtcI90S0eTCta2eVODOfAmJjJj5ubUWMMuWArl62o.05K6', 97.6308234105892, 'student', '2025-09-30 00:00:00'),
+(19, 'Student 19', 'student19@example.com', '$2b$12$Na6ABHjNtcI90S0eTCta2eVODOfAmJjJj5ubUWMMuWArl62o.05K6', 94.74253470460677, 'student', '2025-10-01 00:00:00'),
+(20, 'Student 20', 'student20@example.com', '$2b$12$Na6ABHjNtcI90S0eTCta2eVODOfAmJjJj5ubUWMMuWArl62o.05K6', 96.76806294476496, 'student', '2025-09-27 00:00:00'),
+(21, 'Student 21', 'student21@example.com', '$2b$12$Na6ABHjNtcI90S0eTCta2eVODOfAmJjJj5ubUWMMuWArl62o.05K6', 93.40005353107207, 'student', '2025-09-19 00:00:00'),
+(22, 'Student 22', 'student22@example.com', '$2b$12$Na6ABHjNtcI90S0eTCta2eVODOfAmJjJj5ubUWMMuWArl62o.05K6', 95.2283876586513, 'student', '2025-09-18 00:00:00'),
+(23, 'Student 23', 'student23@example.com', '$2b$12$Na6ABHjNtcI90S0eTCta2eVODOfAmJjJj5ubUWMMuWArl62o.05K6', 89.93189917297119, 'student', '2025-08-31 00:00:00'),
+(24, 'Student 24', 'student24@example.com', '$2b$12$Na6ABHjNtcI90S0eTCta2eVODOfAmJjJj5ubUWMMuWArl62o.05K6', 70.7887172575523, 'student', '2025-08-25 00:00:00'),
+(25, 'Student 25', 'student25@example.com', '$2b$12$Na6ABHjNtcI90S0eTCta2eVODOfAmJjJj5ubUWMMuWArl62o.05K6', 95.78604317546461, 'student', '2025-10-01 00:00:00'),
+(26, 'Student 26', 'student26@example.com', '$2b$12$Na6ABHjNtcI90S0eTCta2eVODOfAmJjJj5ubUWMMuWArl62o.05K6', 46.133124878183416, 'student', '2025-08-28 00:00:00'),
+(27, 'Student 27', 'student27@example.com', '$2b$12$Na6ABHjNtcI90S0eTCta2eVODOfAmJjJj5ubUWMMuWArl62o.05K6', 91.86172606623626, 'student', '2025-09-20 00:00:00'),
+(28, 'Student 28', 'student28@example.com', '$2b$12$Na6ABHjNtcI90S0eTCta2eVODOfAmJjJj5ubUWMMuWArl62o.05K6', 97.68313568686612, 'student', '2025-08-18 00:00:00'),
+(29, 'Student 29', 'student29@example.com', '$2b$12$Na6ABHjNtcI90S0eTCta2eVODOfAmJjJj5ubUWMMuWArl62o.05K6', 91.82983645572837, 'student', '2025-08-22 00:00:00'),
+(30, 'Student 30', 'student30@example.com', '$2b$12$Na6ABHjNtcI90S0eTCta2eVODOfAmJjJj5ubUWMMuWArl62o.05K6', 91.929083758082, 'student', '2025-08-19 00:00:00'),
+(31, 'Student 31', 'student31@example.com', '$2b$12$Na6ABHjNtcI90S0eTCta2eVODOfAmJjJj5ubUWMMuWArl62o.05K6', 90.27755691011318, 'student', '2025-08-29 00:00:00'),
+(32, 'Student 32', 'student32@example.com', '$2b$12$Na6ABHjNtcI90S0eTCta2eVODOfAmJjJj5ubUWMMuWArl62o.05K6', 94.63036299059668, 'student', '2025-09-06 00:00:00'),
+(33, 'Student 33', 'student33@example.com', '$2b$12$Na6ABHjNtcI90S0eTCta2eVODOfAmJjJj5ubUWMMuWArl62o.05K6', 96.69703680513132, 'student', '2025-09-18 00:00:00'),
+(34, 'Student 34', 'student34@example.com', '$2b$12$Na6ABHjNtcI90S0eTCta2eVODOfAmJjJj5ubUWMMuWArl62o.05K6', 86.40008697359515, 'student', '2025-09-04 00:00:00'),
+(35, 'Student 35', 'student35@example.com', '$2b$12$Na6ABHjNtcI90S0eTCta2eVODOfAmJjJj5ubUWMMuWArl62o.05K6', 97.35704165665342, 'student', '2025-08-26 00:00:00'),
+(36, 'Student 36', 'student36@example.com', '$2b$12$Na6ABHjNtcI90S0eTCta2eVODOfAmJjJj5ubUWMMuWArl62o.05K6', 81.40639794341627, 'student', '2025-09-15 00:00:00'),
+(37, 'Student 37', 'student37@example.com', '$2b$12$Na6ABHjNtcI90S0eTCta2eVODOfAmJjJj5ubUWMMuWArl62o.05K6', 92.39943910491506, 'student', '2025-08-12 00:00:00'),
+(38, 'Student 38', 'student38@example.com', '$2b$12$Na6ABHjNtcI90S0eTCta2eVODOfAmJjJj5ubUWMMuWArl62o.05K6', 94.1999922058985, 'student', '2025-08-08 00:00:00'),
+(39, 'Student 39', 'student39@example.com', '$2b$12$Na6ABHjNtcI90S0eTCta2eVODOfAmJjJj5ubUWMMuWArl62o.05K6', 91.48915050708165, 'student', '2025-10-02 00:00:00'),
+(40, 'Student 40', 'student40@example.com', '$2b$12$Na6ABHjNtcI90S0eTCta2eVODOfAmJjJj5ubUWMMuWArl62o.05K6', 72.50026158764402, 'student', '2025-08-15 00:00:00'),
+(41, 'Student 41', 'student41@example.com', '$2b$12$Na6ABHjNtcI90S0eTCta2eVODOfAmJjJj5ubUWMMuWArl62o.05K6', 92.19572547396866, 'student', '2025-08-12 00:00:00'),
+(42, 'Student 42', 'student42@example.com', '$2b$12$Na6ABHjNtcI90S0eTCta2eVODOfAmJjJj5ubUWMMuWArl62o.05K6', 90.60143302265034, 'student', '2025-09-22 00:00:00'),
+(43, 'Student 43', 'student43@example.com', '$2b$12$Na6ABHjNtcI90S0eTCta2eVODOfAmJjJj5ubUWMMuWArl62o.05K6', 85.28907285555209, 'student', '2025-08-19 00:00:00'),
+(44, 'Student 44', 'student44@example.com', '$2b$12$Na6ABHjNtcI90S0eTCta2eVODOfAmJjJj5ubUWMMuWArl62o.05K6', 95.39494095696978, 'student', '2025-09-05 00:00:00'),
+(45, 'Student 45', 'student45@example.com', '$2b$12$Na6ABHjNtcI90S0eTCta2eVODOfAmJjJj5ubUWMMuWArl62o.05K6', 81.8992243714242, 'student', '2025-09-11 00:00:00'),
+(46, 'Student 46', 'student46@example.com', '$2b$12$Na6ABHjNtcI90S0eTCta2eVODOfAmJjJj5ubUWMMuWArl62o.05K6', 62.5510697632728, 'student', '2025-09-15 00:00:00'),
+(47, 'Student 47', 'student47@example.com', '$2b$12$Na6ABHjNtcI90S0eTCta2eVODOfAmJjJj5ubUWMMuWArl62o.05K6', 96.81242740276357, 'student', '2025-09-23 00:00:00'),
+(48, 'Student 48', 'student48@example.com', '$2b$12$Na6ABHjNtcI90S0eTCta2eVODOfAmJjJj5ubUWMMuWArl62o.05K6', 92.65359718032444, 'student', '2025-09-19 00:00:00'),
+(49, 'Student 49', 'student49@example.com', '$2b$12$Na6ABHjNtcI90S0eTCta2eVODOfAmJjJj5ubUWMMuWArl62o.05K6', 91.7825103338763, 'student', '2025-08-15 00:00:00'),
+(50, 'Student 50', 'student50@example.com', '$2b$12$Na6ABHjNtcI90S0eTCta2eVODOfAmJjJj5ubUWMMuWArl62o.05K6', 90.02881229984999, 'student', '2025-09-11 00:00:00');
+INSERT INTO assessments (id, title, difficulty, created_at) VALUES
+(1, 'Arrays 1', 'easy', '2025-09-30 00:00:00'),
+(2, 'Strings 1', 'medium', '2025-10-01 00:00:00'),
+(3, 'Graphs 1', 'hard', '2025-09-21 00:00:00'),
+(4, 'Dynamic Programming 1', 'easy', '2025-09-30 00:00:00'),
+(5, 'Trees 1', 'medium', '2025-09-22 00:00:00');
+INSERT INTO attempts (id, user_id, assessment_id, start_time, end_time, status, final_score, risk_score, problem_solving_score, logic_score, efficiency_score, tab_switch_count, face_absent_seconds, copy_paste_count, multiple_faces_detected, code_similarity) VALUES
+(1, 6, 5, '2025-12-12 20:23:53', '2025-12-12 21:31:36', 'finalized', 40.0, 11.012633185677101, 20.0, 40.0, 37.1, 0, 2.2, 0, FALSE, 13.225266371354202),
+(2, 6, 1, '2025-12-17 01:22:47', '2025-12-17 02:07:17', 'finalized', 50.0, 28.59455441757648, 35.17, 50.0, 35.0, 2, 2.4, 0, FALSE, 7.589108835152956),
+(3, 6, 2, '2025-12-31 20:19:03', '2025-12-31 21:40:05', 'finalized', 62.5, 19.429097143350546, 42.5, 62.5, 47.5, 1, 0, 0, FALSE, 18.85819428670109),
+(4, 7, 2, '2025-11-10 09:53:20', '2025-11-10 11:00:58', 'finalized', 100.0, 2.1932075915728335, 80.0, 100.0, 87.39, 0, 0, 0, FALSE, 4.386415183145667),
+(5, 7, 4, '2025-10-16 10:20:10', '2025-10-16 11:34:44', 'finalized', 50.0, 9.961213802400968, 30.0, 50.0, 35.0, 0, 0, 0, FALSE, 19.922427604801936),
+(6, 7, 5, '2025-11-23 08:55:32', '2025-11-23 09:34:51', 'finalized', 60.0, 21.819621990520645, 46.89, 60.0, 45.0, 1, 2.1, 0, FALSE, 15.239243981041293),
+(7, 7, 3, '2025-11-21 06:59:02', '2025-11-21 07:18:33', 'finalized', 100.0, 24.853213789438122, 93.49, 100.0, 85.0, 1, 0, 1, FALSE, 19.706427578876244),
+(8, 8, 2, '2025-10-26 05:57:51', '2025-10-26 06:10:45', 'finalized', 100.0, 30.299310690899762, 95.7, 100.0, 85.0, 2, 1.5, 0, FALSE, 14.598621381799523),
+(9, 8, 4, '2025-10-22 12:42:57', '2025-10-22 13:30:30', 'finalized', 62.5, 22.202173844515595, 46.65, 62.5, 47.5, 2, 0, 0, FALSE, 4.404347689031189),
+(10, 8, 2, '2025-10-09 21:25:33', '2025-10-09 21:38:35', 'finalized', 75.0, 5.7104309332528445, 70.66, 75.0, 60.0, 0, 0, 0, FALSE, 11.420861866505689),
+(11, 8, 4, '2025-11-17 21:24:11', '2025-11-17 22:02:21', 'finalized', 83.33, 18.59302605394963, 70.61, 83.33, 68.33, 1, 2.6, 0, FALSE, 6.786052107899263),
+(12, 8, 2, '2025-12-25 15:50:33', '2025-12-25 16:10:28', 'finalized', 20.0, 0.9790872820160035, 13.36, 20.0, 5.0, 0, 0, 0, FALSE, 1.958174564032007),
+(13, 8, 1, '2025-12-05 07:36:27', '2025-12-05 08:55:15', 'finalized', 83.33, 38.098978672676374, 63.33, 83.33, 77.08, 3, 3.1, 0, FALSE, 3.7979573453527427),
+(14, 9, 1, '2025-10-08 22:02:29', '2025-10-08 22:50:18', 'finalized', 87.5, 10.950351064500277, 71.56, 87.5, 83.9, 0, 0, 1, FALSE, 11.900702129000553),
+(15, 9, 4, '2025-12-07 13:21:33', '2025-12-07 13:58:39', 'finalized', 80.0, 9.456145125313538, 67.63, 80.0, 71.17, 0, 3.4, 0, FALSE, 5.312290250627076),
+(16, 9, 4, '2025-10-15 16:58:06', '2025-10-15 17:44:03', 'finalized', 100.0, 11.287913140600192, 84.68, 100.0, 85.0, 0, 2.8, 1, FALSE, 1.3758262812003852),
+(17, 9, 3, '2025-10-26 17:13:26', '2025-10-26 18:08:53', 'finalized', 80.0, 8.142911143933677, 61.52, 80.0, 65.0, 0, 3.4, 0, FALSE, 2.6858222878673543),
+(18, 9, 5, '2025-10-14 04:58:05', '2025-10-14 05:17:41', 'finalized', 70.0, 4.885318521493765, 63.47, 70.0, 55.0, 0, 0, 0, FALSE, 9.77063704298753),
+(19, 9, 1, '2025-12-29 21:35:12', '2025-12-29 21:47:08', 'finalized', 58.33, 21.910196237558765, 54.35, 58.33, 43.33, 1, 0, 1, FALSE, 13.82039247511753),
+(20, 9, 1, '2025-10-17 11:19:17', '2025-10-17 12:38:46', 'finalized', 60.0, 13.578092322504261, 40.0, 60.0, 45.0, 1, 0, 0, FALSE, 7.156184645008523),
+(21, 9, 1, '2025-12-08 05:19:50', '2025-12-08 05:58:54', 'finalized', 100.0, 17.823864961476318, 86.98, 100.0, 88.3, 0, 0, 2, FALSE, 15.647729922952633),
+(22, 9, 3, '2025-11-11 23:21:40', '2025-11-12 00:00:32', 'finalized', 80.0, 10.353454991528618, 67.04, 80.0, 65.0, 0, 1.2, 0, FALSE, 15.906909983057236),
+(23, 10, 1, '2025-11-03 20:54:20', '2025-11-03 21:37:22', 'finalized', 75.0, 24.625343157615553, 60.66, 75.0, 60.0, 1, 0, 1, FALSE, 19.25068631523111),
+(24, 10, 1, '2025-10-28 18:34:53', '2025-10-28 18:45:06', 'finalized', 75.0, 10.199203485665855, 71.59, 75.0, 73.45, 0, 0, 1, FALSE, 10.398406971331708),
+(25, 10, 2, '2025-12-20 07:18:23', '2025-12-20 08:36:53', 'finalized', 100.0, 9.000468350970914, 80.0, 100.0, 85.0, 0, 0, 0, FALSE, 18.00093670194183),
+(26, 10, 4, '2025-11-21 05:40:51', '2025-11-21 06:28:04', 'finalized', 60.0, 14.39984781195682, 44.26, 60.0, 45.0, 0, 1.8, 1, FALSE, 11.59969562391364),
+(27, 10, 4, '2025-12-05 13:34:28', '2025-12-05 14:23:27', 'finalized', 90.0, 16.584234645366642, 73.67, 90.0, 85.64, 0, 4.2, 0, FALSE, 16.368469290733284),
+(28, 10, 3, '2025-12-14 22:16:43', '2025-12-14 22:53:47', 'finalized', 20.0, 1.944352367397093, 7.64, 20.0, 5.0, 0, 0, 0, FALSE, 3.888704734794186),
+(29, 10, 4, '2025-12-09 14:37:22', '2025-12-09 15:34:47', 'finalized', 80.0, 4.251461939427341, 60.86, 80.0, 65.0, 0, 0, 0, FALSE, 8.502923878854682),
+(30, 11, 2, '2025-10-07 21:01:02', '2025-10-07 22:22:08', 'finalized', 62.5, 38.61494909783262, 42.5, 62.5, 47.5, 1, 5.0, 2, FALSE, 17.229898195665246),
+(31, 11, 2, '2025-11-15 16:44:18', '2025-11-15 17:24:41', 'finalized', 62.5, 10.805776576576685, 49.04, 62.5, 47.5, 1, 0, 0, FALSE, 1.611553153153369),
+(32, 11, 4, '2025-10-17 15:27:39', '2025-10-17 16:04:13', 'finalized', 91.67, 19.04838478340177, 79.48, 91.67, 78.21, 1, 0, 0, FALSE, 18.096769566803538),
+(33, 11, 5, '2025-11-28 17:00:13', '2025-11-28 17:07:53', 'finalized', 33.33, 6.032525889412414, 30.77, 33.33, 18.33, 0, 0, 0, FALSE, 12.065051778824827),
+(34, 11, 2, '2025-10-24 09:53:32', '2025-10-24 11:05:11', 'finalized', 62.5, 4.673901492323101, 42.5, 62.5, 47.5, 0, 0, 0, FALSE, 9.347802984646203),
+(35, 11, 5, '2025-10-15 09:23:39', '2025-10-15 10:53:36', 'finalized', 75.0, 3.7910386418813955, 55.0, 75.0, 65.51, 0, 0, 0, FALSE, 7.582077283762791),
+(36, 11, 3, '2025-10-23 13:12:15', NULL, 'in_progress', NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL),
+(37, 11, 3, '2025-11-24 08:56:14', '2025-11-24 09:08:20', 'finalized', 60.0, 6.523823457847904, 55.97, 60.0, 45.0, 0, 0, 1, FALSE, 3.0476469156958075),
+(38, 12, 3, '2025-10-24 03:53:39', '2025-10-24 05:02:08', 'finalized', 40.0, 26.306144159329804, 20.0, 40.0, 25.0, 1, 2.2, 1, FALSE, 13.812288318659608),
+(39, 12, 1, '2025-12-02 21:34:50', '2025-12-02 22:12:59', 'finalized', 100.0, 13.455388706439987, 87.28, 100.0, 85.0, 1, 1.2, 0, FALSE, 2.1107774128799717),
+(40, 12, 2, '2025-11-07 03:57:33', '2025-11-07 05:05:19', 'finalized', 75.0, 25.94621878614, 55.0, 75.0, 60.0, 0, 8.3, 0, FALSE, 18.692437572280003),
+(41, 12, 2, '2025-10-30 01:56:59', '2025-10-30 03:03:31', 'finalized', 62.5, 18.803199797582252, 42.5, 62.5, 52.41, 1, 0, 0, FALSE, 17.606399595164508),
+(42, 13, 1, '2025-10-29 19:45:08', '2025-10-29 21:06:01', 'finalized', 62.5, 4.481745495865708, 42.5, 62.5, 47.5, 0, 0, 0, FALSE, 8.963490991731415),
+(43, 13, 3, '2025-10-04 16:10:46', '2025-10-04 16:28:28', 'finalized', 40.0, 13.628549421857688, 34.1, 40.0, 27.69, 0, 3.3, 0, FALSE, 14.057098843715378),
+(44, 13, 3, '2025-10-29 07:16:51', '2025-10-29 08:03:42', 'finalized', 100.0, 10.274831634825548, 84.38, 100.0, 89.4, 0, 4.0, 0, FALSE, 4.549663269651094),
+(45, 13, 1, '2025-10-20 10:07:44', '2025-10-20 10:54:00', 'finalized', 60.0, 20.443393271371495, 44.58, 60.0, 45.0, 1, 3.8, 0, FALSE, 5.686786542742988),
+(46, 13, 3, '2025-11-18 11:29:05', '2025-11-18 12:34:13', 'finalized', 100.0, 5.8518090839623005, 80.0, 100.0, 89.17, 0, 0, 1, FALSE, 1.703618167924601),
+(47, 13, 5, '2025-10-27 02:19:36', '2025-10-27 02:40:46', 'finalized', 100.0, 15.686294706242332, 92.94, 100.0, 89.12, 1, 0, 0, FALSE, 11.372589412484665),
+(48, 13, 1, '2025-10-08 20:20:48', '2025-10-08 21:49:02', 'finalized', 100.0, 14.699124790076858, 80.0, 100.0, 85.0, 1, 0, 0, FALSE, 9.398249580153717),
+(49, 14, 4, '2025-10-30 23:19:58', '2025-10-31 00:03:34', 'finalized', 87.5, 26.642403013200095, 72.97, 87.5, 76.56, 0, 4.2, 2, FALSE, 16.484806026400186),
+(50, 14, 4, '2025-12-31 10:32:03', '2025-12-31 11:16:27', 'finalized', 75.0, 30.82229404420203, 60.2, 75.0, 60.0, 0, 10.700000000000001, 1, FALSE, 8.844588088404057),
+(51, 14, 5, '2025-10-30 00:09:06', '2025-10-30 00:38:52', 'finalized', 60.0, 100.0, 50.08, 60.0, 45.81, 4, 3.0, 3, FALSE, 84.5163029889004),
+(52, 14, 4, '2025-12-02 10:50:31', '2025-12-02 12:03:34', 'finalized', 50.0, 47.518615602617864, 30.0, 50.0, 35.0, 2, 7.3, 2, FALSE, 5.83723120523572),
+(53, 14, 4, '2025-12-10 11:43:41', '2025-12-10 12:26:00', 'finalized', 91.67, 52.91917417070812, 77.56, 91.67, 76.67, 3, 8.700000000000001, 0, FALSE, 11.03834834141622),
+(54, 14, 4, '2025-11-24 18:17:01', '2025-11-24 19:13:31', 'finalized', 50.0, 81.89203630574218, 31.17, 50.0, 46.2, 4, 11.1, 2, FALSE, 19.384072611484346),
+(55, 15, 5, '2025-12-24 16:45:25', '2025-12-24 17:35:16', 'finalized', 40.0, 0.6842074718155144, 23.38, 40.0, 25.0, 0, 0, 0, FALSE, 1.368414943631029),
+(56, 15, 2, '2025-12-03 06:42:42', '2025-12-03 07:26:56', 'finalized', 60.0, 15.241974321839685, 45.26, 60.0, 54.03, 1, 1.4, 0, FALSE, 4.883948643679368),
+(57, 15, 2, '2025-11-12 00:09:00', '2025-11-12 01:31:16', 'finalized', 87.5, 11.379046310035685, 67.5, 87.5, 72.5, 0, 0, 1, FALSE, 12.75809262007137),
+(58, 15, 1, '2025-11-16 14:52:36', '2025-11-16 15:32:27', 'finalized', 80.0, 21.66653267422361, 66.72, 80.0, 65.0, 1, 2.8, 1, FALSE, 2.1330653484472184),
+(59, 16, 3, '2025-11-06 20:26:07', '2025-11-06 21:49:35', 'finalized', 100.0, 19.041552908937255, 80.0, 100.0, 85.0, 1, 0, 0, FALSE, 18.083105817874507),
+(60, 16, 5, '2025-10-30 18:52:50', '2025-10-30 19:29:15', 'finalized', 50.0, 22.208231901628118, 37.86, 50.0, 35.0, 1, 3.9, 0, FALSE, 8.816463803256232),
+(61, 16, 2, '2025-11-28 06:30:17', '2025-11-28 07:25:05', 'finalized', 20.0, 6.645444203687465, 1.73, 20.0, 5.0, 0, 0, 1, FALSE, 3.29088840737493),
+(62, 16, 3, '2025-12-30 17:53:18', '2025-12-30 19:04:05', 'finalized', 58.33, 18.045876440205618, 38.33, 58.33, 43.33, 1, 0, 0, FALSE, 16.09175288041124),
+(63, 16, 4, '2025-11-07 12:19:03', '2025-11-07 12:36:22', 'finalized', 100.0, 6.748365553753219, 94.23, 100.0, 95.18, 0, 0, 0, FALSE, 13.496731107506438),
+(64, 16, 5, '2025-11-17 18:37:14', '2025-11-17 18:45:39', 'finalized', 20.0, 31.959273747550295, 17.19, 20.0, 9.16, 1, 3.5, 1, FALSE, 19.91854749510059),
+(65, 16, 2, '2025-10-14 06:34:49', '2025-10-14 06:53:05', 'finalized', 41.67, 19.081158856977005, 35.58, 41.67, 26.67, 1, 0, 1, FALSE, 8.16231771395401),
+(66, 17, 2, '2025-10-06 04:14:04', '2025-10-06 05:09:39', 'finalized', 100.0, 23.22768738061978, 81.47, 100.0, 95.69, 0, 8.3, 0, FALSE, 13.25537476123956),
+(67, 17, 1, '2025-12-04 07:16:47', '2025-12-04 08:43:18', 'finalized', 50.0, 17.7436857780482, 30.0, 50.0, 38.41, 0, 0, 2, FALSE, 15.4873715560964),
+(68, 18, 5, '2025-10-17 01:08:50', NULL, 'in_progress', NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL),
+(69, 18, 5, '2025-12-18 16:47:51', '2025-12-18 17:25:20', 'finalized', 60.0, 4.482752142698842, 47.51, 60.0, 45.0, 0, 0, 0, FALSE, 8.965504285397683),
+(70, 18, 5, '2025-11-07 03:36:43', '2025-11-07 04:51:47', 'finalized', 100.0, 9.262736192799917, 80.0, 100.0, 86.16, 0, 0, 1, FALSE, 8.525472385599835),
+(71, 18, 4, '2025-10-13 11:34:09', '2025-10-13 12:46:05', 'finalized', 80.0, 9.946277558609236, 60.0, 80.0, 66.8, 0, 0, 0, FALSE, 19.89255511721847),
+(72, 19, 5, '2025-10-12 15:06:09', '2025-10-12 15:26:46', 'finalized', 80.0, 28.13592517619125, 73.13, 80.0, 67.0, 1, 4.3, 0, FALSE, 19.071850352382498),
+(73, 19, 1, '2025-12-08 16:24:32', '2025-12-08 17:34:17', 'finalized', 37.5, 5.616833815697281, 17.5, 37.5, 22.5, 0, 0, 0, FALSE, 11.233667631394562),
+(74, 19, 4, '2025-12-07 01:14:38', '2025-12-07 01:36:19', 'finalized', 62.5, 18.821893962043887, 55.27, 62.5, 47.5, 0, 4.5, 1, FALSE, 9.643787924087771),
+(75, 20, 5, '2025-10-14 03:42:07', '2025-10-14 04:25:09', 'finalized', 100.0, 9.290842909949363, 85.66, 100.0, 85.0, 0, 0, 0, FALSE, 18.581685819898727),
+(76, 20, 1, '2025-12-22 12:47:01', '2025-12-22 13:28:31', 'finalized', 100.0, 5.717576830544453, 86.17, 100.0, 97.56, 0, 2.4, 0, FALSE, 1.8351536610889063),
+(77, 20, 4, '2025-11-23 12:06:51', '2025-11-23 12:41:13', 'finalized', 100.0, 0.5260882642552178, 88.54, 100.0, 85.0, 0, 0, 0, FALSE, 1.0521765285104356),
+(78, 20, 1, '2025-10-18 06:47:29', '2025-10-18 08:16:50', 'finalized', 60.0, 16.78486254760133, 40.0, 60.0, 45.0, 1, 0, 0, FALSE, 13.56972509520266),
+(79, 21, 1, '2025-12-06 18:31:53', NULL, 'in_progress', NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL),
+(80, 21, 2, '2025-12-14 12:40:08', '2025-12-14 13:43:55', 'finalized', 100.0, 4.362195955123122, 80.0, 100.0, 97.2, 0, 0, 0, FALSE, 8.724391910246243),
+(81, 21, 3, '2025-11-16 15:18:18', '2025-11-16 15:33:55', 'finalized', 100.0, 1.71873180578069, 94.79, 100.0, 88.53, 0, 0, 0, FALSE, 3.43746361156138),
+(82, 21, 3, '2025-12-02 00:20:10', '2025-12-02 01:27:59', 'finalized', 62.5, 13.132246669681866, 42.5, 62.5, 47.5, 0, 3.4, 0, FALSE, 12.66449333936373),
+(83, 21, 2, '2025-11-23 12:23:55', '2025-11-23 13:38:32', 'finalized', 80.0, 19.51292140579582, 60.0, 80.0, 73.06, 1, 0, 0, FALSE, 19.025842811591637),
+(84, 21, 4, '2025-12-02 23:13:36', '2025-12-03 00:26:03', 'finalized', 80.0, 27.273368852897782, 60.0, 80.0, 67.69, 1, 3.6, 1, FALSE, 10.146737705795562),
+(85, 22, 1, '2025-11-15 21:02:08', '2025-11-15 21:12:16', 'finalized', 41.67, 7.389210454812405, 38.29, 41.67, 26.67, 0, 0, 0, FALSE, 14.77842090962481),
+(86, 22, 5, '2025-10-06 23:35:23', '2025-10-07 00:41:47', 'finalized', 80.0, 21.46127091143719, 60.0, 80.0, 65.0, 1, 0, 1, FALSE, 12.922541822874383),
+(87, 22, 4, '2025-10-06 19:12:27', '2025-10-06 19:51:16', 'finalized', 80.0, 18.86564204723738, 67.06, 80.0, 65.0, 1, 0, 1, FALSE, 7.731284094474757),
+(88, 23, 2, '2025-12-24 16:17:35', '2025-12-24 17:44:52', 'finalized', 100.0, 3.095818874159609, 80.0, 100.0, 95.9, 0, 0, 0, FALSE, 6.191637748319218),
+(89, 23, 2, '2025-11-08 13:43:35', '2025-11-08 14:33:25', 'finalized', 100.0, 26.876682675343467, 83.39, 100.0, 88.01, 1, 3.7, 0, FALSE, 18.953365350686937),
+(90, 23, 2, '2025-11-19 05:05:36', '2025-11-19 05:36:48', 'finalized', 62.5, 26.513450566891255, 52.1, 62.5, 55.45, 1, 4.1, 0, FALSE, 16.62690113378251),
+(91, 23, 4, '2025-12-16 20:47:17', '2025-12-16 21:14:53', 'finalized', 58.33, 5.340111496982612, 49.13, 58.33, 49.64, 0, 0, 0, FALSE, 10.680222993965224),
+(92, 23, 2, '2025-11-02 01:06:44', '2025-11-02 02:15:46', 'finalized', 60.0, 25.35909387552485, 40.0, 60.0, 45.0, 0, 5.1, 2, FALSE, 10.318187751049702),
+(93, 23, 1, '2025-10-15 02:31:12', '2025-10-15 03:15:07', 'finalized', 66.67, 13.495850781386489, 52.03, 66.67, 51.67, 1, 0, 0, FALSE, 6.991701562772978),
+(94, 24, 1, '2025-10-25 21:24:09', '2025-10-25 22:21:52', 'finalized', 75.0, 34.288800991160535, 55.76, 75.0, 60.0, 1, 6.6, 1, FALSE, 12.177601982321068),
+(95, 24, 3, '2025-11-13 02:15:18', '2025-11-13 02:35:28', 'finalized', 83.33, 28.67679322908846, 76.61, 83.33, 68.33, 1, 9.0, 0, FALSE, 1.3535864581769208),
+(96, 24, 5, '2025-11-23 01:48:26', '2025-11-23 03:07:43', 'finalized', 100.0, 45.24622899747038, 80.0, 100.0, 85.0, 2, 10.3, 0, FALSE, 9.292457994940754),
+(97, 24, 2, '2025-12-09 12:22:27', '2025-12-09 13:32:47', 'finalized', 100.0, 12.533137652026173, 80.0, 100.0, 85.0, 1, 0, 0, FALSE, 5.066275304052348),
+(98, 24, 3, '2025-12-15 03:17:42', '2025-12-15 03:48:47', 'finalized', 58.33, 64.35098164844075, 47.97, 58.33, 54.41, 3, 9.7, 1, FALSE, 19.901963296881508),
+(99, 24, 3, '2025-10-20 12:29:38', '2025-10-20 13:49:06', 'finalized', 30.0, 29.627794683625496, 10.0, 30.0, 23.59, 1, 6.6, 1, FALSE, 2.8555893672509947),
+(100, 24, 1, '2025-11-30 23:44:50', '2025-12-01 00:49:39', 'finalized', 70.0, 24.186897662998113, 50.0, 70.0, 56.27, 0, 8.2, 1, FALSE, 5.573795325996227),
+(101, 24, 2, '2025-10-14 00:21:15', '2025-10-14 00:29:47', 'finalized', 100.0, 53.20219255966693, 97.16, 100.0, 85.0, 2, 5.6, 3, FALSE, 14.004385119333866),
+(102, 25, 2, '2025-11-07 02:20:16', '2025-11-07 03:34:43', 'finalized', 0.0, 6.119483626205209, 0.0, 0.0, 0.0, 0, 0, 0, FALSE, 12.238967252410418),
+(103, 25, 3, '2025-10-11 08:53:47', '2025-10-11 09:07:45', 'finalized', 80.0, 18.97960151650412, 75.34, 80.0, 74.56, 0, 2.6, 1, FALSE, 17.559203033008234),
+(104, 25, 5, '2025-12-17 18:08:39', '2025-12-17 19:28:55', 'finalized', 37.5, 17.040483102644508, 17.5, 37.5, 22.5, 0, 4.6, 1, FALSE, 5.680966205289022),
+(105, 26, 3, '2025-10-22 01:24:59', '2025-10-22 02:45:11', 'finalized', 66.67, 24.49671656801606, 46.67, 66.67, 51.67, 0, 3.3, 3, FALSE, 5.793433136032116),
+(106, 26, 2, '2025-11-01 07:55:49', '2025-11-01 09:06:45', 'finalized', 62.5, 87.2943441679393, 42.5, 62.5, 47.5, 3, 5.5, 1, FALSE, 82.58868833587862),
+(107, 26, 1, '2025-10-16 16:16:07', '2025-10-16 16:34:20', 'finalized', 100.0, 63.140531243988974, 93.93, 100.0, 91.11, 1, 4.1, 1, FALSE, 79.88106248797794),
+(108, 26, 4, '2025-10-07 21:46:03', '2025-10-07 22:29:27', 'finalized', 60.0, 72.86543611232321, 45.53, 60.0, 46.2, 3, 0, 0, FALSE, 85.73087222464642),
+(109, 26, 3, '2025-11-07 04:44:29', '2025-11-07 06:05:01', 'finalized', 80.0, 28.193327103330834, 60.0, 80.0, 68.27, 0, 6.5, 2, FALSE, 10.386654206661666),
+(110, 26, 5, '2025-10-17 11:03:24', '2025-10-17 12:31:10', 'finalized', 75.0, 39.387671041885326, 55.0, 75.0, 60.0, 1, 5.2, 2, FALSE, 17.975342083770663),
+(111, 26, 5, '2025-12-26 16:08:17', '2025-12-26 16:16:55', 'finalized', 58.33, 59.716054638685115, 55.45, 58.33, 43.33, 5, 0, 1, FALSE, 9.432109277370229),
+(112, 26, 2, '2025-12-24 08:51:42', '2025-12-24 09:05:12', 'finalized', 50.0, 100.0, 45.5, 50.0, 39.66, 4, 12.8, 1, FALSE, 88.94542288191128),
+(113, 26, 3, '2025-11-08 20:45:05', '2025-11-08 21:43:57', 'finalized', 40.0, 63.574670341996956, 20.38, 40.0, 35.42, 3, 11.100000000000001, 2, FALSE, 2.7493406839939105),
+(114, 27, 4, '2025-10-18 08:01:45', '2025-10-18 09:02:18', 'finalized', 25.0, 14.132297256698525, 5.0, 25.0, 22.36, 0, 0, 1, FALSE, 18.26459451339705),
+(115, 27, 2, '2025-10-19 23:55:49', '2025-10-20 00:57:52', 'finalized', 60.0, 10.374661759232518, 40.0, 60.0, 45.0, 1, 0, 0, FALSE, 0.7493235184650371),
+(116, 27, 5, '2025-10-31 23:18:15', '2025-11-01 00:40:47', 'finalized', 66.67, 11.624942625397386, 46.67, 66.67, 55.02, 0, 5.0, 0, FALSE, 3.249885250794773),
+(117, 27, 2, '2025-11-16 13:20:53', '2025-11-16 14:01:00', 'finalized', 100.0, 4.277032503134061, 86.63, 100.0, 85.0, 0, 0, 0, FALSE, 8.554065006268122),
+(118, 27, 4, '2025-11-03 20:07:28', '2025-11-03 20:24:18', 'finalized', 60.0, 17.61553150815393, 54.39, 60.0, 58.16, 1, 0, 1, FALSE, 5.231063016307855),
+(119, 27, 1, '2025-11-06 21:49:01', '2025-11-06 22:26:16', 'finalized', 100.0, 11.174157458447763, 87.58, 100.0, 85.0, 1, 0, 0, FALSE, 2.3483149168955264),
+(120, 27, 3, '2025-12-30 22:44:18', '2025-12-30 23:29:34', 'finalized', 75.0, 12.18411622657326, 59.91, 75.0, 60.0, 1, 0, 0, FALSE, 4.368232453146518),
+(121, 28, 1, '2025-12-15 06:40:14', '2025-12-15 08:06:34', 'finalized', 62.5, 8.544860073949511, 42.5, 62.5, 50.93, 0, 0, 0, FALSE, 17.089720147899023),
+(122, 28, 2, '2025-11-14 21:33:47', '2025-11-14 21:54:39', 'finalized', 60.0, 14.623783057389236, 53.04, 60.0, 45.0, 1, 0, 0, FALSE, 9.247566114778474),
+(123, 29, 2, '2025-12-21 06:28:26', '2025-12-21 06:33:50', 'finalized', 40.0, 0.31734871023079037, 38.2, 40.0, 25.0, 0, 0, 0, FALSE, 0.6346974204615807),
+(124, 29, 2, '2025-11-11 16:43:44', '2025-11-11 17:13:18', 'finalized', 62.5, 38.928467760775874, 52.64, 62.5, 55.52, 2, 4.5, 0, FALSE, 19.85693552155174),
+(125, 29, 2, '2025-11-10 03:53:34', '2025-11-10 05:10:46', 'finalized', 60.0, 32.09478183539194, 40.0, 60.0, 57.52, 1, 7.0, 0, FALSE, 16.18956367078389),
+(126, 29, 1, '2025-11-12 16:54:05', '2025-11-12 18:23:02', 'finalized', 80.0, 2.3433927848756166, 60.0, 80.0, 65.02, 0, 0, 0, FALSE, 4.686785569751233),
+(127, 29, 2, '2025-10-24 02:16:26', '2025-10-24 02:29:08', 'finalized', 80.0, 8.017644351442033, 75.77, 80.0, 71.22, 0, 0, 1, FALSE, 6.035288702884065),
+(128, 30, 1, '2025-11-01 04:13:04', '2025-11-01 04:55:38', 'finalized', 58.33, 9.722902353436858, 44.14, 58.33, 55.39, 0, 0, 0, FALSE, 19.445804706873716),
+(129, 30, 5, '2025-12-04 11:02:06', '2025-12-04 11:59:08', 'finalized', 75.0, 7.075767974879722, 55.99, 75.0, 60.0, 0, 0, 0, FALSE, 14.151535949759444),
+(130, 30, 1, '2025-12-20 05:35:40', '2025-12-20 06:43:53', 'finalized', 91.67, 6.710774935220479, 71.67, 91.67, 76.67, 0, 1.5, 0, FALSE, 7.421549870440957),
+(131, 30, 1, '2025-11-24 00:07:16', '2025-11-24 00:38:16', 'finalized', 50.0, 23.37159763202248, 39.67, 50.0, 42.0, 0, 4.5, 1, FALSE, 18.743195264044953),
+(132, 30, 4, '2025-12-13 23:45:44', '2025-12-14 00:06:45', 'finalized', 100.0, 33.8281195236204, 92.99, 100.0, 85.0, 2, 0, 1, FALSE, 17.656239047240806),
+(133, 31, 2, '2025-12-15 22:43:26', '2025-12-15 23:32:09', 'finalized', 30.0, 9.347582502963535, 13.76, 30.0, 15.0, 0, 0, 0, FALSE, 18.69516500592707),
+(134, 31, 3, '2025-11-28 05:30:02', '2025-11-28 06:32:02', 'finalized', 70.0, 6.416944543987072, 50.0, 70.0, 55.0, 0, 0, 0, FALSE, 12.833889087974145),
+(135, 31, 2, '2025-11-19 15:10:14', '2025-11-19 16:18:09', 'finalized', 100.0, 29.46383824440779, 80.0, 100.0, 85.0, 1, 4.7, 2, FALSE, 0.12767648881557792),
+(136, 31, 1, '2025-10-16 08:22:42', '2025-10-16 08:59:17', 'finalized', 66.67, 15.51643560911257, 54.48, 66.67, 51.67, 1, 0, 0, FALSE, 11.032871218225138),
+(137, 31, 5, '2025-10-04 03:36:53', '2025-10-04 03:44:10', 'finalized', 60.0, 16.488974857402503, 57.57, 60.0, 45.0, 1, 0, 1, FALSE, 2.9779497148050105),
+(138, 31, 5, '2025-10-21 15:14:02', '2025-10-21 16:43:39', 'finalized', 50.0, 11.53735719559153, 30.0, 50.0, 46.02, 0, 0, 1, FALSE, 13.074714391183061),
+(139, 31, 1, '2025-12-25 07:47:44', '2025-12-25 07:57:03', 'finalized', 100.0, 8.45329794540328, 96.89, 100.0, 85.0, 0, 0, 0, FALSE, 16.90659589080656),
+(140, 32, 1, '2025-10-12 06:12:33', '2025-10-12 07:29:39', 'finalized', 100.0, 22.470361040844885, 80.0, 100.0, 92.14, 0, 5.800000000000001, 1, FALSE, 11.740722081689768),
+(141, 32, 1, '2025-12-15 00:52:47', '2025-12-15 01:52:09', 'finalized', 40.0, 9.88477957914103, 20.21, 40.0, 25.0, 0, 0, 0, FALSE, 19.76955915828206),
+(142, 32, 5, '2025-12-12 07:25:24', '2025-12-12 07:41:06', 'finalized', 100.0, 21.34122947404735, 94.77, 100.0, 97.59, 1, 0, 1, FALSE, 12.682458948094698),
+(143, 33, 4, '2025-11-25 16:40:16', '2025-11-25 17:36:31', 'finalized', 75.0, 0.7350668372242153, 56.25, 75.0, 60.0, 0, 0, 0, FALSE, 1.4701336744484306),
+(144, 33, 4, '2025-10-29 00:25:12', '2025-10-29 00:51:15', 'finalized', 58.33, 10.872972323551162, 49.65, 58.33, 52.77, 1, 0, 0, FALSE, 1.7459446471023221),
+(145, 33, 5, '2025-11-13 20:15:18', '2025-11-13 21:21:34', 'finalized', 90.0, 3.8523791739598368, 70.0, 90.0, 75.0, 0, 0, 0, FALSE, 7.7047583479196735),
+(146, 33, 4, '2025-10-31 08:03:13', '2025-10-31 09:04:42', 'finalized', 66.67, 17.56921361395157, 46.67, 66.67, 51.67, 1, 3.4, 0, FALSE, 1.538427227903143),
+(147, 34, 5, '2025-10-26 22:35:47', '2025-10-26 23:48:28', 'finalized', 30.0, 24.74225376504607, 10.0, 30.0, 15.0, 1, 0, 1, FALSE, 19.484507530092138),
+(148, 34, 3, '2025-10-16 05:11:34', '2025-10-16 05:57:35', 'finalized', 87.5, 12.160553023241471, 72.16, 87.5, 76.0, 0, 1.7, 1, FALSE, 7.521106046482942),
+(149, 34, 3, '2025-12-21 06:34:12', '2025-12-21 07:32:50', 'finalized', 100.0, 2.096483963612835, 80.46, 100.0, 85.0, 0, 0, 0, FALSE, 4.19296792722567),
+(150, 34, 1, '2025-12-19 10:44:31', '2025-12-19 11:29:17', 'finalized', 58.33, 32.56765164067752, 43.41, 58.33, 43.33, 2, 3.6, 1, FALSE, 0.7353032813550398),
+(151, 34, 5, '2025-11-06 21:45:51', '2025-11-06 23:04:09', 'finalized', 100.0, 18.186065585817275, 80.0, 100.0, 98.18, 1, 3.6, 0, FALSE, 1.9721311716345502),
+(152, 34, 5, '2025-10-24 13:18:00', '2025-10-24 14:32:43', 'finalized', 66.67, 12.95432220518406, 46.67, 66.67, 61.96, 0, 2.5, 1, FALSE, 5.908644410368118),
+(153, 34, 1, '2025-12-31 09:01:52', '2025-12-31 09:18:35', 'finalized', 100.0, 33.2918000804691, 94.43, 100.0, 97.81, 2, 2.4, 0, FALSE, 16.983600160938195),
+(154, 35, 2, '2025-12-07 17:50:56', '2025-12-07 18:18:22', 'finalized', 58.33, 4.321344524292825, 49.19, 58.33, 43.33, 0, 0, 0, FALSE, 8.64268904858565),
+(155, 35, 2, '2025-10-05 20:01:22', '2025-10-05 21:30:12', 'finalized', 60.0, 1.0175204872714239, 40.0, 60.0, 45.0, 0, 0, 0, FALSE, 2.0350409745428477),
+(156, 35, 2, '2025-12-26 15:51:32', '2025-12-26 17:09:50', 'finalized', 40.0, 1.1423207333627816, 20.0, 40.0, 25.0, 0, 0, 0, FALSE, 2.2846414667255632),
+(157, 35, 5, '2025-11-06 04:11:03', '2025-11-06 05:18:33', 'finalized', 50.0, 11.230445183314835, 30.0, 50.0, 44.91, 0, 4.7, 0, FALSE, 3.66089036662967),
+(158, 35, 5, '2025-12-09 07:49:27', '2025-12-09 08:13:45', 'finalized', 37.5, 1.8709857996240264, 29.4, 37.5, 31.7, 0, 0, 0, FALSE, 3.741971599248053),
+(159, 35, 5, '2025-12-23 17:58:03', '2025-12-23 19:04:37', 'finalized', 58.33, 6.846966705599865, 38.33, 58.33, 44.27, 0, 0, 0, FALSE, 13.69393341119973),
+(160, 36, 1, '2025-10-11 00:38:11', '2025-10-11 02:00:22', 'finalized', 41.67, 15.108059802145585, 21.67, 41.67, 26.67, 1, 0, 0, FALSE, 10.216119604291169),
+(161, 36, 3, '2025-11-27 14:31:13', '2025-11-27 14:51:48', 'finalized', 66.67, 29.39069903383333, 59.81, 66.67, 62.5, 2, 0, 1, FALSE, 8.78139806766666),
+(162, 36, 2, '2025-10-14 09:31:45', '2025-10-14 10:09:06', 'finalized', 100.0, 30.190001564029885, 87.55, 100.0, 88.56, 1, 2.7, 1, FALSE, 19.58000312805977),
+(163, 36, 5, '2025-10-31 09:53:17', '2025-10-31 10:37:47', 'finalized', 75.0, 18.621716330753678, 60.17, 75.0, 60.0, 0, 6.1, 1, FALSE, 2.843432661507357),
+(164, 36, 4, '2025-12-03 09:36:12', '2025-12-03 10:17:53', 'finalized', 30.0, 14.502540788653826, 16.11, 30.0, 15.0, 0, 0, 1, FALSE, 19.005081577307653),
+(165, 36, 1, '2025-11-03 18:38:21', '2025-11-03 20:02:48', 'finalized', 100.0, 41.795747419162055, 80.0, 100.0, 97.09, 2, 7.9, 1, FALSE, 1.9914948383241171),
+(166, 36, 1, '2025-12-18 02:35:43', '2025-12-18 03:43:27', 'finalized', 50.0, 36.32725562725924, 30.0, 50.0, 35.0, 0, 1.0, 0, TRUE, 18.654511254518486),
+(167, 37, 1, '2025-11-08 02:27:31', '2025-11-08 02:55:06', 'finalized', 60.0, 2.134211769462131, 50.81, 60.0, 58.47, 0, 0, 0, FALSE, 4.268423538924262),
+(168, 37, 5, '2025-10-10 13:36:37', '2025-10-10 13:59:44', 'finalized', 60.0, 16.275616896226182, 52.29, 60.0, 48.88, 0, 3.8, 1, FALSE, 7.351233792452363),
+(169, 37, 4, '2025-11-01 01:18:55', '2025-11-01 01:42:38', 'finalized', 62.5, 20.08268836374388, 54.59, 62.5, 47.5, 1, 1.3, 0, FALSE, 14.96537672748776),
+(170, 37, 5, '2025-12-31 07:30:31', '2025-12-31 08:31:43', 'finalized', 75.0, 18.5339663178473, 55.0, 75.0, 65.88, 1, 1.5, 0, FALSE, 11.067932635694602),
+(171, 37, 3, '2025-11-30 06:07:10', '2025-11-30 07:35:07', 'finalized', 100.0, 18.979125603569898, 80.0, 100.0, 85.0, 1, 0, 0, FALSE, 17.958251207139792),
+(172, 38, 1, '2025-11-20 12:06:42', NULL, 'in_progress', NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL),
+(173, 38, 1, '2025-10-23 22:43:02', '2025-10-23 22:53:28', 'finalized', 70.0, 18.49906885616642, 66.52, 70.0, 65.94, 1, 2.7, 0, FALSE, 6.198137712332839),
+(174, 38, 2, '2025-11-21 15:25:34', '2025-11-21 15:58:18', 'finalized', 60.0, 2.3863738818396585, 49.09, 60.0, 45.0, 0, 0, 0, FALSE, 4.772747763679317),
+(175, 38, 4, '2025-10-26 17:40:44', '2025-10-26 17:57:30', 'finalized', 100.0, 12.364129325227156, 94.41, 100.0, 93.47, 0, 3.7, 0, FALSE, 9.92825865045431),
+(176, 38, 5, '2025-11-05 15:52:53', '2025-11-05 17:09:17', 'finalized', 66.67, 24.750505877781784, 46.67, 66.67, 51.67, 1, 0, 1, FALSE, 19.501011755563567),
+(177, 39, 5, '2025-11-20 04:06:27', '2025-11-20 05:13:35', 'finalized', 100.0, 2.2840442315325102, 80.0, 100.0, 94.96, 0, 0, 0, FALSE, 4.5680884630650205),
+(178, 39, 1, '2025-11-21 09:38:52', '2025-11-21 09:44:13', 'finalized', 40.0, 18.03115486457554, 38.22, 40.0, 25.0, 1, 0, 0, FALSE, 16.062309729151078),
+(179, 39, 2, '2025-12-11 07:47:20', '2025-12-11 08:49:35', 'finalized', 100.0, 1.7934435027230566, 80.0, 100.0, 96.89, 0, 0, 0, FALSE, 3.5868870054461133),
+(180, 39, 1, '2025-12-20 02:14:36', '2025-12-20 03:30:01', 'finalized', 100.0, 18.282736276961188, 80.0, 100.0, 85.0, 1, 2.3, 0, FALSE, 7.365472553922374),
+(181, 39, 5, '2025-11-19 21:36:49', '2025-11-19 22:08:29', 'finalized', 90.0, 25.59815842002845, 79.44, 90.0, 81.19, 1, 3.2, 1, FALSE, 8.396316840056905),
+(182, 39, 3, '2025-10-08 19:33:56', '2025-10-08 19:58:22', 'finalized', 91.67, 19.118957633362765, 83.53, 91.67, 87.88, 0, 6.6, 0, FALSE, 11.83791526672553),
+(183, 40, 3, '2025-10-31 07:39:15', '2025-10-31 08:19:53', 'finalized', 62.5, 71.52477157411326, 48.96, 62.5, 57.76, 3, 0, 0, FALSE, 83.04954314822653),
+(184, 40, 5, '2025-11-11 11:14:34', '2025-11-11 11:36:03', 'finalized', 60.0, 87.2694726857107, 52.84, 60.0, 49.32, 2, 4.2, 2, FALSE, 97.73894537142141),
+(185, 40, 4, '2025-10-06 00:25:35', '2025-10-06 01:25:47', 'finalized', 80.0, 36.5742858151158, 60.0, 80.0, 65.0, 2, 1.2, 1, FALSE, 18.348571630231604),
+(186, 40, 1, '2025-10-10 06:43:58', '2025-10-10 06:51:56', 'finalized', 83.33, 24.266640184283794, 80.67, 83.33, 80.93, 1, 0, 2, FALSE, 8.533280368567587),
+(187, 40, 2, '2025-11-06 08:44:51', '2025-11-06 09:19:09', 'finalized', 50.0, 55.3622138643362, 38.57, 50.0, 46.63, 1, 0, 1, FALSE, 80.7244277286724),
+(188, 41, 1, '2025-10-27 04:33:22', '2025-10-27 05:52:35', 'finalized', 40.0, 25.97116352759452, 20.0, 40.0, 28.7, 2, 0, 0, FALSE, 11.942327055189041),
+(189, 41, 1, '2025-10-05 20:16:55', '2025-10-05 21:00:16', 'finalized', 87.5, 38.981051011206695, 73.05, 87.5, 72.5, 1, 10.799999999999999, 0, FALSE, 14.762102022413398),
+(190, 41, 1, '2025-11-06 20:01:31', '2025-11-06 21:27:17', 'finalized', 100.0, 13.090530721512195, 80.0, 100.0, 85.0, 1, 0, 0, FALSE, 6.181061443024392),
+(191, 42, 5, '2025-10-24 05:51:42', '2025-10-24 05:59:25', 'finalized', 75.0, 8.024244445881552, 72.43, 75.0, 60.0, 0, 0, 0, FALSE, 16.048488891763103),
+(192, 42, 1, '2025-12-26 07:05:32', '2025-12-26 07:54:42', 'finalized', 60.0, 6.0103217018068635, 43.61, 60.0, 45.0, 0, 0, 1, FALSE, 2.0206434036137266),
+(193, 42, 2, '2025-11-01 07:09:49', '2025-11-01 07:58:51', 'finalized', 37.5, 37.868232292979584, 21.16, 37.5, 24.38, 2, 4.9, 1, FALSE, 6.1364645859591604),
+(194, 42, 2, '2025-12-08 20:19:03', '2025-12-08 21:04:15', 'finalized', 80.0, 9.675316856159355, 64.93, 80.0, 65.0, 0, 0, 0, FALSE, 19.35063371231871),
+(195, 42, 1, '2025-10-24 10:43:23', '2025-10-24 12:05:35', 'finalized', 90.0, 15.11395620295498, 70.0, 90.0, 75.0, 1, 0, 1, FALSE, 0.2279124059099602),
+(196, 42, 1, '2025-10-23 08:35:59', '2025-10-23 09:15:03', 'finalized', 83.33, 3.414285596371216, 70.31, 83.33, 70.3, 0, 1.2, 0, FALSE, 2.028571192742432),
+(197, 42, 2, '2025-11-18 13:17:27', '2025-11-18 14:41:22', 'finalized', 50.0, 13.879312677343032, 30.0, 50.0, 43.28, 0, 0, 1, FALSE, 17.758625354686064),
+(198, 43, 5, '2025-10-12 00:56:58', '2025-10-12 01:48:06', 'finalized', 100.0, 40.61523073445265, 82.96, 100.0, 85.0, 3, 1.4, 1, FALSE, 5.630461468905306),
+(199, 43, 1, '2025-10-26 01:31:39', NULL, 'in_progress', NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL),
+(200, 43, 5, '2025-10-11 12:11:19', '2025-10-11 12:56:31', 'finalized', 83.33, 4.7094445294958955, 68.26, 83.33, 69.62, 0, 0, 0, FALSE, 9.418889058991791),
+(201, 43, 1, '2025-12-28 21:12:56', '2025-12-28 21:54:06', 'finalized', 60.0, 23.12235142115287, 46.28, 60.0, 53.86, 1, 2.8, 0, FALSE, 15.044702842305743),
+(202, 43, 1, '2025-12-06 19:18:51', '2025-12-06 19:37:03', 'finalized', 100.0, 21.74728493557136, 93.93, 100.0, 85.0, 1, 3.2, 1, FALSE, 0.6945698711427251),
+(203, 43, 5, '2025-11-27 11:02:20', '2025-11-27 12:17:53', 'finalized', 100.0, 35.55047654642809, 80.0, 100.0, 85.0, 1, 4.8, 2, FALSE, 11.900953092856161),
+(204, 43, 1, '2025-11-03 01:04:13', '2025-11-03 01:18:21', 'finalized', 80.0, 7.816856609254615, 75.29, 80.0, 65.0, 0, 0, 0, FALSE, 15.63371321850923),
+(205, 43, 2, '2025-10-13 22:11:16', '2025-10-13 23:12:51', 'finalized', 40.0, 10.356334811459167, 20.0, 40.0, 25.0, 0, 0, 1, FALSE, 10.712669622918334),
+(206, 43, 3, '2025-11-05 09:16:23', '2025-11-05 10:17:29', 'finalized', 37.5, 0.38782532481795085, 17.5, 37.5, 23.66, 0, 0, 0, FALSE, 0.7756506496359017),
+(207, 43, 2, '2025-12-28 08:51:29', '2025-12-28 09:41:44', 'finalized', 40.0, 2.803466531846416, 23.25, 40.0, 28.95, 0, 0, 0, FALSE, 5.606933063692832),
+(208, 44, 2, '2025-12-26 08:41:01', '2025-12-26 09:17:08', 'finalized', 58.33, 9.444603297076618, 46.29, 58.33, 43.33, 0, 2.3, 0, FALSE, 9.689206594153239),
+(209, 44, 1, '2025-11-22 03:32:07', '2025-11-22 04:28:10', 'finalized', 100.0, 8.36976677608695, 81.32, 100.0, 92.33, 0, 0, 0, FALSE, 16.7395335521739),
+(210, 44, 4, '2025-10-27 05:21:16', '2025-10-27 05:30:46', 'finalized', 100.0, 9.230735683729712, 96.83, 100.0, 85.0, 0, 0, 0, FALSE, 18.461471367459424),
+(211, 44, 2, '2025-12-08 03:15:04', '2025-12-08 03:24:14', 'finalized', 40.0, 7.489611344849333, 36.94, 40.0, 30.56, 0, 0, 0, FALSE, 14.979222689698666),
+(212, 44, 3, '2025-12-08 21:08:17', '2025-12-08 21:25:37', 'finalized', 100.0, 11.515873328559636, 94.22, 100.0, 90.23, 0, 0, 1, FALSE, 13.031746657119271),
+(213, 45, 4, '2025-12-08 05:38:26', '2025-12-08 05:44:38', 'finalized', 25.0, 20.287091992720814, 22.93, 25.0, 10.0, 1, 3.4, 0, FALSE, 6.974183985441627),
+(214, 45, 4, '2025-10-27 11:11:58', NULL, 'in_progress', NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL),
+(215, 45, 5, '2025-12-06 07:24:00', '2025-12-06 08:20:05', 'finalized', 80.0, 23.596870447454947, 61.31, 80.0, 71.12, 1, 2.3, 0, FALSE, 17.993740894909898),
+(216, 45, 4, '2025-12-20 04:47:15', '2025-12-20 06:14:10', 'finalized', 100.0, 28.54635101544213, 80.0, 100.0, 85.0, 1, 6.6, 0, FALSE, 10.692702030884263),
+(217, 45, 3, '2025-12-18 04:56:33', '2025-12-18 06:06:30', 'finalized', 20.0, 23.005592354057036, 0.0, 20.0, 7.09, 0, 10.2, 0, FALSE, 5.211184708114072),
+(218, 45, 1, '2025-10-31 13:11:19', '2025-10-31 14:19:38', 'finalized', 91.67, 12.583557538174633, 71.67, 91.67, 76.67, 0, 4.8, 0, FALSE, 5.967115076349265),
+(219, 45, 2, '2025-10-08 05:58:24', '2025-10-08 06:23:59', 'finalized', 80.0, 34.735422713205644, 71.47, 80.0, 65.0, 1, 8.5, 0, FALSE, 15.470845426411293),
+(220, 45, 4, '2025-11-27 22:49:37', NULL, 'in_progress', NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL),
+(221, 45, 3, '2025-11-23 19:48:13', '2025-11-23 20:20:26', 'finalized', 70.0, 38.25287022470265, 59.26, 70.0, 63.37, 3, 3.8, 0, FALSE, 1.305740449405286),
+(222, 46, 5, '2025-11-22 12:21:35', '2025-11-22 13:48:00', 'finalized', 60.0, 47.921271550458926, 40.0, 60.0, 47.24, 3, 5.0, 0, FALSE, 15.84254310091785),
+(223, 46, 5, '2025-11-08 10:15:42', '2025-11-08 10:55:37', 'finalized', 60.0, 20.09304548063252, 46.69, 60.0, 45.0, 2, 0, 0, FALSE, 0.18609096126503522),
+(224, 46, 5, '2025-11-12 20:42:05', '2025-11-12 21:00:52', 'finalized', 75.0, 42.10356627462014, 68.74, 75.0, 72.29, 2, 1.5, 2, FALSE, 18.20713254924029),
+(225, 46, 3, '2025-12-08 19:37:52', '2025-12-08 20:48:29', 'finalized', 50.0, 35.549984703305796, 30.0, 50.0, 35.42, 1, 7.299999999999999, 2, FALSE, 1.8999694066116057),
+(226, 46, 1, '2025-12-15 14:44:36', '2025-12-15 14:55:51', 'finalized', 100.0, 50.107503029903384, 96.25, 100.0, 95.32, 2, 7.1, 2, FALSE, 11.81500605980677),
+(227, 46, 4, '2025-12-19 21:24:44', '2025-12-19 22:47:24', 'finalized', 50.0, 100.0, 30.0, 50.0, 36.68, 1, 21.199999999999996, 2, FALSE, 93.14025896514683),
+(228, 46, 1, '2025-12-28 14:39:17', '2025-12-28 16:07:57', 'finalized', 100.0, 27.28098585665374, 80.0, 100.0, 85.0, 0, 8.9, 1, FALSE, 8.961971713307477),
+(229, 46, 4, '2025-12-25 03:59:51', '2025-12-25 05:12:54', 'finalized', 40.0, 51.43294547169756, 20.0, 40.0, 25.0, 3, 1.4, 3, FALSE, 7.265890943395121),
+(230, 47, 1, '2025-10-12 11:02:40', '2025-10-12 11:37:56', 'finalized', 100.0, 9.807458073661941, 88.24, 100.0, 92.74, 0, 4.3, 0, FALSE, 2.4149161473238845),
+(231, 47, 2, '2025-12-24 17:45:24', '2025-12-24 18:44:02', 'finalized', 100.0, 11.71754354912822, 80.46, 100.0, 85.0, 0, 1.4, 0, FALSE, 17.835087098256437),
+(232, 47, 5, '2025-11-16 09:47:27', '2025-11-16 11:12:54', 'finalized', 100.0, 1.7720243850214557, 80.0, 100.0, 85.0, 0, 0, 0, FALSE, 3.5440487700429113),
+(233, 47, 2, '2025-11-28 04:07:45', '2025-11-28 04:36:27', 'finalized', 50.0, 8.578699964552635, 40.43, 50.0, 40.1, 0, 2.3, 0, FALSE, 7.9573999291052715),
+(234, 48, 5, '2025-10-16 09:58:57', '2025-10-16 11:00:18', 'finalized', 100.0, 26.32373713051317, 80.0, 100.0, 85.0, 1, 2.3, 1, FALSE, 13.44747426102634),
+(235, 48, 5, '2025-12-10 23:20:37', '2025-12-10 23:49:53', 'finalized', 41.67, 10.859279802253635, 31.91, 41.67, 26.67, 0, 4.0, 0, FALSE, 5.718559604507272),
+(236, 48, 1, '2025-12-24 06:21:16', '2025-12-24 07:23:56', 'finalized', 25.0, 6.833903286647871, 5.0, 25.0, 14.7, 0, 0, 0, FALSE, 13.667806573295742),
+(237, 48, 3, '2025-10-17 05:12:10', '2025-10-17 05:25:38', 'finalized', 62.5, 5.109223036788938, 58.01, 62.5, 53.7, 0, 0, 0, FALSE, 10.218446073577876),
+(238, 48, 1, '2025-12-19 08:45:25', '2025-12-19 09:29:41', 'finalized', 37.5, 24.337884940551895, 22.74, 37.5, 22.5, 1, 4.0, 0, FALSE, 12.675769881103793),
+(239, 49, 2, '2025-12-13 16:42:47', '2025-12-13 18:10:09', 'finalized', 91.67, 25.56598620595333, 71.67, 91.67, 81.6, 2, 0, 0, FALSE, 11.13197241190666),
+(240, 49, 5, '2025-10-15 15:04:37', '2025-10-15 15:31:35', 'finalized', 40.0, 13.92880795479055, 31.01, 40.0, 27.51, 1, 1.6, 0, FALSE, 1.4576159095811003),
+(241, 49, 5, '2025-12-10 17:01:03', '2025-12-10 17:49:26', 'finalized', 75.0, 3.4940295086203568, 58.87, 75.0, 70.68, 0, 0, 0, FALSE, 6.9880590172407135),
+(242, 49, 3, '2025-12-27 18:27:48', '2025-12-27 19:01:55', 'finalized', 20.0, 39.186072991872706, 8.63, 20.0, 5.0, 0, 0, 1, TRUE, 18.37214598374541),
+(243, 50, 4, '2025-10-06 20:55:14', '2025-10-06 21:44:03', 'finalized', 50.0, 21.92512387933677, 33.73, 50.0, 35.0, 2, 0, 0, FALSE, 3.8502477586735417),
+(244, 50, 1, '2025-11-21 21:27:41', '2025-11-21 21:43:55', 'finalized', 75.0, 3.0392680917367016, 69.59, 75.0, 60.0, 0, 1.0, 0, FALSE, 2.078536183473403),
+(245, 50, 1, '2025-11-24 05:03:29', '2025-11-24 06:07:54', 'finalized', 41.67, 20.764042459196666, 21.67, 41.67, 26.87, 1, 1.3, 1, FALSE, 6.328084918393337),
+(246, 50, 5, '2025-11-09 19:36:18', '2025-11-09 19:57:27', 'finalized', 100.0, 15.8689189766257, 92.95, 100.0, 89.6, 0, 4.0, 0, FALSE, 15.737837953251399),
+(247, 50, 1, '2025-11-01 06:11:52', '2025-11-01 07:39:40', 'finalized', 83.33, 18.201342650804342, 63.33, 83.33, 72.77, 0, 4.3, 0, FALSE, 19.20268530160869),
+(248, 50, 3, '2025-10-16 23:43:13', '2025-10-17 00:28:54', 'finalized', 20.0, 12.100528906903905, 4.77, 20.0, 9.14, 1, 0, 0, FALSE, 4.201057813807811),
+(249, 50, 2, '2025-12-13 23:39:29', '2025-12-14 00:31:25', 'finalized', 100.0, 7.81265203689594, 82.69, 100.0, 85.0, 0, 1.6, 0, FALSE, 9.225304073791879);
+INSERT INTO behavior_logs (attempt_id, event_type, severity_score, timestamp) VALUES
+(1, 'face_missing', 2.2, '2025-12-12 21:06:47'),
+(2, 'face_missing', 2.4, '2025-12-17 01:41:00'),
+(2, 'tab_switch', 1.0, '2025-12-17 01:53:44'),
+(2, 'tab_switch', 1.0, '2025-12-17 02:06:10'),
+(3, 'tab_switch', 1.0, '2025-12-31 20:26:41'),
+(6, 'tab_switch', 1.0, '2025-11-23 09:03:21'),
+(6, 'face_missing', 2.1, '2025-11-23 09:18:45'),
+(7, 'tab_switch', 1.0, '2025-11-21 07:05:49'),
+(7, 'copy_paste', 1.0, '2025-11-21 07:17:08'),
+(8, 'tab_switch', 1.0, '2025-10-26 05:59:01'),
+(8, 'tab_switch', 1.0, '2025-10-26 06:06:08'),
+(8, 'face_missing', 1.5, '2025-10-26 06:09:06'),
+(9, 'tab_switch', 1.0, '2025-10-22 13:13:46'),
+(9, 'tab_switch', 1.0, '2025-10-22 13:18:16'),
+(11, 'face_missing', 2.6, '2025-11-17 21:27:52'),
+(11, 'tab_switch', 1.0, '2025-11-17 21:30:48'),
+(13, 'tab_switch', 1.0, '2025-12-05 08:05:38'),
+(13, 'face_missing', 1.0, '2025-12-05 08:29:45'),
+(13, 'face_missing', 2.1, '2025-12-05 08:38:34'),
+(13, 'tab_switch', 1.0, '2025-12-05 08:42:10'),
+(13, 'tab_switch', 1.0, '2025-12-05 08:42:45'),
+(14, 'copy_paste', 1.0, '2025-10-08 22:06:21'),
+(15, 'face_missing', 3.4, '2025-12-07 13:27:08'),
+(16, 'copy_paste', 1.0, '2025-10-15 17:12:39'),
+(16, 'face_missing', 2.8, '2025-10-15 17:36:32'),
+(17, 'face_missing', 3.4, '2025-10-26 18:08:31'),
+(19, 'tab_switch', 1.0, '2025-12-29 21:35:57'),
+(19, 'copy_paste', 1.0, '2025-12-29 21:39:40'),
+(20, 'tab_switch', 1.0, '2025-10-17 11:39:30'),
+(21, 'copy_paste', 1.0, '2025-12-08 05:30:55'),
+(21, 'copy_paste', 1.0, '2025-12-08 05:35:59'),
+(22, 'face_missing', 1.2, '2025-11-11 23:53:47'),
+(23, 'copy_paste', 1.0, '2025-11-03 20:56:13'),
+(23, 'tab_switch', 1.0, '2025-11-03 21:29:06'),
+(24, 'copy_paste', 1.0, '2025-10-28 18:43:36'),
+(26, 'copy_paste', 1.0, '2025-11-21 05:52:43'),
+(26, 'face_missing', 1.8, '2025-11-21 06:26:14'),
+(27, 'face_missing', 4.2, '2025-12-05 13:46:03'),
+(30, 'tab_switch', 1.0, '2025-10-07 21:19:14'),
+(30, 'face_missing', 5.0, '2025-10-07 21:44:21'),
+(30, 'copy_paste', 1.0, '2025-10-07 21:59:17'),
+(30, 'copy_paste', 1.0, '2025-10-07 22:09:57'),
+(31, 'tab_switch', 1.0, '2025-11-15 17:19:53'),
+(32, 'tab_switch', 1.0, '2025-10-17 15:32:02'),
+(36, 'face_missing', 4.8, '2025-10-23 13:41:01'),
+(37, 'copy_paste', 1.0, '2025-11-24 08:56:45'),
+(38, 'face_missing', 2.2, '2025-10-24 03:57:09'),
+(38, 'tab_switch', 1.0, '2025-10-24 04:09:17'),
+(38, 'copy_paste', 1.0, '2025-10-24 04:44:53'),
+(39, 'tab_switch', 1.0, '2025-12-02 21:43:05'),
+(39, 'face_missing', 1.2, '2025-12-02 22:11:12'),
+(40, 'face_missing', 4.1, '2025-11-07 04:29:17'),
+(40, 'face_missing', 4.2, '2025-11-07 04:34:17'),
+(41, 'tab_switch', 1.0, '2025-10-30 02:42:35'),
+(43, 'face_missing', 3.3, '2025-10-04 16:26:55'),
+(44, 'face_missing', 4.0, '2025-10-29 07:29:29'),
+(45, 'tab_switch', 1.0, '2025-10-20 10:10:50'),
+(45, 'face_missing', 3.8, '2025-10-20 10:16:21'),
+(46, 'copy_paste', 1.0, '2025-11-18 12:25:12'),
+(47, 'tab_switch', 1.0, '2025-10-27 02:40:42'),
+(48, 'tab_switch', 1.0, '2025-10-08 20:49:36'),
+(49, 'copy_paste', 1.0, '2025-10-30 23:35:18'),
+(49, 'copy_paste', 1.0, '2025-10-30 23:57:08'),
+(49, 'face_missing', 4.2, '2025-10-31 00:00:13'),
+(50, 'face_missing', 3.4, '2025-12-31 10:33:48'),
+(50, 'face_missing', 1.3, '2025-12-31 10:34:46'),
+(50, 'copy_paste', 1.0, '2025-12-31 10:50:26'),
+(50, 'face_missing', 4.6, '2025-12-31 10:54:03'),
+(50, 'face_missing', 1.4, '2025-12-31 11:11:19'),
+(51, 'tab_switch', 1.0, '2025-10-30 00:12:40'),
+(51, 'copy_paste', 1.0, '2025-10-30 00:17:42'),
+(51, 'copy_paste', 1.0, '2025-10-30 00:19:50'),
+(51, 'tab_switch', 1.0, '2025-10-30 00:20:03'),
+(51, 'copy_paste', 1.0, '2025-10-30 00:20:08'),
+(51, 'face_missing', 3.0, '2025-10-30 00:31:42'),
+(51, 'tab_switch', 1.0, '2025-10-30 00:31:58'),
+(51, 'tab_switch', 1.0, '2025-10-30 00:38:22'),
+(52, 'copy_paste', 1.0, '2025-12-02 11:06:00'),
+(52, 'face_missing', 3.5, '2025-12-02 11:23:11'),
+(52, 'tab_switch', 1.0, '2025-12-02 11:29:50'),
+(52, 'face_missing', 3.8, '2025-12-02 11:32:56'),
+(52, 'tab_switch', 1.0, '2025-12-02 11:50:20'),
+(52, 'copy_paste', 1.0, '2025-12-02 11:53:31'),
+(53, 'face_missing', 2.1, '2025-12-10 11:43:51'),
+(53, 'tab_switch', 1.0, '2025-12-10 11:56:41'),
+(53, 'tab_switch', 1.0, '2025-12-10 12:09:52'),
+(53, 'face_missing', 4.2, '2025-12-10 12:12:00'),
+(53, 'face_missing', 2.4, '2025-12-10 12:18:20'),
+(53, 'tab_switch', 1.0, '2025-12-10 12:24:36'),
+(54, 'copy_paste', 1.0, '2025-11-24 18:18:03'),
+(54, 'face_missing', 3.0, '2025-11-24 18:19:32'),
+(54, 'tab_switch', 1.0, '2025-11-24 18:19:59'),
+(54, 'face_missing', 2.3, '2025-11-24 18:23:52'),
+(54, 'face_missing', 4.3, '2025-11-24 18:27:24'),
+(54, 'tab_switch', 1.0, '2025-11-24 18:38:44'),
+(54, 'tab_switch', 1.0, '2025-11-24 18:45:03'),
+(54, 'copy_paste', 1.0, '2025-11-24 18:48:12'),
+(54, 'face_missing', 1.5, '2025-11-24 18:57:18'),
+(54, 'tab_switch', 1.0, '2025-11-24 19:09:57'),
+(56, 'tab_switch', 1.0, '2025-12-03 06:49:25'),
+(56, 'face_missing', 1.4, '2025-12-03 06:54:03'),
+(57, 'copy_paste', 1.0, '2025-11-12 00:41:52'),
+(58, 'tab_switch', 1.0, '2025-11-16 15:12:14'),
+(58, 'face_missing', 2.8, '2025-11-16 15:16:11'),
+(58, 'copy_paste', 1.0, '2025-11-16 15:21:33'),
+(59, 'tab_switch', 1.0, '2025-11-06 21:20:09'),
+(60, 'face_missing', 3.9, '2025-10-30 19:02:10'),
+(60, 'tab_switch', 1.0, '2025-10-30 19:05:48'),
+(61, 'copy_paste', 1.0, '2025-11-28 06:39:18'),
+(62, 'tab_switch', 1.0, '2025-12-30 18:09:01'),
+(64, 'copy_paste', 1.0, '2025-11-17 18:40:43'),
+(64, 'face_missing', 3.5, '2025-11-17 18:41:11'),
+(64, 'tab_switch', 1.0, '2025-11-17 18:45:02'),
+(65, 'copy_paste', 1.0, '2025-10-14 06:49:07'),
+(65, 'tab_switch', 1.0, '2025-10-14 06:50:18'),
+(66, 'face_missing', 3.7, '2025-10-06 04:51:14'),
+(66, 'face_missing', 4.6, '2025-10-06 04:58:05'),
+(67, 'copy_paste', 1.0, '2025-12-04 07:45:04'),
+(67, 'copy_paste', 1.0, '2025-12-04 08:32:27'),
+(70, 'copy_paste', 1.0, '2025-11-07 04:47:54'),
+(72, 'face_missing', 4.3, '2025-10-12 15:19:45'),
+(72, 'tab_switch', 1.0, '2025-10-12 15:21:33'),
+(74, 'face_missing', 4.5, '2025-12-07 01:16:23'),
+(74, 'copy_paste', 1.0, '2025-12-07 01:26:38'),
+(76, 'face_missing', 2.4, '2025-12-22 12:47:26'),
+(78, 'tab_switch', 1.0, '2025-10-18 07:45:22'),
+(79, 'face_missing', 1.8, '2025-12-06 18:46:18'),
+(79, 'copy_paste', 1.0, '2025-12-06 18:51:38'),
+(82, 'face_missing', 3.4, '2025-12-02 00:55:56'),
+(83, 'tab_switch', 1.0, '2025-11-23 12:44:04'),
+(84, 'copy_paste', 1.0, '2025-12-02 23:34:12'),
+(84, 'face_missing', 3.6, '2025-12-02 23:57:43'),
+(84, 'tab_switch', 1.0, '2025-12-03 00:14:53'),
+(86, 'tab_switch', 1.0, '2025-10-07 00:07:51'),
+(86, 'copy_paste', 1.0, '2025-10-07 00:30:44'),
+(87, 'tab_switch', 1.0, '2025-10-06 19:23:17'),
+(87, 'copy_paste', 1.0, '2025-10-06 19:35:32'),
+(89, 'face_missing', 3.7, '2025-11-08 14:18:17'),
+(89, 'tab_switch', 1.0, '2025-11-08 14:30:22'),
+(90, 'tab_switch', 1.0, '2025-11-19 05:15:41'),
+(90, 'face_missing', 4.1, '2025-11-19 05:34:06'),
+(92, 'copy_paste', 1.0, '2025-11-02 01:25:37'),
+(92, 'copy_paste', 1.0, '2025-11-02 01:40:52'),
+(92, 'face_missing', 2.1, '2025-11-02 01:58:52'),
+(92, 'face_missing', 3.0, '2025-11-02 02:03:53'),
+(93, 'tab_switch', 1.0, '2025-10-15 03:06:14'),
+(94, 'copy_paste', 1.0, '2025-10-25 21:29:33'),
+(94, 'tab_switch', 1.0, '2025-10-25 21:30:54'),
+(94, 'face_missing', 1.6, '2025-10-25 22:12:18'),
+(94, 'face_missing', 2.1, '2025-10-25 22:20:47'),
+(94, 'face_missing', 2.9, '2025-10-25 22:20:53'),
+(95, 'face_missing', 3.3, '2025-11-13 02:20:12'),
+(95, 'tab_switch', 1.0, '2025-11-13 02:23:26'),
+(95, 'face_missing', 1.1, '2025-11-13 02:32:53'),
+(95, 'face_missing', 4.6, '2025-11-13 02:33:35'),
+(96, 'tab_switch', 1.0, '2025-11-23 01:54:22'),
+(96, 'face_missing', 2.0, '2025-11-23 02:02:35'),
+(96, 'face_missing', 4.1, '2025-11-23 02:33:49'),
+(96, 'face_missing', 4.2, '2025-11-23 02:35:30'),
+(96, 'tab_switch', 1.0, '2025-11-23 02:52:37'),
+(97, 'tab_switch', 1.0, '2025-12-09 13:24:56'),
+(98, 'tab_switch', 1.0, '2025-12-15 03:21:56'),
+(98, 'face_missing', 4.8, '2025-12-15 03:29:16'),
+(98, 'tab_switch', 1.0, '2025-12-15 03:30:15'),
+(98, 'face_missing', 4.9, '2025-12-15 03:34:38'),
+(98, 'copy_paste', 1.0, '2025-12-15 03:44:54'),
+(98, 'tab_switch', 1.0, '2025-12-15 03:44:59'),
+(99, 'copy_paste', 1.0, '2025-10-20 12:37:27'),
+(99, 'tab_switch', 1.0, '2025-10-20 13:09:59'),
+(99, 'face_missing', 3.8, '2025-10-20 13:17:37'),
+(99, 'face_missing', 2.8, '2025-10-20 13:17:46'),
+(100, 'face_missing', 4.8, '2025-11-30 23:47:02'),
+(100, 'copy_paste', 1.0, '2025-12-01 00:15:08'),
+(100, 'face_missing', 3.4, '2025-12-01 00:31:11'),
+(101, 'copy_paste', 1.0, '2025-10-14 00:22:44'),
+(101, 'face_missing', 1.8, '2025-10-14 00:23:33'),
+(101, 'tab_switch', 1.0, '2025-10-14 00:25:41'),
+(101, 'tab_switch', 1.0, '2025-10-14 00:25:43'),
+(101, 'copy_paste', 1.0, '2025-10-14 00:26:42'),
+(101, 'copy_paste', 1.0, '2025-10-14 00:27:10'),
+(101, 'face_missing', 3.8, '2025-10-14 00:29:37'),
+(103, 'copy_paste', 1.0, '2025-10-11 08:59:11'),
+(103, 'face_missing', 2.6, '2025-10-11 09:00:46'),
+(104, 'face_missing', 4.6, '2025-12-17 18:16:12'),
+(104, 'copy_paste', 1.0, '2025-12-17 18:50:10'),
+(105, 'copy_paste', 1.0, '2025-10-22 01:31:11'),
+(105, 'copy_paste', 1.0, '2025-10-22 02:01:07'),
+(105, 'face_missing', 1.6, '2025-10-22 02:11:04'),
+(105, 'copy_paste', 1.0, '2025-10-22 02:43:43'),
+(105, 'face_missing', 1.7, '2025-10-22 02:44:15'),
+(106, 'tab_switch', 1.0, '2025-11-01 08:03:59'),
+(106, 'tab_switch', 1.0, '2025-11-01 08:17:23'),
+(106, 'face_missing', 1.6, '2025-11-01 08:39:24'),
+(106, 'face_missing', 3.9, '2025-11-01 08:42:58'),
+(106, 'copy_paste', 1.0, '2025-11-01 08:46:24'),
+(106, 'tab_switch', 1.0, '2025-11-01 08:55:50'),
+(107, 'face_missing', 1.8, '2025-10-16 16:21:33'),
+(107, 'face_missing', 2.3, '2025-10-16 16:26:47'),
+(107, 'tab_switch', 1.0, '2025-10-16 16:30:23'),
+(107, 'copy_paste', 1.0, '2025-10-16 16:33:08'),
+(108, 'tab_switch', 1.0, '2025-10-07 21:46:36'),
+(108, 'tab_switch', 1.0, '2025-10-07 21:53:23'),
+(108, 'tab_switch', 1.0, '2025-10-07 22:15:28'),
+(109, 'face_missing', 1.5, '2025-11-07 04:57:41'),
+(109, 'face_missing', 5.0, '2025-11-07 05:00:42'),
+(109, 'copy_paste', 1.0, '2025-11-07 05:04:10'),
+(109, 'copy_paste', 1.0, '2025-11-07 05:34:24'),
+(110, 'copy_paste', 1.0, '2025-10-17 11:05:40'),
+(110, 'tab_switch', 1.0, '2025-10-17 11:46:53'),
+(110, 'face_missing', 2.2, '2025-10-17 11:49:19'),
+(110, 'copy_paste', 1.0, '2025-10-17 11:53:41'),
+(110, 'face_missing', 3.0, '2025-10-17 12:12:59'),
+(111, 'copy_paste', 1.0, '2025-12-26 16:08:36'),
+(111, 'tab_switch', 1.0, '2025-12-26 16:10:48'),
+(111, 'tab_switch', 1.0, '2025-12-26 16:11:11'),
+(111, 'tab_switch', 1.0, '2025-12-26 16:12:25'),
+(111, 'tab_switch', 1.0, '2025-12-26 16:14:46'),
+(111, 'tab_switch', 1.0, '2025-12-26 16:16:28'),
+(112, 'tab_switch', 1.0, '2025-12-24 08:54:39'),
+(112, 'face_missing', 2.9, '2025-12-24 08:55:54'),
+(112, 'face_missing', 1.9, '2025-12-24 08:56:46'),
+(112, 'face_missing', 2.1, '2025-12-24 08:56:47'),
+(112, 'tab_switch', 1.0, '2025-12-24 08:57:32'),
+(112, 'tab_switch', 1.0, '2025-12-24 08:59:32'),
+(112, 'tab_switch', 1.0, '2025-12-24 09:00:47'),
+(112, 'copy_paste', 1.0, '2025-12-24 09:01:15'),
+(112, 'face_missing', 4.1, '2025-12-24 09:03:43'),
+(112, 'face_missing', 1.8, '2025-12-24 09:03:43'),
+(113, 'tab_switch', 1.0, '2025-11-08 20:50:28'),
+(113, 'face_missing', 2.1, '2025-11-08 20:52:32'),
+(113, 'face_missing', 4.3, '2025-11-08 21:03:35'),
+(113, 'tab_switch', 1.0, '2025-11-08 21:08:43'),
+(113, 'copy_paste', 1.0, '2025-11-08 21:21:20'),
+(113, 'copy_paste', 1.0, '2025-11-08 21:30:48'),
+(113, 'face_missing', 4.7, '2025-11-08 21:32:36'),
+(113, 'tab_switch', 1.0, '2025-11-08 21:33:50'),
+(114, 'copy_paste', 1.0, '2025-10-18 08:45:50'),
+(115, 'tab_switch', 1.0, '2025-10-20 00:52:54'),
+(116, 'face_missing', 5.0, '2025-11-01 00:32:25'),
+(118, 'tab_switch', 1.0, '2025-11-03 20:09:51'),
+(118, 'copy_paste', 1.0, '2025-11-03 20:14:00'),
+(119, 'tab_switch', 1.0, '2025-11-06 21:59:55'),
+(120, 'tab_switch', 1.0, '2025-12-30 22:53:25'),
+(122, 'tab_switch', 1.0, '2025-11-14 21:51:12'),
+(124, 'tab_switch', 1.0, '2025-11-11 16:56:30'),
+(124, 'face_missing', 4.5, '2025-11-11 16:56:37'),
+(124, 'tab_switch', 1.0, '2025-11-11 16:58:04'),
+(125, 'tab_switch', 1.0, '2025-11-10 03:54:02'),
+(125, 'face_missing', 3.1, '2025-11-10 04:24:55'),
+(125, 'face_missing', 3.9, '2025-11-10 04:51:28'),
+(127, 'copy_paste', 1.0, '2025-10-24 02:21:52'),
+(130, 'face_missing', 1.5, '2025-12-20 05:52:14'),
+(131, 'face_missing', 4.5, '2025-11-24 00:13:41'),
+(131, 'copy_paste', 1.0, '2025-11-24 00:30:11'),
+(132, 'tab_switch', 1.0, '2025-12-13 23:53:54'),
+(132, 'tab_switch', 1.0, '2025-12-13 23:59:16'),
+(132, 'copy_paste', 1.0, '2025-12-14 00:03:56'),
+(135, 'tab_switch', 1.0, '2025-11-19 15:19:47'),
+(135, 'face_missing', 4.7, '2025-11-19 15:47:14'),
+(135, 'copy_paste', 1.0, '2025-11-19 16:07:30'),
+(135, 'copy_paste', 1.0, '2025-11-19 16:08:02'),
+(136, 'tab_switch', 1.0, '2025-10-16 08:57:13'),
+(137, 'tab_switch', 1.0, '2025-10-04 03:39:19'),
+(137, 'copy_paste', 1.0, '2025-10-04 03:43:45'),
+(138, 'copy_paste', 1.0, '2025-10-21 16:09:28'),
+(140, 'copy_paste', 1.0, '2025-10-12 06:17:02'),
+(140, 'face_missing', 2.1, '2025-10-12 06:22:42'),
+(140, 'face_missing', 3.7, '2025-10-12 06:50:49'),
+(142, 'tab_switch', 1.0, '2025-12-12 07:27:04'),
+(142, 'copy_paste', 1.0, '2025-12-12 07:38:31'),
+(144, 'tab_switch', 1.0, '2025-10-29 00:50:26'),
+(146, 'face_missing', 1.7, '2025-10-31 08:21:34'),
+(146, 'face_missing', 1.7, '2025-10-31 08:29:12'),
+(146, 'tab_switch', 1.0, '2025-10-31 08:41:24'),
+(147, 'tab_switch', 1.0, '2025-10-26 22:54:16'),
+(147, 'copy_paste', 1.0, '2025-10-26 23:27:39'),
+(148, 'face_missing', 1.7, '2025-10-16 05:38:45'),
+(148, 'copy_paste', 1.0, '2025-10-16 05:54:46'),
+(150, 'tab_switch', 1.0, '2025-12-19 10:54:01'),
+(150, 'face_missing', 3.6, '2025-12-19 11:13:24'),
+(150, 'tab_switch', 1.0, '2025-12-19 11:18:36'),
+(150, 'copy_paste', 1.0, '2025-12-19 11:25:20'),
+(151, 'face_missing', 3.6, '2025-11-06 21:51:53'),
+(151, 'tab_switch', 1.0, '2025-11-06 22:19:44'),
+(152, 'face_missing', 2.5, '2025-10-24 14:21:13'),
+(152, 'copy_paste', 1.0, '2025-10-24 14:26:19'),
+(153, 'face_missing', 2.4, '2025-12-31 09:03:31'),
+(153, 'tab_switch', 1.0, '2025-12-31 09:07:43'),
+(153, 'tab_switch', 1.0, '2025-12-31 09:09:38'),
+(157, 'face_missing', 4.7, '2025-11-06 04:51:20'),
+(160, 'tab_switch', 1.0, '2025-10-11 00:42:38'),
+(161, 'tab_switch', 1.0, '2025-11-27 14:32:38'),
+(161, 'copy_paste', 1.0, '2025-11-27 14:39:39'),
+(161, 'tab_switch', 1.0, '2025-11-27 14:46:16'),
+(162, 'copy_paste', 1.0, '2025-10-14 09:35:48'),
+(162, 'face_missing', 2.7, '2025-10-14 09:41:15'),
+(162, 'tab_switch', 1.0, '2025-10-14 09:55:41'),
+(163, 'copy_paste', 1.0, '2025-10-31 10:02:20'),
+(163, 'face_missing', 4.7, '2025-10-31 10:12:12'),
+(163, 'face_missing', 1.4, '2025-10-31 10:21:22'),
+(164, 'copy_paste', 1.0, '2025-12-03 10:03:42'),
+(165, 'face_missing', 4.9, '2025-11-03 19:07:16'),
+(165, 'face_missing', 3.0, '2025-11-03 19:22:25'),
+(165, 'tab_switch', 1.0, '2025-11-03 19:27:15'),
+(165, 'tab_switch', 1.0, '2025-11-03 19:40:56'),
+(165, 'copy_paste', 1.0, '2025-11-03 19:57:15'),
+(166, 'multiple_faces', 1.0, '2025-12-18 03:35:56'),
+(166, 'face_missing', 1.0, '2025-12-18 03:41:07'),
+(168, 'face_missing', 3.8, '2025-10-10 13:40:43'),
+(168, 'copy_paste', 1.0, '2025-10-10 13:41:07'),
+(169, 'tab_switch', 1.0, '2025-11-01 01:23:27'),
+(169, 'face_missing', 1.3, '2025-11-01 01:38:08'),
+(170, 'tab_switch', 1.0, '2025-12-31 07:36:26'),
+(170, 'face_missing', 1.5, '2025-12-31 08:20:21'),
+(171, 'tab_switch', 1.0, '2025-11-30 06:48:21'),
+(172, 'copy_paste', 1.0, '2025-11-20 12:08:58'),
+(172, 'face_missing', 3.7, '2025-11-20 13:11:00'),
+(172, 'face_missing', 2.7, '2025-11-20 13:21:17'),
+(172, 'face_missing', 4.4, '2025-11-20 13:24:18'),
+(173, 'tab_switch', 1.0, '2025-10-23 22:47:55'),
+(173, 'face_missing', 2.7, '2025-10-23 22:49:53'),
+(175, 'face_missing', 3.7, '2025-10-26 17:51:57'),
+(176, 'copy_paste', 1.0, '2025-11-05 16:09:00'),
+(176, 'tab_switch', 1.0, '2025-11-05 16:15:40'),
+(178, 'tab_switch', 1.0, '2025-11-21 09:39:15'),
+(180, 'face_missing', 1.0, '2025-12-20 02:41:59'),
+(180, 'face_missing', 1.3, '2025-12-20 03:16:57'),
+(180, 'tab_switch', 1.0, '2025-12-20 03:18:06'),
+(181, 'tab_switch', 1.0, '2025-11-19 21:37:02'),
+(181, 'copy_paste', 1.0, '2025-11-19 21:48:15'),
+(181, 'face_missing', 3.2, '2025-11-19 21:58:31'),
+(182, 'face_missing', 2.8, '2025-10-08 19:36:49'),
+(182, 'face_missing', 3.8, '2025-10-08 19:46:38'),
+(183, 'tab_switch', 1.0, '2025-10-31 07:55:11'),
+(183, 'tab_switch', 1.0, '2025-10-31 07:57:48'),
+(183, 'tab_switch', 1.0, '2025-10-31 08:10:09'),
+(184, 'copy_paste', 1.0, '2025-11-11 11:19:37'),
+(184, 'tab_switch', 1.0, '2025-11-11 11:23:36'),
+(184, 'face_missing', 4.2, '2025-11-11 11:24:57'),
+(184, 'copy_paste', 1.0, '2025-11-11 11:25:45'),
+(184, 'tab_switch', 1.0, '2025-11-11 11:30:22'),
+(185, 'tab_switch', 1.0, '2025-10-06 00:32:32'),
+(185, 'face_missing', 1.2, '2025-10-06 01:18:53'),
+(185, 'tab_switch', 1.0, '2025-10-06 01:20:27'),
+(185, 'copy_paste', 1.0, '2025-10-06 01:21:48'),
+(186, 'copy_paste', 1.0, '2025-10-10 06:44:19'),
+(186, 'copy_paste', 1.0, '2025-10-10 06:47:54'),
+(186, 'tab_switch', 1.0, '2025-10-10 06:50:52'),
+(187, 'tab_switch', 1.0, '2025-11-06 08:54:59'),
+(187, 'copy_paste', 1.0, '2025-11-06 09:04:59'),
+(188, 'tab_switch', 1.0, '2025-10-27 05:39:32'),
+(188, 'tab_switch', 1.0, '2025-10-27 05:47:42'),
+(189, 'face_missing', 3.1, '2025-10-05 20:20:44'),
+(189, 'face_missing', 4.1, '2025-10-05 20:31:53'),
+(189, 'face_missing', 3.6, '2025-10-05 20:35:06'),
+(189, 'tab_switch', 1.0, '2025-10-05 20:41:19'),
+(190, 'tab_switch', 1.0, '2025-11-06 21:19:01'),
+(192, 'copy_paste', 1.0, '2025-12-26 07:41:27'),
+(193, 'copy_paste', 1.0, '2025-11-01 07:34:10'),
+(193, 'tab_switch', 1.0, '2025-11-01 07:43:04'),
+(193, 'tab_switch', 1.0, '2025-11-01 07:53:27'),
+(193, 'face_missing', 4.9, '2025-11-01 07:57:09'),
+(195, 'tab_switch', 1.0, '2025-10-24 10:54:00'),
+(195, 'copy_paste', 1.0, '2025-10-24 10:55:29'),
+(196, 'face_missing', 1.2, '2025-10-23 09:05:53'),
+(197, 'copy_paste', 1.0, '2025-11-18 14:00:57'),
+(198, 'tab_switch', 1.0, '2025-10-12 01:08:13'),
+(198, 'face_missing', 1.4, '2025-10-12 01:10:59'),
+(198, 'copy_paste', 1.0, '2025-10-12 01:34:47'),
+(198, 'tab_switch', 1.0, '2025-10-12 01:38:25'),
+(198, 'tab_switch', 1.0, '2025-10-12 01:41:35'),
+(201, 'face_missing', 2.8, '2025-12-28 21:30:54'),
+(201, 'tab_switch', 1.0, '2025-12-28 21:38:15'),
+(202, 'face_missing', 3.2, '2025-12-06 19:32:03'),
+(202, 'tab_switch', 1.0, '2025-12-06 19:32:58'),
+(202, 'copy_paste', 1.0, '2025-12-06 19:35:03'),
+(203, 'copy_paste', 1.0, '2025-11-27 11:13:01'),
+(203, 'tab_switch', 1.0, '2025-11-27 11:18:45'),
+(203, 'face_missing', 4.8, '2025-11-27 11:25:09'),
+(203, 'copy_paste', 1.0, '2025-11-27 12:00:08'),
+(205, 'copy_paste', 1.0, '2025-10-13 22:18:28'),
+(208, 'face_missing', 2.3, '2025-12-26 09:09:28'),
+(212, 'copy_paste', 1.0, '2025-12-08 21:15:35'),
+(213, 'face_missing', 3.4, '2025-12-08 05:41:02'),
+(213, 'tab_switch', 1.0, '2025-12-08 05:43:33'),
+(215, 'face_missing', 2.3, '2025-12-06 07:42:52'),
+(215, 'tab_switch', 1.0, '2025-12-06 07:44:22'),
+(216, 'tab_switch', 1.0, '2025-12-20 04:50:43'),
+(216, 'face_missing', 2.7, '2025-12-20 05:40:15'),
+(216, 'face_missing', 3.9, '2025-12-20 06:06:51'),
+(217, 'face_missing', 1.4, '2025-12-18 05:14:01'),
+(217, 'face_missing', 4.0, '2025-12-18 05:21:32'),
+(217, 'face_missing', 4.8, '2025-12-18 05:42:22'),
+(218, 'face_missing', 4.8, '2025-10-31 13:21:02'),
+(219, 'face_missing', 4.4, '2025-10-08 06:04:33'),
+(219, 'face_missing', 4.1, '2025-10-08 06:15:02'),
+(219, 'tab_switch', 1.0, '2025-10-08 06:17:50'),
+(220, 'tab_switch', 1.0, '2025-11-27 23:04:25'),
+(220, 'tab_switch', 1.0, '2025-11-27 23:11:14'),
+(221, 'tab_switch', 1.0, '2025-11-23 19:48:21'),
+(221, 'tab_switch', 1.0, '2025-11-23 19:48:49'),
+(221, 'face_missing', 3.8, '2025-11-23 19:59:58'),
+(221, 'tab_switch', 1.0, '2025-11-23 20:11:18'),
+(222, 'face_missing', 3.9, '2025-11-22 12:39:29'),
+(222, 'tab_switch', 1.0, '2025-11-22 12:47:18'),
+(222, 'face_missing', 1.1, '2025-11-22 12:52:12'),
+(222, 'tab_switch', 1.0, '2025-11-22 13:10:37'),
+(222, 'tab_switch', 1.0, '2025-11-22 13:28:30'),
+(223, 'tab_switch', 1.0, '2025-11-08 10:17:02'),
+(223, 'tab_switch', 1.0, '2025-11-08 10:23:04'),
+(224, 'tab_switch', 1.0, '2025-11-12 20:45:39'),
+(224, 'face_missing', 1.5, '2025-11-12 20:45:42'),
+(224, 'copy_paste', 1.0, '2025-11-12 20:48:58'),
+(224, 'tab_switch', 1.0, '2025-11-12 20:59:32'),
+(224, 'copy_paste', 1.0, '2025-11-12 20:59:56'),
+(225, 'copy_paste', 1.0, '2025-12-08 19:44:42'),
+(225, 'tab_switch', 1.0, '2025-12-08 19:50:01'),
+(225, 'copy_paste', 1.0, '2025-12-08 19:51:29'),
+(225, 'face_missing', 1.3, '2025-12-08 19:51:41'),
+(225, 'face_missing', 4.6, '2025-12-08 20:09:25'),
+(225, 'face_missing', 1.4, '2025-12-08 20:47:43'),
+(226, 'copy_paste', 1.0, '2025-12-15 14:46:31'),
+(226, 'face_missing', 2.4, '2025-12-15 14:46:32'),
+(226, 'copy_paste', 1.0, '2025-12-15 14:47:26'),
+(226, 'tab_switch', 1.0, '2025-12-15 14:50:42'),
+(226, 'face_missing', 2.1, '2025-12-15 14:51:10'),
+(226, 'tab_switch', 1.0, '2025-12-15 14:52:04'),
+(226, 'face_missing', 2.6, '2025-12-15 14:52:23'),
+(227, 'face_missing', 3.6, '2025-12-19 21:26:25'),
+(227, 'copy_paste', 1.0, '2025-12-19 21:37:44'),
+(227, 'face_missing', 3.9, '2025-12-19 21:55:18'),
+(227, 'face_missing', 1.2, '2025-12-19 22:00:27'),
+(227, 'tab_switch', 1.0, '2025-12-19 22:13:41'),
+(227, 'face_missing', 4.6, '2025-12-19 22:24:54'),
+(227, 'copy_paste', 1.0, '2025-12-19 22:36:09'),
+(227, 'face_missing', 3.8, '2025-12-19 22:36:23'),
+(227, 'face_missing', 4.1, '2025-12-19 22:43:27'),
+(228, 'face_missing', 4.9, '2025-12-28 14:46:09'),
+(228, 'face_missing', 2.3, '2025-12-28 15:24:27'),
+(228, 'copy_paste', 1.0, '2025-12-28 15:30:58'),
+(228, 'face_missing', 1.7, '2025-12-28 15:46:24'),
+(229, 'tab_switch', 1.0, '2025-12-25 04:04:44'),
+(229, 'copy_paste', 1.0, '2025-12-25 04:07:15'),
+(229, 'face_missing', 1.4, '2025-12-25 04:41:26'),
+(229, 'copy_paste', 1.0, '2025-12-25 04:46:23'),
+(229, 'copy_paste', 1.0, '2025-12-25 04:49:27'),
+(229, 'tab_switch', 1.0, '2025-12-25 04:54:55'),
+(229, 'tab_switch', 1.0, '2025-12-25 04:56:08'),
+(230, 'face_missing', 3.1, '2025-10-12 11:09:55'),
+(230, 'face_missing', 1.2, '2025-10-12 11:13:52'),
+(231, 'face_missing', 1.4, '2025-12-24 18:13:41'),
+(233, 'face_missing', 2.3, '2025-11-28 04:20:52'),
+(234, 'copy_paste', 1.0, '2025-10-16 10:12:39'),
+(234, 'tab_switch', 1.0, '2025-10-16 10:19:21'),
+(234, 'face_missing', 2.3, '2025-10-16 10:49:15'),
+(235, 'face_missing', 4.0, '2025-12-10 23:39:48'),
+(238, 'face_missing', 4.0, '2025-12-19 08:59:16'),
+(238, 'tab_switch', 1.0, '2025-12-19 09:06:45'),
+(239, 'tab_switch', 1.0, '2025-12-13 16:52:57'),
+(239, 'tab_switch', 1.0, '2025-12-13 17:07:00'),
+(240, 'face_missing', 1.6, '2025-10-15 15:15:37'),
+(240, 'tab_switch', 1.0, '2025-10-15 15:20:32'),
+(242, 'multiple_faces', 1.0, '2025-12-27 18:28:24'),
+(242, 'copy_paste', 1.0, '2025-12-27 19:00:13'),
+(243, 'tab_switch', 1.0, '2025-10-06 21:14:32'),
+(243, 'tab_switch', 1.0, '2025-10-06 21:32:06'),
+(244, 'face_missing', 1.0, '2025-11-21 21:28:48'),
+(245, 'face_missing', 1.3, '2025-11-24 05:15:38'),
+(245, 'tab_switch', 1.0, '2025-11-24 05:34:49'),
+(245, 'copy_paste', 1.0, '2025-11-24 05:42:44'),
+(246, 'face_missing', 4.0, '2025-11-09 19:37:51'),
+(247, 'face_missing', 4.3, '2025-11-01 06:16:04'),
+(248, 'tab_switch', 1.0, '2025-10-17 00:21:06'),
+(249, 'face_missing', 1.6, '2025-12-13 23:54:33');
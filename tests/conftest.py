@@ -0,0 +1,87 @@
+"""
+Shared fixtures. The backend is imported against a throwaway SQLite database
+with cheap bcrypt rounds; every test starts from empty tables and empty
+in-memory services.
+"""
+import os
+import sys
+import tempfile
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "backend"))
+
+# Must be set before app.core.config is imported
+_DB_DIR = tempfile.mkdtemp(prefix="trustscore-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_DB_DIR, 'trustscore.db')}"
+os.environ["ASYNC_DATABASE_URL"] = ""
+os.environ["BCRYPT_ROUNDS"] = "4"
+os.environ["PASSWORD_HASH_WORKERS"] = "1"
+os.environ["SIMILARITY_WORKERS"] = "1"
+os.environ["SIMILARITY_INDEX_PATH"] = ""
+os.environ["EVENT_FLUSH_INTERVAL_SECONDS"] = "0.05"
+
+import pytest
+
+from tests.helpers import wait_for_event_flush, wait_for_idle_finalization
+
+
+@pytest.fixture(scope="session")
+def app_client():
+    from fastapi.testclient import TestClient
+
+    from app.database.base import Base
+    from app.database.db import engine
+    from app.main import app
+
+    Base.metadata.create_all(bind=engine)
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture
+def client(app_client):
+    """The app client, over empty tables and empty in-memory state."""
+    from app.core.auth_cache import auth_cache
+    from app.database.base import Base
+    from app.database.db import engine
+    from app.services.finalization_service import attempt_finalization_service
+    from app.services.live_risk_service import live_risk_service
+    from ai_engine.code_similarity import FingerprintIndex
+    from app.services.proctoring_feed import proctoring_feed
+
+    # Let the previous test's background work land before its rows are deleted
+    wait_for_event_flush()
+    wait_for_idle_finalization()
+    with engine.begin() as connection:
+        for table in reversed(Base.metadata.sorted_tables):
+            connection.execute(table.delete())
+    auth_cache.clear()
+    # Ids are reused once the tables are emptied: forget every tracked attempt
+    live_risk_service._accumulators.clear()
+    proctoring_feed._last_state.clear()
+    attempt_finalization_service.pipeline.similarity_index = FingerprintIndex(analyzer=attempt_finalization_service.analyzer)
+    yield app_client
+
+
+@pytest.fixture
+def db():
+    from app.database.db import SessionLocal
+
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def restore_risk_weights():
+    """Put back the active risk weights and the config refresher after the test."""
+    import app.core.config as config
+    from ai_engine.risk_weights import get_risk_weights, set_risk_weights, set_risk_weights_refresher
+
+    weights = get_risk_weights()
+    yield
+    set_risk_weights(weights)
+    set_risk_weights_refresher(config.refresh_risk_weights)
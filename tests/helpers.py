@@ -0,0 +1,70 @@
+"""Helpers that drive the app through its API, shared by the test modules."""
+import time
+
+PASSWORD = "test-password"
+# Seconds to wait for background work (finalization, event flushes)
+BACKGROUND_TIMEOUT = 30.0
+
+
+def create_user(client, email: str, role: str = "student") -> dict:
+    """Register a user with the given role and return its auth headers and id."""
+    from app.database.db import SessionLocal
+    from app.models.user import User
+
+    response = client.post("/api/auth/register", json={"name": email.split("@")[0], "email": email, "password": PASSWORD})
+    assert response.status_code == 201, response.text
+    user_id = response.json()["id"]
+    if role != "student":
+        with SessionLocal() as session:
+            session.get(User, user_id).role = role
+            session.commit()
+    token = client.post("/api/auth/login", json={"email": email, "password": PASSWORD}).json()["access_token"]
+    return {"id": user_id, "headers": {"Authorization": f"Bearer {token}"}}
+
+
+def create_assessment(title: str = "Two Sum") -> int:
+    from app.database.db import SessionLocal
+    from app.models.assessment import Assessment
+
+    with SessionLocal() as session:
+        assessment = Assessment(title=title, difficulty="easy")
+        session.add(assessment)
+        session.commit()
+        return assessment.id
+
+
+def start_attempt(client, user: dict, assessment_id: int) -> int:
+    response = client.post("/api/attempts/", json={"assessment_id": assessment_id}, headers=user["headers"])
+    assert response.status_code == 201, response.text
+    return response.json()["id"]
+
+
+def submission(code: str = "def solve(xs):\n    return sorted(xs)\n") -> dict:
+    return {"code": code, "test_cases_passed": 8, "total_test_cases": 10, "final_score": 80.0}
+
+
+def wait_for_finalizations(count: int, completed_before: int) -> None:
+    from app.services.finalization_service import attempt_finalization_service
+
+    deadline = time.monotonic() + BACKGROUND_TIMEOUT
+    while attempt_finalization_service.get_stats()["completed"] - completed_before < count:
+        assert time.monotonic() < deadline, "attempts were not finalized in time"
+        time.sleep(0.01)
+
+
+def wait_for_idle_finalization() -> None:
+    from app.services.finalization_service import attempt_finalization_service
+
+    deadline = time.monotonic() + BACKGROUND_TIMEOUT
+    while attempt_finalization_service.get_stats()["pending"]:
+        assert time.monotonic() < deadline, "attempts were not finalized in time"
+        time.sleep(0.01)
+
+
+def wait_for_event_flush() -> None:
+    from app.services.event_ingestion import behavior_event_queue
+
+    deadline = time.monotonic() + BACKGROUND_TIMEOUT
+    while behavior_event_queue.written_events + behavior_event_queue.failed_events < behavior_event_queue.enqueued_events:
+        assert time.monotonic() < deadline, "behavior events were not flushed in time"
+        time.sleep(0.01)
@@ -0,0 +1,109 @@
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from app.models.attempt import ATTEMPT_FINALIZED, ATTEMPT_IN_PROGRESS, Attempt
+from app.models.cohort_stats import AssessmentDailyStats
+from app.models.skill_analytics import SkillAnalytics
+from app.models.trust_ledger import TrustLedgerEntry
+from app.services.finalization_service import attempt_finalization_service
+from app.services.similarity_jobs import similarity_job_service
+
+from tests.helpers import create_assessment, create_user, start_attempt, submission, wait_for_event_flush, wait_for_finalizations
+
+
+def test_submit_finalizes_attempt_once(client, db):
+    student = create_user(client, "student@example.com")
+    attempt_id = start_attempt(client, student, create_assessment())
+    events = [{"event_type": "tab_switch"}] * 3
+    assert client.post(f"/api/attempts/{attempt_id}/events", json=events, headers=student["headers"]).status_code == 202
+    wait_for_event_flush()
+
+    completed = attempt_finalization_service.get_stats()["completed"]
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        responses = list(pool.map(
+            lambda _: client.post(f"/api/attempts/{attempt_id}/submit", json=submission(), headers=student["headers"]),
+            range(2)
+        ))
+    assert sorted(response.status_code for response in responses) == [202, 409]
+    wait_for_finalizations(1, completed)
+
+    # A late duplicate is refused as well
+    response = client.post(f"/api/attempts/{attempt_id}/submit", json=submission(), headers=student["headers"])
+    assert response.status_code == 409
+
+    attempt = db.get(Attempt, attempt_id)
+    assert attempt.status == ATTEMPT_FINALIZED
+    assert attempt.risk_score == 30.0
+    assert db.query(TrustLedgerEntry).filter_by(attempt_id=attempt_id).count() == 1
+    assert db.get(SkillAnalytics, student["id"]).attempt_count == 1
+    assert db.query(AssessmentDailyStats).one().attempt_count == 1
+
+
+def test_finalize_attempt_skips_attempts_not_submitted(client, db):
+    student = create_user(client, "student@example.com")
+    attempt_id = start_attempt(client, student, create_assessment())
+
+    result = attempt_finalization_service.finalize_attempt(db, attempt_id, "print(1)", 1, 1, 100.0, (None, 0.0))
+    assert result is None
+    attempt = db.get(Attempt, attempt_id)
+    assert attempt.status == ATTEMPT_IN_PROGRESS
+    assert attempt.end_time is None
+    assert db.query(TrustLedgerEntry).count() == 0
+
+
+def test_submit_rejects_foreign_attempt(client):
+    owner = create_user(client, "owner@example.com")
+    other = create_user(client, "other@example.com")
+    attempt_id = start_attempt(client, owner, create_assessment())
+
+    response = client.post(f"/api/attempts/{attempt_id}/submit", json=submission(), headers=other["headers"])
+    assert response.status_code == 404
+
+
+def test_submit_scores_in_process_when_similarity_pool_fails(client, db, monkeypatch):
+    student = create_user(client, "student@example.com")
+    attempt_id = start_attempt(client, student, create_assessment())
+
+    def broken_pool(*args, **kwargs):
+        raise BrokenProcessPool("a worker was killed")
+
+    monkeypatch.setattr(similarity_job_service, "submit", broken_pool)
+    completed = attempt_finalization_service.get_stats()["completed"]
+    response = client.post(f"/api/attempts/{attempt_id}/submit", json=submission(), headers=student["headers"])
+    assert response.status_code == 202
+    assert response.json()["similarity_job_id"] is None
+    wait_for_finalizations(1, completed)
+    assert db.get(Attempt, attempt_id).status == ATTEMPT_FINALIZED
+
+
+def test_failed_submit_releases_the_claim(client, db, monkeypatch):
+    student = create_user(client, "student@example.com")
+    attempt_id = start_attempt(client, student, create_assessment())
+
+    def unavailable(*args, **kwargs):
+        raise RuntimeError("cannot schedule new futures after shutdown")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(attempt_finalization_service.pipeline, "similarity_candidates", unavailable)
+        with pytest.raises(RuntimeError):
+            client.post(f"/api/attempts/{attempt_id}/submit", json=submission(), headers=student["headers"])
+    assert db.get(Attempt, attempt_id).status == ATTEMPT_IN_PROGRESS
+    assert attempt_finalization_service.get_stats()["pending"] == 0
+
+    completed = attempt_finalization_service.get_stats()["completed"]
+    assert client.post(f"/api/attempts/{attempt_id}/submit", json=submission(), headers=student["headers"]).status_code == 202
+    wait_for_finalizations(1, completed)
+    db.expire_all()
+    assert db.get(Attempt, attempt_id).status == ATTEMPT_FINALIZED
+
+
+def test_finalization_stats_are_reviewer_only(client):
+    student = create_user(client, "student@example.com")
+    proctor = create_user(client, "proctor@example.com", role="proctor")
+
+    assert client.get("/api/attempts/finalization/stats", headers=student["headers"]).status_code == 403
+    response = client.get("/api/attempts/finalization/stats", headers=proctor["headers"])
+    assert response.status_code == 200
+    assert "pipeline" in response.json()
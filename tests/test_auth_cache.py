@@ -0,0 +1,104 @@
+import time
+
+from passlib.hash import bcrypt
+
+from app.core.auth_cache import AuthCache, auth_cache
+from app.database.db import SessionLocal
+from app.models.user import User
+
+from tests.helpers import PASSWORD, create_user
+
+
+def _sleep_to_next_second() -> None:
+    # Token `iat` claims have one-second resolution
+    time.sleep(1.0 - time.time() % 1.0 + 0.01)
+
+
+def _set_role(user_id: int, role: str) -> None:
+    with SessionLocal() as session:
+        session.get(User, user_id).role = role
+        session.commit()
+
+
+def test_tokens_issued_in_the_invalidation_second_stay_fresh():
+    cache = AuthCache()
+    now = int(time.time())
+    cache.invalidate_user(1)
+    assert cache.claims_are_fresh(1, now + 1)
+    assert cache.claims_are_fresh(1, int(time.time()))
+    assert not cache.claims_are_fresh(1, now - 1)
+    assert not cache.claims_are_fresh(1, None)
+    assert cache.claims_are_fresh(2, None)
+
+
+
+def test_stale_markers_are_pruned_after_a_token_lifetime(monkeypatch):
+    cache = AuthCache(token_lifetime_seconds=60)
+    now = 1_000_000.0
+    monkeypatch.setattr(time, "time", lambda: now)
+    cache.invalidate_user(1)
+    cache.invalidate_user(2)
+
+    now += 30
+    cache.invalidate_user(1)
+    now += 45
+    cache.invalidate_user(3)
+    # User 2's marker only covered tokens issued more than a lifetime ago
+    assert list(cache._stale_before) == [1, 3]
+    assert cache.claims_are_fresh(2, None)
+    assert not cache.claims_are_fresh(1, now - 60)
+def test_cache_stats_are_admin_only(client):
+    student = create_user(client, "student@example.com")
+    proctor = create_user(client, "proctor@example.com", role="proctor")
+    admin = create_user(client, "admin@example.com", role="admin")
+
+    assert client.get("/api/auth/cache-stats").status_code == 401
+    for user in (student, proctor):
+        assert client.get("/api/auth/cache-stats", headers=user["headers"]).status_code == 403
+    response = client.get("/api/auth/cache-stats", headers=admin["headers"])
+    assert response.status_code == 200
+    assert response.json()["invalidations"] >= 1
+
+
+def test_role_change_reaches_existing_tokens(client):
+    user = create_user(client, "user@example.com")
+    assert client.get("/api/auth/cache-stats", headers=user["headers"]).status_code == 403
+    _sleep_to_next_second()
+
+    _set_role(user["id"], "admin")
+    assert client.get("/api/auth/cache-stats", headers=user["headers"]).status_code == 200
+    _set_role(user["id"], "student")
+    assert client.get("/api/auth/cache-stats", headers=user["headers"]).status_code == 403
+
+
+def test_uncommitted_or_unrelated_changes_do_not_invalidate(client):
+    user = create_user(client, "user@example.com")
+    invalidations = auth_cache.invalidations
+    with SessionLocal() as session:
+        session.get(User, user["id"]).role = "admin"
+        session.flush()
+        session.rollback()
+        session.get(User, user["id"]).trust_score = 90.0
+        session.commit()
+    assert auth_cache.invalidations == invalidations
+
+
+def test_rehash_on_login_keeps_new_token_fresh(client):
+    user = create_user(client, "user@example.com")
+    with SessionLocal() as session:
+        session.get(User, user["id"]).hashed_password = bcrypt.using(rounds=5).hash(PASSWORD)
+        session.commit()
+    _sleep_to_next_second()
+
+    invalidations = auth_cache.invalidations
+    response = client.post("/api/auth/login", json={"email": "user@example.com", "password": PASSWORD})
+    assert auth_cache.invalidations == invalidations + 1
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    with SessionLocal() as session:
+        assert session.get(User, user["id"]).hashed_password.startswith("$2b$04$")
+
+    # The fresh token's claims are trusted: deleting the row does not break it
+    with SessionLocal() as session:
+        session.delete(session.get(User, user["id"]))
+        session.commit()
+    assert client.get("/api/auth/cache-stats", headers=headers).status_code == 403
@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from ai_engine.behavior_monitor import BehaviorMonitor
+from ai_engine.monitor_registry import MonitorRegistry
+from ai_engine.vision import VisionFrameProcessor
+
+
+class FakeClock:
+    def __init__(self, now: float = 100.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_process_vision_frame_updates_face_status():
+    clock = FakeClock()
+    monitor = BehaviorMonitor(clock=clock)
+    frame = np.zeros((480, 640, 3), dtype=np.uint8)
+    seen_widths = []
+
+    def no_face(image):
+        seen_widths.append(image.shape[1])
+        return 0
+
+    assert monitor.process_vision_frame(frame, detector=no_face, timestamp=101.0) == 0
+    assert not monitor.face_detected
+    assert seen_widths == [160]
+
+    assert monitor.process_vision_frame(frame, detector=lambda image: 2, timestamp=103.5) == 2
+    assert monitor.face_detected
+    assert monitor.multiple_faces_detected
+    assert monitor.get_total_absent_seconds() == 2.5
+    assert monitor.get_absence_timeline() == [{"start": 1.0, "end": 3.5, "seconds": 2.5}]
+
+
+def test_absence_window_and_summary():
+    clock = FakeClock()
+    monitor = BehaviorMonitor(clock=clock)
+    for absent_at, present_at in ((110.0, 112.0), (120.0, 125.0)):
+        monitor.update_face_status(False, absent_at)
+        monitor.update_face_status(True, present_at)
+    monitor.update_face_status(False, 130.0)
+    clock.now = 131.0
+
+    # [121, 131]: 4 s of the second absence plus 1 s of the open one
+    assert monitor.absence_in_last(10.0) == 5.0
+    summary = monitor.get_behavior_summary()
+    assert summary["absence_count"] == 3
+    assert summary["total_absent_seconds"] == 8.0
+
+
+def test_registry_handle_matches_monitor():
+    clock = FakeClock()
+    registry = MonitorRegistry(clock=clock)
+    handle = registry.add(1)
+    monitor = BehaviorMonitor(clock=clock)
+    for target in (handle, monitor):
+        target.update_face_status(False, 101.0)
+        target.update_face_status(True, 104.0)
+        target.update_multiple_faces(True)
+    assert handle.get_behavior_summary() == monitor.get_behavior_summary()
+
+
+def test_frame_submitted_after_shutdown_does_not_block_wait_idle():
+    processor = VisionFrameProcessor(detector=lambda image: 1, max_workers=1)
+    monitor = BehaviorMonitor(clock=FakeClock())
+    processor.register("stream", monitor)
+    frame = np.zeros((48, 64), dtype=np.uint8)
+
+    assert processor.submit_frame("stream", frame, timestamp=100.0)
+    assert processor.wait_idle(timeout=5.0)
+    processor.shutdown()
+
+    with pytest.raises(RuntimeError):
+        processor.submit_frame("stream", frame, timestamp=200.0)
+    assert processor.wait_idle(timeout=1.0)
+    assert processor.get_stats()["frames_sampled"] == 1
+    # The stream is not left marked busy
+    assert processor._streams["stream"].busy is False
@@ -0,0 +1,105 @@
+import json
+from collections import Counter
+from itertools import product
+
+import pytest
+
+from ai_engine.code_similarity import CodeSimilarityAnalyzer, FingerprintIndex
+
+BOILERPLATE = "def solve(xs):\n"
+SUBMISSIONS = {
+    f"s{i}": f"{BOILERPLATE}    return [value_{i} * {i * 37} for value_{i} in xs if value_{i} % {i + 3}]\n"
+    for i in range(20)
+}
+
+
+def _index(**kwargs) -> FingerprintIndex:
+    index = FingerprintIndex(**kwargs)
+    for submission_id, code in SUBMISSIONS.items():
+        index.add_submission("two-sum", submission_id, code)
+    index.add_submission("fizzbuzz", "f1", "for i in range(1, 101):\n    print('Fizz' * (i % 3 == 0) or i)\n")
+    return index
+
+
+def test_save_and_load_round_trip(tmp_path):
+    index = _index()
+    index.remove_submission("two-sum", "s19")
+    path = str(tmp_path / "index.json")
+    index.save(path)
+
+    with open(path, encoding="utf-8") as handle:
+        payload = json.load(handle)
+    assert payload["analyzer"] == CodeSimilarityAnalyzer.name
+    assert not (tmp_path / "index.json.tmp").exists()
+
+    assert FingerprintIndex.load(path, shortlist_factor=2).shortlist_factor == 2
+    loaded = FingerprintIndex.load(path)
+    assert loaded._fingerprints == index._fingerprints
+    assert loaded._postings == index._postings
+    assert loaded.submission_count("two-sum") == 19
+    assert loaded.submission_count("fizzbuzz") == 1
+    for code in (SUBMISSIONS["s3"], SUBMISSIONS["s19"]):
+        assert loaded.find_similar(code, "two-sum", top_k=3) == index.find_similar(code, "two-sum", top_k=3)
+
+
+def test_exclude_skips_the_submission_itself():
+    index = _index()
+    code = SUBMISSIONS["s5"]
+    assert index.find_similar(code, "two-sum", top_k=1) == [("s5", 100.0)]
+
+    matches = index.find_similar(code, "two-sum", top_k=3, exclude="s5")
+    assert matches and all(submission_id != "s5" for submission_id, _ in matches)
+    assert "s5" not in dict(index.shortlist(code, "two-sum", top_k=None, exclude="s5"))
+    # Other assessments are never searched
+    assert index.find_similar(code, "fizzbuzz") == []
+
+
+def test_boilerplate_fingerprints_are_ignored_once_common():
+    # window=1 keeps every k-gram, so the boilerplate's fingerprints are held by every submission
+    cutoff = _index(window=1, common_fraction=0.5, common_min_submissions=20)
+    assert cutoff.shortlist(BOILERPLATE, "two-sum", top_k=None) == []
+    # A distinctive body is still found through its own fingerprints
+    assert cutoff.find_similar(SUBMISSIONS["s7"], "two-sum", top_k=1) == [("s7", 100.0)]
+
+    # Below common_min_submissions the cut-off is not applied
+    no_cutoff = _index(window=1, common_fraction=0.5, common_min_submissions=21)
+    assert len(no_cutoff.shortlist(BOILERPLATE, "two-sum", top_k=None)) == 20
+
+
+PAIR_SNIPPETS = [
+    "",
+    "x",
+    "print(1)",
+    "print(2)",
+    SUBMISSIONS["s1"],
+    SUBMISSIONS["s2"],
+    SUBMISSIONS["s1"].replace("    ", "\t"),
+    "zzzz qqqq jjjj",
+]
+
+
+@pytest.mark.parametrize("threshold", [0.0, 25.0, 50.0, 80.0, 95.0, 100.0])
+def test_score_above_matches_exact_score(threshold):
+    for first, second in product(PAIR_SNIPPETS, repeat=2):
+        score = CodeSimilarityAnalyzer.calculate_similarity(first, second)
+        expected = score if score >= threshold else None
+        assert CodeSimilarityAnalyzer.score_above(first, second, threshold) == expected
+        assert CodeSimilarityAnalyzer.score_above(first, second, threshold, Counter(first)) == expected
+        assert CodeSimilarityAnalyzer.similar_above(first, second, threshold) == (score >= threshold)
+
+
+def test_score_above_keeps_pairs_exactly_at_the_threshold():
+    # The upper bounds round like the exact score, so a pair scoring the threshold is never pruned
+    for first, second in product(PAIR_SNIPPETS, repeat=2):
+        score = CodeSimilarityAnalyzer.calculate_similarity(first, second)
+        assert CodeSimilarityAnalyzer.score_above(first, second, score) == score
+        assert CodeSimilarityAnalyzer.similar_above(first, second, score)
+
+
+def test_score_candidates_with_threshold_filters_the_full_scores():
+    candidates = list(enumerate(PAIR_SNIPPETS))
+    code = SUBMISSIONS["s1"]
+    everything = CodeSimilarityAnalyzer.score_candidates(code, candidates)
+    assert CodeSimilarityAnalyzer.score_candidates(code, candidates, 60.0) == [
+        (candidate_id, score) for candidate_id, score in everything if score >= 60.0
+    ]
@@ -0,0 +1,50 @@
+from datetime import datetime
+
+from app.services.cohort_analytics_service import CohortAnalyticsService
+from app.services.finalization_service import attempt_finalization_service
+
+from tests.helpers import create_assessment, create_user, start_attempt, submission, wait_for_event_flush, wait_for_finalizations
+
+
+def _finalize(client, student, assessment_id: int, tab_switches: int, code: str) -> None:
+    attempt_id = start_attempt(client, student, assessment_id)
+    if tab_switches:
+        client.post(f"/api/attempts/{attempt_id}/events", json=[{"event_type": "tab_switch"}] * tab_switches, headers=student["headers"])
+        wait_for_event_flush()
+    completed = attempt_finalization_service.get_stats()["completed"]
+    client.post(f"/api/attempts/{attempt_id}/submit", json=submission(code), headers=student["headers"])
+    wait_for_finalizations(1, completed)
+
+
+def test_cohort_analytics_are_reviewer_only(client):
+    student = create_user(client, "student@example.com")
+    assert client.get("/api/analytics/cohort", headers=student["headers"]).status_code == 403
+
+
+def test_cohort_aggregates_match_rebuild(client, db):
+    proctor = create_user(client, "proctor@example.com", role="proctor")
+    students = [create_user(client, f"student{i}@example.com") for i in range(2)]
+    assessment_id = create_assessment()
+    other_assessment_id = create_assessment("Word Count")
+    _finalize(client, students[0], assessment_id, 0, "def solve(xs):\n    return sorted(xs)\n")
+    _finalize(client, students[1], assessment_id, 6, "import sys\nprint(len(sys.stdin.read().split()))\n")
+
+    response = client.get("/api/analytics/cohort", params={"assessment_id": assessment_id}, headers=proctor["headers"])
+    assert response.status_code == 200
+    cohort = response.json()
+    assert (cohort["attempts"], cohort["flagged"], cohort["flagged_rate"]) == (2, 1, 0.5)
+    assert cohort["mean_risk_score"] == 30.0
+    assert cohort["mean_trust_score"] == 97.0
+    assert cohort["risk_histogram"]["counts"] == [1, 0, 0, 0, 0, 0, 1, 0, 0, 0]
+    assert cohort["trust_histogram"]["counts"] == [0] * 9 + [2]
+    assert cohort["daily"] == [{
+        "day": datetime.utcnow().date().isoformat(), "attempts": 2, "flagged": 1,
+        "mean_risk_score": 30.0, "mean_trust_score": 97.0
+    }]
+
+    other = client.get("/api/analytics/cohort", params={"assessment_id": other_assessment_id}, headers=proctor["headers"]).json()
+    assert (other["attempts"], other["mean_risk_score"], other["daily"]) == (0, None, [])
+
+    assert CohortAnalyticsService.rebuild_all(db) == 2
+    rebuilt = client.get("/api/analytics/cohort", params={"assessment_id": assessment_id}, headers=proctor["headers"]).json()
+    assert rebuilt == cohort
@@ -0,0 +1,162 @@
+from datetime import datetime
+
+from sqlalchemy.exc import IntegrityError
+
+from app.database.db import SessionLocal
+from app.models.behavior_log import BehaviorLog
+from app.services.event_ingestion import behavior_event_queue, write_behavior_logs
+from app.services.finalization_service import attempt_finalization_service
+from app.services.live_risk_service import live_risk_service
+from app.services.proctoring_feed import proctoring_feed
+
+from tests.helpers import create_assessment, create_user, start_attempt, submission, wait_for_event_flush, wait_for_finalizations
+
+TAB_SWITCHES = [{"event_type": "tab_switch"}] * 5
+
+
+def test_events_are_stored_and_scored(client, db):
+    student = create_user(client, "student@example.com")
+    attempt_id = start_attempt(client, student, create_assessment())
+
+    response = client.post(f"/api/attempts/{attempt_id}/events", json=TAB_SWITCHES, headers=student["headers"])
+    assert response.status_code == 202
+    assert response.json() == {"attempt_id": attempt_id, "accepted": 5, "live_risk_score": 50.0}
+    wait_for_event_flush()
+    assert db.query(BehaviorLog).filter_by(attempt_id=attempt_id).count() == 5
+
+
+def test_events_for_someone_elses_attempt_are_rejected(client, db):
+    owner = create_user(client, "owner@example.com")
+    intruder = create_user(client, "intruder@example.com")
+    attempt_id = start_attempt(client, owner, create_assessment())
+
+    response = client.post(f"/api/attempts/{attempt_id}/events", json=TAB_SWITCHES, headers=intruder["headers"])
+    assert response.status_code == 404
+    response = client.post("/api/attempts/99999/events", json=TAB_SWITCHES, headers=intruder["headers"])
+    assert response.status_code == 404
+
+    wait_for_event_flush()
+    assert db.query(BehaviorLog).count() == 0
+    assert client.get(f"/api/attempts/{attempt_id}/risk", headers=owner["headers"]).json()["live_risk_score"] == 0.0
+
+
+def test_events_after_submission_are_rejected(client):
+    student = create_user(client, "student@example.com")
+    attempt_id = start_attempt(client, student, create_assessment())
+    completed = attempt_finalization_service.get_stats()["completed"]
+    assert client.post(f"/api/attempts/{attempt_id}/submit", json=submission(), headers=student["headers"]).status_code == 202
+    wait_for_finalizations(1, completed)
+
+    response = client.post(f"/api/attempts/{attempt_id}/events", json=TAB_SWITCHES, headers=student["headers"])
+    assert response.status_code == 409
+    assert client.get(f"/api/attempts/{attempt_id}/risk", headers=student["headers"]).status_code == 409
+    assert not live_risk_service.is_tracked(attempt_id)
+
+
+def test_live_risk_is_visible_to_owner_and_reviewers_only(client):
+    owner = create_user(client, "owner@example.com")
+    other = create_user(client, "other@example.com")
+    proctor = create_user(client, "proctor@example.com", role="proctor")
+    attempt_id = start_attempt(client, owner, create_assessment())
+    client.post(f"/api/attempts/{attempt_id}/events", json=TAB_SWITCHES, headers=owner["headers"])
+
+    assert client.get(f"/api/attempts/{attempt_id}/risk", headers=other["headers"]).status_code == 404
+    for user in (owner, proctor):
+        response = client.get(f"/api/attempts/{attempt_id}/risk", headers=user["headers"])
+        assert response.status_code == 200
+        assert response.json()["live_risk_score"] == 50.0
+
+
+def test_event_queue_stats_are_reviewer_only(client):
+    student = create_user(client, "student@example.com")
+    admin = create_user(client, "admin@example.com", role="admin")
+
+    assert client.get("/api/attempts/events/stats", headers=student["headers"]).status_code == 403
+    assert client.get("/api/attempts/events/stats", headers=admin["headers"]).status_code == 200
+
+
+def test_rebuilt_accumulator_does_not_count_queued_events_twice(client, monkeypatch):
+    student = create_user(client, "student@example.com")
+    attempt_id = start_attempt(client, student, create_assessment())
+    client.post(f"/api/attempts/{attempt_id}/events", json=TAB_SWITCHES[:2], headers=student["headers"])
+    wait_for_event_flush()
+    # As after a restart: the attempt is no longer tracked in memory
+    live_risk_service.discard(attempt_id)
+
+    rebuild = live_risk_service.get_accumulator
+
+    def rebuild_after_flush(attempt_id, db=None):
+        # The worst case: the drainer writes everything queued before the rebuild reads
+        if db is not None:
+            wait_for_event_flush()
+        return rebuild(attempt_id, db)
+
+    monkeypatch.setattr(live_risk_service, "get_accumulator", rebuild_after_flush)
+    response = client.post(f"/api/attempts/{attempt_id}/events", json=TAB_SWITCHES[:3], headers=student["headers"])
+    assert response.json()["live_risk_score"] == 50.0
+
+
+def test_failed_batch_is_retried_per_attempt(client, db):
+    student = create_user(client, "student@example.com")
+    attempt_id = start_attempt(client, student, create_assessment())
+    bad_attempt_id = attempt_id + 1000
+
+    class RejectingSession:
+        """Fails any insert touching bad_attempt_id, like a foreign key violation would."""
+
+        def __init__(self):
+            self.session = SessionLocal()
+
+        def execute(self, statement, rows):
+            if any(row["attempt_id"] == bad_attempt_id for row in rows):
+                raise IntegrityError("INSERT INTO behavior_logs", None, Exception("foreign key violation"))
+            return self.session.execute(statement, rows)
+
+        def __getattr__(self, name):
+            return getattr(self.session, name)
+
+    rows = [
+        {"attempt_id": attempt_id, "event_type": "tab_switch", "severity_score": None, "timestamp": datetime.utcnow()},
+        {"attempt_id": bad_attempt_id, "event_type": "tab_switch", "severity_score": None, "timestamp": datetime.utcnow()},
+        {"attempt_id": attempt_id, "event_type": "copy_paste", "severity_score": None, "timestamp": datetime.utcnow()},
+    ]
+    assert write_behavior_logs(RejectingSession, rows) == 1
+    assert db.query(BehaviorLog).filter_by(attempt_id=attempt_id).count() == 2
+
+
+def test_invalid_severity_scores_are_rejected(client, db):
+    student = create_user(client, "student@example.com")
+    attempt_id = start_attempt(client, student, create_assessment())
+    url = f"/api/attempts/{attempt_id}/events"
+
+    # The JSON parser accepts NaN / Infinity literals: send them raw
+    for severity in ("NaN", "Infinity", "-1", "1e9"):
+        body = '[{"event_type": "face_missing", "severity_score": %s}]' % severity
+        response = client.post(url, content=body, headers={**student["headers"], "Content-Type": "application/json"})
+        assert response.status_code == 422, severity
+
+    response = client.post(url, json=[{"event_type": "face_missing", "severity_score": 30}], headers=student["headers"])
+    assert response.status_code == 202
+    assert response.json()["live_risk_score"] == 60.0
+    wait_for_event_flush()
+    assert db.query(BehaviorLog).filter_by(attempt_id=attempt_id).count() == 1
+
+
+def test_batch_racing_finalization_does_not_retrack_the_attempt(client, monkeypatch):
+    student = create_user(client, "student@example.com")
+    attempt_id = start_attempt(client, student, create_assessment())
+    enqueue = behavior_event_queue.enqueue
+
+    async def enqueue_then_finalize(rows):
+        await enqueue(rows)
+        # Finalization discards the accumulator while the request awaits
+        live_risk_service.discard(attempt_id)
+
+    monkeypatch.setattr(behavior_event_queue, "enqueue", enqueue_then_finalize)
+    published = []
+    monkeypatch.setattr(proctoring_feed, "publish_risk", published.append)
+
+    response = client.post(f"/api/attempts/{attempt_id}/events", json=TAB_SWITCHES, headers=student["headers"])
+    assert response.status_code == 409
+    assert not live_risk_service.is_tracked(attempt_id)
+    assert published == []
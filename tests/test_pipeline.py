@@ -0,0 +1,35 @@
+from ai_engine.code_similarity import CodeSimilarityAnalyzer
+from ai_engine.pipeline import AttemptFinalizationPipeline, FinishedAttempt
+
+CODE = "def solve(values):\n    total = 0\n    for value in values:\n        total += value * value\n    return total\n"
+
+
+def _attempt(attempt_id: int, code: str = CODE) -> FinishedAttempt:
+    return FinishedAttempt(
+        attempt_id=attempt_id, user_id=attempt_id, assessment_id=1, code=code, time_taken=600,
+        test_cases_passed=8, total_test_cases=10, final_score=80.0, old_trust_score=100.0
+    )
+
+
+def test_finalize_finds_copied_submission():
+    pipeline = AttemptFinalizationPipeline()
+    first = pipeline.finalize(_attempt(1))
+    second = pipeline.finalize(_attempt(2))
+
+    assert first.similar_submission_id is None
+    assert (second.similar_submission_id, second.code_similarity) == (1, 100.0)
+    assert second.risk_score == 50.0
+
+
+def test_similarity_is_scored_outside_the_index_lock(monkeypatch):
+    pipeline = AttemptFinalizationPipeline()
+    pipeline.finalize(_attempt(1))
+    lock_held = []
+
+    def score_candidates(code, candidates, min_similarity=None):
+        lock_held.append(pipeline._index_lock.locked())
+        return [(candidate_id, CodeSimilarityAnalyzer.calculate_similarity(code, other)) for candidate_id, other in candidates]
+
+    monkeypatch.setattr(CodeSimilarityAnalyzer, "score_candidates", staticmethod(score_candidates))
+    assert pipeline.finalize(_attempt(2)).code_similarity == 100.0
+    assert lock_held == [False]
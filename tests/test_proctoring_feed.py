@@ -0,0 +1,99 @@
+import asyncio
+import gc
+
+import pytest
+from starlette.requests import ClientDisconnect
+
+from app.services.live_risk_service import live_risk_service
+from app.services.proctoring_feed import ProctoringFeed, ProctoringFeedFull, proctoring_feed
+
+from tests.helpers import create_user
+
+
+def test_feed_is_reviewer_only(client):
+    student = create_user(client, "student@example.com")
+    assert client.get("/api/proctoring/feed", headers=student["headers"]).status_code == 403
+
+
+def test_full_feed_is_refused_before_the_response_starts(client, monkeypatch):
+    proctor = create_user(client, "proctor@example.com", role="proctor")
+
+    # The feed filled up between a capacity check and the subscription
+    def subscribe():
+        raise ProctoringFeedFull("full")
+
+    monkeypatch.setattr(proctoring_feed, "subscribe", subscribe)
+    response = client.get("/api/proctoring/feed", headers=proctor["headers"])
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "5"
+
+
+def test_stream_uses_the_given_subscriber():
+    feed = ProctoringFeed(snapshot_source=lambda: [], summary_source=lambda attempt_id: {}, max_subscribers=1)
+
+    async def scenario():
+        subscriber = feed.subscribe()
+        stream = feed.stream(subscriber)
+        assert (await stream.__anext__()).startswith(b"event: snapshot\n")
+        assert feed.get_stats()["subscribers"] == 1
+        await stream.aclose()
+        assert feed.get_stats()["subscribers"] == 0
+
+    asyncio.run(scenario())
+
+
+def test_discarded_attempts_are_forgotten():
+    previous_loop = proctoring_feed._loop
+
+    async def scenario():
+        subscriber = proctoring_feed.subscribe()
+        try:
+            live_risk_service.record_event(1, "tab_switch")
+            proctoring_feed.publish_risk(1)
+            assert proctoring_feed.get_stats()["tracked_attempts"] == 1
+
+            # Discards happen on finalization worker threads
+            await asyncio.to_thread(live_risk_service.discard, 1)
+            await asyncio.sleep(0)
+            assert proctoring_feed.get_stats()["tracked_attempts"] == 0
+        finally:
+            proctoring_feed.unsubscribe(subscriber)
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        proctoring_feed._loop = previous_loop
+
+
+def test_dropped_connections_release_their_subscriptions():
+    from app.core.auth_cache import Principal
+    from app.routes.proctoring import get_proctoring_feed
+
+    feed = ProctoringFeed(snapshot_source=lambda: [], summary_source=lambda attempt_id: {}, max_subscribers=2)
+    proctor = Principal(1, "proctor", "proctor@example.com", "proctor")
+
+    async def client_gone(message):
+        raise OSError("connection reset")
+
+    async def receive():
+        return {"type": "http.disconnect"}
+
+    async def scenario(monkeypatch):
+        monkeypatch.setattr("app.routes.proctoring.proctoring_feed", feed)
+        for _ in range(5):
+            # The client leaves before the response starts: the body is never iterated
+            response = await get_proctoring_feed(current_user=proctor)
+            with pytest.raises((OSError, ClientDisconnect)):
+                await response({"type": "http", "asgi": {"spec_version": "2.4"}}, receive, client_gone)
+            del response
+            gc.collect()
+            assert feed.get_stats()["subscribers"] == 0
+
+        # A stream that was read from and closed
+        stream = feed.open_stream()
+        assert (await stream.__anext__()).startswith(b"event: snapshot\n")
+        await stream.aclose()
+        assert feed.get_stats()["subscribers"] == 0
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        asyncio.run(scenario(monkeypatch))
@@ -0,0 +1,67 @@
+import hashlib
+import json
+
+import pytest
+
+from app.services.finalization_service import attempt_finalization_service
+from ai_engine.report_generator import ReportGenerator
+
+from tests.helpers import create_assessment, create_user, start_attempt, submission, wait_for_finalizations
+
+
+def test_serialize_report_is_canonical_json():
+    report = {"b": 1e16, "a": [0.1, "é"], "c": {"z": None, "y": True}}
+
+    payload, content_hash = ReportGenerator.serialize_report(report)
+    assert payload == json.dumps(report, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    assert payload.startswith(b'{"a":[0.1,"\xc3\xa9"],"b":1e+16,')
+    assert content_hash == hashlib.sha256(payload).hexdigest()
+    assert ReportGenerator.serialize_report(dict(reversed(report.items()))) == (payload, content_hash)
+
+
+def test_serialize_report_rejects_non_finite_numbers():
+    with pytest.raises(ValueError):
+        ReportGenerator.serialize_report({"risk": float("nan")})
+
+
+def _finalized_report(client):
+    student = create_user(client, "student@example.com")
+    attempt_id = start_attempt(client, student, create_assessment())
+    completed = attempt_finalization_service.get_stats()["completed"]
+    response = client.post(f"/api/attempts/{attempt_id}/submit", json=submission(), headers=student["headers"])
+    assert response.status_code == 202, response.text
+    wait_for_finalizations(1, completed)
+    return student, attempt_id
+
+
+def test_report_etag_revalidation(client):
+    student, attempt_id = _finalized_report(client)
+    url = f"/api/reports/{attempt_id}"
+
+    response = client.get(url, headers=student["headers"])
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert etag == f'"{hashlib.sha256(response.content).hexdigest()}"'
+    assert response.headers["cache-control"] == "private, no-cache"
+
+    for if_none_match in (etag, f"W/{etag}", "*", f'"stale", {etag}', f'W/"stale",W/{etag}'):
+        revalidated = client.get(url, headers={**student["headers"], "If-None-Match": if_none_match})
+        assert revalidated.status_code == 304, if_none_match
+        assert revalidated.content == b""
+        assert revalidated.headers["etag"] == etag
+
+    for if_none_match in ('"stale"', 'W/"stale"', etag.strip('"')):
+        changed = client.get(url, headers={**student["headers"], "If-None-Match": if_none_match})
+        assert changed.status_code == 200, if_none_match
+        assert changed.content == response.content
+
+
+def test_report_is_hidden_from_other_students(client):
+    _, attempt_id = _finalized_report(client)
+    other = create_user(client, "other@example.com")
+    proctor = create_user(client, "proctor@example.com", role="proctor")
+
+    # Not found, even with a wildcard validator
+    response = client.get(f"/api/reports/{attempt_id}", headers={**other["headers"], "If-None-Match": "*"})
+    assert response.status_code == 404
+    assert client.get(f"/api/reports/{attempt_id}", headers=proctor["headers"]).status_code == 200
@@ -0,0 +1,46 @@
+from types import SimpleNamespace
+
+import pytest
+
+from ai_engine.risk_accumulator import RiskAccumulator
+from ai_engine.risk_calculator import RiskCalculator
+from ai_engine.risk_weights import RiskContributions, RiskWeights, set_risk_weights
+
+
+@pytest.mark.parametrize("severity", [float("nan"), float("inf"), float("-inf"), -5.0, None])
+def test_invalid_absence_durations_count_as_zero(severity):
+    accumulator = RiskAccumulator(1)
+    assert accumulator.apply_event("face_missing", severity)
+    accumulator.apply_event("face_missing", 10.0)
+    assert accumulator.face_absent_seconds == 10.0
+    assert accumulator.live_risk_score == 20.0
+
+
+def test_rebuild_ignores_non_finite_stored_rows():
+    logs = [SimpleNamespace(event_type="face_missing", severity_score=value) for value in (float("nan"), 4.0)]
+    logs.append(SimpleNamespace(event_type="tab_switch", severity_score=None))
+    accumulator = RiskAccumulator.from_behavior_logs(1, logs)
+    assert (accumulator.face_absent_seconds, accumulator.tab_switch_count) == (4.0, 1)
+    assert accumulator.finalize(0.0).score == 18.0
+
+
+def _fields(contributions: RiskContributions) -> dict:
+    return {name: getattr(contributions, name) for name in RiskContributions.__slots__}
+
+
+def test_finalize_matches_calculator_after_weights_reload(restore_risk_weights):
+    accumulator = RiskAccumulator(1)
+    for event_type, severity in [("tab_switch", None), ("face_missing", 3.5), ("copy_paste", None), ("tab_switch", None)]:
+        accumulator.apply_event(event_type, severity)
+    assert accumulator.live_risk_score == 32.0
+
+    set_risk_weights(RiskWeights(tab_switch_weight=7.5, face_absent_weight=1.25, code_similarity_weight=0.3,
+                                 copy_paste_weight=4, multiple_faces_penalty=30, max_risk_score=90.0))
+    accumulator.apply_event("multiple_faces")
+    # The running sum is re-derived from the totals, not carried over from the old weights
+    assert accumulator.live_risk_score == 2 * 7.5 + 3.5 * 1.25 + 4 + 30
+
+    for similarity in (0.0, 42.5, 100.0):
+        expected = RiskCalculator.calculate_risk_breakdown(2, 3.5, similarity, 1, True)
+        assert _fields(accumulator.finalize(similarity)) == _fields(expected)
+    assert accumulator.finalize(100.0).score == 83.375
@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from ai_engine.risk_calculator import RiskCalculator
+from ai_engine.risk_weights import RiskWeights, set_risk_weights
+
+
+def _attempts(count: int = 500):
+    rng = np.random.default_rng(7)
+    return (
+        rng.integers(0, 12, count),
+        np.round(rng.uniform(0, 60, count), 3),
+        np.round(rng.uniform(0, 100, count), 2),
+        rng.integers(0, 6, count),
+        rng.random(count) < 0.2
+    )
+
+
+def _scalar_scores(tab_switches, absent, similarity, copy_paste, multiple_faces):
+    return [
+        RiskCalculator.calculate_risk_score(int(t), float(a), float(s), int(c), bool(m))
+        for t, a, s, c, m in zip(tab_switches, absent, similarity, copy_paste, multiple_faces)
+    ]
+
+
+@pytest.mark.parametrize("weights", [
+    RiskWeights(),
+    RiskWeights(tab_switch_weight=3.3, face_absent_weight=0.7, code_similarity_weight=0.15,
+                copy_paste_weight=1.1, multiple_faces_penalty=12.5, max_risk_score=80.0),
+])
+def test_batch_matches_scalar_scores_exactly(weights, restore_risk_weights):
+    set_risk_weights(weights)
+    columns = _attempts()
+
+    batch = RiskCalculator.calculate_risk_scores_batch(*columns)
+    assert batch.dtype == np.float64
+    # Exact equality, not approx: stored scores must not depend on the code path
+    assert batch.tolist() == _scalar_scores(*columns)
+    assert batch.max() <= weights.max_risk_score
+
+
+def test_batch_defaults_and_empty_input():
+    tab_switches, absent, similarity, _, _ = _attempts(50)
+
+    batch = RiskCalculator.calculate_risk_scores_batch(tab_switches, absent, similarity)
+    assert batch.tolist() == _scalar_scores(tab_switches, absent, similarity, [0] * 50, [False] * 50)
+    assert RiskCalculator.calculate_risk_scores_batch([], [], []).tolist() == []
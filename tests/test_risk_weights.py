@@ -0,0 +1,51 @@
+import json
+
+import pytest
+
+from ai_engine.explainability import ExplainabilityEngine
+from ai_engine.risk_calculator import RiskCalculator
+from ai_engine.risk_weights import RiskWeights, set_risk_weights, set_risk_weights_refresher
+
+
+def test_from_mapping_coerces_numbers():
+    weights = RiskWeights.from_mapping({"tab_switch_weight": "12", "face_absent_weight": "2.5", "unknown": "x"})
+    assert weights.tab_switch_weight == 12
+    assert isinstance(weights.tab_switch_weight, int)
+    assert weights.face_absent_weight == 2.5
+    assert weights.code_similarity_weight == 0.5
+
+
+@pytest.mark.parametrize("value", ["ten", None, [10], True, float("nan"), "inf"])
+def test_from_mapping_rejects_non_numbers(value):
+    with pytest.raises(ValueError):
+        RiskWeights.from_mapping({"tab_switch_weight": value})
+
+
+def test_risk_calculator_runs_the_refresher(restore_risk_weights):
+    set_risk_weights_refresher(lambda: set_risk_weights(RiskWeights(tab_switch_weight=20)))
+    assert RiskCalculator.calculate_risk_score(tab_switch_count=2) == 40.0
+    assert RiskCalculator.calculate_risk_scores_batch([2], [0.0], [0.0]).tolist() == [40.0]
+
+
+def test_explanation_rounds_contributions():
+    explanation = ExplainabilityEngine.generate_risk_explanation(0, 3.3, 0.0, 0, False, 6.6)
+    assert explanation["contributing_factors"]["face_absence"]["risk_contribution"] == 6.6
+    assert "(+6.6 risk)" in explanation["human_readable_explanation"]
+
+
+def test_invalid_weights_file_keeps_previous_weights(tmp_path, monkeypatch, restore_risk_weights):
+    import app.core.config as config
+
+    weights_file = tmp_path / "weights.json"
+    monkeypatch.setattr(config, "RISK_WEIGHTS_FILE", str(weights_file))
+
+    def reload(values):
+        weights_file.write_text(json.dumps(values))
+        monkeypatch.setattr(config, "_risk_weights_file_mtime", None)
+        monkeypatch.setattr(config, "_risk_weights_next_check", 0.0)
+        return RiskCalculator.calculate_risk_score(tab_switch_count=1)
+
+    assert reload({"tab_switch_weight": 12}) == 12.0
+    assert reload({"tab_switch_weight": "10"}) == 10.0
+    assert reload({"tab_switch_weight": "ten"}) == 10.0
+    assert reload([1, 2]) == 10.0
@@ -0,0 +1,88 @@
+import os
+import signal
+import time
+
+import pytest
+
+from app.services.finalization_service import attempt_finalization_service
+from app.services.similarity_jobs import JOB_DONE, JOB_FAILED, SimilarityJobService, SimilarityPoolUnavailable
+
+from tests.helpers import BACKGROUND_TIMEOUT, create_assessment, create_user, start_attempt, submission, wait_for_finalizations
+
+CODE = "def solve(values):\n    total = 0\n    for value in values:\n        total += value * value\n    return total\n"
+
+
+def test_students_cannot_run_similarity_jobs(client):
+    student = create_user(client, "student@example.com")
+    job = {"code": CODE, "assessment_id": create_assessment(), "exhaustive": True}
+
+    assert client.post("/api/similarity/jobs", json=job, headers=student["headers"]).status_code == 403
+    assert client.get("/api/similarity/jobs/some-job", headers=student["headers"]).status_code == 403
+    assert client.delete("/api/similarity/jobs/some-job", headers=student["headers"]).status_code == 403
+    assert client.get("/api/similarity/stats", headers=student["headers"]).status_code == 403
+
+
+def test_reviewer_job_finds_a_copied_submission(client):
+    student = create_user(client, "student@example.com")
+    proctor = create_user(client, "proctor@example.com", role="proctor")
+    assessment_id = create_assessment()
+    attempt_id = start_attempt(client, student, assessment_id)
+    completed = attempt_finalization_service.get_stats()["completed"]
+    client.post(f"/api/attempts/{attempt_id}/submit", json=submission(CODE), headers=student["headers"])
+    wait_for_finalizations(1, completed)
+
+    assert client.get("/api/similarity/stats", headers=proctor["headers"]).status_code == 200
+    response = client.post("/api/similarity/jobs", json={"code": CODE, "assessment_id": assessment_id}, headers=proctor["headers"])
+    assert response.status_code == 202
+    job_id = response.json()["job_id"]
+
+    deadline = time.monotonic() + BACKGROUND_TIMEOUT
+    while (job := client.get(f"/api/similarity/jobs/{job_id}", headers=proctor["headers"]).json())["status"] == "queued":
+        assert time.monotonic() < deadline, "similarity job did not finish in time"
+        time.sleep(0.05)
+    assert job["status"] == "done"
+    assert job["matches"][0] == {"submission_id": attempt_id, "similarity": 100.0}
+
+
+def _wait_until(condition) -> None:
+    deadline = time.monotonic() + BACKGROUND_TIMEOUT
+    while not condition():
+        assert time.monotonic() < deadline, "condition not reached in time"
+        time.sleep(0.01)
+
+
+def test_pool_recovers_after_a_worker_is_killed():
+    service = SimilarityJobService(max_workers=1, chunk_size=1)
+    candidates = [(1, CODE), (2, CODE.replace("value", "item"))]
+    try:
+        job = service.wait(service.submit(CODE, candidates))
+        assert job.status == JOB_DONE
+        broken = service._executor
+        for process in list(broken._processes.values()):
+            os.kill(process.pid, signal.SIGKILL)
+        _wait_until(lambda: broken._broken)
+
+        with pytest.raises(SimilarityPoolUnavailable):
+            service.submit(CODE, candidates)
+        stats = service.get_stats()
+        assert stats["pending_chunks"] == 0
+        assert stats["finished_jobs"][JOB_FAILED] == 1
+        assert service._executor is None
+
+        job = service.wait(service.submit(CODE, candidates))
+        assert (job.status, job.best_match) == (JOB_DONE, (1, 100.0))
+        assert service.get_stats()["pending_chunks"] == 0
+    finally:
+        service.shutdown()
+
+
+def test_submit_after_shutdown_fails_the_job():
+    service = SimilarityJobService(max_workers=1, chunk_size=1)
+    service.wait(service.submit(CODE, [(1, CODE)]))
+    executor = service._executor
+    executor.shutdown(wait=True)
+
+    with pytest.raises(SimilarityPoolUnavailable):
+        service.submit(CODE, [(1, CODE), (2, CODE)])
+    assert service.get_stats()["pending_chunks"] == 0
+    assert [job.status for job in service._jobs.values()] == [JOB_DONE, JOB_FAILED]
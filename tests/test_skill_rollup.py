@@ -0,0 +1,56 @@
+import statistics
+
+import pytest
+
+from app.models.attempt import Attempt
+from app.models.skill_analytics import SkillAnalytics
+from app.services.finalization_service import attempt_finalization_service
+from app.services.skill_rollup_service import SkillRollupService
+from ai_engine.skill_analyzer import SkillRollup
+
+from tests.helpers import create_assessment, create_user, start_attempt, submission, wait_for_finalizations
+
+SUBMISSIONS = [
+    {**submission("def solve(xs):\n    return sorted(xs)\n"), "test_cases_passed": 3},
+    {**submission("def solve(xs):\n    out = []\n    for x in xs:\n        out.append(x)\n    return out\n"), "test_cases_passed": 7},
+    {**submission("def solve(xs):\n    return list(reversed(xs))\n"), "test_cases_passed": 10},
+]
+
+
+def test_rollup_matches_batch_statistics():
+    scores = [{"problem_solving_score": value, "logic_score": value / 2, "efficiency_score": 100 - value} for value in (30.0, 72.5, 90.0, 55.0)]
+    rollup = SkillRollup()
+    for skill_scores in scores:
+        rollup.add(skill_scores)
+
+    problem_solving = [skill_scores["problem_solving_score"] for skill_scores in scores]
+    assert rollup.problem_solving_mean == pytest.approx(statistics.mean(problem_solving))
+    assert rollup.logic_mean == pytest.approx(statistics.mean(value / 2 for value in problem_solving))
+    assert rollup.code_quality_mean == pytest.approx(statistics.mean(100 - value for value in problem_solving))
+    assert rollup.consistency_score == round(100 - statistics.pstdev(problem_solving), 2)
+
+
+def test_finalization_rollup_equals_rebuild(client, db):
+    student = create_user(client, "student@example.com")
+    assessment_id = create_assessment()
+    for body in SUBMISSIONS:
+        attempt_id = start_attempt(client, student, assessment_id)
+        completed = attempt_finalization_service.get_stats()["completed"]
+        assert client.post(f"/api/attempts/{attempt_id}/submit", json=body, headers=student["headers"]).status_code == 202
+        wait_for_finalizations(1, completed)
+
+    attempts = db.query(Attempt).filter_by(user_id=student["id"]).all()
+    problem_solving = [attempt.problem_solving_score for attempt in attempts]
+    row = db.get(SkillAnalytics, student["id"])
+    assert row.attempt_count == 3
+    assert row.problem_solving_score == pytest.approx(statistics.mean(problem_solving))
+    assert row.logic_score == pytest.approx(statistics.mean(attempt.logic_score for attempt in attempts))
+    assert row.code_quality_score == pytest.approx(statistics.mean(attempt.efficiency_score for attempt in attempts))
+    assert row.consistency_score == round(100 - statistics.pstdev(problem_solving), 2)
+    incremental = (row.problem_solving_score, row.logic_score, row.code_quality_score, row.consistency_score, row.problem_solving_m2)
+
+    assert SkillRollupService.rebuild_all(db) == 1
+    db.expire_all()
+    row = db.get(SkillAnalytics, student["id"])
+    assert row.attempt_count == 3
+    assert (row.problem_solving_score, row.logic_score, row.code_quality_score, row.consistency_score, row.problem_solving_m2) == pytest.approx(incremental)
@@ -0,0 +1,86 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from ai_engine.code_similarity import CodeSimilarityAnalyzer, FingerprintIndex
+from ai_engine.token_similarity import TokenSimilarityAnalyzer, get_similarity_analyzer
+
+ORIGINAL = "def solve(values):\n    total = 0\n    for value in values:\n        total += value * 2\n    return total\n"
+RENAMED = "def answer(xs):\n    # accumulate\n    acc = 0\n    for x in xs:\n        acc += x * 7\n    return acc\n"
+DIFFERENT = "import sys\nprint(sorted(sys.stdin.read().split(), key=len))\n"
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    TokenSimilarityAnalyzer.clear_cache()
+    yield
+    TokenSimilarityAnalyzer.clear_cache()
+
+
+def test_renamed_copy_is_identical():
+    assert TokenSimilarityAnalyzer.calculate_similarity(ORIGINAL, RENAMED) == 100.0
+    assert TokenSimilarityAnalyzer.calculate_similarity(ORIGINAL, DIFFERENT) < 50.0
+
+
+@pytest.mark.parametrize("threshold", [0.0, 30.0, 60.0, 99.0, 100.0])
+def test_similar_above_matches_exact_score(threshold):
+    for first, second in ((ORIGINAL, RENAMED), (ORIGINAL, DIFFERENT), (DIFFERENT, "x = (1,")):
+        score = TokenSimilarityAnalyzer.calculate_similarity(first, second)
+        assert TokenSimilarityAnalyzer.similar_above(first, second, threshold) == (score >= threshold)
+
+
+def test_cache_stays_bounded_under_concurrent_use(monkeypatch):
+    monkeypatch.setattr(TokenSimilarityAnalyzer, "cache_size", 8)
+    snippets = [f"value_{i} = {i}\nprint(value_{i} + 1)\n" for i in range(64)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        scores = list(pool.map(lambda code: TokenSimilarityAnalyzer.calculate_similarity(code, snippets[0]), snippets * 4))
+    assert scores == [100.0] * len(scores)
+    assert len(TokenSimilarityAnalyzer._cache) <= 8
+    assert TokenSimilarityAnalyzer.normalize(snippets[-1]) is TokenSimilarityAnalyzer.normalize(snippets[-1])
+
+
+def test_fingerprints_are_cached_token_kgrams():
+    assert TokenSimilarityAnalyzer.fingerprint(ORIGINAL) == TokenSimilarityAnalyzer.fingerprint(RENAMED)
+    assert TokenSimilarityAnalyzer.fingerprint(ORIGINAL) is TokenSimilarityAnalyzer.normalize(ORIGINAL).fingerprints
+    assert not TokenSimilarityAnalyzer.fingerprint(ORIGINAL) & TokenSimilarityAnalyzer.fingerprint(DIFFERENT)
+
+
+def test_token_index_finds_renamed_copies(tmp_path):
+    character_index = FingerprintIndex()
+    token_index = FingerprintIndex(analyzer=TokenSimilarityAnalyzer)
+    for index in (character_index, token_index):
+        index.add_submission(1, "original", ORIGINAL)
+        index.add_submission(1, "other", DIFFERENT)
+
+    assert token_index.find_similar(RENAMED, 1, top_k=1) == [("original", 100.0)]
+    assert character_index.find_similar(RENAMED, 1, top_k=1) != [("original", 100.0)]
+
+    # A file written by the character index is re-fingerprinted for the token analyzer
+    path = str(tmp_path / "index.json")
+    character_index.save(path)
+    loaded = FingerprintIndex.load(path, analyzer=TokenSimilarityAnalyzer)
+    assert loaded.find_similar(RENAMED, 1, top_k=1) == [("original", 100.0)]
+
+
+def test_score_candidates_matches_the_character_interface():
+    candidates = [("original", ORIGINAL), ("other", DIFFERENT)]
+    assert TokenSimilarityAnalyzer.score_candidates(RENAMED, candidates) == [
+        ("original", 100.0), ("other", TokenSimilarityAnalyzer.calculate_similarity(RENAMED, DIFFERENT))
+    ]
+    assert TokenSimilarityAnalyzer.score_candidates(RENAMED, candidates, min_similarity=90.0) == [("original", 100.0)]
+    assert get_similarity_analyzer("token") is TokenSimilarityAnalyzer
+    assert get_similarity_analyzer("character") is CodeSimilarityAnalyzer
+    with pytest.raises(ValueError):
+        get_similarity_analyzer("ast")
+
+
+def test_similarity_job_pool_runs_the_token_analyzer():
+    from app.services.similarity_jobs import JOB_DONE, SimilarityJobService
+
+    service = SimilarityJobService(max_workers=1, analyzer_name="token")
+    try:
+        job = service.wait(service.submit(RENAMED, [("original", ORIGINAL), ("other", DIFFERENT)], top_k=1))
+        assert (job.status, job.best_match) == (JOB_DONE, ("original", 100.0))
+    finally:
+        service.shutdown()
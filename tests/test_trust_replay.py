@@ -0,0 +1,80 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models.attempt import ATTEMPT_FINALIZED, Attempt
+from app.models.trust_ledger import TrustLedgerEntry
+from app.models.user import User
+from app.services.finalization_service import attempt_finalization_service
+from app.services.trust_service import LEDGER_REASON_REPLAY, TrustService
+from ai_engine.risk_weights import RiskWeights, get_risk_weights, set_risk_weights
+
+from tests.helpers import create_assessment, create_user, start_attempt, submission, wait_for_event_flush, wait_for_finalizations
+
+
+@pytest.fixture
+def restore_risk_weights():
+    weights = get_risk_weights()
+    yield
+    set_risk_weights(weights)
+
+
+def _finalize_with_tab_switches(client, student, assessment_id: int, tab_switches: int) -> int:
+    attempt_id = start_attempt(client, student, assessment_id)
+    client.post(f"/api/attempts/{attempt_id}/events", json=[{"event_type": "tab_switch"}] * tab_switches, headers=student["headers"])
+    wait_for_event_flush()
+    completed = attempt_finalization_service.get_stats()["completed"]
+    client.post(f"/api/attempts/{attempt_id}/submit", json=submission(), headers=student["headers"])
+    wait_for_finalizations(1, completed)
+    return attempt_id
+
+
+def test_replay_with_unchanged_weights_changes_nothing(client, db):
+    student = create_user(client, "student@example.com")
+    assessment_id = create_assessment()
+    for tab_switches in (2, 4):
+        _finalize_with_tab_switches(client, student, assessment_id, tab_switches)
+    # The second submission repeats the first: its risk includes code similarity
+    assert db.query(Attempt).filter(Attempt.code_similarity > 0).count() == 1
+    trust_score = db.get(User, student["id"]).trust_score
+
+    stats = TrustService.replay_all(db)
+    assert stats == {"attempts": 2, "rescored": 0, "users": 1, "changed": 0}
+    db.expire_all()
+    assert db.get(User, student["id"]).trust_score == trust_score
+
+
+def test_replay_rescores_attempts_after_weights_change(client, db, restore_risk_weights):
+    student = create_user(client, "student@example.com")
+    attempt_id = _finalize_with_tab_switches(client, student, create_assessment(), 3)
+    attempt = db.get(Attempt, attempt_id)
+    assert (attempt.status, attempt.tab_switch_count, attempt.risk_score) == (ATTEMPT_FINALIZED, 3, 30.0)
+
+    set_risk_weights(RiskWeights.from_mapping({"tab_switch_weight": 20}))
+    stats = TrustService.replay_all(db, batch_size=1)
+    assert stats["rescored"] == 1
+    assert stats["changed"] == 1
+
+    db.expire_all()
+    assert db.get(Attempt, attempt_id).risk_score == 60.0
+    assert db.get(User, student["id"]).trust_score == 94.0
+    entry = db.query(TrustLedgerEntry).filter_by(reason=LEDGER_REASON_REPLAY).one()
+    assert entry.delta == -3.0
+
+
+def test_replay_keeps_risk_of_attempts_without_stored_factors(client, db, restore_risk_weights):
+    student = create_user(client, "student@example.com")
+    assessment_id = create_assessment()
+    started = datetime(2026, 1, 1)
+    for day, risk_score in enumerate((40.0, 20.0)):
+        db.add(Attempt(
+            user_id=student["id"], assessment_id=assessment_id, status=ATTEMPT_FINALIZED, risk_score=risk_score,
+            start_time=started + timedelta(days=day), end_time=started + timedelta(days=day, hours=1)
+        ))
+    db.commit()
+
+    set_risk_weights(RiskWeights.from_mapping({"tab_switch_weight": 20}))
+    stats = TrustService.replay_all(db, batch_size=1)
+    assert stats == {"attempts": 2, "rescored": 0, "users": 1, "changed": 1}
+    db.expire_all()
+    assert db.get(User, student["id"]).trust_score == 94.0
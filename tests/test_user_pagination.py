@@ -0,0 +1,39 @@
+from app.database.db import SessionLocal
+from app.models.user import User
+
+from tests.helpers import create_user
+
+
+def _set_trust_scores(scores: dict) -> None:
+    with SessionLocal() as session:
+        for user_id, score in scores.items():
+            session.get(User, user_id).trust_score = score
+        session.commit()
+
+
+def test_trust_score_pages_walk_every_user_once(client):
+    users = [create_user(client, f"user{i}@example.com") for i in range(5)]
+    _set_trust_scores({user["id"]: score for user, score in zip(users, (70.0, 55.0, 90.0, 55.0, 40.0))})
+
+    seen, cursor = [], None
+    while True:
+        params = {"min_trust_score": 50, "limit": 2, **({"cursor": cursor} if cursor else {})}
+        response = client.get("/api/users/", params=params, headers=users[0]["headers"])
+        assert response.status_code == 200
+        seen += [row["trust_score"] for row in response.json()]
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+    assert seen == [55.0, 55.0, 70.0, 90.0]
+
+
+def test_invalid_cursors_are_rejected(client):
+    user = create_user(client, "user@example.com")
+    for params in (
+        {"min_trust_score": 50, "cursor": f"10.0,{user['id']}"},
+        {"min_trust_score": 50, "cursor": "nan,1"},
+        {"min_trust_score": 50, "cursor": "60.0"},
+        {"cursor": "abc"},
+    ):
+        response = client.get("/api/users/", params=params, headers=user["headers"])
+        assert response.status_code == 400, params